@@ -0,0 +1,4 @@
+"""
+Benchmarks of clickqt, run them with ``python -m benchmarks <benchmark> [options]`` (see ``python -m benchmarks --help``).
+The benchmarks run under the offscreen QPA platform unless QT_QPA_PLATFORM is set.
+"""
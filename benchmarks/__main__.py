@@ -0,0 +1,29 @@
+""" Runs a benchmark: python -m benchmarks <benchmark> [options] """
+from __future__ import annotations
+
+import importlib
+import sys
+
+#: Name -> module of every benchmark
+BENCHMARKS = {
+    "construction": "benchmarks.construction",
+    "imports": "benchmarks.imports",
+    "output": "benchmarks.output",
+    "roundtrip": "benchmarks.roundtrip",
+}
+
+
+def main() -> int:
+    if len(sys.argv) < 2 or sys.argv[1] not in BENCHMARKS:
+        print(
+            f"Usage: python -m benchmarks {{{','.join(BENCHMARKS)}}} [options]\n"
+            "       python -m benchmarks <benchmark> --help",
+            file=sys.stderr,
+        )
+        return 2
+    module = importlib.import_module(BENCHMARKS[sys.argv[1]])
+    return module.main(sys.argv[2:])
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,296 @@
+""" Contains the helpers shared by all benchmarks. """
+from __future__ import annotations
+
+import argparse
+from contextlib import contextmanager
+import functools
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import typing as t
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import click  # pylint: disable=wrong-import-position
+import PySide6  # pylint: disable=wrong-import-position
+from PySide6.QtCore import (
+    QCoreApplication,
+    QEvent,
+)  # pylint: disable=wrong-import-position
+from PySide6.QtWidgets import QApplication  # pylint: disable=wrong-import-position
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None  # type: ignore[assignment]
+
+#: A case of a benchmark: name -> configuration
+Cases = t.Dict[str, t.Dict[str, t.Any]]
+#: Runs one case and returns its metrics: (configuration, repeat) -> metrics
+CaseRunner = t.Callable[[t.Dict[str, t.Any], int], t.Dict[str, t.Any]]
+
+#: Suffixes of metrics where smaller values are better
+LOWER_IS_BETTER = ("_s", "_ms", "_kb")
+#: Suffixes of metrics where bigger values are better
+HIGHER_IS_BETTER = ("_per_s",)
+
+
+def application() -> QApplication:
+    """Returns the QApplication, created on first use."""
+
+    return QApplication.instance() or QApplication([])
+
+
+def process_events():
+    """Processes all pending events, including deferred deletions."""
+
+    app = application()
+    app.processEvents()
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    app.processEvents()
+
+
+def peak_rss_kb() -> t.Optional[int]:
+    """Returns the peak resident set size of the process in KiB, None if it is unknown (Windows)."""
+
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak  # Bytes on macOS
+
+
+class Timer:
+    """Accumulates the time spent in a code block (``with timer: ...``) over several runs."""
+
+    def __init__(self):
+        self.total = 0.0
+        self.calls = 0
+        self.__start = 0.0
+
+    def __enter__(self) -> Timer:
+        self.__start = time.perf_counter()
+        return self
+
+    def __exit__(self, *_):
+        self.total += time.perf_counter() - self.__start
+        self.calls += 1
+
+
+@contextmanager
+def timed_methods(*methods: t.Tuple[type, str]) -> t.Iterator[t.Dict[str, Timer]]:
+    """Measures the time spent in the methods **methods** ((class, name) pairs) while the block runs.
+    Recursive calls are only counted once.
+
+    :return: "Class.name" -> :class:`~benchmarks.common.Timer`
+    """
+
+    timers: t.Dict[str, Timer] = {}
+    originals = []
+    for cls, name in methods:
+        original = getattr(cls, name)
+        timer = timers[f"{cls.__name__}.{name}"] = Timer()
+        originals.append((cls, name, original))
+        setattr(cls, name, _timed(original, timer))
+    try:
+        yield timers
+    finally:
+        for cls, name, original in originals:
+            setattr(cls, name, original)
+
+
+def _timed(function: t.Callable, timer: Timer) -> t.Callable:
+    depth = 0
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        nonlocal depth
+        if depth > 0:  # Recursive call
+            return function(*args, **kwargs)
+        depth += 1
+        try:
+            with timer:
+                return function(*args, **kwargs)
+        finally:
+            depth -= 1
+
+    return wrapper
+
+
+def environment() -> t.Dict[str, t.Any]:
+    """Returns the versions and the platform the benchmarks ran on."""
+
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+        "click": click.__version__,
+        "pyside6": PySide6.__version__,
+        "qpa_platform": os.environ.get("QT_QPA_PLATFORM"),
+    }
+
+
+def compare(
+    results: t.Dict[str, t.Dict[str, t.Any]],
+    baseline: t.Dict[str, t.Dict[str, t.Any]],
+    tolerance: float,
+) -> t.List[str]:
+    """Compares the metrics of **results** with those of **baseline** (case -> metrics) and returns a description of every regression,
+    i.e. of every metric that got worse than the baseline by more than **tolerance** (0.2 = 20 %).
+    Metrics whose names end with :attr:`LOWER_IS_BETTER` or :attr:`HIGHER_IS_BETTER` are compared, others are ignored.
+    """
+
+    regressions: t.List[str] = []
+    for case, metrics in results.items():
+        for metric, value in metrics.items():
+            base = baseline.get(case, {}).get(metric)
+            if not isinstance(value, (int, float)) or not isinstance(
+                base, (int, float)
+            ):
+                continue
+            if metric.endswith(HIGHER_IS_BETTER):
+                worse = value < base * (1 - tolerance)
+            elif metric.endswith(LOWER_IS_BETTER):
+                worse = value > base * (1 + tolerance)
+            else:
+                continue
+            if worse:
+                regressions.append(
+                    f"{case}.{metric}: {value:.6g} (baseline {base:.6g})"
+                )
+    return regressions
+
+
+def parser(description: str) -> argparse.ArgumentParser:
+    """Returns the command line parser of a benchmark."""
+
+    parser_ = argparse.ArgumentParser(description=description)
+    parser_.add_argument(
+        "--case",
+        action="append",
+        dest="cases",
+        metavar="NAME",
+        help="Run only this case (can be given several times)",
+    )
+    parser_.add_argument(
+        "--repeat", type=int, default=3, help="Runs per case, the best run is reported"
+    )
+    parser_.add_argument(
+        "--output", "-o", help="Write the results as JSON to this file"
+    )
+    parser_.add_argument(
+        "--baseline", "-b", help="Compare the results with this JSON file"
+    )
+    parser_.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed relative regression against the baseline (default: 0.2 = 20 %%)",
+    )
+    parser_.add_argument(
+        "--isolate",
+        action="store_true",
+        help="Run every case in its own process (clean peak RSS)",
+    )
+    parser_.add_argument("--list", action="store_true", help="List the cases and exit")
+    return parser_
+
+
+def run_cases(
+    name: str, cases: Cases, run_case: CaseRunner, args: argparse.Namespace
+) -> t.Dict[str, t.Any]:
+    """Runs the selected **cases** of the benchmark **name** and returns the report (environment and case -> metrics)."""
+
+    selected = args.cases or list(cases)
+    unknown = [case for case in selected if case not in cases]
+    if unknown:
+        raise SystemExit(f"Unknown case(s) of '{name}': {', '.join(unknown)}")
+
+    results: t.Dict[str, t.Dict[str, t.Any]] = {}
+    for case in selected:
+        if args.isolate and len(selected) > 1:
+            results[case] = _run_isolated(name, case, args)
+        else:
+            application()
+            results[case] = {
+                "config": cases[case],
+                **run_case(cases[case], args.repeat),
+            }
+            process_events()
+        print(f"{name}.{case}: {_summary(results[case])}", file=sys.stderr)
+
+    return {"benchmark": name, "environment": environment(), "results": results}
+
+
+def main(
+    name: str,
+    description: str,
+    cases: Cases,
+    run_case: CaseRunner,
+    argv: t.Optional[t.Sequence[str]] = None,
+) -> int:
+    """Entry point of a benchmark: Runs the cases, writes the report and compares it with the baseline.
+
+    :return: The exit code, 1 if there are regressions
+    """
+
+    args = parser(description).parse_args(argv)
+    if args.list:
+        for case, config in cases.items():
+            print(f"{case}: {config}")
+        return 0
+
+    report = run_cases(name, cases, run_case, args)
+    text = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            baseline = json.load(file)
+        regressions = compare(
+            report["results"], baseline.get("results", {}), args.tolerance
+        )
+        for regression in regressions:
+            print(f"Regression: {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+def _run_isolated(name: str, case: str, args: argparse.Namespace) -> t.Dict[str, t.Any]:
+    with tempfile.TemporaryDirectory() as directory:
+        output = os.path.join(directory, "result.json")
+        subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "benchmarks",
+                name,
+                "--case",
+                case,
+                "--repeat",
+                str(args.repeat),
+                "--output",
+                output,
+            ],
+            check=True,
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        )
+        with open(output, encoding="utf-8") as file:
+            return json.load(file)["results"][case]
+
+
+def _summary(metrics: t.Dict[str, t.Any]) -> str:
+    return ", ".join(
+        f"{metric}={value:.4g}" if isinstance(value, float) else f"{metric}={value}"
+        for metric, value in metrics.items()
+        if metric.endswith(LOWER_IS_BETTER + HIGHER_IS_BETTER)
+    )
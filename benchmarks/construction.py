@@ -0,0 +1,101 @@
+""" Benchmark of the construction of the GUI of synthetic CLIs (see :mod:`benchmarks.synthetic`). """
+from __future__ import annotations
+
+import gc
+import sys
+import time
+import typing as t
+
+from benchmarks import common
+from benchmarks.synthetic import count_params, synthetic_cli
+
+import clickqt  # pylint: disable=wrong-import-order
+from clickqt.core.control import Control  # pylint: disable=wrong-import-order
+from clickqt.core.gui import GUI  # pylint: disable=wrong-import-order
+
+#: The cases of the benchmark: Arguments of :func:`~benchmarks.synthetic.synthetic_cli` and of :func:`~clickqt.core.core.qtgui_from_click`
+CASES: common.Cases = {
+    "single": {"params": 20},
+    "single_wide": {"params": 500},
+    "groups_fanout": {"depth": 1, "fanout": 30, "params": 15},
+    "groups_deep": {"depth": 4, "fanout": 3, "params": 10, "group_params": 3},
+    "option_groups": {"params": 60, "option_groups": 5},
+    "scalars": {"params": 200, "kinds": ["str", "int", "float", "bool", "choice"]},
+    "composite": {
+        "params": 100,
+        "kinds": ["tuple", "nargs", "multiple", "multiple_choice", "multiple_tuple"],
+    },
+    "composite_list_editors": {
+        "params": 100,
+        "kinds": ["tuple", "nargs", "multiple", "multiple_choice", "multiple_tuple"],
+        "list_editors": True,
+    },
+    "prompts": {"params": 100, "kinds": ["password", "confirmation", "flag"]},
+    "tree_navigator": {
+        "depth": 2,
+        "fanout": 10,
+        "params": 15,
+        "tree_navigator": True,
+    },
+}
+
+#: Keys of a case that are passed to :func:`~clickqt.core.core.qtgui_from_click`
+GUI_OPTIONS = ("tree_navigator", "list_editors")
+
+
+def run_case(config: t.Dict[str, t.Any], repeat: int) -> t.Dict[str, t.Any]:
+    """Builds the CLI of **config** and creates its GUI **repeat** times, the fastest run is reported."""
+
+    cli_args = {key: value for key, value in config.items() if key not in GUI_OPTIONS}
+    gui_args = {key: value for key, value in config.items() if key in GUI_OPTIONS}
+    cli = synthetic_cli(**cli_args)
+
+    runs: t.List[t.Dict[str, float]] = []
+    widgets = 0
+    for _ in range(repeat):
+        streams = sys.stdout, sys.stderr
+        with common.timed_methods((Control, "parse_cmd"), (GUI, "construct")) as timers:
+            start = time.perf_counter()
+            control = clickqt.qtgui_from_click(cli, **gui_args)
+            total = time.perf_counter() - start
+        widgets = sum(len(widgets) for widgets in control.widget_registry.values())
+        runs.append(
+            {
+                "total_s": total,
+                "parse_cmd_s": timers["Control.parse_cmd"].total,
+                "construct_s": timers["GUI.construct"].total,
+                "parse_cmd_calls": timers["Control.parse_cmd"].calls,
+            }
+        )
+        # The GUI replaces sys.stdout and sys.stderr with streams into its terminal
+        sys.stdout, sys.stderr = streams
+        control.gui.window.deleteLater()
+        del control
+        gc.collect()
+        common.process_events()
+
+    best = min(runs, key=lambda run: run["total_s"])
+    return {
+        **best,
+        "params": count_params(cli),
+        "widgets": widgets,
+        "total_per_param_ms": best["total_s"] * 1000 / max(count_params(cli), 1),
+        "peak_rss_kb": common.peak_rss_kb(),
+    }
+
+
+def main(argv: t.Optional[t.Sequence[str]] = None) -> int:
+    """Runs the benchmark, see ``python -m benchmarks construction --help``."""
+
+    return common.main(
+        "construction",
+        "Times qtgui_from_click (total, Control.parse_cmd and GUI.construct) for synthetic CLIs "
+        "and records the peak RSS.",
+        CASES,
+        run_case,
+        argv,
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+""" Benchmark of the import time of clickqt, which must stay small because "clickqtfy --help" and "import clickqt" pay it. """
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import typing as t
+
+from benchmarks import common
+
+#: The cases of the benchmark: The imported module and the budget for the cumulative import time of the modules of clickqt
+CASES: common.Cases = {
+    "clickqt": {"module": "clickqt", "budget_ms": 50.0},
+    "main": {"module": "clickqt.__main__", "budget_ms": 50.0},
+}
+
+
+def import_times(module: str) -> t.Dict[str, t.Tuple[int, int]]:
+    """Imports **module** in a new interpreter (``python -X importtime``).
+
+    :return: module -> (self, cumulative) import time in microseconds of every imported module
+    """
+
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "QT_QPA_PLATFORM": "offscreen"},
+    )
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        own, cumulative, name = line[len("import time:") :].split("|")
+        if own.strip().isdigit():
+            times[name.strip()] = (int(own), int(cumulative))
+    return times
+
+
+def run_case(config: t.Dict[str, t.Any], repeat: int) -> t.Dict[str, t.Any]:
+    """Imports the module of **config** **repeat** times in new interpreters, the fastest run is reported.
+    Asserts that the time spent in the modules of clickqt stays within the budget of **config**.
+    """
+
+    runs = []
+    for _ in range(repeat):
+        times = import_times(config["module"])
+        runs.append(
+            {
+                "clickqt_ms": sum(
+                    own
+                    for name, (own, _) in times.items()
+                    if name.startswith("clickqt")
+                )
+                / 1000,
+                "total_ms": times[config["module"]][1] / 1000,
+                "modules": len(times),
+            }
+        )
+
+    best = {metric: min(run[metric] for run in runs) for metric in runs[0]}
+    assert (
+        best["clickqt_ms"] <= config["budget_ms"]
+    ), f"'import {config['module']}' spent {best['clickqt_ms']:.1f} ms in clickqt (budget {config['budget_ms']} ms)"
+    return best
+
+
+def main(argv: t.Optional[t.Sequence[str]] = None) -> int:
+    """Runs the benchmark, see ``python -m benchmarks imports --help``."""
+
+    return common.main(
+        "imports",
+        "Times 'import clickqt' and 'import clickqt.__main__' in new interpreters; "
+        "asserts that the modules of clickqt stay within the import time budget.",
+        CASES,
+        run_case,
+        argv,
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
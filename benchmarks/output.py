@@ -0,0 +1,228 @@
+""" Benchmark of the output pipeline: Callback -> OutputStream -> TerminalOutput.newMessage -> TerminalOutput.writeText """
+from __future__ import annotations
+
+import os
+import random
+import statistics
+import sys
+import time
+import typing as t
+
+from benchmarks import common
+
+import click  # pylint: disable=wrong-import-order
+from PySide6.QtCore import (
+    QEventLoop,
+    QObject,
+    QThread,
+    QTimer,
+    Signal,
+)  # pylint: disable=wrong-import-order
+from PySide6.QtGui import QColor  # pylint: disable=wrong-import-order
+
+from clickqt.core.commandexecutor import (
+    CommandExecutor,
+    ExecutionStep,
+)  # pylint: disable=wrong-import-order
+from clickqt.core.output import (
+    OutputStream,
+    TerminalOutput,
+)  # pylint: disable=wrong-import-order
+
+#: The cases of the benchmark, the keys of a case are
+#:
+#: - writes: Number of write calls of the callback
+#: - lines: Lines per write
+#: - width: Characters per line
+#: - style: "plain", "ansi" (every line colored with click.style) or "binary" (random bytes, utf-8 with replacement characters)
+#: - stderr: Every n-th write goes to sys.stderr, 0 = only sys.stdout
+CASES: common.Cases = {
+    "tiny_writes": {"writes": 20000, "lines": 1, "width": 40},
+    "huge_writes": {"writes": 10, "lines": 5000, "width": 80},
+    "ansi": {"writes": 5000, "lines": 1, "width": 60, "style": "ansi"},
+    "ansi_huge": {"writes": 10, "lines": 1000, "width": 60, "style": "ansi"},
+    "binary": {"writes": 2000, "lines": 1, "width": 120, "style": "binary"},
+    "interleaved_stderr": {"writes": 10000, "lines": 1, "width": 40, "stderr": 2},
+}
+
+#: Interval of the heartbeat timer that detects event loop stalls, in milliseconds
+HEARTBEAT_MS = 2
+#: A run fails if the output isn't shown within this time, in seconds
+TIMEOUT_S = 300
+
+
+def make_messages(
+    config: t.Dict[str, t.Any], seed: int = 0
+) -> t.List[t.Tuple[int, "str | bytes"]]:
+    """Returns the writes of **config** (see :data:`CASES`): (1 = sys.stdout / 2 = sys.stderr, message) pairs.
+    Every message ends with a newline.
+    """
+
+    rng = random.Random(seed)
+    style = config.get("style", "plain")
+    width = config.get("width", 40)
+    stderr = config.get("stderr", 0)
+
+    def line(number: int) -> "str | bytes":
+        if style == "binary":
+            data = bytes(rng.randrange(256) for _ in range(width))
+            return data.decode("utf-8", "replace").encode("utf-8") + b"\n"
+        text = f"{number:08d} " + "x" * max(width - 9, 0)
+        if style == "ansi":
+            text = click.style(
+                text, fg=rng.choice(["red", "green", "blue"]), bold=number % 2 == 0
+            )
+        return text + "\n"
+
+    messages: t.List[t.Tuple[int, "str | bytes"]] = []
+    number = 0
+    for write in range(config.get("writes", 1)):
+        lines = [line(number + i) for i in range(config.get("lines", 1))]
+        number += len(lines)
+        message = b"".join(lines) if style == "binary" else "".join(lines)  # type: ignore[arg-type]
+        messages.append((2 if stderr and write % stderr == stderr - 1 else 1, message))
+    return messages
+
+
+class _Driver(QObject):  # pylint: disable=too-few-public-methods
+    requestExecution: Signal = Signal(list)
+
+
+def run_once(
+    config: t.Dict[str, t.Any], terminal: TerminalOutput
+) -> t.Dict[str, t.Any]:
+    """Runs a command that writes the messages of **config** through :class:`~clickqt.core.commandexecutor.CommandExecutor`
+    and waits until **terminal** has shown all of them.
+    """
+
+    messages = make_messages(config)
+    sent: t.List[float] = []
+    received: t.List[float] = []
+    ticks: t.List[float] = []
+
+    def callback():
+        streams = {1: sys.stdout, 2: sys.stderr}
+        for stream, message in messages:
+            sent.append(time.perf_counter())
+            streams[stream].write(message)
+
+    loop = QEventLoop()
+
+    def message_shown():
+        received.append(time.perf_counter())
+        if len(received) == len(messages):
+            loop.quit()
+
+    # Connected after writeText, so it runs when the text has been inserted
+    terminal.newMessage.connect(message_shown)
+
+    heartbeat = QTimer()
+    heartbeat.setInterval(HEARTBEAT_MS)
+    heartbeat.timeout.connect(lambda: ticks.append(time.perf_counter()))
+
+    # The output streams the GUI installs, without the copy to the console
+    with open(os.devnull, "w", encoding="utf-8") as devnull:
+        streams = sys.stdout, sys.stderr
+        sys.stdout = OutputStream(terminal, devnull, QColor("black"))  # type: ignore[assignment]
+        sys.stderr = OutputStream(terminal, devnull, QColor("red"))  # type: ignore[assignment]
+
+        thread = QThread()
+        thread.start()
+        worker = CommandExecutor(output=terminal)
+        worker.moveToThread(thread)
+        worker.finished.connect(thread.quit)
+        worker.finished.connect(lambda: loop.quit() if worker.failed else None)
+        driver = _Driver()
+        driver.requestExecution.connect(worker.run)
+        QTimer.singleShot(TIMEOUT_S * 1000, loop.quit)
+
+        try:
+            heartbeat.start()
+            ticks.append(time.perf_counter())
+            driver.requestExecution.emit(
+                [
+                    ExecutionStep(
+                        click.Command("output", callback=callback), "output", {}, (), {}
+                    )
+                ]
+            )
+            loop.exec()
+            heartbeat.stop()
+            thread.quit()
+            thread.wait()
+        finally:
+            sys.stdout, sys.stderr = streams
+            terminal.newMessage.disconnect(message_shown)
+
+    if worker.failed or len(received) != len(messages):
+        raise RuntimeError(
+            f"Only {len(received)} of {len(messages)} messages were shown"
+        )
+
+    start = time.perf_counter()
+    terminal.viewport().repaint()
+    paint = time.perf_counter() - start
+
+    lines = sum(message.count("\n" if isinstance(message, str) else b"\n") for _, message in messages)  # type: ignore[arg-type]
+    size = sum(len(message) for _, message in messages)
+    total = received[-1] - sent[0]
+    latencies = sorted(
+        (shown - written) * 1000 for written, shown in zip(sent, received)
+    )
+    gaps = [
+        later - earlier for earlier, later in zip(ticks, ticks[1:] + [received[-1]])
+    ]
+    return {
+        "lines": lines,
+        "total_s": total,
+        "write_s": sent[-1] - sent[0],
+        "lines_per_s": lines / total,
+        "chars_per_s": size / total,
+        "latency_mean_ms": statistics.fmean(latencies),
+        "latency_p50_ms": latencies[len(latencies) // 2],
+        "latency_p95_ms": latencies[
+            min(int(len(latencies) * 0.95), len(latencies) - 1)
+        ],
+        "latency_max_ms": latencies[-1],
+        "max_stall_ms": max(max(gaps) * 1000 - HEARTBEAT_MS, 0.0),
+        "paint_ms": paint * 1000,
+        "document_blocks": terminal.document().blockCount(),
+    }
+
+
+def run_case(config: t.Dict[str, t.Any], repeat: int) -> t.Dict[str, t.Any]:
+    """Runs **config** **repeat** times in a shown :class:`~clickqt.core.output.TerminalOutput`, the fastest run is reported."""
+
+    terminal = TerminalOutput()
+    terminal.newMessage.connect(terminal.writeText)  # Like the GUI
+    terminal.setReadOnly(True)
+    terminal.resize(800, 600)
+    terminal.show()
+    common.process_events()
+
+    runs = []
+    for _ in range(repeat):
+        terminal.clear()
+        common.process_events()
+        runs.append(run_once(config, terminal))
+
+    terminal.deleteLater()
+    best = min(runs, key=lambda run: run["total_s"])
+    return {**best, "peak_rss_kb": common.peak_rss_kb()}
+
+
+def main(argv: t.Optional[t.Sequence[str]] = None) -> int:
+    """Runs the benchmark, see ``python -m benchmarks output --help``."""
+
+    return common.main(
+        "output",
+        "Measures the throughput, the latency (write -> text in the terminal) and the longest event loop stall "
+        "of the terminal output for different output patterns.",
+        CASES,
+        run_case,
+        argv,
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,211 @@
+""" Benchmark of the validation of a run and of the command line round trip (export and import) of filled forms. """
+from __future__ import annotations
+
+import datetime
+import gc
+import io
+import os
+import random
+import sys
+import time
+import typing as t
+
+from benchmarks import common
+from benchmarks.synthetic import ALL_KINDS, synthetic_cli
+
+import click  # pylint: disable=wrong-import-order
+from PySide6.QtWidgets import QApplication  # pylint: disable=wrong-import-order
+
+import clickqt  # pylint: disable=wrong-import-order
+from clickqt.core.control import Control  # pylint: disable=wrong-import-order
+from clickqt.core.output import OutputStream  # pylint: disable=wrong-import-order
+from clickqt.widgets.basewidget import BaseWidget  # pylint: disable=wrong-import-order
+
+#: The kinds of the forms: All kinds except files, whose values are opened on every validation
+FORM_KINDS: t.Tuple[str, ...] = tuple(kind for kind in ALL_KINDS if kind != "file")
+
+#: The cases of the benchmark: Arguments of :func:`~benchmarks.synthetic.synthetic_cli` (a single command)
+CASES: common.Cases = {
+    f"params_{params}": {"params": params, "kinds": list(FORM_KINDS)}
+    for params in (10, 100, 1000, 10000)
+}
+
+
+def random_value(kind: str, rng: random.Random) -> t.Any:
+    """Returns a random valid value of a parameter of **kind**, in the form :func:`~clickqt.widgets.basewidget.BaseWidget.set_value` accepts."""
+
+    if kind == "str" or kind in ("password", "confirmation"):
+        return f"v{rng.randrange(10**6)}"
+    if kind == "int":
+        return rng.randrange(-1000, 1000)
+    if kind == "float":
+        return round(rng.uniform(-100, 100), 3)
+    if kind in ("bool", "flag"):
+        return rng.random() < 0.5
+    if kind == "count":
+        return rng.randrange(5)
+    if kind == "intrange":
+        return rng.randrange(11)
+    if kind == "choice":
+        return f"c{rng.randrange(20)}"
+    if kind == "datetime":
+        return datetime.datetime(2000, 1, 1) + datetime.timedelta(
+            days=rng.randrange(10000)
+        )
+    if kind == "path":
+        return f"dir{rng.randrange(100)}/file{rng.randrange(100)}.txt"
+    if kind == "file":
+        return "-"
+    if kind == "tuple":
+        return (f"t{rng.randrange(100)}", rng.randrange(100), float(rng.randrange(10)))
+    if kind == "nargs":
+        return tuple(rng.randrange(100) for _ in range(3))
+    if kind == "multiple":
+        return [rng.randrange(100) for _ in range(rng.randrange(1, 4))]
+    if kind == "multiple_choice":
+        return sorted(
+            {f"c{rng.randrange(20)}" for _ in range(rng.randrange(1, 4))},
+            key=lambda c: int(c[1:]),
+        )
+    if kind == "multiple_tuple":
+        return [
+            (f"m{rng.randrange(100)}", rng.randrange(100))
+            for _ in range(rng.randrange(1, 4))
+        ]
+    raise ValueError(f"Unknown parameter kind: {kind}")
+
+
+def fill(widgets: t.Dict[str, BaseWidget], kinds: t.Sequence[str], seed: int):
+    """Sets every widget of **widgets** (named p0, p1, ... like the options of :func:`~benchmarks.synthetic.synthetic_cli`)
+    to a random value of its kind.
+    """
+
+    rng = random.Random(seed)
+    for name, widget in widgets.items():
+        widget.set_value(random_value(kinds[int(name[1:]) % len(kinds)], rng))
+
+
+def values(widgets: t.Dict[str, BaseWidget]) -> t.Dict[str, t.Any]:
+    """Returns the validated values of **widgets**, comparable with ==."""
+
+    def comparable(value: t.Any) -> t.Any:
+        if isinstance(value, (list, tuple)):
+            return [comparable(v) for v in value]
+        if isinstance(value, io.IOBase):
+            return getattr(value, "name", None)
+        return value
+
+    result = {}
+    for name, widget in widgets.items():
+        value, err = widget.get_value()
+        if err.type != err.ErrorType.NO_ERROR:
+            raise AssertionError(f"Invalid value of {name}: {err.message()}")
+        result[name] = comparable(value)
+    return result
+
+
+def run_once(control: Control, kinds: t.Sequence[str], seed: int) -> t.Dict[str, t.Any]:
+    """Fills the form of **control** with random values and measures the validation, the export and the import.
+    The widgets are set to other values before the import, the imported values must equal the exported ones.
+    """
+
+    node = control.current_node()
+    widgets = node.widgets
+
+    start = time.perf_counter()
+    fill(widgets, kinds, seed)
+    populate = time.perf_counter() - start
+    expected = values(widgets)
+
+    start = time.perf_counter()
+    steps = control.build_steps(node)
+    validation = time.perf_counter() - start
+    assert steps is not None, "Validation failed"
+
+    start = time.perf_counter()
+    cmdline = control.command_to_cli_string(node)
+    export = time.perf_counter() - start
+
+    # Different values, so the import has to change every widget
+    fill(widgets, kinds, seed + 1)
+    QApplication.clipboard().setText(cmdline)
+    with common.timed_methods(
+        (click.parser, "split_arg_string"), (click.Command, "parse_args")
+    ) as timers:
+        start = time.perf_counter()
+        control.import_cmdline()
+        imported = time.perf_counter() - start
+
+    actual = values(widgets)
+    differences = [name for name in expected if expected[name] != actual[name]]
+    assert not differences, "Round trip changed " + ", ".join(
+        f"{name}: {expected[name]!r} -> {actual[name]!r}" for name in differences[:10]
+    )
+
+    return {
+        "populate_s": populate,
+        "validation_s": validation,
+        "export_s": export,
+        "import_s": imported,
+        "split_arg_string_s": timers["click.parser.split_arg_string"].total,
+        "parse_args_s": timers["Command.parse_args"].total,
+        "cmdline_chars": len(cmdline),
+    }
+
+
+def run_case(config: t.Dict[str, t.Any], repeat: int) -> t.Dict[str, t.Any]:
+    """Creates the GUI of **config** and runs :func:`run_once` **repeat** times, the fastest run is reported."""
+
+    cli = synthetic_cli(**config)
+    kinds = config.get("kinds", ALL_KINDS)
+    streams = sys.stdout, sys.stderr
+    start = time.perf_counter()
+    control = clickqt.qtgui_from_click(cli)
+    construction = time.perf_counter() - start
+    control.set_ep_or_path(cli.name)
+    control.set_is_ep(True)
+
+    try:
+        # The messages of the import are shown in the terminal, but not copied to the console
+        with open(os.devnull, "w", encoding="utf-8") as devnull:
+            for stream in (sys.stdout, sys.stderr):
+                if isinstance(stream, OutputStream):
+                    stream.stream = devnull
+            runs = [run_once(control, kinds, seed=2 * run) for run in range(repeat)]
+    finally:
+        # The GUI replaces sys.stdout and sys.stderr with streams into its terminal
+        sys.stdout, sys.stderr = streams
+        control.gui.window.deleteLater()
+        del control
+        gc.collect()
+        common.process_events()
+
+    best = {
+        metric: min(run[metric] for run in runs)
+        for metric in runs[0]
+        if metric.endswith("_s")
+    }
+    return {
+        **best,
+        "construction_s": construction,
+        "cmdline_chars": runs[-1]["cmdline_chars"],
+        "params": len(cli.params),
+        "peak_rss_kb": common.peak_rss_kb(),
+    }
+
+
+def main(argv: t.Optional[t.Sequence[str]] = None) -> int:
+    """Runs the benchmark, see ``python -m benchmarks roundtrip --help``."""
+
+    return common.main(
+        "roundtrip",
+        "Fills forms with random values and times the validation of a run, the export as command line "
+        "and its import; asserts that the import restores the exported values.",
+        CASES,
+        run_case,
+        argv,
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,142 @@
+""" Contains the generator of synthetic click CLIs. """
+from __future__ import annotations
+
+import random
+import typing as t
+
+import click
+from click_option_group import optgroup
+
+#: Creates the keyword arguments of a click.Option of a kind: random generator -> keyword arguments
+OptionFactory = t.Callable[[random.Random], t.Dict[str, t.Any]]
+
+#: The kinds of parameters the generator can create
+PARAM_KINDS: t.Dict[str, OptionFactory] = {
+    "str": lambda rng: {"type": str, "default": f"text{rng.randrange(100)}"},
+    "int": lambda rng: {"type": int, "default": rng.randrange(100)},
+    "float": lambda rng: {"type": float, "default": rng.random()},
+    "bool": lambda rng: {"type": bool, "default": rng.random() < 0.5},
+    "flag": lambda rng: {"is_flag": True},
+    "count": lambda rng: {"count": True},
+    "intrange": lambda rng: {"type": click.IntRange(0, 10), "default": 5},
+    "choice": lambda rng: {
+        "type": click.Choice([f"c{i}" for i in range(20)]),
+        "default": f"c{rng.randrange(20)}",
+    },
+    "datetime": lambda rng: {"type": click.DateTime(), "default": "2023-06-01"},
+    "path": lambda rng: {"type": click.Path(), "default": "."},
+    "file": lambda rng: {"type": click.File("r"), "default": "-"},
+    "password": lambda rng: {"hide_input": True, "default": "secret"},
+    "confirmation": lambda rng: {"confirmation_prompt": True, "default": "value"},
+    "tuple": lambda rng: {"type": (str, int, float), "default": ("a", 1, 1.5)},
+    "nargs": lambda rng: {"type": int, "nargs": 3, "default": (1, 2, 3)},
+    "multiple": lambda rng: {"type": int, "multiple": True, "default": [1, 2, 3]},
+    "multiple_choice": lambda rng: {
+        "type": click.Choice([f"c{i}" for i in range(20)]),
+        "multiple": True,
+        "default": ["c1", "c2"],
+    },
+    "multiple_tuple": lambda rng: {
+        "type": (str, int),
+        "multiple": True,
+        "default": [("a", 1), ("b", 2)],
+    },
+}
+
+#: All kinds of parameters
+ALL_KINDS: t.Tuple[str, ...] = tuple(PARAM_KINDS)
+
+
+def make_option(kind: str, name: str, rng: random.Random) -> t.Dict[str, t.Any]:
+    """Returns the keyword arguments of a click.Option of **kind** (see :data:`PARAM_KINDS`) named **name**."""
+
+    return {
+        "param_decls": [f"--{name}"],
+        "help": f"{kind} option",
+        **PARAM_KINDS[kind](rng),
+    }
+
+
+def synthetic_command(
+    name: str,
+    params: int,
+    kinds: t.Sequence[str],
+    option_groups: int,
+    rng: random.Random,
+) -> click.Command:
+    """Returns a command with **params** options of the kinds **kinds** (in turn).
+    The last options are split into **option_groups** groups of click_option_group (up to half of the options).
+    """
+
+    options = [make_option(kinds[i % len(kinds)], f"p{i}", rng) for i in range(params)]
+    grouped = min(len(options) // 2, 4 * option_groups) if option_groups else 0
+    plain, grouped_options = (
+        options[: len(options) - grouped],
+        options[len(options) - grouped :],
+    )
+
+    def callback(**kwargs):
+        return len(kwargs)
+
+    # The decorators are applied innermost first: The options of a group, then the group
+    for group in range(option_groups):
+        for kwargs in reversed(grouped_options[group::option_groups]):
+            decls = kwargs.pop("param_decls")
+            callback = optgroup.option(*decls, **kwargs)(callback)
+        callback = optgroup.group(f"Group {group}", help=f"Option group {group}")(
+            callback
+        )
+    command = click.command(name)(callback)
+    command.params[:0] = [click.Option(**kwargs) for kwargs in plain]
+    return command
+
+
+def synthetic_cli(
+    depth: int = 0,
+    fanout: int = 3,
+    params: int = 10,
+    kinds: t.Sequence[str] = ALL_KINDS,
+    option_groups: int = 0,
+    group_params: int = 0,
+    seed: int = 0,
+) -> click.Command:
+    """Returns a synthetic click CLI.
+
+    :param depth: Number of group levels, 0 = a single command
+    :param fanout: Number of subcommands of every group
+    :param params: Number of options of every command
+    :param kinds: The kinds of the options (see :data:`PARAM_KINDS`), used in turn
+    :param option_groups: Number of option groups (click_option_group) of every command
+    :param group_params: Number of options of every group
+    :param seed: Seed of the random default values
+    """
+
+    rng = random.Random(seed)
+    unknown = [kind for kind in kinds if kind not in PARAM_KINDS]
+    if unknown:
+        raise ValueError(f"Unknown parameter kinds: {', '.join(unknown)}")
+
+    def build(name: str, level: int) -> click.Command:
+        if level == depth:
+            return synthetic_command(name, params, kinds, option_groups, rng)
+        group = click.Group(
+            name,
+            params=[
+                click.Option(**make_option(kinds[i % len(kinds)], f"g{i}", rng))
+                for i in range(group_params)
+            ],
+        )
+        for i in range(fanout):
+            group.add_command(build(f"{name}-{i}" if level else f"cmd{i}", level + 1))
+        return group
+
+    return build("cli", 0)
+
+
+def count_params(cmd: click.Command) -> int:
+    """Returns the number of parameters of **cmd** and all its subcommands."""
+
+    count = len(cmd.params)
+    if isinstance(cmd, click.Group):
+        count += sum(count_params(child) for child in cmd.commands.values())
+    return count
@@ -1,4 +1,31 @@
 # The version file is generated automatically by setuptools_scm
 from clickqt._version import version as __version__
 
-from clickqt.core.core import qtgui_from_click
+import importlib
+import typing as t
+
+if t.TYPE_CHECKING:
+    from clickqt.core.core import qtgui_from_click
+    from clickqt.core.logtee import LogTee
+    from clickqt.core.shell import Shell
+
+# The GUI (PySide6, widgets) is imported on first use, "import clickqt" stays cheap
+_LAZY_ATTRIBUTES = {
+    "qtgui_from_click": "clickqt.core.core",
+    "LogTee": "clickqt.core.logtee",
+    "Shell": "clickqt.core.shell",
+}
+
+__all__ = ["__version__", *_LAZY_ATTRIBUTES]
+
+
+def __getattr__(name: str) -> t.Any:
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> t.List[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
@@ -3,12 +3,167 @@ Contains the entry point for clickqt, called clickqtfy, allowing external use.
 """
 from __future__ import annotations
 
+from contextlib import contextmanager
+import functools
+import hashlib
+import json
+import os
+import socket
+import stat
+import struct
+import subprocess
 import sys
+import tempfile
+import threading
+import time
+from types import CodeType, ModuleType
+import typing as t
 from importlib import util, metadata
+from importlib.machinery import ModuleSpec
 
 import click
-from clickqt.core.control import Control
-from clickqt.core.core import qtgui_from_click
+
+# The GUI is imported when it is needed, so "clickqtfy --help" doesn't load PySide6
+
+#: Name of the module of an imported file
+MODULE_NAME = "clickqtfy.imported_module"
+#: Name of the thread that resolves the target while the GUI is imported
+TARGET_THREAD = "clickqtfy-target"
+#: Top-level packages whose import makes clickqtfy run the target in the main thread (see :func:`imports_qt`)
+QT_MODULES = ("clickqt", "PySide6", "PySide2", "PyQt6", "PyQt5", "qtpy")
+#: Name of the phase in which the main thread waits for the target thread
+WAIT_PHASE = "wait for target"
+
+#: Environment variable that enables --daemon
+DAEMON_ENVVAR = "CLICKQTFY_DAEMON"
+#: Seconds a new daemon may take until it accepts requests
+DAEMON_START_TIMEOUT = 30.0
+#: Seconds the daemon may take to open a window, includes the first import of the target
+DAEMON_REPLY_TIMEOUT = 300.0
+
+#: A phase of the start: (name, thread, start, end), in seconds since the start
+Phase = t.Tuple[str, str, float, float]
+
+#: Real path of a file -> the module of the file, every file is run only once per process (see :func:`load_module`)
+_modules: dict[str, ModuleType] = {}
+#: Value of an entry point ('module:attribute') -> the loaded object (see :func:`load_entrypoint`)
+_entrypoint_objects: dict[str, t.Any] = {}
+_cache_lock = threading.RLock()
+
+
+class StartupTimer:
+    """Records the phases of the start of clickqtfy in the main thread and in the thread that resolves the target."""
+
+    def __init__(self):
+        self.origin = time.perf_counter()
+        self.phases: list[Phase] = []
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def phase(self, name: str) -> t.Iterator[None]:
+        """Records the duration of the block as phase **name** of the current thread."""
+
+        start = time.perf_counter() - self.origin
+        try:
+            yield
+        finally:
+            end = time.perf_counter() - self.origin
+            with self.lock:
+                self.phases.append((name, threading.current_thread().name, start, end))
+
+    def critical_path(self) -> list[Phase]:
+        """Returns the phases that determined the duration of the start: The phases of the main thread, but if it had to wait
+        for the target, the phases of the target thread replace the phases before the wait.
+        """
+
+        main = [phase for phase in self.phases if phase[1] != TARGET_THREAD]
+        waits = [phase for phase in main if phase[0] == WAIT_PHASE]
+        if not waits or waits[0][3] - waits[0][2] < 0.001:
+            return [phase for phase in main if phase[0] != WAIT_PHASE]
+        target = [phase for phase in self.phases if phase[1] == TARGET_THREAD]
+        return target + [phase for phase in main if phase[2] >= waits[0][3]]
+
+    def report(self) -> str:
+        """Returns a table of all phases (in milliseconds) followed by the critical path."""
+
+        lines = [
+            "clickqtfy startup (ms):",
+            f"  {'phase':<22}{'thread':<18}{'start':>9}{'end':>9}{'duration':>10}",
+        ]
+        for name, thread, start, end in sorted(self.phases, key=lambda p: p[2]):
+            lines.append(
+                f"  {name:<22}{thread:<18}{start * 1000:>9.1f}{end * 1000:>9.1f}{(end - start) * 1000:>10.1f}"
+            )
+        path = self.critical_path()
+        total = max((phase[3] for phase in self.phases), default=0.0)
+        lines.append(
+            f"  critical path: {' -> '.join(phase[0] for phase in path)} "
+            f"= {sum(phase[3] - phase[2] for phase in path) * 1000:.1f} ms (total {total * 1000:.1f} ms)"
+        )
+        return "\n".join(lines)
+
+
+class TargetResolver(threading.Thread):
+    """Resolves the target of clickqtfy in the background: Scans the installed entry points or reads and compiles the file,
+    then imports the target, so the main thread only has to look up the command.
+    Targets that import Qt or clickqt at module level and targets with a custom GUI are imported by the main thread,
+    they often create Qt objects when they are imported (e.g. a Control for --custom-gui).
+
+    :param entrypoint: Name of an entry point or a file path
+    :param funcname: Name of the command in the file, None if **entrypoint** is an entry point
+    :param custom_gui: Name of the entry point (or the variable in the file) of the custom GUI, defaults to None
+    :param timer: Records the duration of the resolution, defaults to None
+    """
+
+    def __init__(
+        self,
+        entrypoint: str,
+        funcname: t.Optional[str],
+        custom_gui: t.Optional[str] = None,
+        timer: t.Optional[StartupTimer] = None,
+    ):
+        super().__init__(name=TARGET_THREAD, daemon=True)
+        self.entrypoint = entrypoint
+        self.funcname = funcname
+        self.custom_gui = custom_gui
+        self.timer = timer or StartupTimer()
+        #: The entry point or the (spec, code) of the file (None if the file has already been run)
+        self.target: "metadata.EntryPoint | tuple[ModuleSpec, CodeType] | None" = None
+        #: The entry point of the custom GUI (None for files, they contain the GUI themselves)
+        self.gui_target: t.Optional[metadata.EntryPoint] = None
+        self.error: t.Optional[BaseException] = None
+
+    def run(self):
+        try:
+            with self.timer.phase("resolve target"):
+                if self.funcname:
+                    if os.path.realpath(self.entrypoint) not in _modules:
+                        self.target = compile_module(self.entrypoint)
+                else:
+                    self.target = find_entrypoint(self.entrypoint)
+                    if self.custom_gui:
+                        self.gui_target = find_entrypoint(self.custom_gui)
+            if self.target is None or self.custom_gui:
+                return
+            # The imported target is cached, load_target() only looks up the command
+            if self.funcname:
+                if not imports_qt(self.target[1]):
+                    with self.timer.phase("import target"):
+                        load_module(self.entrypoint, self.target)
+                        self.target = None
+            elif not imports_qt(module_code(self.target.module)):
+                with self.timer.phase("import target"):
+                    load_entrypoint(self.target)
+        except BaseException as e:  # pylint: disable=broad-exception-caught
+            self.error = e
+
+    def result(self):
+        """Waits for the resolution and returns the target and the target of the custom GUI, raises the error of the resolution."""
+
+        self.join()
+        if self.error is not None:
+            raise self.error
+        return self.target, self.gui_target
 
 
 @click.command("clickqtfy")
@@ -21,7 +176,20 @@ from clickqt.core.core import qtgui_from_click
     help="Use this to insert your own GUI entry point,"
     "either as a standalone entry point or as a variable to a Control() object.",
 )
-def clickqtfy(entrypoint, funcname, custom_gui):
+@click.option(
+    "--timing",
+    is_flag=True,
+    help="Print the duration of the phases of the start and its critical path to stderr.",
+)
+@click.option(
+    "--daemon",
+    is_flag=True,
+    envvar=DAEMON_ENVVAR,
+    help="Open the window in the resident clickqtfy process of the user, which is started if it isn't running. "
+    "It keeps PySide6 and the loaded commands, so further windows open almost instantly. "
+    f"Changed files of a command are loaded again. Can be enabled with {DAEMON_ENVVAR}=1, not available on Windows.",
+)
+def clickqtfy(entrypoint, funcname, custom_gui, timing, daemon):
     """
     Generate a GUI for an entry point or a file + click.command combinaiton.
 
@@ -29,38 +197,218 @@ def clickqtfy(entrypoint, funcname, custom_gui):
     FUNCNAME: Name of the click.command inside the file at ENTRYPOINT.\n
     If FUNCNAME is provided, ENTRYPOINT is interpreted as a file. Otherwise, as an entry point.
     """
+    timer = StartupTimer()
+    report_stream = sys.stderr  # The GUI sends sys.stderr to its terminal
     appname = entrypoint + (f" - {funcname}" if funcname else "")
-    gui_specs = None
-    command = None
-    control = None
-    if custom_gui:
-        if funcname:
-            gui_specs = get_gui_specs_from_path(entrypoint, custom_gui)
-        else:
-            gui_specs = get_gui_specs_from_entrypoint(custom_gui)
-
     if funcname:
         click.types.File().convert(entrypoint, None, None)  # check if its real file
-        command = get_command_from_path(entrypoint, funcname)
-    else:
-        command = get_command_from_entrypoint(entrypoint)
 
-    if gui_specs:
+    if daemon and hasattr(socket, "AF_UNIX"):
+        with timer.phase("daemon request"):
+            opened = open_in_daemon(entrypoint, funcname, custom_gui)
+        if opened:
+            if timing:
+                click.echo(timer.report(), file=report_stream)
+            return None
+        click.echo(
+            "clickqtfy: The daemon is not available, the window is opened by this process.",
+            err=True,
+        )
+
+    # The target is resolved while PySide6 is imported and the application is created
+    resolver = TargetResolver(entrypoint, funcname, custom_gui, timer)
+    resolver.start()
+    with timer.phase("import GUI"):
+        from clickqt.core.core import (  # pylint: disable=import-outside-toplevel
+            create_application,
+            qtgui_from_click,
+        )
+    with timer.phase("create QApplication"):
+        create_application(appname)
+    with timer.phase(WAIT_PHASE):
+        target, gui_target = resolver.result()
+
+    with timer.phase("load target"):
+        command, gui_specs = load_target(
+            entrypoint, funcname, custom_gui, target, gui_target
+        )
+
+    with timer.phase("build Control"):
         control = qtgui_from_click(
-            command, custom_mapping=gui_specs, application_name=appname
+            command, custom_mapping=gui_specs or None, application_name=appname
         )
-    else:
-        control = qtgui_from_click(command, application_name=appname)
     control.set_is_ep(funcname is None)
     control.set_ep_or_path(entrypoint)
+    if timing:
+        click.echo(timer.report(), file=report_stream)
     return control()
 
 
+def load_target(
+    entrypoint: str,
+    funcname: t.Optional[str],
+    custom_gui: t.Optional[str] = None,
+    target: "metadata.EntryPoint | tuple[ModuleSpec, CodeType] | None" = None,
+    gui_target: t.Optional[metadata.EntryPoint] = None,
+) -> tuple[click.Command, t.Optional[dict]]:
+    """
+    Returns the command and the custom mapping (None without `custom_gui`) of a target of clickqtfy.
+    `target` and `gui_target` are the results of a `TargetResolver`, they are looked up if they are not given.
+    """
+    gui_specs = None
+    if funcname:
+        # The command and the custom GUI come from the same run of the file
+        module = load_module(entrypoint, target)
+        if custom_gui:
+            gui_specs = validate_gui_ep(get_module_attribute(module, custom_gui))
+        command = validate_entrypoint(get_module_attribute(module, funcname))
+    else:
+        if custom_gui:
+            gui_specs = validate_gui_ep(
+                load_entrypoint(gui_target or find_entrypoint(custom_gui))
+            )
+        command = validate_entrypoint(
+            load_entrypoint(target or find_entrypoint(entrypoint))
+        )
+    return command, gui_specs
+
+
+def daemon_socket_path() -> str:
+    """
+    Returns the path of the socket of the daemon of the user for this interpreter and version of clickqt.
+    The socket is in the runtime directory of the user ($XDG_RUNTIME_DIR) or in a private directory in the temporary directory
+    (see `private_directory()`).
+    """
+    from clickqt import __version__  # pylint: disable=import-outside-toplevel
+
+    key = hashlib.sha1(f"{sys.executable}\0{__version__}".encode()).hexdigest()[:12]
+    directory = os.environ.get("XDG_RUNTIME_DIR") or private_directory(
+        os.path.join(tempfile.gettempdir(), f"clickqtfy-{os.getuid()}")
+    )
+    return os.path.join(directory, f"clickqtfy-{os.getuid()}-{key}.sock")
+
+
+def private_directory(path: str) -> str:
+    """
+    Creates the directory `path` that only the user can access (mode 0700) and returns `path`.
+    An existing `path` has to be a directory (not a link) of the user, its mode is set to 0700.
+    Otherwise, raises `PermissionError`: Another user could replace the socket in it.
+    """
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.getuid():
+        raise PermissionError(f"'{path}' is not a directory of the user")
+    if stat.S_IMODE(info.st_mode) != 0o700:
+        os.chmod(path, 0o700)
+    return path
+
+
+def daemon_owner(connection: socket.socket, path: str) -> int:
+    """
+    Returns the user id of the process that accepted `connection`, or the user id of the owner of the socket file `path`
+    if the platform doesn't report the peer of a connection.
+    """
+    if hasattr(socket, "SO_PEERCRED"):
+        size = struct.calcsize("iII")  # struct ucred: pid, uid, gid
+        _, uid, _ = struct.unpack(
+            "iII", connection.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, size)
+        )
+        return uid
+    return os.stat(path).st_uid
+
+
+def request_daemon(
+    request: dict, path: str, timeout: float = DAEMON_REPLY_TIMEOUT
+) -> t.Optional[dict]:
+    """
+    Sends `request` as JSON line to the daemon listening on `path` and returns its reply,
+    or None if no daemon listens on `path`.
+    Raises `PermissionError` without sending `request` if the daemon belongs to another user.
+    """
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.settimeout(timeout)
+            connection.connect(path)
+            if daemon_owner(connection, path) != os.getuid():
+                raise PermissionError(
+                    f"The clickqtfy daemon at '{path}' belongs to another user"
+                )
+            connection.sendall(json.dumps(request).encode() + b"\n")
+            with connection.makefile("rb") as replies:
+                reply = replies.readline()
+    except (FileNotFoundError, ConnectionRefusedError):
+        return None
+    if not reply:
+        raise ConnectionError(f"The clickqtfy daemon at '{path}' closed the connection")
+    return json.loads(reply)
+
+
+def start_daemon(path: str) -> subprocess.Popen:
+    """
+    Starts a daemon that listens on `path` in a new session, so it outlives the calling process.
+    """
+    return subprocess.Popen(  # pylint: disable=consider-using-with
+        [sys.executable, "-m", "clickqt.core.daemon", path],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+def open_in_daemon(
+    entrypoint: str,
+    funcname: t.Optional[str],
+    custom_gui: t.Optional[str] = None,
+    path: t.Optional[str] = None,
+) -> bool:
+    """
+    Lets the daemon at `path` (defaults to `daemon_socket_path()`) open the window of the target, the daemon is started
+    if it isn't running. Returns False if no daemon could be reached or the socket isn't private (see `private_directory()`
+    and `request_daemon()`), raises `click.ClickException` if the target can't be opened.
+    """
+    request = {
+        "entrypoint": entrypoint,
+        "funcname": funcname,
+        "custom_gui": custom_gui,
+        "cwd": os.getcwd(),
+    }
+    try:
+        path = path or daemon_socket_path()
+        reply = request_daemon(request, path)
+        if reply is None:
+            process = start_daemon(path)
+            deadline = time.monotonic() + DAEMON_START_TIMEOUT
+            while reply is None and time.monotonic() < deadline:
+                # A daemon that exits at once found another daemon that was started at the same time
+                exited = process.poll() is not None
+                reply = request_daemon(request, path)
+                if exited:
+                    break
+                time.sleep(0.05)
+    except PermissionError as e:
+        click.echo(f"clickqtfy: {e}", err=True)
+        return False
+    if reply is None:
+        return False
+    if not reply["ok"]:
+        raise click.ClickException(reply["error"])
+    return True
+
+
 def get_command_from_entrypoint(epname: str) -> click.Command:
     """
     Returns the click.Command specified by `epname`.
     If `epname` is not a click.Command, raises `ImportError`.
     """
+    return validate_entrypoint(load_entrypoint(find_entrypoint(epname)))
+
+
+def find_entrypoint(epname: str) -> metadata.EntryPoint:
+    """
+    Returns the installed entry point named `epname` without loading it.
+    If there is no such entry point, raises `ImportError`.
+    """
     eps = get_entrypoints_from_name(epname)
     if len(eps) == 0:
         raise ImportError(f"No entry point named '{epname}' found.")
@@ -69,38 +417,125 @@ def get_command_from_entrypoint(epname: str) -> click.Command:
         raise ImportError(
             f"No entry point named '{epname}' found. Similar ones:\n{concateps}"
         )
-    return validate_entrypoint(eps[0].load())
+    return eps[0]
 
 
 def get_entrypoints_from_name(epname: str) -> list[metadata.EntryPoint]:
     """
     Returns the entrypoints that include `epname` in their name.
     """
-    grouped_eps = metadata.entry_points()
     candidates: list[metadata.EntryPoint] = []
-    for group in grouped_eps.values():
-        for entrypoint in group:
-            if entrypoint.name == epname:
-                return [entrypoint]
-            if epname in entrypoint.name or epname in entrypoint.value:
-                candidates.append(entrypoint)
+    for entrypoint in installed_entrypoints():
+        if entrypoint.name == epname:
+            return [entrypoint]
+        if epname in entrypoint.name or epname in entrypoint.value:
+            candidates.append(entrypoint)
     return candidates
 
 
+@functools.lru_cache(maxsize=None)
+def installed_entrypoints() -> tuple[metadata.EntryPoint, ...]:
+    """
+    Returns all installed entry points, the installed packages are scanned only once per process.
+    """
+    eps = metadata.entry_points()
+    if isinstance(eps, dict):  # Python < 3.12: group -> entry points
+        return tuple(ep for group in dict.values(eps) for ep in group)
+    return tuple(eps)
+
+
+def load_entrypoint(entrypoint: metadata.EntryPoint) -> t.Any:
+    """
+    Returns the object of `entrypoint`, it is loaded only once per process.
+    """
+    with _cache_lock:
+        if entrypoint.value not in _entrypoint_objects:
+            _entrypoint_objects[entrypoint.value] = entrypoint.load()
+        return _entrypoint_objects[entrypoint.value]
+
+
 def get_gui_specs_from_entrypoint(epname: str):
     """
-    Returns the click.Command specified by `epname`.
-    If `epname` is not a click.Command, raises `ImportError`.
+    Returns the custom mapping of the Control specified by `epname`.
+    If `epname` is not a Control, raises `TypeError`.
     """
-    eps = get_entrypoints_from_name(epname)
-    if len(eps) == 0:
-        raise ImportError(f"No entry point named '{epname}' found.")
-    if len(eps) > 1 or (len(eps) == 1 and eps[0].name != epname):
-        concateps = "\n".join([ep.name for ep in eps])
+    return validate_gui_ep(load_entrypoint(find_entrypoint(epname)))
+
+
+def compile_module(eppath: str) -> tuple[ModuleSpec, CodeType]:
+    """
+    Returns the spec and the code of the file `eppath` without running it.
+    The code is taken from the bytecode cache if it is up to date.
+    """
+    spec = util.spec_from_file_location(MODULE_NAME, eppath)
+    return spec, spec.loader.get_code(MODULE_NAME)
+
+
+def module_code(name: str) -> t.Optional[CodeType]:
+    """
+    Returns the code of the module `name` without running it (its parent packages are imported),
+    None if the module has no Python code (e.g. an extension module).
+    """
+    spec = util.find_spec(name)
+    if spec is None or not hasattr(spec.loader, "get_code"):
+        return None
+    return spec.loader.get_code(name)
+
+
+def imports_qt(code: t.Optional[CodeType]) -> bool:
+    """
+    Returns whether the module `code` imports Qt or clickqt at module level, then it may create Qt objects when it is run
+    and has to be run by the main thread. Returns True if `code` is None (unknown).
+    """
+    if code is None:
+        return True
+    return any(name.split(".")[0] in QT_MODULES for name in code.co_names)
+
+
+def exec_module(spec: ModuleSpec, code: CodeType) -> ModuleType:
+    """
+    Runs `code`, the code of the file of `spec` (see `compile_module`), as module and returns the module.
+    """
+    module = util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    exec(code, module.__dict__)  # pylint: disable=exec-used
+    return module
+
+
+def load_module(
+    eppath: str, compiled: t.Optional[tuple[ModuleSpec, CodeType]] = None
+) -> ModuleType:
+    """
+    Returns the module of the file `eppath`, the file is run only once per process.
+    `compiled` is the result of `compile_module` for the file, if it is already known.
+    """
+    key = os.path.realpath(eppath)
+    with _cache_lock:
+        if key not in _modules:
+            _modules[key] = exec_module(*(compiled or compile_module(eppath)))
+        return _modules[key]
+
+
+def forget_targets():
+    """
+    Forgets all loaded files and entry point objects, the next load runs them again.
+    """
+    with _cache_lock:
+        _modules.clear()
+        _entrypoint_objects.clear()
+        sys.modules.pop(MODULE_NAME, None)
+
+
+def get_module_attribute(module: ModuleType, name: str) -> t.Any:
+    """
+    Returns the attribute `name` of the imported file `module`, raises `ImportError` if it doesn't exist.
+    """
+    entrypoint = getattr(module, name, None)
+    if entrypoint is None:
         raise ImportError(
-            f"No entry point named '{epname}' found. Similar ones:\n{concateps}"
+            f"Module '{module.__spec__.origin}' does not contain the entry point '{name}'."
         )
-    return validate_gui_ep(eps[0].load())
+    return entrypoint
 
 
 def get_command_from_path(eppath: str, epname: str) -> click.Command:
@@ -108,34 +543,14 @@ def get_command_from_path(eppath: str, epname: str) -> click.Command:
     Returns the entrypoint given by the file path and the function name,
     or raises `ImportError` if the endpoint is not a `click.Command`.
     """
-    modulename = "clickqtfy.imported_module"
-    spec = util.spec_from_file_location(modulename, eppath)
-    module = util.module_from_spec(spec)
-    sys.modules[modulename] = module
-    spec.loader.exec_module(module)
-    entrypoint = getattr(module, epname, None)
-    if entrypoint is None:
-        raise ImportError(
-            f"Module '{spec.origin}' does not contain the entry point '{epname}'."
-        )
-    return validate_entrypoint(entrypoint)
+    return validate_entrypoint(get_module_attribute(load_module(eppath), epname))
 
 
 def get_gui_specs_from_path(eppath: str, epname: str):
     """
     Returns the entpoint pointing to a Control() object, or raises `ImportError` if it doesn't.
     """
-    modulename = "clickqtfy.imported_module"
-    spec = util.spec_from_file_location(modulename, eppath)
-    module = util.module_from_spec(spec)
-    sys.modules[modulename] = module
-    spec.loader.exec_module(module)
-    entrypoint = getattr(module, epname, None)
-    if entrypoint is None:
-        raise ImportError(
-            f"Module '{spec.origin}' does not contain the entry point '{epname}'."
-        )
-    return validate_gui_ep(entrypoint)
+    return validate_gui_ep(get_module_attribute(load_module(eppath), epname))
 
 
 def validate_entrypoint(entrypoint):
@@ -148,6 +563,10 @@ def validate_entrypoint(entrypoint):
 
 
 def validate_gui_ep(entrypoint):
+    from clickqt.core.control import (  # pylint: disable=import-outside-toplevel
+        Control,
+    )
+
     if not isinstance(entrypoint, Control):
         raise TypeError(f"Entry point '{entrypoint}' is not a Control")
     return entrypoint.custom_mapping
@@ -1 +1,16 @@
-from .focusoutvalidator import FocusOutValidator
+import typing as t
+
+if t.TYPE_CHECKING:
+    from .focusoutvalidator import FocusOutValidator
+
+
+def __getattr__(name: str) -> t.Any:
+    # Imported on first use, it needs PySide6.QtWidgets
+    if name == "FocusOutValidator":
+        from .focusoutvalidator import (  # pylint: disable=import-outside-toplevel
+            FocusOutValidator,
+        )
+
+        globals()[name] = FocusOutValidator
+        return FocusOutValidator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
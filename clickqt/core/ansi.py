@@ -0,0 +1,285 @@
+""" Contains the AnsiParser and AnsiTextWriter classes. """
+from __future__ import annotations
+
+import re
+import typing as t
+
+from PySide6.QtGui import QColor, QFont, QTextCharFormat, QTextCursor
+
+# Control Sequence Introducer sequences, e.g. '\x1b[1;31m' (SGR) or '\x1b[2K'
+_CSI = re.compile(r"\x1b\[([0-9;:?]*)([@-~])")
+# Beginning of an escape sequence whose remaining characters are in the next chunk
+_PARTIAL_CSI = re.compile(r"\x1b(\[[0-9;:?]*)?")
+
+# 16 standard colors (normal + bright), xterm defaults
+_BASIC_COLORS = (
+    (0, 0, 0),
+    (205, 0, 0),
+    (0, 205, 0),
+    (205, 205, 0),
+    (0, 0, 238),
+    (205, 0, 205),
+    (0, 205, 205),
+    (229, 229, 229),
+    (127, 127, 127),
+    (255, 0, 0),
+    (0, 255, 0),
+    (255, 255, 0),
+    (92, 92, 255),
+    (255, 0, 255),
+    (0, 255, 255),
+    (255, 255, 255),
+)
+_CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+
+#: A run of text with its format, a format of None marks a carriage return (= the current line will be overwritten)
+TextRun = t.Tuple[str, t.Optional[QTextCharFormat]]
+
+
+def color_256(index: int) -> QColor:
+    """Returns the color with the index **index** of the xterm 256 color palette."""
+
+    if index < 16:
+        return QColor(*_BASIC_COLORS[index])
+    if index < 232:
+        index -= 16
+        return QColor(
+            _CUBE_LEVELS[index // 36],
+            _CUBE_LEVELS[(index // 6) % 6],
+            _CUBE_LEVELS[index % 6],
+        )
+    gray = 8 + 10 * (min(index, 255) - 232)
+    return QColor(gray, gray, gray)
+
+
+class AnsiParser:
+    """Streaming parser for text containing ANSI escape sequences (e.g. produced by click.style or click.secho).
+    SGR sequences (colors, bold, italic, underline, ...) are converted into QTextCharFormat objects, all other
+    control sequences are removed. Escape sequences may be split over several chunks, the style persists between chunks.
+
+    :param color: The default foreground color
+    """
+
+    def __init__(self, color: QColor):
+        self.color = QColor(color)
+        self.__pending = ""
+        self.__formats: dict[tuple, QTextCharFormat] = {}  # One format object per style
+        self.reset()
+
+    def reset(self):
+        """Resets the style to the default style and drops incomplete escape sequences."""
+
+        self.__pending = ""
+        self.__reset_style()
+
+    def flush(self):
+        """Ends the stream (e.g. when a run has finished) and drops the text held back for the next chunk:
+        A trailing carriage return has no visible effect at the end of the stream and an incomplete escape sequence
+        is never completed. The style is kept.
+        """
+
+        self.__pending = ""
+
+    def __reset_style(self):
+        self.foreground: t.Optional[QColor] = None
+        self.background: t.Optional[QColor] = None
+        self.bold = False
+        self.dim = False
+        self.italic = False
+        self.underline = False
+        self.strikeout = False
+        self.inverse = False
+        self.__format = self.__build_format()
+
+    def feed(self, text: str) -> list[TextRun]:
+        """Parses the next chunk of the stream and returns the formatted text runs.
+
+        :param text: The next chunk
+        """
+
+        if self.__pending:
+            text = self.__pending + text
+            self.__pending = ""
+
+        if text.endswith(("\r", "\x1b")) or "\x1b" in text[-32:]:
+            text = self.__hold_back(text)
+
+        if "\x1b" not in text:  # Fast path: no escape sequence
+            return self.__plain(text)
+
+        runs: list[TextRun] = []
+        pos = 0
+        for match in _CSI.finditer(text):
+            if match.start() > pos:
+                runs.extend(self.__plain(text[pos : match.start()]))
+            # Private sequences ('\x1b[?...m') are ignored
+            if match.group(2) == "m" and "?" not in match.group(1):
+                self.__apply_sgr(match.group(1))
+            pos = match.end()
+        if pos < len(text):
+            runs.extend(self.__plain(text[pos:]))
+
+        return runs
+
+    def __hold_back(self, text: str) -> str:
+        """Keeps an incomplete escape sequence or a trailing carriage return ('\\r\\n' might be split) for the next chunk."""
+
+        if (esc := text.rfind("\x1b")) != -1 and _PARTIAL_CSI.fullmatch(text, esc):
+            self.__pending = text[esc:]
+            return text[:esc]
+        if text.endswith("\r"):
+            self.__pending = "\r"
+            return text[:-1]
+        return text
+
+    def __plain(self, text: str) -> list[TextRun]:
+        if not text:
+            return []
+        if "\r" not in text:
+            return [(text, self.__format)]
+
+        runs: list[TextRun] = []
+        for i, part in enumerate(text.replace("\r\n", "\n").split("\r")):
+            if i > 0:
+                runs.append(("", None))
+            if part:
+                runs.append((part, self.__format))
+        return runs
+
+    def __apply_sgr(self, params: str):
+        codes = [int(code) if code else 0 for code in re.split("[;:]", params)]
+        i = 0
+        while i < len(codes):
+            code = codes[i]
+            if code == 0:
+                self.__reset_style()
+            elif code == 1:
+                self.bold = True
+            elif code == 2:
+                self.dim = True
+            elif code == 3:
+                self.italic = True
+            elif code == 4:
+                self.underline = True
+            elif code == 7:
+                self.inverse = True
+            elif code == 9:
+                self.strikeout = True
+            elif code == 22:
+                self.bold = self.dim = False
+            elif code == 23:
+                self.italic = False
+            elif code == 24:
+                self.underline = False
+            elif code == 27:
+                self.inverse = False
+            elif code == 29:
+                self.strikeout = False
+            elif 30 <= code <= 37:
+                self.foreground = color_256(code - 30)
+            elif 90 <= code <= 97:
+                self.foreground = color_256(code - 90 + 8)
+            elif code == 39:
+                self.foreground = None
+            elif 40 <= code <= 47:
+                self.background = color_256(code - 40)
+            elif 100 <= code <= 107:
+                self.background = color_256(code - 100 + 8)
+            elif code == 49:
+                self.background = None
+            elif code in (38, 48):
+                color, i = self.__extended_color(codes, i)
+                if color is not None:
+                    if code == 38:
+                        self.foreground = color
+                    else:
+                        self.background = color
+            i += 1
+
+        self.__format = self.__build_format()
+
+    @staticmethod
+    def __extended_color(codes: list[int], i: int) -> tuple[t.Optional[QColor], int]:
+        """Parses '38;5;n' and '38;2;r;g;b', returns the color and the index of the last consumed code."""
+
+        if i + 2 < len(codes) and codes[i + 1] == 5:
+            return color_256(codes[i + 2]), i + 2
+        if i + 4 < len(codes) and codes[i + 1] == 2:
+            return QColor(*(min(c, 255) for c in codes[i + 2 : i + 5])), i + 4
+        return None, len(codes)
+
+    def __build_format(self) -> QTextCharFormat:
+        foreground = self.foreground if self.foreground is not None else self.color
+        background = self.background
+        if self.inverse:
+            foreground, background = (
+                background if background is not None else QColor("white"),
+                foreground,
+            )
+
+        key = (
+            foreground.rgba(),
+            background.rgba() if background is not None else None,
+            self.bold,
+            self.dim,
+            self.italic,
+            self.underline,
+            self.strikeout,
+        )
+        if (fmt := self.__formats.get(key)) is None:
+            fmt = QTextCharFormat()
+            fmt.setForeground(foreground.darker(150) if self.dim else foreground)
+            if background is not None:
+                fmt.setBackground(background)
+            if self.bold:
+                fmt.setFontWeight(QFont.Weight.Bold)
+            fmt.setFontItalic(self.italic)
+            fmt.setFontUnderline(self.underline)
+            fmt.setFontStrikeOut(self.strikeout)
+            self.__formats[key] = fmt
+
+        return fmt
+
+
+class AnsiTextWriter:
+    """Inserts text with ANSI escape sequences into a QTextDocument.
+    Every default color (= stream, e.g. stdout or stderr) has its own :class:`~clickqt.core.ansi.AnsiParser`.
+    """
+
+    def __init__(self):
+        self.parsers: dict[int, AnsiParser] = {}
+
+    def reset(self):
+        """Resets the style of all streams."""
+
+        for parser in self.parsers.values():
+            parser.reset()
+
+    def flush(self):
+        """Ends the streams, see :func:`~clickqt.core.ansi.AnsiParser.flush`."""
+
+        for parser in self.parsers.values():
+            parser.flush()
+
+    def insert(self, cursor: QTextCursor, text: str, color: QColor):
+        """Inserts **text** at the position of **cursor**.
+
+        :param cursor: The cursor, should be at the end of the document
+        :param text: The text, may contain ANSI escape sequences
+        :param color: The default color of the stream the text was written to
+        """
+
+        if (parser := self.parsers.get(color.rgba())) is None:
+            parser = self.parsers[color.rgba()] = AnsiParser(color)
+
+        for run, fmt in parser.feed(text):
+            if (
+                fmt is None
+            ):  # Carriage return: Overwrite the current line (e.g. progress bars)
+                cursor.movePosition(
+                    QTextCursor.MoveOperation.StartOfBlock,
+                    QTextCursor.MoveMode.KeepAnchor,
+                )
+                cursor.removeSelectedText()
+            else:
+                cursor.insertText(run, fmt)
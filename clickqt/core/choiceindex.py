@@ -0,0 +1,123 @@
+""" Contains the ChoiceIndex class. """
+from __future__ import annotations
+
+from bisect import bisect_left
+import re
+import typing as t
+import weakref
+
+import click
+
+
+class ChoiceIndex:
+    """Lookup table of the normalized choices of a click.Choice, so a value is validated in O(1) instead of normalizing all choices
+    like click.Choice.convert does. Values are normalized the same way as in click: First by the token_normalize_func of the context,
+    then they are casefolded if the choice is not case sensitive.
+
+    :param choice: The click.Choice object
+    :param ctx: The context whose token_normalize_func should be considered, defaults to None
+    """
+
+    def __init__(self, choice: click.Choice, ctx: t.Optional[click.Context] = None):
+        self.choice = choice
+        self.choices: t.Sequence[str] = choice.choices
+        self.size = len(self.choices)
+        self.case_sensitive = choice.case_sensitive
+        self.normalize_func = None if ctx is None else ctx.token_normalize_func
+
+        #: Normalized choice -> row of the choice (the last one wins, like in click)
+        self.rows: dict[str, int] = {}
+        for row, choice_str in enumerate(self.choices):
+            self.rows[self.normalize(choice_str)] = row
+        self.__sorted_keys: t.Optional[list[str]] = None
+
+    def normalize(self, value: str) -> str:
+        """Returns the normalized **value**."""
+
+        if self.normalize_func is not None:
+            value = self.normalize_func(value)
+        return value if self.case_sensitive else value.casefold()
+
+    def is_outdated(self, choice: click.Choice, ctx: t.Optional[click.Context]) -> bool:
+        """Returns True if the index doesn't match **choice** or the token_normalize_func of **ctx** anymore."""
+
+        return (
+            choice.choices is not self.choices
+            or len(choice.choices) != self.size
+            or choice.case_sensitive != self.case_sensitive
+            or (None if ctx is None else ctx.token_normalize_func)
+            is not self.normalize_func
+        )
+
+    def find(self, value: t.Any) -> t.Optional[int]:
+        """Returns the row of the choice **value** stands for, None if it isn't a valid choice."""
+
+        if not isinstance(value, str):
+            return None
+        return self.rows.get(self.normalize(value))
+
+    def convert(
+        self,
+        value: t.Any,
+        param: t.Optional[click.Parameter] = None,
+        ctx: t.Optional[click.Context] = None,
+    ) -> t.Any:
+        """Same as click.Choice.convert, but a valid value is looked up in O(1).
+        Other values are passed to click.Choice.convert, which raises the usual error.
+        """
+
+        if (row := self.find(value)) is not None and not self.is_outdated(
+            self.choice, ctx
+        ):
+            return self.choices[row]
+        return type(self.choice).convert(self.choice, value, param, ctx)
+
+    def match(self, text: str, limit: int = 50) -> list[str]:
+        """Returns up to **limit** choices that start with **text** (in alphabetical order of the normalized choices),
+        followed by choices that contain the characters of **text** in the same order (fuzzy matching).
+
+        :param text: The typed text
+        :param limit: Maximum number of returned choices
+        """
+
+        if self.__sorted_keys is None:
+            self.__sorted_keys = sorted(self.rows)
+        keys = self.__sorted_keys
+        prefix = self.normalize(text)
+
+        rows: list[int] = []
+        i = bisect_left(keys, prefix)
+        while i < len(keys) and len(rows) < limit and keys[i].startswith(prefix):
+            rows.append(self.rows[keys[i]])
+            i += 1
+
+        if len(rows) < limit and prefix:
+            pattern = re.compile(".*?".join(map(re.escape, prefix)))
+            found = set(rows)
+            for key in keys:
+                if pattern.search(key) and self.rows[key] not in found:
+                    rows.append(self.rows[key])
+                    if len(rows) == limit:
+                        break
+
+        return [self.choices[row] for row in rows]
+
+
+_indexes: weakref.WeakKeyDictionary[
+    click.Choice, ChoiceIndex
+] = weakref.WeakKeyDictionary()
+
+
+def choice_index(
+    choice: click.Choice, ctx: t.Optional[click.Context] = None
+) -> ChoiceIndex:
+    """Returns the :class:`~clickqt.core.choiceindex.ChoiceIndex` of **choice** and **ctx**, the index is built once per choice.
+
+    :param choice: The click.Choice object
+    :param ctx: The context whose token_normalize_func should be considered, defaults to None
+    """
+
+    index = _indexes.get(choice)
+    if index is None or index.is_outdated(choice, ctx):
+        index = _indexes[choice] = ChoiceIndex(choice, ctx)
+    return index
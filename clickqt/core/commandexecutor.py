@@ -3,36 +3,126 @@ from __future__ import annotations
 import sys
 import typing as t
 import traceback
+from contextlib import ExitStack
 import click
 from PySide6.QtCore import Signal, QObject, Slot
 
+from clickqt.core.output import OutputTarget, route_output
+from clickqt.core.logtee import RunLog, tee_output
+
+
+class ExecutionStep:
+    """A command of the executed command hierarchy together with the values for its callback.
+
+    :param command: The click command
+    :param info_name: The name of the command as it is used on the command line
+    :param params: Parameter name to value, stored in the context of the command (ctx.params)
+    :param args: The positional arguments of the callback
+    :param kwargs: The keyword arguments of the callback
+    :param resources: Objects that are closed when the run is done, e.g. streams that replace sys.stdin, defaults to ()
+    """
+
+    def __init__(
+        self,
+        command: click.Command,
+        info_name: str,
+        params: dict[str, t.Any],
+        args: t.Sequence[t.Any],
+        kwargs: dict[str, t.Any],
+        resources: t.Sequence[t.IO[t.Any]] = (),
+    ):
+        self.command = command
+        self.info_name = info_name
+        self.params = params
+        self.args = args
+        self.kwargs = kwargs
+        self.resources = resources
+
 
 class CommandExecutor(QObject):
-    """Worker which executes the received tasks/callbacks"""
+    """Worker which executes the callbacks of the received command hierarchy
+
+    :param output: Receives everything the callbacks write to sys.stdout and sys.stderr, defaults to None (= the terminal output of the GUI)
+    :param log: Log of the run, receives everything the callbacks write and will be closed after the execution, defaults to None (= no log)
+    """
 
     finished: Signal = Signal()
     # Internal Qt-signal emitted when :func:`~clickqt.core.commandexecutor.CommandExecutor.run`-Slot has finished
+    resultReady: Signal = Signal(object)
+    # Internal Qt-signal emitted before finished when the selected command returned a value (!= None)
 
-    @Slot(list, click.Context)
+    def __init__(
+        self, output: t.Optional[OutputTarget] = None, log: t.Optional[RunLog] = None
+    ):
+        super().__init__()
+
+        self.output = output
+        self.log = log
+        #: True, if the last execution was terminated by an exception
+        self.failed: bool = False
+        #: Return value of the callback of the selected command (= last step)
+        self.result: t.Any = None
+
+    @Slot(list)
     def run(
-        self, tasks: t.Iterable[t.Callable], ctx: click.Context
+        self, steps: t.Sequence[ExecutionStep]
     ):  # pragma: no cover; Tested in test_execution.py
-        """Pushes the current context on the click internal stack and executes the received tasks.
+        """Executes the received steps (root command to selected command) like click.Group.invoke does:
+        Every command gets its own click.Context whose parent is the context of the previous command. The context of a subcommand is
+        created after the callback of its group has finished, so values the group stores in ctx.obj are inherited by the subcommand.
+        The contexts keep the ANSI styles of click.style/click.secho, they are rendered by the output and removed for streams which aren't terminals.
+        All contexts are pushed on the click internal stack and closed when the execution is done, as are the resources of all steps.
         When the execution is done, the finished signal will be emitted
 
-        :param tasks: The callbacks to execute
-        :param ctx: The current context which should be pushed on the click internal stack
+        :param steps: The commands to execute, ordered from root command to selected command
         """
 
-        # Push context of selected command, needed for @click.pass_context and @click.pass_obj
-        click.globals.push_context(ctx)
-
-        for task in tasks:
-            try:
-                task()
-            except SystemExit as e:
-                print(f"SystemExit-Exception, return code: {e.code}", file=sys.stderr)
-            except Exception as e:  # pylint: disable=broad-exception-caught
-                traceback.print_exc(file=sys.stderr)
+        with ExitStack() as stack:
+            if self.output is not None:
+                stack.enter_context(route_output(self.output))
+            stack.enter_context(tee_output(self.log))
+            for step in steps:
+                for resource in step.resources:
+                    stack.callback(resource.close)
+            self.result = None
+            self.failed = not self.__execute(steps)
 
+        if self.result is not None:
+            self.resultReady.emit(self.result)
         self.finished.emit()
+
+    def __execute(self, steps: t.Sequence[ExecutionStep]) -> bool:
+        try:
+            with ExitStack() as stack:
+                parent: t.Optional[click.Context] = None
+                for i, step in enumerate(steps):
+                    ctx = step.command.context_class(
+                        step.command,
+                        info_name=step.info_name,
+                        parent=parent,
+                        color=True,  # The output renders ANSI styles, see OutputStream.isatty
+                    )
+                    ctx.params = step.params
+                    if i + 1 < len(steps):
+                        ctx.invoked_subcommand = steps[i + 1].info_name
+
+                    # Needed for @click.pass_context, @click.pass_obj and click.get_current_context()
+                    stack.enter_context(ctx)
+                    if step.command.callback is not None:
+                        result = ctx.invoke(
+                            step.command.callback, *step.args, **step.kwargs
+                        )
+                        if i == len(steps) - 1:
+                            self.result = result
+                    parent = ctx
+        except SystemExit as e:
+            print(f"SystemExit-Exception, return code: {e.code}", file=sys.stderr)
+            return e.code in (None, 0)
+        except click.exceptions.Exit as e:
+            print(f"SystemExit-Exception, return code: {e.exit_code}", file=sys.stderr)
+            return e.exit_code == 0
+        except Exception:  # pylint: disable=broad-exception-caught
+            traceback.print_exc(file=sys.stderr)
+            return False
+
+        return True
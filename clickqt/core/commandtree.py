@@ -0,0 +1,116 @@
+""" Contains the CommandNode and CommandTree classes. """
+from __future__ import annotations
+
+import typing as t
+
+import click
+
+if t.TYPE_CHECKING:
+    from PySide6.QtWidgets import QTabWidget
+    from clickqt.widgets.basewidget import BaseWidget
+    from clickqt.core.executionplan import ExecutionPlan
+
+CommandPath = t.Tuple[str, ...]
+
+
+class CommandNode:
+    """A command of the command hierarchy together with the clickqt widgets of its parameters.
+
+    :param name: The name of the command as it is used on the command line
+    :param command: The click command of this node
+    :param parent: The node of the group which contains **command**, defaults to None (= root command)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        command: click.Command,
+        parent: t.Optional["CommandNode"] = None,
+    ):
+        self.name = name
+        self.command = command
+        self.parent = parent
+        self.children: dict[str, CommandNode] = {}
+        self.ordered_children: list[CommandNode] = []
+        #: Position of this node in the children of its parent (= tab index)
+        self.index: int = len(parent.children) if parent is not None else 0
+        #: Names of the components from the root command to this command
+        self.path: CommandPath = (parent.path if parent is not None else ()) + (name,)
+        #: Nodes from the root command to this command
+        self.lineage: t.Tuple[CommandNode, ...] = (
+            parent.lineage if parent is not None else ()
+        ) + (self,)
+
+        #: Parameter name to clickqt widget, None if the widgets were not created (yet)
+        self.widgets: t.Optional[dict[str, BaseWidget]] = None
+        #: Parameter name to (nargs, name of the parameter type)
+        self.param_infos: dict[str, tuple[int, str]] = {}
+        #: Precompiled execution plan, None if it has to be (re)built
+        self.plan: t.Optional[ExecutionPlan] = None
+        #: The QTabWidget containing the subcommands of a group
+        self.tab_widget: t.Optional[QTabWidget] = None
+
+    @property
+    def is_group(self) -> bool:
+        """True, if the command of this node is a click.Group."""
+
+        return isinstance(self.command, click.Group)
+
+    def child_at(self, index: int) -> "CommandNode":
+        """Returns the child at position **index**."""
+
+        return self.ordered_children[index]
+
+    def __repr__(self) -> str:
+        return f"CommandNode({':'.join(self.path)})"
+
+
+class CommandTree:
+    """The command hierarchy of a click command as tree of :class:`~clickqt.core.commandtree.CommandNode` objects
+    with an index from the path of a command to its node.
+
+    :param cmd: The root command
+    """
+
+    def __init__(self, cmd: click.Command):
+        self.index: dict[CommandPath, CommandNode] = {}
+        self.root = self.__add(cmd.name, cmd, None)
+
+    def __add(
+        self, name: str, cmd: click.Command, parent: t.Optional[CommandNode]
+    ) -> CommandNode:
+        node = CommandNode(name, cmd, parent)
+        assert node.path not in self.index, f"Not a unique command path ({node.path})"
+
+        if parent is not None:
+            parent.children[name] = node
+            parent.ordered_children.append(node)
+        self.index[node.path] = node
+
+        if isinstance(cmd, click.Group):
+            for subcmd_name, subcmd in cmd.commands.items():
+                self.__add(subcmd_name, subcmd, node)
+
+        return node
+
+    def __iter__(self) -> t.Iterator[CommandNode]:
+        """Iterates over all nodes in pre-order."""
+
+        return iter(self.index.values())
+
+    def __getitem__(self, path: CommandPath) -> CommandNode:
+        return self.index[path]
+
+    def resolve(self, names: t.Iterable[str]) -> CommandNode:
+        """Follows the subcommands in **names** from the root command as far as possible and returns the last matching node.
+
+        :param names: Command line components after the root command, e.g. ['sub_group', 'cmd', '--option', 'value']
+        """
+
+        node = self.root
+        for name in names:
+            if (child := node.children.get(name)) is None:
+                break
+            node = child
+
+        return node
@@ -1,12 +1,12 @@
 from __future__ import annotations
 
+import functools
+import io
 import typing as t
 import sys
 from functools import reduce
 import re
-import inspect
 import click
-from click_option_group._core import _GroupTitleFakeOption, GroupedOption
 from PySide6.QtWidgets import (
     QWidget,
     QFrame,
@@ -17,15 +17,22 @@ from PySide6.QtWidgets import (
     QSizePolicy,
     QLabel,
     QLayout,
+    QPlainTextDocumentLayout,
 )
 from PySide6.QtCore import QThread, QObject, Signal, Slot, Qt
-from PySide6.QtGui import QPalette, QClipboard
+from PySide6.QtGui import QPalette, QClipboard, QTextDocument
 
 from clickqt.core.gui import GUI
-from clickqt.core.commandexecutor import CommandExecutor
+from clickqt.core.commandexecutor import CommandExecutor, ExecutionStep
 from clickqt.core.error import ClickQtError
+from clickqt.core.commandtree import CommandNode, CommandTree
+from clickqt.core.executionplan import ExecutionPlan, WidgetKind
+from clickqt.core.navigator import CommandNavigator
+from clickqt.core.jobmanager import Job, JobManager, JobPanel, JobStatus
+from clickqt.core.output import route_output
+from clickqt.core.logtee import LogTee, RunLog
+from clickqt.core.utils import is_grouped_option, is_option_group_title
 from clickqt.widgets.basewidget import BaseWidget
-from clickqt.widgets.messagebox import MessageBox
 from clickqt.widgets.filefield import FileField
 
 
@@ -33,10 +40,20 @@ class Control(QObject):
     """Regulates the creation of the GUI with their widgets according to clicks parameter types and causes the execution/abortion of a selected command.
 
     :param cmd: The callback function from which a GUI should be created
+    :param custom_mapping: The dictionary containing the customized mapping from a user-defined click type to an intended Qt Widget
+    :param is_ep: Whether **ep_or_path** is the name of an entry point or a file path
+    :param ep_or_path: The entry point name or the file path of **cmd**
+    :param tree_navigator: Navigate through the command hierarchy with a tree view instead of nested QTabWidgets, defaults to False.
+                           The content of a command is created when it is selected for the first time.
+    :param job_limit: Enables the job manager, which runs up to **job_limit** commands at the same time (0 = number of CPUs).
+                      Every run gets its own output, status, elapsed time and cancel button. Defaults to None (= one run at a time)
+    :param log_tee: Writes the output of every run to its own log file, defaults to None (= no log files)
+    :param list_editors: Edit the values of multiple options in list editors instead of one widget per value, defaults to False
+    :param working_directory: Directory to which relative paths of the widgets are relative, defaults to None (= the working directory of the process)
     """
 
     #: Internal Qt-signal, which will be emitted when the :func:`~clickqt.core.control.Control.start_execution`-Slot was triggered and executed successfully.
-    requestExecution: Signal = Signal(list, click.Context)  # Generics do not work here
+    requestExecution: Signal = Signal(list)  # Generics do not work here
 
     def __init__(
         self,
@@ -44,12 +61,19 @@ class Control(QObject):
         custom_mapping: dict = None,
         is_ep: bool = True,
         ep_or_path: str = " ",
+        tree_navigator: bool = False,
+        job_limit: t.Optional[int] = None,
+        log_tee: t.Optional[LogTee] = None,
+        list_editors: bool = False,
+        working_directory: t.Optional[str] = None,
     ):
         """Initializing the GUI object and the registries together with the differentiation of a group command and a simple command."""
 
         super().__init__()
 
         self.gui = GUI()
+        self.gui.list_editors = list_editors
+        self.gui.working_directory = working_directory
         self.cmd = cmd
 
         self.is_ep = is_ep
@@ -64,6 +88,26 @@ class Control(QObject):
         # Otherwise "QThread: Destroyed while thread is still running" would be appear
         self.worker_thread: QThread = None
         self.worker: CommandExecutor = None
+        self.log_tee = log_tee
+        self.run_log: t.Optional[RunLog] = None
+
+        # Concurrent runs, each in its own thread
+        self.job_manager: t.Optional[JobManager] = None
+        self.shown_job: t.Optional[Job] = None
+        #: Document of the terminal output for the messages of the 'Copy'- and 'Import'-buttons, jobs have their own documents
+        self.message_document: t.Optional[QTextDocument] = None
+        if job_limit is not None:
+            self.job_manager = JobManager(job_limit)
+            self.job_manager.activityChanged.connect(self.jobs_changed)
+            self.gui.job_panel = JobPanel(self.job_manager)
+            self.gui.job_panel.jobSelected.connect(self.show_job)
+            self.job_manager.jobRemoved.connect(self.job_removed)
+            self.message_document = QTextDocument(self)
+            self.message_document.setDocumentLayout(
+                QPlainTextDocumentLayout(self.message_document)
+            )
+            self.gui.terminal_output.setDocument(self.message_document)
+            self.gui.search_bar.watch(self.message_document)
 
         # Connect GUI buttons with slots
         self.gui.run_button.clicked.connect(self.start_execution)
@@ -71,12 +115,20 @@ class Control(QObject):
         self.gui.copy_button.clicked.connect(self.construct_command_string)
         self.gui.import_button.clicked.connect(self.import_cmdline)
 
-        # Groups-Command-name concatinated with ":" to command-option-names to BaseWidget
-        self.widget_registry: dict[str, dict[str, BaseWidget]] = {}
-        self.command_registry: dict[str, dict[str, tuple[int, t.Callable]]] = {}
+        # Command hierarchy, every node stores the widgets of the parameters of its command
+        self.command_tree = CommandTree(cmd)
 
         # Add all widgets
-        self.parse(self.gui.widgets_container, cmd, cmd.name)
+        self.navigator: t.Optional[CommandNavigator] = None
+        if tree_navigator and self.command_tree.root.is_group:
+            self.navigator = CommandNavigator(self.create_navigator_page)
+            self.gui.widgets_container = self.navigator
+            self.navigator.add_node(self.command_tree.root)
+            self.navigator.select(
+                self.navigator.first_leaf(self.command_tree.root.path)
+            )
+        else:
+            self.parse(self.gui.widgets_container, self.command_tree.root)
 
         self.gui.construct()
 
@@ -94,37 +146,56 @@ class Control(QObject):
     def set_custom_mapping(self, custom_mapping):
         self.custom_mapping = custom_mapping
 
+    @property
+    def widget_registry(self) -> dict[str, dict[str, BaseWidget]]:
+        """Groups-Command-name concatenated with ':' to command-option-names to BaseWidget.
+        This is a view of :attr:`~clickqt.core.control.Control.command_tree`, commands whose widgets were not created (yet) are missing.
+        Command names containing ':' may collide, use :attr:`~clickqt.core.control.Control.command_tree` instead.
+        """
+
+        return {
+            self.hierarchy_to_str(list(node.path)): node.widgets
+            for node in self.command_tree
+            if node.widgets is not None
+        }
+
+    @property
+    def command_registry(self) -> dict[str, dict[str, tuple[int, str]]]:
+        """Groups-Command-name concatenated with ':' to command-option-names to (nargs, name of the parameter type).
+        See also :attr:`~clickqt.core.control.Control.widget_registry`.
+        """
+
+        return {
+            self.hierarchy_to_str(list(node.path)): node.param_infos
+            for node in self.command_tree
+            if node.widgets is not None
+        }
+
     def parameter_to_widget(
         self,
-        command: click.Command,
-        groups_command_name: str,
+        node: CommandNode,
         param: click.Parameter,
     ) -> QWidget:
         """Creates a clickqt widget according to :func:`~clickqt.core.gui.GUI.create_widget` and returns the container of the widget (label-element + Qt-widget).
 
-        :param command: The click command of the provided **param**
-        :param groups_command_name: The hierarchy of the **command** as string whereby the names of the components are
-                                    concatenated according to :func:`~clickqt.core.control.Control.concat`
+        :param node: The node of the click command of the provided **param**
         :param param: The click parameter whose type a clickqt widget should be created from
 
         :return: The container of the created widget (label-element + Qt-widget)
         """
 
         assert param.name, "No parameter name specified"
-        assert self.widget_registry[groups_command_name].get(param.name) is None
+        assert node.widgets.get(param.name) is None
 
         widget = self.gui.create_widget(
             param.type,
             param,
             widgetsource=self.gui.create_widget,
-            com=command,
+            com=node.command,
         )
 
-        self.widget_registry[groups_command_name][param.name] = widget
-        self.command_registry[groups_command_name][param.name] = (
-            param.nargs,
-            type(param.type).__name__,
-        )
+        node.widgets[param.name] = widget
+        node.param_infos[param.name] = (param.nargs, type(param.type).__name__)
 
         return widget.container
 
@@ -133,34 +204,22 @@ class Control(QObject):
 
         return a + ":" + b
 
-    def parse(
-        self,
-        tab_widget: QWidget,
-        cmd: click.Command,
-        group_name: str,
-        group_names_concatenated: str = "",
-    ):
-        if isinstance(cmd, click.Group):
+    def parse(self, tab_widget: QWidget, node: CommandNode):
+        cmd = node.command
+        if node.is_group:
             child_tabs: QWidget = None
-            concat_group_names = (
-                self.concat(group_names_concatenated, group_name)
-                if group_names_concatenated
-                else group_name
-            )
             if len(cmd.params) > 0:
                 child_tabs = QWidget()
                 child_tabs.setLayout(QVBoxLayout())
-                group_params = self.parse_cmd(cmd, concat_group_names)
+                group_params = self.parse_cmd(node)
                 group_params.widget().layout().setContentsMargins(0, 0, 0, 0)
                 group_params.setSizePolicy(
                     QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed
                 )  # Group params don't have to be resizable
                 child_tabs.layout().addWidget(group_params)
-                child_tabs.layout().addWidget(
-                    self.parse_cmd_group(cmd, concat_group_names)
-                )
+                child_tabs.layout().addWidget(self.parse_cmd_group(node))
             else:
-                child_tabs = self.parse_cmd_group(cmd, concat_group_names)
+                child_tabs = self.parse_cmd_group(node)
 
             child_tabs.setAutoFillBackground(True)
             child_tabs.setBackgroundRole(
@@ -170,56 +229,56 @@ class Control(QObject):
             if tab_widget == self.gui.widgets_container:
                 self.gui.widgets_container = child_tabs
             else:
-                tab_widget.addTab(child_tabs, group_name)
+                tab_widget.addTab(child_tabs, node.name)
         elif tab_widget == self.gui.widgets_container:
-            self.gui.widgets_container = self.parse_cmd(cmd, cmd.name)
+            self.gui.widgets_container = self.parse_cmd(node)
         else:
-            tab_widget.addTab(
-                self.parse_cmd(
-                    cmd,
-                    self.concat(group_names_concatenated, cmd.name)
-                    if group_names_concatenated
-                    else cmd.name,
-                ),
-                group_name,
+            tab_widget.addTab(self.parse_cmd(node), node.name)
+
+    def create_navigator_page(self, node: CommandNode) -> QWidget:
+        """Creates the page of the command of **node** for the :class:`~clickqt.core.navigator.CommandNavigator`.
+        Groups without parameters only show their help text.
+
+        :param node: The node of the command from which the page should be created
+
+        :returns: The created page
+        """
+
+        cmd = node.command
+        if node.is_group and len(cmd.params) == 0:
+            page = QLabel(
+                text=cmd.help.strip() if cmd.help else "<No docstring provided>"
             )
+            page.setAlignment(Qt.AlignmentFlag.AlignTop)
+            return page
+
+        return self.parse_cmd(node)
 
-    def parse_cmd_group(
-        self, cmdgroup: click.Group, group_names_concatenated: str
-    ) -> QTabWidget:
-        """Creates for every group in **cmdgroup** a QTabWidget instance and adds every command in **cmdgroup** as a tab to it.
+    def parse_cmd_group(self, node: CommandNode) -> QTabWidget:
+        """Creates for every group in the group of **node** a QTabWidget instance and adds every command of the group as a tab to it.
         The creation of the content of every tab is realized by calling :func:`~clickqt.core.control.Control.parse_cmd`.
         To realize command hierachies, this method is called recursively.
 
-        :param cmdgroup: The group from which a QTabWidget with content should be created
-        :param group_names_concatenated: The hierarchy of **cmdgroup** as string whereby the names of the components are
-                                         concatenated according to :func:`~clickqt.core.control.Control.concat`
+        :param node: The node of the group from which a QTabWidget with content should be created
 
-        :returns: A Qt-GUI representation in a QTabWidget of **cmdgroup**
+        :returns: A Qt-GUI representation in a QTabWidget of the group
         """
 
-        group_tab_widget = QTabWidget()
-        for group_name, group_cmd in cmdgroup.commands.items():
-            self.parse(
-                group_tab_widget, group_cmd, group_name, group_names_concatenated
-            )
+        node.tab_widget = QTabWidget()
+        for child in node.ordered_children:
+            self.parse(node.tab_widget, child)
 
-        return group_tab_widget
+        return node.tab_widget
 
-    def parse_cmd(
-        self,
-        cmd: click.Command,
-        groups_command_name: str,
-    ) -> QScrollArea:
-        """Creates for every click parameter in **cmd** a clickqt widget and returns them stored in a QScrollArea.
+    def parse_cmd(self, node: CommandNode) -> QScrollArea:
+        """Creates for every click parameter in the command of **node** a clickqt widget and returns them stored in a QScrollArea.
         The widgets are divided into a "Required arguments", "Optional arguments" and "Option Group" part.
 
-        :param cmd: The command from which a QTabWidget with content should be created
-        :param groups_command_name: The hierarchy of **cmd** as string whereby the names of the components are
-                                    concatenated according to :func:`~clickqt.core.control.Control.concat`
+        :param node: The node of the command from which a QTabWidget with content should be created
 
         :returns: The created clickqt widgets stored in a QScrollArea
         """
+        cmd = node.command
         cmdbox = QWidget()
         cmdbox.setLayout(QVBoxLayout())
         cmdbox.layout().setAlignment(Qt.AlignmentFlag.AlignTop)
@@ -241,12 +300,11 @@ class Control(QObject):
 
         INITIAL_CHILD_WIDGETS = len(required_box.children())  # layout, label, line
 
-        assert (
-            self.widget_registry.get(groups_command_name) is None
-        ), f"Not a unique group_command_name_concat ({groups_command_name})"
+        assert node.widgets is None, f"Widgets of {node} were already created"
 
-        self.widget_registry[groups_command_name] = {}
-        self.command_registry[groups_command_name] = {}
+        node.widgets = {}
+        node.param_infos = {}
+        node.plan = None
 
         # parameter name to flag values
         feature_switches: dict[str, QLayout] = {}
@@ -258,8 +316,8 @@ class Control(QObject):
             has_flag_value = hasattr(param, "flag_value")
             flag_value = param.flag_value if has_flag_value else None
             widget_required = param.required or isinstance(param, click.Argument)
-            is_option_group = isinstance(param, _GroupTitleFakeOption)
-            is_grouped_option = isinstance(param, GroupedOption)
+            is_option_group = is_option_group_title(param)
+            is_grouped = is_grouped_option(param)
             target_layout = (required_box if widget_required else optional_box).layout()
             created_widget = None
 
@@ -272,25 +330,19 @@ class Control(QObject):
                 feature_switches[param.name].append(param)
             else:
                 # most other params
-                created_widget = self.parameter_to_widget(
-                    cmd,
-                    groups_command_name,
-                    param,
-                )
+                created_widget = self.parameter_to_widget(node, param)
                 if is_option_group:
                     # the "heading" of the option group, creates a new section
                     current_option_group = param.name
                     option_group_layouts[current_option_group] = QVBoxLayout()
                 else:
-                    if is_grouped_option:
+                    if is_grouped:
                         # a member of an option group
                         assert (
                             current_option_group is not None
                         ), "Option groups are out of order!"
                         target_layout = option_group_layouts.get(current_option_group)
-                    self.widget_registry[groups_command_name][
-                        param.name
-                    ].set_enabled_changeable(
+                    node.widgets[param.name].set_enabled_changeable(
                         enabled=widget_required
                         or (
                             param.default
@@ -304,9 +356,7 @@ class Control(QObject):
                 target_layout.addWidget(created_widget)
 
         for keys, values in option_group_layouts.items():
-            self.widget_registry[groups_command_name][keys].widget.setContentLayout(
-                values
-            )
+            node.widgets[keys].widget.setContentLayout(values)
 
         # Create for every feature switch a ComboBox
         for param_name, switch_names in feature_switches.items():
@@ -320,13 +370,9 @@ class Control(QObject):
                 switch_names[0].flag_value,
             )  # First param with default==True is the default
             (required_box if choice.required else optional_box).layout().addWidget(
-                self.parameter_to_widget(
-                    cmd,
-                    groups_command_name,
-                    choice,
-                )
+                self.parameter_to_widget(node, choice)
             )
-            self.widget_registry[groups_command_name][param_name].set_value(default)
+            node.widgets[param_name].set_value(default)
         helptext = cmd.help
         cmdbox.layout().addWidget(
             QLabel(text=helptext.strip() if helptext else "<No docstring provided>")
@@ -343,6 +389,15 @@ class Control(QObject):
 
         return cmd_tab_widget
 
+    def execution_plan(self, node: CommandNode) -> ExecutionPlan:
+        """Returns the :class:`~clickqt.core.executionplan.ExecutionPlan` of the command of **node**.
+        The plan is built on the first call and reused until the widgets of the command change.
+        """
+
+        if node.plan is None:
+            node.plan = ExecutionPlan(node)
+        return node.plan
+
     def check_error(self, err: ClickQtError) -> bool:
         """Checks whether **err** contains an error and prints on error case the message of it to sys.stderr.
 
@@ -355,51 +410,32 @@ class Control(QObject):
 
         return False
 
-    def current_command_hierarchy(
-        self, tab_widget: QWidget, cmd: click.Command
-    ) -> list[click.Command]:
-        """Returns the hierarchy of the command of the selected tab as list whereby the order of the list is from root command
-        to the selected command.
-
-        :param tab_widget: The currend widget of the root-QTabWidget
-        :param cmd: The click command provided to :func:`~clickqt.core.control.Control`
-
-        :return: The hierarchy of the command of the selected tab as ordered list (root command to selected command)
-        """
-
-        if isinstance(cmd, click.Group):
-            if len(cmd.params) > 0:  # Group has params
-                tab_widget = tab_widget.findChild(QTabWidget)
-
-            assert isinstance(tab_widget, QTabWidget)
+    def current_node(self) -> CommandNode:
+        """Returns the node of the command of the selected tab (or the selected node of the tree navigator)."""
 
-            command = cmd.get_command(
-                ctx=None, cmd_name=tab_widget.tabText(tab_widget.currentIndex())
-            )
+        if self.navigator is not None:
+            return self.command_tree[self.navigator.current_path()]
 
-            return [cmd] + self.current_command_hierarchy(
-                tab_widget.currentWidget(), command
-            )
+        node = self.command_tree.root
+        while node.tab_widget is not None and node.ordered_children:
+            node = node.child_at(node.tab_widget.currentIndex())
 
-        return [cmd]
+        return node
 
     def select_current_command_hierarchy(
         self, commands: list[str]
     ) -> tuple[list[str], QWidget]:
         """Set up the tab widgets such that the command gets selected, up to `commands`."""
+        node = self.command_tree.resolve(commands)
+
+        if self.navigator is not None:
+            return list(node.path[1:]), self.navigator.select(node.path)
+
         widget = self.gui.widgets_container
-        fulfilled_cmds = []
-        for command in commands:
-            if not isinstance(widget, QTabWidget):
-                return fulfilled_cmds, widget
-            subcommands = [widget.tabText(i) for i in range(widget.count())]
-            if command not in subcommands:
-                return fulfilled_cmds, widget
-            tabidx = subcommands.index(command)
-            fulfilled_cmds.append(command)
-            widget.setCurrentIndex(tabidx)
-            widget = widget.currentWidget()
-        return fulfilled_cmds, widget
+        for child in node.lineage[1:]:
+            child.parent.tab_widget.setCurrentIndex(child.index)
+            widget = child.parent.tab_widget.currentWidget()
+        return list(node.path[1:]), widget
 
     def clean_command_string(self, word, text):
         """Returns a string without any special characters using regex."""
@@ -418,11 +454,16 @@ class Control(QObject):
         assert isinstance(command_hierarchy, list)
         return ":".join(command_hierarchy)
 
-    def command_to_cli_string(self, command_hierarchy: list[str]):
-        """Returns the click command line string corresponding to the current UI setup."""
+    def command_to_cli_string(self, node: t.Union[CommandNode, list[str]]):
+        """Returns the click command line string corresponding to the current UI setup.
+
+        :param node: The node of the command or its hierarchy (root command to command)
+        """
+        if not isinstance(node, CommandNode):
+            node = self.command_tree[tuple(node)]
+        command_hierarchy = list(node.path)
         param_strings = ""
-        hierarchy_str = self.hierarchy_to_str(command_hierarchy)
-        widgets = list(self.widget_registry[hierarchy_str].values())
+        widgets = node.widgets.values() if node.widgets is not None else ()
         for widget in filter(lambda widget: widget.is_enabled, widgets):
             param_strings += widget.get_widget_value_cmdline()
         msgpieces = []
@@ -445,8 +486,15 @@ class Control(QObject):
     def stop_execution(self):
         """Qt-Slot, which stops the execution of the command(-hierarchy) which is currently running."""
 
-        print("Execution stopped!", file=sys.stderr)
+        if self.job_manager is not None:
+            self.job_manager.cancel_all()
+            return
+
+        with route_output(self.gui.terminal_output):
+            print("Execution stopped!", file=sys.stderr)
         self.worker_thread.terminate()
+        if self.run_log is not None:
+            self.run_log.close()
         self.execution_finished()
 
     @Slot()
@@ -457,9 +505,11 @@ class Control(QObject):
 
         self.worker_thread.deleteLater()
         self.worker.deleteLater()
+        self.gui.terminal_output.ansi.flush()
 
         self.worker_thread = None
         self.worker = None
+        self.run_log = None
 
         self.gui.run_button.setEnabled(True)
         self.gui.stop_button.setEnabled(False)
@@ -468,122 +518,208 @@ class Control(QObject):
     def start_execution(self):
         """Qt-Slot, which validates the selected command hierarchy and causes (on success) their execution in another thread by
         emitting the :func:`~clickqt.core.control.Control.requestExecution`-Signal. Widgets that will show a dialog will be validated at last.
+        With the job manager, the run is submitted as new job instead (see :func:`~clickqt.core.control.Control.submit_job`).
         This slot is automatically executed when the user clicks on the 'Run'-button.
         """
 
+        if self.job_manager is not None:
+            self.submit_job()
+            return
+
         self.gui.terminal_output.clear()
+        self.gui.result_viewer.set_result(None)
 
-        hierarchy_selected_command = self.current_command_hierarchy(
-            self.gui.widgets_container, self.cmd
-        )
+        selected_node = self.current_node()
+        with route_output(self.gui.terminal_output):
+            steps = self.build_steps(selected_node)
+        if steps is not None:
+            self.gui.run_button.setEnabled(False)
+            self.gui.stop_button.setEnabled(True)
+
+            self.run_log = self.open_run_log(selected_node)
+            self.worker_thread = QThread()
+            self.worker_thread.start()
+            self.worker = CommandExecutor(
+                output=self.gui.terminal_output, log=self.run_log
+            )
+            self.worker.moveToThread(self.worker_thread)
+            self.worker.finished.connect(self.worker_thread.quit)
+            self.worker.finished.connect(self.execution_finished)
+            self.worker.resultReady.connect(self.gui.result_viewer.set_result)
+            self.requestExecution.connect(self.worker.run)
+
+            self.requestExecution.emit(steps)
+
+    def submit_job(self):
+        """Validates the selected command hierarchy and submits a new job to the job manager.
+        The output of the validation is part of the output of the job, a job that failed validation is shown as failed.
+        """
+
+        assert self.job_manager is not None
+
+        selected_node = self.current_node()
+        job = Job(self.command_to_cli_string(selected_node))
+        self.gui.search_bar.watch(job.document)  # Indexed while the output arrives
+        with route_output(job):
+            steps = self.build_steps(selected_node)
+
+        if steps is None:
+            job.set_status(JobStatus.FAILED)
+        else:
+            job.steps = steps
+            if self.log_tee is not None:  # The log is opened when the job starts
+                job.open_log = functools.partial(
+                    self.log_tee.open_run, selected_node.path, job.title
+                )
+        job.statusChanged.connect(self.job_status_changed)
+        self.job_manager.submit(job)
+
+    def open_run_log(self, node: CommandNode) -> t.Optional[RunLog]:
+        """Returns a new log for a run of the command of **node** or None, if runs are not logged."""
+
+        if self.log_tee is None:
+            return None
+        return self.log_tee.open_run(node.path, self.command_to_cli_string(node))
+
+    @Slot(QObject)
+    def show_job(self, job: Job):
+        """Qt-Slot, which shows the output of **job** in the terminal output."""
+
+        self.shown_job = job
+        self.gui.terminal_output.setDocument(job.document)
+        self.gui.search_bar.document_changed()
+        self.gui.result_viewer.set_result(job.result)
+
+    @Slot(QObject)
+    def job_removed(self, job: Job):
+        """Qt-Slot, which shows the messages instead of the output of **job** if it is shown, **job** is deleted afterwards."""
+
+        if job is self.shown_job:
+            self.show_messages()
+
+    def show_messages(self):
+        """Prepares the terminal output for the messages of the 'Copy'- and 'Import'-buttons.
+        Without the job manager, the terminal output is cleared. With the job manager, the message document is shown
+        instead of the output of a job, previous messages are kept.
+        """
+
+        if self.job_manager is None:
+            self.gui.terminal_output.clear()
+        elif self.shown_job is not None:
+            self.shown_job = None
+            self.gui.terminal_output.setDocument(self.message_document)
+            self.gui.search_bar.document_changed()
+            self.gui.result_viewer.set_result(None)
 
-        def run_command(
-            command: click.Command, hierarchy: list[str]
-        ) -> t.Optional[t.Callable]:
+    @Slot(QObject)
+    def job_status_changed(self, job: Job):
+        """Qt-Slot, which shows the return value of **job** when it has finished and its output is shown."""
+
+        if job is self.shown_job and job.is_done:
+            self.gui.result_viewer.set_result(job.result)
+
+    @Slot()
+    def jobs_changed(self):
+        """Qt-Slot, which enables the 'Stop'-button (= cancel all jobs) if there are running or queued jobs."""
+
+        self.gui.stop_button.setEnabled(self.job_manager.is_active())
+
+    def build_steps(
+        self, selected_node: CommandNode
+    ) -> t.Optional[list[ExecutionStep]]:
+        """Validates the widgets of the command hierarchy of **selected_node** (root command to selected command) and returns
+        the :class:`~clickqt.core.commandexecutor.ExecutionStep` of every command. Widgets that will show a dialog will be validated at last.
+
+        :return: The steps or None, if a value is invalid
+        """
+
+        # Only possible with the tree navigator
+        if selected_node.is_group and not selected_node.command.invoke_without_command:
+            print("Error: Missing command.", file=sys.stderr)
+            return None
+
+        def run_command(node: CommandNode) -> t.Optional[ExecutionStep]:
+            plan = self.execution_plan(node)
             kwargs: dict[str, t.Any] = {}
             has_error = False
+            # FileFields that will show an input dialog
+            stdin_widgets: list[FileField] = []
             dialog_widgets: list[BaseWidget] = []  # widgets that will show a dialog
-            hierarchy_str = self.hierarchy_to_str(hierarchy)
-
-            if (
-                self.widget_registry.get(hierarchy_str) is not None
-            ):  # Groups with no options are not in the dict
-                # Check the values of all non dialog widgets for errors
-                for option_name, widget in self.widget_registry[hierarchy_str].items():
-                    if not widget.is_enabled:
-                        kwargs[option_name] = widget.get_param_default(
-                            widget.param, () if widget.param.multiple else None
-                        )
-                        continue
-                    if isinstance(widget, MessageBox):
-                        dialog_widgets.append(
-                            widget
-                        )  # MessageBox widgets should be shown at last
-                    elif (
-                        isinstance(widget, FileField)
-                        and "r" in widget.type.mode
-                        and widget.get_widget_value() == "-"
+            # Files (incl. stdin streams) that are opened in the worker thread, closed after the run
+            resources: list[t.IO[t.Any]] = []
+
+            # Check the values of all non dialog widgets for errors
+            for option_name, widget, kind, expose_value, alternative in plan.entries:
+                if not widget.is_enabled:
+                    kwargs[option_name] = widget.get_param_default(
+                        widget.param, alternative
+                    )
+                elif kind == WidgetKind.DIALOG:
+                    dialog_widgets.append(
+                        widget
+                    )  # MessageBox widgets should be shown at last
+                elif kind == WidgetKind.STDIN and widget.get_widget_value() == "-":
+                    stdin_widgets.insert(
+                        0, widget
+                    )  # FileField widgets with input dialog should be shown at last, but before MessageBox widgets
+                else:
+                    widget_value, err = widget.get_value()
+                    has_error |= self.check_error(err)
+                    if isinstance(widget, FileField) and isinstance(
+                        widget_value, (io.IOBase, click.utils.LazyFile)
                     ):
-                        dialog_widgets.insert(
-                            0, widget
-                        )  # FileField widgets with input dialog should be shown at last, but before MessageBox widgets
-                    else:
-                        widget_value, err = widget.get_value()
-                        has_error |= self.check_error(err)
+                        resources.append(widget_value)
 
-                        if widget.param.expose_value:
-                            kwargs[option_name] = widget_value
+                    if expose_value:
+                        kwargs[option_name] = widget_value
 
-                if has_error:
+            if has_error:
+                return None
+
+            # Now check the values of all dialog widgets for errors
+            for widget in stdin_widgets + dialog_widgets:
+                widget_value, err = widget.get_value()
+                if isinstance(widget, FileField):
+                    assert callable(widget_value)
+                    widget_value, err = widget_value()
+                    if isinstance(widget_value, io.IOBase):
+                        resources.append(widget_value)
+
+                if self.check_error(err):
                     return None
 
-                # Now check the values of all dialog widgets for errors
-                for widget in dialog_widgets:
-                    widget_value, err = widget.get_value()
-                    if isinstance(widget, FileField):
-                        assert callable(widget_value)
-                        widget_value, err = widget_value()
-
-                    if self.check_error(err):
-                        return None
-
-                    if widget.param.expose_value:
-                        kwargs[widget.param.name] = widget_value
-
-            if len(callback_args := inspect.getfullargspec(command.callback).args) > 0:
-                args: list[t.Any] = []
-                for ca in callback_args:  # Bring the args in the correct order
-                    args.append(
-                        kwargs.pop(ca, None)
-                    )  # Remove explicitly mentioned args from kwargs
+                if widget.param.expose_value:
+                    kwargs[widget.param.name] = widget_value
+
+            step = plan.step(kwargs, resources)
+            if len(plan.callback_args) > 0:
                 print(
-                    f"For command details, please call '{self.command_to_string(hierarchy_str)} --help'"
+                    f"For command details, please call '{self.command_to_string(self.hierarchy_to_str(list(node.path)))} --help'"
                 )
-                print(self.command_to_cli_string(hierarchy))
-                return lambda: command.callback(*args, **kwargs)
-            return lambda: command.callback(  # pylint: disable=unnecessary-lambda
-                **kwargs
-            )
+                print(self.command_to_cli_string(node))
+            return step
 
-        callables: list[t.Callable] = []
-        for i, command in enumerate(hierarchy_selected_command, 1):
-            hierarchy = [g.name for g in hierarchy_selected_command[:i]]
-            if (c := run_command(command, hierarchy)) is not None:
-                callables.append(c)
+        steps: list[ExecutionStep] = []
+        for node in selected_node.lineage:
+            if (s := run_command(node)) is not None:
+                steps.append(s)
 
-        if len(callables) == len(hierarchy_selected_command):
-            self.gui.run_button.setEnabled(False)
-            self.gui.stop_button.setEnabled(True)
+        return steps if len(steps) == len(selected_node.lineage) else None
 
-            self.worker_thread = QThread()
-            self.worker_thread.start()
-            self.worker = CommandExecutor()
-            self.worker.moveToThread(self.worker_thread)
-            self.worker.finished.connect(self.worker_thread.quit)
-            self.worker.finished.connect(self.execution_finished)
-            self.requestExecution.connect(self.worker.run)
-
-            self.requestExecution.emit(
-                callables, click.Context(hierarchy_selected_command[-1])
-            )
-
-    def get_hierarchy(self):
-        return [
-            g.name
-            for g in self.current_command_hierarchy(
-                self.gui.widgets_container, self.cmd
-            )
-        ]
+    def get_hierarchy(self) -> list[str]:
+        """Returns the names of the selected command hierarchy (root command to selected command)."""
+        return list(self.current_node().path)
 
     def construct_command_string(self):
         """
         Build a shell-executable command from the current state of the GUI and put it into the clipboard.
         """
-        self.gui.terminal_output.clear()
-        message = self.command_to_cli_string(self.get_hierarchy())
-        clip_board = QApplication.clipboard()
-        clip_board.setText(message, QClipboard.Clipboard)
-        click.echo(f"Copied to clipboard: '{message}'")
+        self.show_messages()
+        with route_output(self.gui.terminal_output):
+            message = self.command_to_cli_string(self.current_node())
+            clip_board = QApplication.clipboard()
+            clip_board.setText(message, QClipboard.Clipboard)
+            click.echo(f"Copied to clipboard: '{message}'")
 
     def get_clipboard(self) -> str:
         """Obtain the clipboard as a string."""
@@ -591,49 +727,43 @@ class Control(QObject):
 
     def import_cmdline(self) -> None:
         """Set the values of the widgets according to the text in the clipboard."""
-        self.gui.terminal_output.clear()
-        cmdstr = self.get_clipboard()
-        click.echo(f"Importing '{cmdstr}' ...")
-        splitstrs = click.parser.split_arg_string(cmdstr)
-        click.echo(f"Read as: '{splitstrs}' ...")
-        error = ClickQtError()
-
-        # sanity checks
-        if self.is_ep:
-            if len(splitstrs) == 0 or splitstrs[0] != self.ep_or_path:
+        self.show_messages()
+        with route_output(self.gui.terminal_output):
+            cmdstr = self.get_clipboard()
+            click.echo(f"Importing '{cmdstr}' ...")
+            splitstrs = click.parser.split_arg_string(cmdstr)
+            click.echo(f"Read as: '{splitstrs}' ...")
+            error = ClickQtError()
+
+            # sanity checks
+            if self.is_ep:
+                if len(splitstrs) == 0 or splitstrs[0] != self.ep_or_path:
+                    error = ClickQtError(
+                        ClickQtError.ErrorType.PROCESSING_VALUE_ERROR,
+                        "Cannot import due to missing or wrong entry point name",
+                    )
+            elif len(splitstrs) <= 3:
                 error = ClickQtError(
                     ClickQtError.ErrorType.PROCESSING_VALUE_ERROR,
-                    "Cannot import due to missing or wrong entry point name",
+                    "Cannot import due to missing or wrong file/function combination",
                 )
-        elif len(splitstrs) <= 3:
-            error = ClickQtError(
-                ClickQtError.ErrorType.PROCESSING_VALUE_ERROR,
-                "Cannot import due to missing or wrong file/function combination",
-            )
-        if self.check_error(error):
-            return
-        if self.is_ep:
-            splitstrs.pop(0)
-        else:
-            splitstrs = splitstrs[2:]
-        click.echo(f"Arguments w/ command: {splitstrs}")
-        hierarchystrs, _ = self.select_current_command_hierarchy(splitstrs)
-        click.echo(f"Set tabs to: '{hierarchystrs}' from '{splitstrs}'")
-        for hierarchystr in hierarchystrs:
-            splitstrs.remove(hierarchystr)
-        click.echo(f"Arguments w/o command: {splitstrs}")
-        commandstr = self.hierarchy_to_str(hierarchystrs)
-
-        cmd: click.Group = self.cmd
-        for cmdname in hierarchystrs:
-            cmd = cmd.commands[cmdname]
-        ctx = click.Context(cmd)
-        cmd.parse_args(ctx, splitstrs[:])
-        if commandstr:
-            relevant_widgets = self.widget_registry[self.cmd.name + ":" + commandstr]
-        else:
-            relevant_widgets = self.widget_registry[self.cmd.name]
-
-        for paramname, paramvalue in ctx.params.items():
-            widget = relevant_widgets[paramname]
-            widget.set_value(paramvalue)
+            if self.check_error(error):
+                return
+            if self.is_ep:
+                splitstrs.pop(0)
+            else:
+                splitstrs = splitstrs[2:]
+            click.echo(f"Arguments w/ command: {splitstrs}")
+            hierarchystrs, _ = self.select_current_command_hierarchy(splitstrs)
+            click.echo(f"Set tabs to: '{hierarchystrs}' from '{splitstrs}'")
+            splitstrs = splitstrs[len(hierarchystrs) :]
+            click.echo(f"Arguments w/o command: {splitstrs}")
+
+            node = self.command_tree[(self.cmd.name, *hierarchystrs)]
+            ctx = click.Context(node.command)
+            node.command.parse_args(ctx, splitstrs[:])
+            relevant_widgets = node.widgets if node.widgets is not None else {}
+
+            for paramname, paramvalue in ctx.params.items():
+                widget = relevant_widgets[paramname]
+                widget.set_value(paramvalue)
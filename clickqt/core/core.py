@@ -8,6 +8,35 @@ from PySide6.QtGui import QIcon
 
 from clickqt.core.control import Control
 from clickqt.core.gui import CustomBindingType
+from clickqt.core.logtee import LogTee
+
+if t.TYPE_CHECKING:
+    from clickqt.core.shell import Shell
+
+
+def create_application(
+    application_name: t.Optional[str] = None, window_icon: t.Optional[str] = None
+) -> QApplication:
+    """Returns the QApplication, it is created if there is none yet.
+
+    :param application_name: Name of a new application, defaults to None (= 'python')
+    :param window_icon: Path to the icon of a new application, defaults to None (= no icon)
+    """
+
+    app = QApplication.instance()
+    if app is None:
+        # Testing: The testing suite creates a QApplication instance
+        app = QApplication([])
+        app.setWindowIcon(QIcon(window_icon))
+        app.setApplicationName(application_name)
+        app.setStyleSheet(
+            """QToolTip {
+                background-color: #182035;
+                color: white;
+                border: white solid 1px
+                }"""
+        )
+    return app
 
 
 def qtgui_from_click(
@@ -15,6 +44,12 @@ def qtgui_from_click(
     custom_mapping: t.Optional[dict[click.ParamType, CustomBindingType]] = None,
     application_name: t.Optional[str] = None,
     window_icon: t.Optional[str] = None,
+    tree_navigator: bool = False,
+    job_limit: t.Optional[int] = None,
+    log_tee: t.Optional[LogTee] = None,
+    list_editors: bool = False,
+    shell: t.Optional[Shell] = None,
+    working_directory: t.Optional[str] = None,
 ):
     """This function is used to generate the GUI for a given command. It takes a click command as its argument and returns a Control object
     that contains the GUI, execution logic, and the generated widgets used for the parameters of the command.
@@ -23,20 +58,32 @@ def qtgui_from_click(
     :param custom_mapping: The dictionary containing the customized mapping from a user-defined click type to an intended Qt Widget.
     :param application_name: Name of the application, defaults to None (= 'python')
     :param window_icon: Path to an icon, changes the icon of the application, defaults to None (= no icon)
+    :param tree_navigator: Navigate through the command hierarchy with a tree view instead of tabs, defaults to False.
+                           Recommended for groups with many subcommands, the content of a command is created on first selection.
+    :param job_limit: Run up to **job_limit** commands at the same time (0 = number of CPUs), every run is shown as job with its own output,
+                      status, elapsed time and cancel button. Defaults to None (= one run at a time)
+    :param log_tee: Writes stdout and stderr of every run to its own log file in the background (see :class:`~clickqt.core.logtee.LogTee`),
+                    defaults to None (= no log files)
+    :param list_editors: Edit the values of multiple options (multiple=True) in a list editor (a table for tuples) instead of
+                         one widget per value, recommended for options with thousands of values. Defaults to False
+    :param shell: Adds the GUI as tab to **shell** instead of showing it in its own window, several GUIs share one process
+                  and one window this way. Defaults to None (= own window)
+    :param working_directory: Directory to which relative paths of the widgets are relative,
+                              defaults to None (= the working directory of the process)
 
     :return: The control-object that contains the GUI
     """
-    if QApplication.instance() is None:
-        # Testing: The testing suite creates a QApplication instance
-        app = QApplication([])
-        app.setWindowIcon(QIcon(window_icon))
-        app.setApplicationName(application_name)
-        app.setStyleSheet(
-            """QToolTip {
-                background-color: #182035;
-                color: white;
-                border: white solid 1px
-                }"""
-        )
+    create_application(application_name, window_icon)
 
-    return Control(cmd, custom_mapping)
+    control = Control(
+        cmd,
+        custom_mapping,
+        tree_navigator=tree_navigator,
+        job_limit=job_limit,
+        log_tee=log_tee,
+        list_editors=list_editors,
+        working_directory=working_directory,
+    )
+    if shell is not None:
+        shell.add(control)
+    return control
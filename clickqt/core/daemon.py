@@ -0,0 +1,331 @@
+""" Contains the LauncherDaemon class. """
+from __future__ import annotations
+
+import functools
+import importlib
+import json
+import os
+import sys
+import sysconfig
+import typing as t
+
+import click
+from PySide6.QtCore import QObject, QTimer, Qt, Slot
+from PySide6.QtGui import QWindow
+from PySide6.QtNetwork import QLocalServer, QLocalSocket
+from PySide6.QtWidgets import QApplication
+
+from clickqt import __main__ as launcher
+from clickqt.core.control import Control
+from clickqt.core.core import create_application, qtgui_from_click
+from clickqt.core.output import install_output_streams, uninstall_output_streams
+
+#: Seconds without open windows after which the daemon quits
+IDLE_TIMEOUT = 30 * 60
+
+#: Key of a loaded target: (entry point or file path, function name, custom GUI)
+TargetKey = t.Tuple[str, t.Optional[str], t.Optional[str]]
+#: State of a source file: (modification time in ns, size), None if the file doesn't exist
+FileStamp = t.Optional[t.Tuple[int, int]]
+
+
+def file_stamp(path: str) -> FileStamp:
+    """Returns the state of the file **path**, it changes when the file is written."""
+
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+@functools.lru_cache(maxsize=None)
+def installed_paths() -> t.Tuple[str, ...]:
+    """Returns the directories of the standard library and of the installed packages."""
+
+    paths = sysconfig.get_paths()
+    return tuple(
+        {
+            os.path.realpath(paths[name])
+            for name in ("stdlib", "platstdlib", "purelib", "platlib")
+            if name in paths
+        }
+    )
+
+
+def is_project_module(name: str, module: t.Any) -> bool:
+    """Returns whether **module** is a Python file of the user (not installed, not part of clickqt),
+    it is imported again when one of the source files of the targets changes.
+    """
+
+    path = getattr(module, "__file__", None)
+    if not path or not path.endswith(".py") or name.split(".")[0] == "clickqt":
+        return False
+    path = os.path.realpath(path)
+    return not any(
+        os.path.commonpath((path, directory)) == directory
+        for directory in installed_paths()
+    )
+
+
+class LauncherDaemon(QObject):
+    """Opens the windows of clickqtfy in a resident process, which keeps PySide6, the QApplication and the loaded targets.
+    A request is a JSON line with the arguments of clickqtfy (entrypoint, funcname, custom_gui) and the working directory (cwd)
+    of the client, the daemon replies with {"ok": true} when the window is shown or with {"ok": false, "error": "..."}.
+    The source files of the loaded targets (and the not installed modules they import) are checked on every request,
+    if one of them has changed, all targets are loaded again.
+
+    :param path: Path of the local socket
+    :param idle_timeout: Seconds without open windows after which the daemon quits, defaults to :data:`IDLE_TIMEOUT` (None = never)
+    """
+
+    def __init__(self, path: str, idle_timeout: t.Optional[float] = IDLE_TIMEOUT):
+        super().__init__()
+
+        self.path = path
+        self.server = QLocalServer(self)
+        self.server.setSocketOptions(QLocalServer.SocketOption.UserAccessOption)
+        self.server.newConnection.connect(self.accept)
+
+        #: The command and the custom mapping of every loaded target
+        self.targets: dict[TargetKey, tuple[click.Command, t.Optional[dict]]] = {}
+        #: Source file -> its state when it was loaded
+        self.sources: dict[str, FileStamp] = {}
+        #: Names of the modules of the user, they are removed from sys.modules when a source file changed
+        self.project_modules: set[str] = set()
+        #: The controls of the open windows
+        self.controls: list[Control] = []
+
+        self.idle_timer = QTimer(self)
+        self.idle_timer.setSingleShot(True)
+        self.idle_timer.timeout.connect(self.stop)
+        if idle_timeout is not None:
+            self.idle_timer.setInterval(int(idle_timeout * 1000))
+            self.idle_timer.start()
+
+        QApplication.instance().focusWindowChanged.connect(self.focus_changed)
+
+    def listen(self) -> bool:
+        """Starts listening on the socket, a socket file left by a crashed daemon is removed.
+
+        :return: True on success, False otherwise
+        """
+
+        QLocalServer.removeServer(self.path)
+        return self.server.listen(self.path)
+
+    @Slot()
+    def stop(self):
+        """Qt-Slot, which closes the socket and quits the application."""
+
+        self.server.close()
+        QApplication.instance().quit()
+
+    @Slot()
+    def accept(self):
+        """Qt-Slot, which reads the requests of new connections."""
+
+        while (connection := self.server.nextPendingConnection()) is not None:
+            connection.disconnected.connect(connection.deleteLater)
+            connection.readyRead.connect(self.read_request)
+            if connection.canReadLine():
+                self.answer(connection)
+
+    @Slot()
+    def read_request(self):
+        """Qt-Slot, which answers the request of the connection that received data, once it has been received completely."""
+
+        connection = self.sender()
+        if isinstance(connection, QLocalSocket) and connection.canReadLine():
+            self.answer(connection)
+
+    def answer(self, connection: QLocalSocket):
+        """Handles the request of **connection**, sends the reply and closes the connection."""
+
+        connection.readyRead.disconnect(self.read_request)
+        try:
+            request = json.loads(bytes(connection.readLine().data()).decode())
+            reply = self.handle(request)
+        except ValueError as e:
+            reply = {"ok": False, "error": f"Invalid request: {e}"}
+        connection.write(json.dumps(reply).encode() + b"\n")
+        connection.flush()
+        connection.disconnectFromServer()
+
+    def handle(self, request: dict) -> dict:
+        """Executes **request** and returns the reply."""
+
+        if request.get("ping"):
+            return {"ok": True}
+        if request.get("stop"):
+            QTimer.singleShot(0, self.stop)
+            return {"ok": True}
+        try:
+            self.open(
+                request["entrypoint"],
+                request.get("funcname"),
+                request.get("custom_gui"),
+                request.get("cwd"),
+            )
+        except (Exception, SystemExit) as e:  # pylint: disable=broad-exception-caught
+            return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+        return {"ok": True}
+
+    def open(
+        self,
+        entrypoint: str,
+        funcname: t.Optional[str] = None,
+        custom_gui: t.Optional[str] = None,
+        cwd: t.Optional[str] = None,
+    ) -> Control:
+        """Opens a window for a target, like clickqtfy.
+        The working directory of the process isn't changed, it is shared by all windows: The file path **entrypoint** and the
+        relative paths of the path and file widgets are relative to **cwd** instead (see
+        :attr:`~clickqt.widgets.basewidget.BaseWidget.working_directory`). Paths the command builds itself are relative to the
+        working directory of the daemon.
+
+        :param entrypoint: Name of an installed entry point or a file path
+        :param funcname: Name of the command in the file, None if **entrypoint** is an entry point
+        :param custom_gui: Name of the entry point (or the variable in the file) of the custom GUI, defaults to None
+        :param cwd: Working directory of the client, relative file paths are relative to it. Defaults to None (= the working directory of the daemon)
+        """
+
+        command, gui_specs = self.load(
+            os.path.abspath(os.path.join(cwd or "", entrypoint))
+            if funcname
+            else entrypoint,
+            funcname,
+            custom_gui,
+        )
+
+        appname = entrypoint + (f" - {funcname}" if funcname else "")
+        control = qtgui_from_click(
+            command, custom_mapping=gui_specs or None, working_directory=cwd
+        )
+        control.set_is_ep(funcname is None)
+        control.set_ep_or_path(entrypoint)
+
+        window = control.gui.window
+        window.setWindowTitle(appname)
+        window.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
+        window.destroyed.connect(functools.partial(self.window_closed, control))
+        self.controls.append(control)
+        self.idle_timer.stop()
+
+        window.show()
+        window.raise_()
+        window.activateWindow()
+        return control
+
+    def load(
+        self, entrypoint: str, funcname: t.Optional[str], custom_gui: t.Optional[str]
+    ) -> tuple[click.Command, t.Optional[dict]]:
+        """Returns the command and the custom mapping of a target, it is loaded again if a source file has changed.
+        The arguments are the ones of :func:`~clickqt.__main__.load_target`.
+        """
+
+        if self.sources_changed():
+            self.reset()
+
+        key = (entrypoint, funcname, custom_gui)
+        if key not in self.targets:
+            before = set(sys.modules)
+            try:
+                if funcname:
+                    self.sources[os.path.realpath(entrypoint)] = file_stamp(entrypoint)
+                    self.targets[key] = launcher.load_target(
+                        entrypoint, funcname, custom_gui
+                    )
+                else:
+                    self.targets[key] = launcher.load_target(
+                        entrypoint,
+                        None,
+                        custom_gui,
+                        self.find_entrypoint(entrypoint),
+                        self.find_entrypoint(custom_gui) if custom_gui else None,
+                    )
+            finally:
+                self.watch(set(sys.modules) - before)
+        return self.targets[key]
+
+    @staticmethod
+    def find_entrypoint(name: str):
+        """Returns the installed entry point **name**, the installed packages are scanned again if it isn't known yet."""
+
+        try:
+            return launcher.find_entrypoint(name)
+        except ImportError:
+            launcher.installed_entrypoints.cache_clear()  # Installed after the last scan?
+            return launcher.find_entrypoint(name)
+
+    def watch(self, module_names: t.Iterable[str]):
+        """Records the source files of the modules **module_names** of the user (see :func:`is_project_module`)."""
+
+        for name in module_names:
+            module = sys.modules.get(name)
+            if module is not None and is_project_module(name, module):
+                self.project_modules.add(name)
+                path = os.path.realpath(module.__file__)
+                self.sources.setdefault(path, file_stamp(path))
+
+    def sources_changed(self) -> bool:
+        """Returns whether a source file of a loaded target has changed."""
+
+        return any(file_stamp(path) != stamp for path, stamp in self.sources.items())
+
+    def reset(self):
+        """Forgets all loaded targets and removes the modules of the user, so they are imported again.
+        Open windows keep their commands.
+        """
+
+        for name in self.project_modules:
+            sys.modules.pop(name, None)
+        launcher.forget_targets()
+        importlib.invalidate_caches()
+        self.targets.clear()
+        self.sources.clear()
+        self.project_modules.clear()
+
+    @Slot(QWindow)
+    def focus_changed(self, window: t.Optional[QWindow]):
+        """Qt-Slot, which sends the output that isn't routed elsewhere to the terminal of the focused window."""
+
+        for control in self.controls:
+            if window is not None and control.gui.window.windowHandle() is window:
+                install_output_streams(control.gui.terminal_output)
+
+    def window_closed(self, control: Control):
+        """Forgets **control** after its window has been closed, starts the idle timer after the last window."""
+
+        self.controls.remove(control)
+        uninstall_output_streams(control.gui.terminal_output)
+        if not self.controls and self.idle_timer.interval() > 0:
+            self.idle_timer.start()
+
+
+def serve(path: str, idle_timeout: t.Optional[float] = IDLE_TIMEOUT) -> int:
+    """Runs a daemon on **path** until it is stopped or idle, returns at once if another daemon already listens on **path**.
+
+    :return: The exit code
+    """
+
+    try:
+        if launcher.request_daemon({"ping": True}, path, timeout=5) is not None:
+            return 0
+    except PermissionError as e:  # The socket of another user is left alone
+        print(f"clickqtfy daemon: {e}", file=sys.stderr)
+        return 1
+    app = create_application("clickqtfy")
+    app.setQuitOnLastWindowClosed(False)
+    daemon = LauncherDaemon(path, idle_timeout)
+    if not daemon.listen():
+        print(
+            f"clickqtfy daemon: Cannot listen on '{path}': {daemon.server.errorString()}",
+            file=sys.stderr,
+        )
+        return 1
+    return app.exec()
+
+
+if __name__ == "__main__":
+    sys.exit(serve(sys.argv[1]))
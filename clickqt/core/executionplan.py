@@ -0,0 +1,96 @@
+""" Contains the ExecutionPlan class. """
+from __future__ import annotations
+
+from enum import IntEnum
+import inspect
+import typing as t
+
+import click
+
+from clickqt.widgets.basewidget import BaseWidget
+from clickqt.widgets.messagebox import MessageBox
+from clickqt.widgets.filefield import FileField
+from clickqt.core.commandexecutor import ExecutionStep
+
+if t.TYPE_CHECKING:
+    from clickqt.core.commandtree import CommandNode
+
+try:
+    from enum_tools.documentation import document_enum
+except ImportError:  # pragma: no cover
+    document_enum = lambda x: x  # pylint: disable=unnecessary-lambda-assignment
+
+
+@document_enum
+class WidgetKind(IntEnum):
+    """Specifies how the value of a widget is obtained when the command is executed."""
+
+    VALUE = 0  # doc: The value is validated immediately.
+    STDIN = 1  # doc: A FileField for reading, '-' streams the stdin source or shows an input dialog.
+    DIALOG = 2  # doc: A MessageBox, always opens a dialog.
+
+
+#: (parameter name, widget, kind, expose_value, value passed to :func:`~clickqt.widgets.basewidget.BaseWidget.get_param_default`)
+PlanEntry = t.Tuple[str, BaseWidget, WidgetKind, bool, t.Any]
+
+
+class ExecutionPlan:
+    """Everything that is needed to validate the widgets of a command and to call its callback, computed once per command.
+    A plan has to be rebuilt when the widgets of the command change.
+
+    :param node: The node of the command
+    """
+
+    def __init__(self, node: "CommandNode"):
+        self.command: click.Command = node.command
+        self.info_name: str = node.name
+        self.callback: t.Optional[t.Callable] = node.command.callback
+        #: Names of the positional arguments of the callback in the correct order
+        self.callback_args: tuple[str, ...] = (
+            tuple(inspect.getfullargspec(self.callback).args)
+            if self.callback is not None
+            else ()
+        )
+        #: One entry per widget in the order of the parameters
+        self.entries: list[PlanEntry] = [
+            (
+                name,
+                widget,
+                self.widget_kind(widget),
+                widget.param.expose_value,
+                () if widget.param.multiple else None,
+            )
+            for name, widget in (node.widgets or {}).items()
+        ]
+
+    @staticmethod
+    def widget_kind(widget: BaseWidget) -> WidgetKind:
+        """Returns the :class:`~clickqt.core.executionplan.WidgetKind` of **widget**."""
+
+        if isinstance(widget, MessageBox):
+            return WidgetKind.DIALOG
+        if isinstance(widget, FileField) and "r" in widget.type.mode:
+            return WidgetKind.STDIN
+        return WidgetKind.VALUE
+
+    def bind(self, kwargs: dict[str, t.Any]) -> tuple[list[t.Any], dict[str, t.Any]]:
+        """Splits **kwargs** into the positional arguments of the callback (in the correct order) and the remaining keyword arguments.
+
+        :param kwargs: Parameter name to value, will be modified
+        """
+
+        return [kwargs.pop(name, None) for name in self.callback_args], kwargs
+
+    def step(
+        self, params: dict[str, t.Any], resources: t.Sequence[t.IO[t.Any]] = ()
+    ) -> ExecutionStep:
+        """Returns the :class:`~clickqt.core.commandexecutor.ExecutionStep` which calls the callback of the command with **params**.
+
+        :param params: Parameter name to value of all exposed parameters
+        :param resources: Objects that are closed when the run is done, defaults to ()
+        """
+
+        args, kwargs = self.bind(dict(params))
+        return ExecutionStep(
+            self.command, self.info_name, params, args, kwargs, resources
+        )
@@ -1,16 +1,15 @@
 from __future__ import annotations
 
-import sys
-from io import BytesIO, TextIOWrapper
 import typing as t
 
-import click
 from PySide6.QtWidgets import QWidget
 from PySide6.QtCore import QObject, QEvent
 
 from clickqt.core.error import ClickQtError
-from clickqt.widgets.basewidget import BaseWidget
+from clickqt.core.output import suppress_output
+from clickqt.widgets.basewidget import BaseWidget, MultiWidget
 from clickqt.widgets.nvaluewidget import NValueWidget
+from clickqt.widgets.textfield import PathField
 
 
 class FocusOutValidator(QWidget):
@@ -31,19 +30,68 @@ class FocusOutValidator(QWidget):
         """
 
         if event.type() == QEvent.Type.FocusOut:
-            # Don't print callback prints
-            old_strerr = sys.stderr
-            old_strout = sys.stdout
-            sys.stderr = sys.stdout = TextIOWrapper(BytesIO(), "utf-8")
+            if paths := self.__path_fields():
+                # Converting a path accesses the filesystem, so the paths are checked in the background first
+                self.__check_paths(paths)
+            else:
+                self.__validate_quietly()
 
+        return QWidget.eventFilter(self, watched, event)
+
+    def __validate_quietly(self):
+        # Don't print callback prints, only the output of this thread is suppressed (running commands still print)
+        with suppress_output():
             # Don't set the new value because the callback call could reject the (new) value
             # when trying to execute the command (=user clicked on the "Run"-button)
             self.__validate(self.widget)
 
-            sys.stderr = old_strerr
-            sys.stdout = old_strout
+    def __path_fields(self) -> list[PathField]:
+        """Returns the path fields whose values are validated when the watched widget went out of focus."""
 
-        return QWidget.eventFilter(self, watched, event)
+        widget = self.widget
+        if widget.parent_widget is None or isinstance(
+            widget.parent_widget, NValueWidget
+        ):
+            return [widget] if isinstance(widget, PathField) else []
+
+        def collect(widget: BaseWidget) -> list[PathField]:
+            if isinstance(widget, PathField):
+                return [widget]
+            if isinstance(widget, MultiWidget):
+                return [field for child in widget.children for field in collect(child)]
+            return []
+
+        return collect(self.__top(widget))
+
+    def __check_paths(self, paths: list[PathField]):
+        """Checks **paths** in the background. The value is validated as usual if all paths are accepted,
+        the path fields convert their values with the results of the checks (see :func:`~clickqt.widgets.textfield.PathField.convert_value`).
+        """
+
+        remaining = len(paths)
+        accepted = True
+
+        def done(ok: bool):
+            nonlocal remaining, accepted
+            remaining -= 1
+            accepted &= ok
+            if remaining > 0:
+                return
+            if accepted:
+                self.__validate_quietly()
+            elif self.__top(self.widget) is not self.widget and not isinstance(
+                self.widget.parent_widget, NValueWidget
+            ):  # The whole (tuple/multi value) widget is invalid
+                self.__top(self.widget).handle_valid(False)
+
+        for path in paths:
+            path.check_path(done)
+
+    @staticmethod
+    def __top(widget: BaseWidget) -> BaseWidget:
+        while widget.parent_widget is not None:
+            widget = widget.parent_widget
+        return widget
 
     def __validate(self, widget: BaseWidget) -> tuple[t.Any, ClickQtError]:
         """Validates the value of the widget that went out of focus."""
@@ -58,11 +106,7 @@ class FocusOutValidator(QWidget):
         # self.widget.parent_widget == NValueWidget -> We have a child here
 
         try:  # Try to convert the provided value into the corresponding click object type
-            ret_val = widget.type.convert(
-                value=widget.get_widget_value(),
-                param=widget.param,
-                ctx=click.Context(widget.click_command),
-            )
+            ret_val = widget.convert_value(widget.get_widget_value())
             # Don't consider callbacks because we have only one child here
             widget.handle_valid(True)
             return (ret_val, ClickQtError())
@@ -1,10 +1,8 @@
 """ Contains the GUI class. """
 from __future__ import annotations
 
-import sys
-from typing import Callable, Tuple, Any
+from typing import Callable, Iterator, Optional, Tuple, Any, TYPE_CHECKING
 import click
-from click_option_group._core import _GroupTitleFakeOption
 from PySide6.QtWidgets import (
     QApplication,
     QSplitter,
@@ -15,28 +13,23 @@ from PySide6.QtWidgets import (
     QSizePolicy,
 )
 from PySide6.QtGui import (
-    QColor,
     Qt,
-    QPalette,
     QScreen,
+    QShortcut,
+    QKeySequence,
 )
-from clickqt.widgets.optiongrouptitlewidget import OptionGroupTitleWidget
-from clickqt.widgets.checkbox import CheckBox
-from clickqt.widgets.numericfields import IntField, RealField
-from clickqt.widgets.datetimeedit import DateTimeEdit
-from clickqt.widgets.customwidget import CustomWidget
-from clickqt.widgets.multivaluewidget import MultiValueWidget
-from clickqt.widgets.basewidget import BaseWidget
-from clickqt.widgets.textfield import TextField
-from clickqt.widgets.passwordfield import PasswordField
-from clickqt.widgets.combobox import CheckableComboBox, ComboBox
-from clickqt.widgets.filefield import FileField
-from clickqt.widgets.filepathfield import FilePathField
-from clickqt.widgets.tuplewidget import TupleWidget
-from clickqt.widgets.nvaluewidget import NValueWidget
-from clickqt.widgets.confirmationwidget import ConfirmationWidget
-from clickqt.widgets.messagebox import MessageBox
-from clickqt.core.output import OutputStream, TerminalOutput
+from clickqt.core.output import (
+    TerminalOutput,
+    install_output_streams,
+    uninstall_output_streams,
+)
+from clickqt.core.search import SearchBar
+from clickqt.core.resultviewer import ResultViewer
+from clickqt.core.utils import is_option_group_title
+from clickqt import widgets
+
+if TYPE_CHECKING:
+    from clickqt.widgets.basewidget import BaseWidget
 
 GetterFnType = Callable[[Any], Any]
 SetterFnType = Callable[[Any], None]
@@ -46,25 +39,139 @@ Represents a Qt widget, a method to obtain the value, and a method to set the va
 """
 
 
+#: Style sheet of the "Stop"-button, shared by all GUIs
+STOP_BUTTON_STYLE = """
+QPushButton {
+    background-color: #FF0000; /* Default background color (red) when disabled */
+    color: #FFFFFF; /* Default text color when disabled */
+}
+QPushButton:enabled {
+    background-color: #00FF00; /* Background color (green) when enabled */
+    color: #FFFFFF; /* Text color when enabled */
+}
+"""
+
+
+#: (GUI class, click type class) -> widget class of the typedict of the GUI class (None = no entry), shared by all GUIs of the process
+_widget_classes: dict[tuple[type, type], Any] = {}
+
+
+class WidgetTypeDict(dict):
+    """Maps click types to widget classes. The widget classes of clickqt are stored by their names in :mod:`clickqt.widgets`
+    and imported when an entry is read for the first time, so reading an entry always returns the class. This includes
+    copies and merges (copy, dict(), {**typedict}, |): They read the entries through __getitem__ or copy the names into a
+    new WidgetTypeDict. Every change clears the widget classes the GUIs have looked up (see :func:`~clickqt.core.gui.GUI.widget_class`).
+    """
+
+    def __setitem__(self, key: type, value: Any):
+        super().__setitem__(key, value)
+        _widget_classes.clear()
+
+    def __delitem__(self, key: type):
+        super().__delitem__(key)
+        _widget_classes.clear()
+
+    def __ior__(self, other: Any) -> WidgetTypeDict:
+        self.update(other)
+        return self
+
+    def update(self, *args: Any, **kwargs: Any):
+        super().update(*args, **kwargs)
+        _widget_classes.clear()
+
+    def setdefault(self, key: type, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def pop(self, *args: Any) -> Any:
+        _widget_classes.clear()
+        return super().pop(*args)
+
+    def popitem(self) -> tuple[type, Any]:
+        _widget_classes.clear()
+        return super().popitem()
+
+    def clear(self):
+        super().clear()
+        _widget_classes.clear()
+
+    def __getitem__(self, key: type) -> Any:
+        value = super().__getitem__(key)
+        if isinstance(value, str):
+            value = getattr(widgets, value)
+            super().__setitem__(key, value)
+        return value
+
+    def get(self, key: type, default: Any = None) -> Any:
+        return self[key] if key in self else default
+
+    def values(self) -> list[Any]:  # type: ignore[override]
+        return [self[key] for key in self]
+
+    def items(self) -> list[tuple[type, Any]]:  # type: ignore[override]
+        return [(key, self[key]) for key in self]
+
+    def __iter__(self) -> Iterator[type]:
+        # Overriding __iter__ makes dict(), {**typedict} and dict.update read the entries through __getitem__
+        return iter(self.keys())
+
+    def copy(self) -> WidgetTypeDict:
+        """Returns a shallow copy, the widget classes that haven't been imported yet stay names until they are read."""
+
+        duplicate = WidgetTypeDict()
+        dict.update(duplicate, dict.items(self))
+        return duplicate
+
+    def __copy__(self) -> WidgetTypeDict:
+        return self.copy()
+
+    def __or__(self, other: Any) -> WidgetTypeDict:
+        if not isinstance(other, dict):
+            return NotImplemented
+        merged = self.copy()
+        merged.update(other)
+        return merged
+
+    def __ror__(self, other: Any) -> dict:
+        if not isinstance(other, dict):
+            return NotImplemented
+        merged = dict(other)
+        merged.update(self)
+        return merged
+
+    def __eq__(self, other: Any) -> bool:
+        return (
+            dict(self.items()) == other if isinstance(other, dict) else NotImplemented
+        )
+
+    def __ne__(self, other: Any) -> bool:
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+
 class GUI:
     """
     Responsible for setting up the components for the Qt-GUI,
     which is used to navigate through the different kind of commands and execute them.
     """
 
-    typedict = {
-        click.types.BoolParamType: CheckBox,
-        click.types.IntParamType: IntField,
-        click.types.FloatParamType: RealField,
-        click.types.StringParamType: TextField,
-        click.types.UUIDParameterType: TextField,
-        click.types.UnprocessedParamType: TextField,
-        click.types.DateTime: DateTimeEdit,
-        click.types.Tuple: TupleWidget,
-        click.types.Choice: ComboBox,
-        click.types.Path: FilePathField,
-        click.types.File: FileField,
-    }
+    #: click type -> widget class, the widget modules are imported when they are needed for the first time
+    typedict = WidgetTypeDict(
+        {
+            click.types.BoolParamType: "CheckBox",
+            click.types.IntParamType: "IntField",
+            click.types.FloatParamType: "RealField",
+            click.types.StringParamType: "TextField",
+            click.types.UUIDParameterType: "TextField",
+            click.types.UnprocessedParamType: "TextField",
+            click.types.DateTime: "DateTimeEdit",
+            click.types.Tuple: "TupleWidget",
+            click.types.Choice: "ComboBox",
+            click.types.Path: "FilePathField",
+            click.types.File: "FileField",
+        }
+    )
 
     def __init__(self):
         self.window = QWidget()
@@ -76,7 +183,12 @@ class GUI:
         self.window.layout().addWidget(self.splitter)
 
         self.widgets_container: QWidget = None  # Control constructs this Qt-widget
+        self.job_panel: QWidget = None  # Only used with the job manager
         self.custom_mapping: dict[click.ParamType, CustomBindingType] = {}
+        #: Multiple options are edited in list editors instead of one widget per value
+        self.list_editors = False
+        #: Directory to which relative paths of the widgets are relative, None = the working directory of the process
+        self.working_directory: Optional[str] = None
         self.buttons_container = QWidget()
         self.buttons_container.setLayout(QHBoxLayout())
         self.buttons_container.setSizePolicy(
@@ -85,18 +197,7 @@ class GUI:
         self.run_button = QPushButton("&Run")  # Shortcut Alt+R
         self.stop_button = QPushButton("&Stop")  # Shortcut Alt+S
         self.stop_button.setEnabled(False)
-        self.stop_button.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #FF0000; /* Default background color (red) when disabled */
-                color: #FFFFFF; /* Default text color when disabled */
-            }
-            QPushButton:enabled {
-                background-color: #00FF00; /* Background color (green) when enabled */
-                color: #FFFFFF; /* Text color when enabled */
-            }
-        """
-        )
+        self.stop_button.setStyleSheet(STOP_BUTTON_STYLE)
         self.copy_button = QPushButton("&Copy-To-Clipboard")
         self.import_button = QPushButton("&Import-From-Clipboard")
         self.buttons_container.layout().addWidget(self.run_button)
@@ -107,27 +208,27 @@ class GUI:
         self.terminal_output = TerminalOutput()
         self.terminal_output.setReadOnly(True)
         self.terminal_output.setToolTip("Terminal output")
-        self.terminal_output.newHtmlMessage.connect(self.terminal_output.writeHtml)
+        self.terminal_output.newMessage.connect(self.terminal_output.writeText)
 
-        sys.stdout = OutputStream(
-            self.terminal_output, sys.stdout, QPalette().color(QPalette.ColorRole.Text)
-        )
-        sys.stderr = OutputStream(self.terminal_output, sys.stderr, QColor("red"))
+        self.search_bar = SearchBar(self.terminal_output)
+        QShortcut(QKeySequence.StandardKey.Find, self.window).activated.connect(
+            self.search_bar.open_search
+        )  # Ctrl+F
+
+        self.result_viewer = ResultViewer()  # Hidden until a command returns a value
+
+        install_output_streams(self.terminal_output)
 
     def __call__(self):
-        """Shows the GUI-window"""
+        """Shows the GUI-window (or the window of the :class:`~clickqt.core.shell.Shell` that contains it)"""
 
-        self.window.show()
+        self.window.window().show()
         QApplication.instance().exec()
 
     def __del__(self):
-        """Resets the default streams"""
+        """Sends the output of the default streams to the previous GUI, if they still send it to this GUI"""
 
-        if isinstance(sys.stdout, OutputStream):
-            sys.stdout = sys.stdout.stream
-
-        if isinstance(sys.stderr, OutputStream):
-            sys.stderr = sys.stderr.stream
+        uninstall_output_streams(self.terminal_output)
 
     def construct(self):
         """Resize and reposition the window."""
@@ -135,7 +236,11 @@ class GUI:
 
         self.splitter.addWidget(self.widgets_container)
         self.splitter.addWidget(self.buttons_container)
+        if self.job_panel is not None:
+            self.splitter.addWidget(self.job_panel)
+        self.splitter.addWidget(self.search_bar)
         self.splitter.addWidget(self.terminal_output)
+        self.splitter.addWidget(self.result_viewer)
 
         size_hint = self.window.sizeHint()
         self.window.resize(
@@ -151,6 +256,33 @@ class GUI:
         assert len(custom_mapping) >= 1
         self.custom_mapping.update(custom_mapping)
 
+    def __init_subclass__(cls, **kwargs: Any):
+        super().__init_subclass__(**kwargs)
+        # A typedict of a subclass must clear the looked up widget classes when it changes, too
+        if "typedict" in cls.__dict__ and not isinstance(cls.typedict, WidgetTypeDict):
+            cls.typedict = WidgetTypeDict(cls.typedict)
+
+    def widget_class(self, otype_class: type) -> Any:
+        """Returns the widget class of :attr:`typedict` for click types of class **otype_class**, None if there is no entry.
+        The lookup is done once per GUI class and process (until :attr:`typedict` changes), all GUIs of the class share the result.
+        A typedict assigned to a single GUI is looked up every time.
+        """
+
+        typedict = self.typedict
+        # Other mappings don't report changes
+        shared = "typedict" not in vars(self) and isinstance(typedict, WidgetTypeDict)
+        key = (type(self), otype_class)
+        if shared and key in _widget_classes:
+            return _widget_classes[key]
+        widgetclass = None
+        for t in typedict:  # Only the widget class of the match is imported
+            if issubclass(otype_class, t):
+                widgetclass = typedict[t]
+                break
+        if shared:
+            _widget_classes[key] = widgetclass
+        return widgetclass
+
     def create_widget(
         self, otype: click.ParamType, param: click.Parameter, **kwargs
     ) -> BaseWidget:
@@ -168,10 +300,16 @@ class GUI:
             needed for :class:`~clickqt.widgets.basewidget.MultiWidget`-widgets
         """
 
+        kwargs.setdefault("working_directory", self.working_directory)
+
         def get_multiarg_version(otype: click.ParamType):
             if isinstance(otype, click.types.Choice):
-                return CheckableComboBox
-            return NValueWidget
+                return widgets.CheckableComboBox
+            if self.list_editors:
+                if isinstance(otype, click.types.Tuple) or param.nargs > 1:
+                    return widgets.TupleTableWidget
+                return widgets.ListEditWidget
+            return widgets.NValueWidget
 
         if (
             hasattr(param, "is_flag")
@@ -179,28 +317,28 @@ class GUI:
             and hasattr(param, "prompt")
             and param.prompt
         ):
-            return MessageBox(otype, param, **kwargs)
+            return widgets.MessageBox(otype, param, **kwargs)
 
         if hasattr(param, "hide_input") and param.hide_input:
-            return PasswordField(otype, param, **kwargs)
+            return widgets.PasswordField(otype, param, **kwargs)
 
         if hasattr(param, "confirmation_prompt") and param.confirmation_prompt:
-            return ConfirmationWidget(otype, param, **kwargs)
+            return widgets.ConfirmationWidget(otype, param, **kwargs)
         if param.multiple:
             return get_multiarg_version(otype)(otype, param, **kwargs)
         if param.nargs > 1:
             if isinstance(otype, click.types.Tuple):
-                return TupleWidget(otype, param, **kwargs)
-            return MultiValueWidget(otype, param, **kwargs)
-        if isinstance(param, _GroupTitleFakeOption):
-            return OptionGroupTitleWidget(otype, param, **kwargs)
+                return widgets.TupleWidget(otype, param, **kwargs)
+            return widgets.MultiValueWidget(otype, param, **kwargs)
+        if is_option_group_title(param):
+            return widgets.OptionGroupTitleWidget(otype, param, **kwargs)
 
-        for t, widgetclass in self.typedict.items():
-            if isinstance(otype, t):
-                return widgetclass(otype, param, **kwargs)
+        if (widgetclass := self.widget_class(type(otype))) is not None:
+            return widgetclass(otype, param, **kwargs)
 
         for t, widgetbindings in self.custom_mapping.items():
             if isinstance(otype, t):
-                return CustomWidget(widgetbindings, otype, param, **kwargs)
+                return widgets.CustomWidget(widgetbindings, otype, param, **kwargs)
 
-        return TextField(otype, param, **kwargs)  # Custom types are mapped to TextField
+        # Custom types are mapped to TextField
+        return widgets.TextField(otype, param, **kwargs)
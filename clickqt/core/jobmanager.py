@@ -0,0 +1,365 @@
+""" Contains the Job, JobManager and JobPanel classes. """
+from __future__ import annotations
+
+from collections import deque
+from enum import IntEnum
+import os
+import sys
+import time
+import typing as t
+
+from PySide6.QtWidgets import (
+    QWidget,
+    QVBoxLayout,
+    QTableWidget,
+    QTableWidgetItem,
+    QPushButton,
+    QHeaderView,
+    QAbstractItemView,
+    QPlainTextDocumentLayout,
+)
+from PySide6.QtGui import QColor, QTextDocument, QTextCursor
+from PySide6.QtCore import QObject, QThread, QTimer, Signal, Slot
+
+from clickqt.core.commandexecutor import CommandExecutor, ExecutionStep
+from clickqt.core.ansi import AnsiTextWriter
+from clickqt.core.output import route_output
+from clickqt.core.logtee import RunLog
+
+#: Number of done jobs whose output is kept, older done jobs are removed
+JOB_RETENTION = 100
+
+try:
+    from enum_tools.documentation import document_enum
+except ImportError:  # pragma: no cover
+    document_enum = lambda x: x  # pylint: disable=unnecessary-lambda-assignment
+
+
+@document_enum
+class JobStatus(IntEnum):
+    """Specifies the state of a :class:`~clickqt.core.jobmanager.Job`."""
+
+    QUEUED = 0  # doc: Waiting for a free slot.
+    RUNNING = 1  # doc: The command hierarchy is being executed.
+    FINISHED = 2  # doc: The execution has finished successfully.
+    FAILED = 3  # doc: The execution (or the validation) has failed.
+    CANCELLED = 4  # doc: The job was cancelled by the user.
+
+
+class Job(QObject):
+    """A single run of a command hierarchy with its own output buffer.
+    The output of the job is stored in a QTextDocument, which can be shown in a :class:`~clickqt.core.output.TerminalOutput`.
+
+    :param title: The command line of the run, shown in the :class:`~clickqt.core.jobmanager.JobPanel`
+    """
+
+    #: Internal Qt-Signal, which will be emitted when there is a new text (with ANSI escape sequences) to display
+    newMessage: Signal = Signal(str, QColor)
+    #: Qt-Signal, which will be emitted when the status of the job has changed
+    statusChanged: Signal = Signal(QObject)
+    #: Internal Qt-Signal, which starts the execution in the worker thread
+    requestExecution: Signal = Signal(list)
+
+    def __init__(self, title: str):
+        super().__init__()
+
+        self.title = title
+        self.steps: list[ExecutionStep] = []
+        self.status = JobStatus.QUEUED
+        self.created = time.monotonic()
+        self.started: t.Optional[float] = None
+        self.ended: t.Optional[float] = None
+
+        self.document = QTextDocument(self)
+        self.document.setDocumentLayout(QPlainTextDocumentLayout(self.document))
+        self.ansi = AnsiTextWriter()
+        self.newMessage.connect(self.write_text)
+
+        self.worker_thread: t.Optional[QThread] = None
+        self.worker: t.Optional[CommandExecutor] = None
+        #: Opens the log of the run when the job starts, None = no log
+        self.open_log: t.Optional[t.Callable[[], RunLog]] = None
+        #: Log of the run, None = no log (or the job hasn't started yet)
+        self.log: t.Optional[RunLog] = None
+        #: Return value of the selected command
+        self.result: t.Any = None
+
+    @property
+    def is_done(self) -> bool:
+        """True, if the job will not run (anymore)."""
+
+        return self.status in (
+            JobStatus.FINISHED,
+            JobStatus.FAILED,
+            JobStatus.CANCELLED,
+        )
+
+    def elapsed(self) -> float:
+        """Returns the run time of the job in seconds, 0 if the job has not started yet."""
+
+        if self.started is None:
+            return 0.0
+        end = self.ended if self.ended is not None else time.monotonic()
+        return end - self.started
+
+    @Slot(str, QColor)
+    def write_text(self, message: str, color: QColor):
+        """Appends **message** to the end of the output of the job.
+
+        :param message: The message that should be appended, may contain ANSI escape sequences
+        :param color: The default color of **message**
+        """
+
+        cursor = QTextCursor(self.document)
+        cursor.movePosition(QTextCursor.End)
+        self.ansi.insert(cursor, message, color)
+
+    def set_status(self, status: JobStatus):
+        """Changes the status of the job and emits :func:`~clickqt.core.jobmanager.Job.statusChanged`."""
+
+        self.status = status
+        if self.is_done and self.ended is None and self.started is not None:
+            self.ended = time.monotonic()
+        self.statusChanged.emit(self)
+
+    def start(self):
+        """Opens the log and executes the steps of the job in a new thread."""
+
+        if self.open_log is not None:
+            self.log = self.open_log()
+        self.worker_thread = QThread()
+        self.worker_thread.start()
+        self.worker = CommandExecutor(output=self, log=self.log)
+        self.worker.moveToThread(self.worker_thread)
+        self.worker.finished.connect(self.worker_thread.quit)
+        self.worker.finished.connect(self.__finished)
+        self.requestExecution.connect(self.worker.run)
+
+        self.started = time.monotonic()
+        self.set_status(JobStatus.RUNNING)
+        self.requestExecution.emit(self.steps)
+
+    def terminate(self):
+        """Stops the execution of a running job."""
+
+        assert self.worker_thread is not None
+
+        with route_output(self):
+            print("Execution stopped!", file=sys.stderr)
+        self.worker_thread.terminate()
+        if self.log is not None:
+            self.log.close()
+        self.__cleanup(JobStatus.CANCELLED)
+
+    @Slot()
+    def __finished(self):
+        if self.worker is not None:
+            self.result = self.worker.result
+            self.__cleanup(
+                JobStatus.FAILED if self.worker.failed else JobStatus.FINISHED
+            )
+
+    def __cleanup(self, status: JobStatus):
+        self.ansi.flush()
+        self.worker_thread.deleteLater()
+        self.worker.deleteLater()
+        self.worker_thread = None
+        self.worker = None
+        self.set_status(status)
+
+
+class JobManager(QObject):
+    """Runs up to **limit** jobs at the same time, further jobs are queued and started in submission order when a slot becomes free.
+    Only the last **retention** done jobs are kept, older done jobs are removed and deleted together with their output.
+
+    :param limit: The maximum number of concurrently running jobs, 0 = number of CPUs
+    :param retention: The number of done jobs that are kept, defaults to :data:`JOB_RETENTION`
+    """
+
+    #: Qt-Signal, which will be emitted when a job was submitted
+    jobAdded: Signal = Signal(QObject)
+    #: Qt-Signal, which will be emitted when a done job was removed, the job is deleted afterwards
+    jobRemoved: Signal = Signal(QObject)
+    #: Qt-Signal, which will be emitted when the number of running or queued jobs has changed
+    activityChanged: Signal = Signal()
+
+    def __init__(self, limit: int, retention: int = JOB_RETENTION):
+        super().__init__()
+
+        if limit < 0:
+            raise ValueError(f"The job limit has to be >= 0 ({limit})")
+        if retention < 1:
+            raise ValueError(f"The job retention has to be >= 1 ({retention})")
+
+        self.limit = limit if limit > 0 else (os.cpu_count() or 1)
+        self.retention = retention
+        self.jobs: list[Job] = []
+        self.queue: deque[Job] = deque()
+        self.running: set[Job] = set()
+
+    def submit(self, job: Job):
+        """Adds **job** to the job list. It will be queued if it isn't done (= failed validation)."""
+
+        self.jobs.append(job)
+        job.statusChanged.connect(self.__status_changed)
+        self.jobAdded.emit(job)
+
+        if not job.is_done:
+            self.queue.append(job)
+            self.dispatch()
+            self.activityChanged.emit()
+        else:
+            self.prune()
+
+    def dispatch(self):
+        """Starts queued jobs until the limit is reached."""
+
+        while self.queue and len(self.running) < self.limit:
+            job = self.queue.popleft()
+            self.running.add(job)
+            job.start()
+
+    def cancel(self, job: Job):
+        """Removes **job** from the queue or stops its execution, if it is running."""
+
+        if job.status == JobStatus.QUEUED:
+            self.queue.remove(job)
+            job.set_status(JobStatus.CANCELLED)
+        elif job.status == JobStatus.RUNNING:
+            job.terminate()
+
+    def cancel_all(self):
+        """Cancels all queued and running jobs."""
+
+        for job in list(self.queue) + list(self.running):
+            self.cancel(job)
+
+    def prune(self):
+        """Removes the oldest done jobs until only :attr:`~clickqt.core.jobmanager.JobManager.retention` done jobs are left."""
+
+        done = [job for job in self.jobs if job.is_done]
+        for job in done[: max(len(done) - self.retention, 0)]:
+            self.jobs.remove(job)
+            self.jobRemoved.emit(job)
+            job.deleteLater()
+
+    def is_active(self) -> bool:
+        """True, if there is a running or queued job."""
+
+        return bool(self.running or self.queue)
+
+    @Slot(QObject)
+    def __status_changed(self, job: Job):
+        if job.is_done:
+            if job in self.running:
+                self.running.discard(job)
+                self.dispatch()
+            self.activityChanged.emit()
+            self.prune()
+
+
+class JobPanel(QWidget):
+    """Shows the jobs of a :class:`~clickqt.core.jobmanager.JobManager` with their status, elapsed time and a cancel button.
+
+    :param manager: The job manager whose jobs should be shown
+    """
+
+    #: Qt-Signal, which will be emitted when the user selected another job
+    jobSelected: Signal = Signal(QObject)
+
+    COLUMNS = ("Command", "Status", "Elapsed", "")
+
+    def __init__(self, manager: JobManager):
+        super().__init__()
+
+        self.manager = manager
+        self.rows: dict[Job, int] = {}
+
+        self.table = QTableWidget(0, len(self.COLUMNS))
+        self.table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self.table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        for column in range(1, len(self.COLUMNS)):
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.ResizeToContents)
+
+        self.setLayout(QVBoxLayout())
+        self.layout().setContentsMargins(0, 0, 0, 0)
+        self.layout().addWidget(self.table)
+
+        # Only the elapsed times of running jobs are updated periodically
+        self.timer = QTimer(self)
+        self.timer.setInterval(500)
+        self.timer.timeout.connect(self.update_elapsed)
+
+        manager.jobAdded.connect(self.add_job)
+        manager.jobRemoved.connect(self.remove_job)
+        self.table.currentCellChanged.connect(self.__current_cell_changed)
+
+    def job_at(self, row: int) -> Job:
+        """Returns the job shown in row **row**."""
+
+        return self.manager.jobs[row]
+
+    @Slot(QObject)
+    def add_job(self, job: Job):
+        """Adds a row for **job** and selects it."""
+
+        row = self.table.rowCount()
+        self.rows[job] = row
+        self.table.insertRow(row)
+        self.table.setItem(row, 0, QTableWidgetItem(job.title))
+        self.table.setItem(row, 1, QTableWidgetItem())
+        self.table.setItem(row, 2, QTableWidgetItem())
+        cancel_button = QPushButton("Cancel")
+        cancel_button.clicked.connect(lambda: self.manager.cancel(job))
+        self.table.setCellWidget(row, 3, cancel_button)
+
+        job.statusChanged.connect(self.update_job)
+        self.update_job(job)
+        self.table.selectRow(row)
+
+    @Slot(QObject)
+    def remove_job(self, job: Job):
+        """Removes the row of **job**."""
+
+        row = self.rows.pop(job)
+        current = self.table.currentRow()
+        # The rows don't match the jobs of the manager until the row is removed
+        self.table.blockSignals(True)
+        self.table.removeRow(row)
+        self.table.blockSignals(False)
+        self.rows = {job: row for row, job in enumerate(self.manager.jobs)}
+        if row == current and self.table.currentRow() >= 0:
+            self.jobSelected.emit(self.job_at(self.table.currentRow()))
+
+    @Slot(QObject)
+    def update_job(self, job: Job):
+        """Shows the current status and elapsed time of **job**."""
+
+        if (
+            row := self.rows.get(job)
+        ) is None:  # Removed by the retention of the manager
+            return
+        self.table.item(row, 1).setText(job.status.name.capitalize())
+        self.table.item(row, 2).setText(f"{job.elapsed():.1f} s")
+        self.table.cellWidget(row, 3).setEnabled(not job.is_done)
+
+        if self.manager.running:
+            self.timer.start()
+        else:
+            self.timer.stop()
+
+    @Slot()
+    def update_elapsed(self):
+        """Updates the elapsed time of all running jobs."""
+
+        for job in self.manager.running:
+            self.table.item(self.rows[job], 2).setText(f"{job.elapsed():.1f} s")
+
+    def __current_cell_changed(self, row: int, *_):
+        if row >= 0:
+            self.jobSelected.emit(self.job_at(row))
@@ -0,0 +1,204 @@
+""" Contains the LogTee and RunLog classes. """
+from __future__ import annotations
+
+import gzip
+import os
+import queue
+import re
+import sys
+import threading
+import time
+import typing as t
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9._-]+")
+_CLOSE = object()  # Tells the writer thread to close the file
+
+#: The log of the current context (= run), None if the output is not logged
+_current_log: ContextVar[t.Optional["RunLog"]] = ContextVar("clickqt_log", default=None)
+
+
+class LogTee:
+    """Configuration of the log files, every run gets its own :class:`~clickqt.core.logtee.RunLog`.
+    The name of a log file consists of the command hierarchy and the start time of the run,
+    e.g. 'cli-sub-cmd_20240101-120000-123.log' (+ '.gz' if compressed). Runs that start in the same millisecond get a counter
+    ('..._20240101-120000-123-1.log'), existing files are never overwritten.
+
+    :param directory: The directory of the log files, will be created if it doesn't exist
+    :param max_bytes: Size (uncompressed) after which the log continues in a new file ('.log.1', '.log.2', ...), defaults to 0 (= no rotation)
+    :param compress: Whether the log files should be gzip-compressed, defaults to False
+    :param buffer_size: Size of the write buffer of a log file in bytes, defaults to 1 MiB
+    """
+
+    def __init__(
+        self,
+        directory: "str | os.PathLike[str]",
+        max_bytes: int = 0,
+        compress: bool = False,
+        buffer_size: int = 1 << 20,
+    ):
+        self.directory = os.fspath(directory)
+        self.max_bytes = max_bytes
+        self.compress = compress
+        self.buffer_size = buffer_size
+
+    def open_run(self, hierarchy: t.Sequence[str], header: str = "") -> "RunLog":
+        """Returns the log of a new run.
+
+        :param hierarchy: Names of the command hierarchy (root command to selected command)
+        :param header: First line of the log, e.g. the command line of the run
+        """
+
+        now = time.time()
+        timestamp = time.strftime("%Y%m%d-%H%M%S", time.localtime(now))
+        name = "-".join(_UNSAFE_CHARS.sub("_", part) for part in hierarchy)
+        return RunLog(self, f"{name}_{timestamp}-{int(now * 1000) % 1000:03d}", header)
+
+
+class RunLog:
+    """The log of a single run. :func:`~clickqt.core.logtee.RunLog.write` only enqueues the text,
+    a background thread writes it in large chunks to the log file, so a slow disk never blocks the command.
+    If the log file cannot be written, the error is reported once on sys.stderr and the log discards all further text.
+
+    :param config: The configuration of the log files
+    :param name: The name of the log file without the extension
+    :param header: First line of the log
+    """
+
+    def __init__(self, config: LogTee, name: str, header: str = ""):
+        self.config = config
+        self.name = name
+        #: Paths of all files of this log (more than one if it was rotated)
+        self.paths: list[str] = []
+        #: The error that stopped the writer thread, None if the log was written successfully
+        self.error: t.Optional[OSError] = None
+        self.__queue: "queue.SimpleQueue[t.Any]" = queue.SimpleQueue()
+        self.__closed = False
+
+        if header:
+            self.write(f"$ {header}\n")
+
+        self.__thread = threading.Thread(
+            target=self.__run, name=f"clickqt-log-{name}", daemon=True
+        )
+        self.__thread.start()
+
+    def write(self, text: str):
+        """Appends **text** to the log. Never blocks."""
+
+        if not self.__closed:
+            self.__queue.put(text)
+
+    def close(self):
+        """Writes the remaining text and closes the log file. Calling it more than once has no effect."""
+
+        if not self.__closed:
+            self.__closed = True
+            self.__queue.put(_CLOSE)
+
+    def wait(self, timeout: t.Optional[float] = None) -> bool:
+        """Waits until the log file is closed.
+
+        :return: True, if the log file was closed within **timeout** seconds
+        """
+
+        self.__thread.join(timeout)
+        return not self.__thread.is_alive()
+
+    def __open(self) -> t.BinaryIO:
+        os.makedirs(self.config.directory, exist_ok=True)
+        if self.paths:  # Rotation
+            return self.__create(
+                os.path.join(
+                    self.config.directory, f"{self.name}.log.{len(self.paths)}"
+                )
+            )
+
+        counter = 0
+        while True:
+            name = self.name if counter == 0 else f"{self.name}-{counter}"
+            try:
+                file = self.__create(os.path.join(self.config.directory, f"{name}.log"))
+            except FileExistsError:  # Another run started in the same millisecond
+                counter += 1
+                continue
+            self.name = name
+            return file
+
+    def __create(self, path: str) -> t.BinaryIO:
+        if self.config.compress:
+            path += ".gz"
+            file = t.cast(t.BinaryIO, gzip.open(path, "xb", compresslevel=6))
+        else:
+            file = open(path, "xb", buffering=self.config.buffer_size)
+        self.paths.append(path)
+        return file
+
+    def __run(self):
+        try:
+            self.__write_all()
+        except OSError as e:
+            self.error = e
+            self.__closed = True  # Nobody reads the queue anymore, stop filling it
+            print(f"Cannot write the log '{self.name}': {e}", file=sys.stderr)
+
+    def __write_all(self):
+        file = self.__open()
+        size = 0
+        closing = False
+
+        try:
+            while not closing:
+                # Collect everything that was written in the meantime and write it at once
+                batch = [self.__queue.get()]
+                while True:
+                    try:
+                        batch.append(self.__queue.get_nowait())
+                    except queue.Empty:
+                        break
+                if any(item is _CLOSE for item in batch):
+                    closing = True
+                    batch = [item for item in batch if item is not _CLOSE]
+
+                data = "".join(batch).encode("utf-8", "replace")
+                if not data:
+                    continue
+
+                if 0 < self.config.max_bytes < size + len(data) and size > 0:
+                    file.close()
+                    file = self.__open()
+                    size = 0
+
+                file.write(data)
+                size += len(data)
+                if self.__queue.empty():  # Idle: Make the output visible on disk
+                    file.flush()
+        finally:
+            file.close()
+
+
+def current_log() -> t.Optional[RunLog]:
+    """Returns the log of the current context or None."""
+
+    return _current_log.get()
+
+
+@contextmanager
+def tee_output(log: t.Optional[RunLog]) -> t.Iterator[None]:
+    """Copies everything written to sys.stdout and sys.stderr in the current context (e.g. thread) to **log**
+    while the context manager is active. **log** will be closed at the end.
+
+    :param log: The log of the run, None = no log
+    """
+
+    if log is None:
+        yield
+        return
+
+    token = _current_log.set(log)
+    try:
+        yield
+    finally:
+        _current_log.reset(token)
+        log.close()
@@ -0,0 +1,123 @@
+""" Contains the CommandNavigator class. """
+from __future__ import annotations
+
+import typing as t
+
+from PySide6.QtWidgets import (
+    QSplitter,
+    QStackedWidget,
+    QTreeWidget,
+    QTreeWidgetItem,
+    QWidget,
+)
+from PySide6.QtCore import Qt, Signal
+
+from clickqt.core.commandtree import CommandNode, CommandPath
+
+PageFactory = t.Callable[[CommandNode], QWidget]
+
+
+class CommandNavigator(QSplitter):
+    """Tree-view based alternative to nested QTabWidgets for wide and deep command groups.
+    Every command of the hierarchy is a node of the tree, the content of the selected node is shown in a QStackedWidget.
+    The pages are created lazily by **page_factory** when their node (or one of its descendants) is selected for the first time.
+
+    :param page_factory: Creates the page of the command stored in the provided node
+    """
+
+    #: Internal Qt-signal, which will be emitted when another command was selected. The argument is the path of the new command.
+    currentPathChanged: Signal = Signal(tuple)
+
+    def __init__(self, page_factory: PageFactory):
+        super().__init__(Qt.Orientation.Horizontal)
+
+        self.page_factory = page_factory
+        self.tree = QTreeWidget()
+        self.tree.setHeaderHidden(True)
+        self.tree.setUniformRowHeights(True)  # Fast layouting for wide groups
+        self.stack = QStackedWidget()
+        self.addWidget(self.tree)
+        self.addWidget(self.stack)
+        self.setStretchFactor(1, 1)
+        self.setChildrenCollapsible(False)
+
+        # Node index: path <-> tree item/node/page
+        self.nodes: dict[CommandPath, CommandNode] = {}
+        self.items: dict[CommandPath, QTreeWidgetItem] = {}
+        self.pages: dict[CommandPath, QWidget] = {}
+        self.page_paths: dict[QWidget, CommandPath] = {}
+
+        self.tree.currentItemChanged.connect(self.__current_item_changed)
+
+    def add_node(self, node: CommandNode):
+        """Adds **node** and all of its children (recursively) to the tree.
+
+        :param node: The node that should be added, its parent has to be added already
+        """
+
+        item = QTreeWidgetItem([node.name])
+        item.setData(0, Qt.ItemDataRole.UserRole, node.path)
+        if node.command.short_help or node.command.help:
+            item.setToolTip(0, node.command.get_short_help_str())
+        if node.parent is None:
+            self.tree.addTopLevelItem(item)
+        else:
+            self.items[node.parent.path].addChild(item)
+
+        self.nodes[node.path] = node
+        self.items[node.path] = item
+
+        for child in node.ordered_children:
+            self.add_node(child)
+        if node.is_group:
+            item.setExpanded(node.parent is None)  # Only the root group is expanded
+
+    def page(self, path: CommandPath) -> QWidget:
+        """Returns the page of the command with the path **path**. The page will be created if it doesn't exist yet."""
+
+        if (page := self.pages.get(path)) is None:
+            page = self.page_factory(self.nodes[path])
+            self.pages[path] = page
+            self.page_paths[page] = path
+            self.stack.addWidget(page)
+
+        return page
+
+    def path_of(self, page: QWidget) -> t.Optional[CommandPath]:
+        """Returns the path of the command whose page is **page** or None, if **page** is not a page of this navigator."""
+
+        return self.page_paths.get(page)
+
+    def current_path(self) -> CommandPath:
+        """Returns the path of the selected command."""
+
+        item = self.tree.currentItem()
+        return () if item is None else item.data(0, Qt.ItemDataRole.UserRole)
+
+    def select(self, path: CommandPath) -> QWidget:
+        """Selects the command with the path **path** and returns its page.
+
+        :raises KeyError: There is no command with the path **path**
+        """
+
+        self.tree.setCurrentItem(self.items[path])
+        return self.page(path)
+
+    def first_leaf(self, path: CommandPath) -> CommandPath:
+        """Returns the path of the first (sub)command of **path** which is not a group or a group without subcommands."""
+
+        item = self.items[path]
+        while item.childCount() > 0:
+            item = item.child(0)
+        return item.data(0, Qt.ItemDataRole.UserRole)
+
+    def __current_item_changed(self, current: t.Optional[QTreeWidgetItem], _):
+        if current is None:
+            return
+
+        path: CommandPath = current.data(0, Qt.ItemDataRole.UserRole)
+        # The pages of all parent groups are needed for the execution of the command
+        for i in range(1, len(path)):
+            self.page(path[:i])
+        self.stack.setCurrentWidget(self.page(path))
+        self.currentPathChanged.emit(path)
@@ -1,52 +1,174 @@
 from __future__ import annotations
 
 from io import BytesIO, TextIOWrapper
-import html
+from contextlib import contextmanager
+from contextvars import ContextVar
+import sys
+import typing as t
 
+import click
 from PySide6.QtWidgets import QPlainTextEdit, QMenu
-from PySide6.QtGui import QTextCursor, QContextMenuEvent, QAction, QColor
+from PySide6.QtGui import QTextCursor, QContextMenuEvent, QAction, QColor, QPalette
 from PySide6.QtCore import Signal
 
+from clickqt.core.ansi import AnsiTextWriter
+from clickqt.core.logtee import current_log
+
+
+class OutputTarget(t.Protocol):  # pylint: disable=too-few-public-methods
+    """An object that can receive the messages of an :class:`~clickqt.core.output.OutputStream`."""
+
+    newMessage: Signal  # Signal(str, QColor): Text (may contain ANSI escape sequences) and default color
+
+
+class _Discard:  # pylint: disable=too-few-public-methods
+    """Marker for :func:`~clickqt.core.output.suppress_output`."""
+
+
+#: The sink of the current context (thread, run or validation), None = the default output of the stream
+_current_output: ContextVar["OutputTarget | _Discard | None"] = ContextVar(
+    "clickqt_output", default=None
+)
+#: The installed default outputs, the last one is the current default output of the streams
+_default_outputs: "list[OutputTarget]" = []
+
 
 class OutputStream(TextIOWrapper):
-    """Sends the content of **stream** as Html-escaped-text to **output**.
+    """Sends the content of **stream** as text to **output**.
+    The stream is installed once as sys.stdout/sys.stderr (see :func:`~clickqt.core.output.install_output_streams`),
+    the receiver of a write is determined by the context of the writer (see :func:`~clickqt.core.output.route_output`).
 
-    :param output: The object to which the content of **stream** should be sent
+    :param output: The object to which the content of **stream** should be sent if the writer didn't route its output elsewhere
     :param stream: The stream-object from which the content should be taken
-    :param color: The display color used in **output**
+    :param color: The default display color used in **output**
     """
 
-    def __init__(self, output: "TerminalOutput", stream: TextIOWrapper, color: QColor):
+    def __init__(self, output: OutputTarget, stream: TextIOWrapper, color: QColor):
         super().__init__(BytesIO(), "utf-8")
         self.output = output
         self.stream = stream
         self.color = color
+        #: True, if **stream** is a terminal, ANSI styles are removed from the text written to other streams
+        self.tty: bool = stream.isatty()
 
     def write(self, message: "bytes | str"):
-        """Writes **message** to **output** and utf-8 decoded + Html-escaped to **stream**
+        """Writes **message** utf-8 decoded to the output of the current context, to **stream** and to the log of the current run.
+        ANSI escape sequences are kept, they are rendered by the receiver.
 
         :param message: The message which should be written to **output** and **stream**
         """
 
         if message:
+            output = _current_output.get()
+            if isinstance(output, _Discard):
+                return
+            if output is None:
+                output = self.output
+
             message = message.decode("utf-8") if isinstance(message, bytes) else message
-            print(message, file=self.stream, end="")  # Write to "normal" stream as well
-            message = (
-                html.escape(message).replace("\r\n", "\n").replace("\n", "<br>")
-            )  # Replace '\n' with HTML code
+            print(
+                message if self.tty else click.unstyle(message),
+                file=self.stream,
+                end="",
+            )  # Write to "normal" stream as well, without styles if it isn't a terminal
+            if (log := current_log()) is not None:
+                log.write(message)
 
             # Send new message to main thread because worker thread could also be here (-> program crash otherwise)
-            self.output.newHtmlMessage.emit(
-                f"<p span style='color: rgb({self.color.red()}, {self.color.green()}, {self.color.blue()})'>{message}</p>"
-            )
+            output.newMessage.emit(message, self.color)
+
+    def isatty(self) -> bool:
+        """Inherited from :class:`~io.TextIOWrapper`\n
+        Returns whether the wrapped stream is a terminal. Runs keep the ANSI styles of click.style/click.secho for the output anyway,
+        see :class:`~clickqt.core.commandexecutor.CommandExecutor`.
+        """
+
+        return self.tty
+
+
+def install_output_streams(output: OutputTarget):
+    """Replaces sys.stdout and sys.stderr with an :class:`~clickqt.core.output.OutputStream`.
+    The streams are installed only once, further calls only change their default output to **output**.
+    The previous default outputs are remembered, see :func:`uninstall_output_streams`.
+
+    :param output: The object that receives all messages which are not routed elsewhere
+    """
+
+    if output in _default_outputs:
+        _default_outputs.remove(output)
+    _default_outputs.append(output)
+
+    if isinstance(sys.stdout, OutputStream):
+        sys.stdout.output = output
+    else:
+        sys.stdout = OutputStream(
+            output, sys.stdout, QPalette().color(QPalette.ColorRole.Text)
+        )
+
+    if isinstance(sys.stderr, OutputStream):
+        sys.stderr.output = output
+    else:
+        sys.stderr = OutputStream(output, sys.stderr, QColor("red"))
+
+
+def uninstall_output_streams(output: OutputTarget):
+    """Forgets **output** as default output. If it is the current one, the streams fall back to the most recently
+    installed output that is still installed, or are reset to the original streams if there is none.
+
+    :param output: The object that should no longer receive the messages
+    """
+
+    if output in _default_outputs:
+        _default_outputs.remove(output)
+
+    for name in ("stdout", "stderr"):
+        stream = getattr(sys, name)
+        if isinstance(stream, OutputStream) and stream.output is output:
+            if _default_outputs:
+                stream.output = _default_outputs[-1]
+            else:
+                setattr(sys, name, stream.stream)
+
+
+@contextmanager
+def route_output(output: OutputTarget) -> t.Iterator[None]:
+    """Sends everything written to sys.stdout and sys.stderr in the current context (e.g. thread) to **output**
+    while the context manager is active. Other threads are not affected.
+
+    :param output: The object that should receive the messages
+    """
+
+    token = _current_output.set(output)
+    try:
+        yield
+    finally:
+        _current_output.reset(token)
+
+
+@contextmanager
+def suppress_output() -> t.Iterator[None]:
+    """Discards everything written to sys.stdout and sys.stderr in the current context (e.g. thread) while the context manager is active.
+    Other threads are not affected.
+    """
+
+    token = _current_output.set(_Discard())
+    try:
+        yield
+    finally:
+        _current_output.reset(token)
 
 
 class TerminalOutput(QPlainTextEdit):
     """Displays the output on the screen. Extends the standard context menu with a 'clear'-function."""
 
-    newHtmlMessage: Signal = Signal(
-        str
-    )  #: Internal Qt-Signal, which will be emitted when there is a new Html-message to display
+    newMessage: Signal = Signal(
+        str, QColor
+    )  #: Internal Qt-Signal, which will be emitted when there is a new text (with ANSI escape sequences) to display
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+        self.ansi = AnsiTextWriter()
 
     def contextMenuEvent(self, event: QContextMenuEvent):  # pragma: no cover
         """Inherited from :class:`~PySide6.QtWidgets.QPlainTextEdit`\n
@@ -59,11 +181,20 @@ class TerminalOutput(QPlainTextEdit):
         action.triggered.connect(self.clear)
         menu.exec(event.globalPos())
 
-    def writeHtml(self, message: str):
-        """Appends **message** to the end of the current content.
+    def writeText(self, message: str, color: QColor):
+        """Appends **message** to the end of the current content. ANSI escape sequences are converted into text formats.
 
-        :param message: The message in Html-format that should be appended to the end of the current content
+        :param message: The message that should be appended to the end of the current content
+        :param color: The default color of **message**
         """
 
         self.moveCursor(QTextCursor.End)
-        self.textCursor().insertHtml(message)
+        self.ansi.insert(self.textCursor(), message, color)
+
+    def clear(self):
+        """Inherited from :class:`~PySide6.QtWidgets.QPlainTextEdit`\n
+        Removes the content and resets the text style.
+        """
+
+        super().clear()
+        self.ansi.reset()
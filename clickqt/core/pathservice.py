@@ -0,0 +1,361 @@
+""" Contains the PathService and PathCompleter classes. """
+from __future__ import annotations
+
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+import os
+import queue
+import stat
+import threading
+import time
+import typing as t
+
+from PySide6.QtWidgets import QCompleter, QLineEdit
+from PySide6.QtCore import QObject, QStringListModel, Qt, Signal, Slot
+
+#: Number of directory entries that are delivered at once
+LISTING_BATCH_SIZE = 256
+#: Seconds a thread waits for the result of :func:`~clickqt.core.pathservice.PathService.stat`
+STAT_TIMEOUT = 5.0
+
+
+class PathInfo(t.NamedTuple):
+    """Result of a stat call together with the access rights of the current user."""
+
+    exists: bool
+    is_dir: bool = False
+    readable: bool = False
+    writable: bool = False
+    executable: bool = False
+    #: Error message if the path couldn't be checked (other than "doesn't exist")
+    error: str = ""
+
+
+def stat_path(path: str) -> PathInfo:
+    """Returns the :class:`~clickqt.core.pathservice.PathInfo` of **path**. Accesses the filesystem (may block)."""
+
+    try:
+        is_dir = stat.S_ISDIR(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return PathInfo(False)
+    except (OSError, ValueError) as e:
+        return PathInfo(False, error=str(e))
+
+    return PathInfo(
+        True,
+        is_dir,
+        os.access(path, os.R_OK),
+        os.access(path, os.W_OK),
+        os.access(path, os.X_OK),
+    )
+
+
+class _DaemonPool:
+    """Runs functions in up to **max_workers** daemon threads. Unlike the threads of a ThreadPoolExecutor, they don't delay
+    the exit of the interpreter while they wait for a (hung network) filesystem.
+    """
+
+    def __init__(self, max_workers: int, thread_name_prefix: str):
+        self.max_workers = max_workers
+        self.thread_name_prefix = thread_name_prefix
+        self.__tasks: queue.SimpleQueue = queue.SimpleQueue()
+        self.__threads: list[threading.Thread] = []
+        self.__idle = 0
+        self.__lock = threading.Lock()
+
+    def submit(self, function: t.Callable[..., t.Any], *args: t.Any) -> Future:
+        """Calls **function** with **args** in a thread of the pool and returns the future of its result."""
+
+        future: Future = Future()
+        self.__tasks.put((future, function, args))
+        with self.__lock:
+            if self.__idle == 0 and len(self.__threads) < self.max_workers:
+                thread = threading.Thread(
+                    target=self.__work,
+                    name=f"{self.thread_name_prefix}_{len(self.__threads)}",
+                    daemon=True,
+                )
+                self.__threads.append(thread)
+                thread.start()
+        return future
+
+    def __work(self):
+        while True:
+            with self.__lock:
+                self.__idle += 1
+            future, function, args = self.__tasks.get()
+            with self.__lock:
+                self.__idle -= 1
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(function(*args))
+            except BaseException as e:  # pylint: disable=broad-exception-caught
+                future.set_exception(e)
+
+
+class PathService(QObject):
+    """Checks paths and lists directories in a thread pool, so the GUI thread never waits for a (slow network) filesystem.
+    The results are cached for **ttl** seconds and delivered via Qt-Signals in the GUI thread,
+    the result of a check is additionally passed to the functions that requested it.
+
+    :param max_workers: Number of threads of the pool, defaults to 4
+    :param ttl: Seconds after which a cached result is outdated, defaults to 10
+    """
+
+    #: Qt-Signal, which will be emitted when a path was checked (path, :class:`~clickqt.core.pathservice.PathInfo`)
+    statReady: Signal = Signal(str, object)
+    #: Qt-Signal, which delivers the entries of a directory in batches (directory, names, complete).
+    #: Names of subdirectories end with a path separator.
+    entriesReady: Signal = Signal(str, list, bool)
+
+    def __init__(self, max_workers: int = 4, ttl: float = 10.0):
+        super().__init__()
+
+        self.ttl = ttl
+        self.__pool = _DaemonPool(max_workers, thread_name_prefix="clickqt-path")
+        self.__lock = threading.Lock()
+        self.__stats: dict[str, tuple[float, PathInfo]] = {}
+        self.__listings: dict[str, tuple[float, list[str]]] = {}
+        self.__pending: set[tuple[str, str]] = set()  # (kind, path)
+        self.__stat_futures: dict[str, Future] = {}  # Path -> its running check
+        # Path -> functions that receive the result of its check (only used in the GUI thread)
+        self.__stat_receivers: dict[str, list[t.Callable[[str, PathInfo], t.Any]]] = {}
+
+        self.statReady.connect(self.__deliver_stat)
+
+    @property
+    def is_busy(self) -> bool:
+        """True, if a check or listing is running."""
+
+        with self.__lock:
+            return len(self.__pending) > 0
+
+    def cached_stat(self, path: str) -> t.Optional[PathInfo]:
+        """Returns the cached :class:`~clickqt.core.pathservice.PathInfo` of **path** or None if it is unknown or outdated."""
+
+        with self.__lock:
+            entry = self.__stats.get(path)
+        return entry[1] if entry and time.monotonic() - entry[0] < self.ttl else None
+
+    def last_stat(self, path: str) -> t.Optional[PathInfo]:
+        """Returns the last known :class:`~clickqt.core.pathservice.PathInfo` of **path** (even if it is outdated) or None if it is unknown."""
+
+        with self.__lock:
+            entry = self.__stats.get(path)
+        return entry[1] if entry else None
+
+    def cached_listing(self, directory: str) -> t.Optional[list[str]]:
+        """Returns the cached entries of **directory** or None if they are unknown or outdated."""
+
+        with self.__lock:
+            entry = self.__listings.get(directory)
+        return entry[1] if entry and time.monotonic() - entry[0] < self.ttl else None
+
+    def request_stat(
+        self,
+        path: str,
+        receiver: t.Optional[t.Callable[[str, PathInfo], t.Any]] = None,
+    ):
+        """Checks **path** in the background, :attr:`~clickqt.core.pathservice.PathService.statReady` delivers the result.
+
+        :param path: The path that should be checked
+        :param receiver: Function that is called with the path and the result in the GUI thread, defaults to None.
+                         Other paths (e.g. requested by other widgets) are not passed to it.
+        """
+
+        if receiver is not None:
+            receivers = self.__stat_receivers.setdefault(path, [])
+            if receiver not in receivers:
+                receivers.append(receiver)
+        self.__stat_future(path)
+
+    def stat(self, path: str, timeout: float = STAT_TIMEOUT) -> PathInfo:
+        """Returns the :class:`~clickqt.core.pathservice.PathInfo` of **path**: The cached result or the result of a check in the pool,
+        for which the calling thread waits at most **timeout** seconds. A check that takes longer is reported as error,
+        its result is cached when it arrives.
+
+        :param path: The path that should be checked
+        :param timeout: Seconds to wait for the check, defaults to :data:`~clickqt.core.pathservice.STAT_TIMEOUT`
+        """
+
+        if (info := self.cached_stat(path)) is not None:
+            return info
+        try:
+            return self.__stat_future(path).result(timeout)
+        except FutureTimeoutError:
+            return PathInfo(
+                False, error=f"Checking {path!r} took longer than {timeout:g} s"
+            )
+
+    def cancel_stat(self, receiver: t.Callable[[str, PathInfo], t.Any]):
+        """Removes **receiver** from all pending checks, e.g. because the requesting widget was deleted."""
+
+        for path in list(self.__stat_receivers):
+            receivers = self.__stat_receivers[path]
+            if receiver in receivers:
+                receivers.remove(receiver)
+            if not receivers:
+                del self.__stat_receivers[path]
+
+    def request_listing(self, directory: str):
+        """Lists **directory** in the background, :attr:`~clickqt.core.pathservice.PathService.entriesReady` delivers the entries."""
+
+        if self.__submit(("list", directory)):
+            self.__pool.submit(self.__list, directory)
+
+    def invalidate(self):
+        """Drops all cached results."""
+
+        with self.__lock:
+            self.__stats.clear()
+            self.__listings.clear()
+
+    def __submit(self, key: tuple[str, str]) -> bool:
+        with self.__lock:
+            if (
+                key in self.__pending
+            ):  # Requested twice, the running request delivers the result
+                return False
+            self.__pending.add(key)
+            return True
+
+    def __stat_future(self, path: str) -> Future:
+        with self.__lock:
+            # A path that is requested twice is checked once
+            if (future := self.__stat_futures.get(path)) is None:
+                future = self.__stat_futures[path] = self.__pool.submit(
+                    self.__stat, path
+                )
+                self.__pending.add(("stat", path))
+        return future
+
+    def __stat(self, path: str) -> PathInfo:
+        info = stat_path(path)
+        with self.__lock:
+            self.__stats[path] = (time.monotonic(), info)
+            self.__pending.discard(("stat", path))
+            del self.__stat_futures[path]
+        self.statReady.emit(path, info)
+        return info
+
+    @Slot(str, object)
+    def __deliver_stat(self, path: str, info: PathInfo):
+        for receiver in self.__stat_receivers.pop(path, []):
+            receiver(path, info)
+
+    def __list(self, directory: str):
+        entries: list[str] = []
+        try:
+            with os.scandir(directory or os.curdir) as it:
+                batch: list[str] = []
+                for entry in it:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    batch.append(entry.name + os.sep if is_dir else entry.name)
+                    if len(batch) == LISTING_BATCH_SIZE:
+                        entries.extend(batch)
+                        self.entriesReady.emit(directory, batch, False)
+                        batch = []
+                entries.extend(batch)
+        except OSError:
+            batch = []
+
+        with self.__lock:
+            self.__listings[directory] = (time.monotonic(), entries)
+            self.__pending.discard(("list", directory))
+        self.entriesReady.emit(directory, batch, True)
+
+
+_service: t.Optional[PathService] = None
+
+
+def path_service() -> PathService:
+    """Returns the :class:`~clickqt.core.pathservice.PathService` shared by all widgets, created on first use."""
+
+    global _service  # pylint: disable=global-statement
+    if _service is None:
+        _service = PathService()
+    return _service
+
+
+class PathCompleter(QCompleter):
+    """Completes the path of a line edit (see :func:`~PySide6.QtWidgets.QLineEdit.setCompleter`) with the entries of the typed directory.
+    The directory is listed by the :class:`~clickqt.core.pathservice.PathService`, entries are added while they arrive.
+
+    :param line_edit: The line edit that should be completed
+    :param service: The service that lists the directories
+    :param dirs_only: Whether only directories should be proposed, defaults to False
+    :param base_directory: Directory to which relative paths are relative, defaults to None (= the working directory of the process)
+    """
+
+    def __init__(
+        self,
+        line_edit: QLineEdit,
+        service: PathService,
+        dirs_only: bool = False,
+        base_directory: t.Optional[str] = None,
+    ):
+        super().__init__(line_edit)
+
+        self.line_edit = line_edit
+        self.service = service
+        self.dirs_only = dirs_only
+        self.base_directory = base_directory
+        #: The directory part (including the trailing separator) of the text whose entries are proposed
+        self.prefix: t.Optional[str] = None
+        #: The listed directory of :attr:`~clickqt.core.pathservice.PathCompleter.prefix`
+        self.directory: t.Optional[str] = None
+
+        #: The proposed paths
+        self.entries = QStringListModel(self)
+        self.setModel(self.entries)
+        self.setCaseSensitivity(
+            Qt.CaseSensitivity.CaseInsensitive
+            if os.name == "nt"
+            else Qt.CaseSensitivity.CaseSensitive
+        )
+
+        line_edit.textEdited.connect(self.update_prefix)
+        service.entriesReady.connect(self.__entries_ready)
+
+    @Slot(str)
+    def update_prefix(self, text: str):
+        """Lists the directory of **text** if it has changed."""
+
+        separators = "/\\" if os.name == "nt" else "/"
+        prefix = text[: max(text.rfind(sep) for sep in separators) + 1]
+        if prefix == self.prefix:
+            return
+
+        self.prefix = prefix
+        self.directory = (
+            os.path.join(self.base_directory, prefix)
+            if self.base_directory is not None and not os.path.isabs(prefix)
+            else prefix
+        )
+        self.entries.setStringList([])
+        if (entries := self.service.cached_listing(self.directory)) is not None:
+            self.__add(entries)
+        else:
+            self.service.request_listing(self.directory)
+
+    @Slot(str, list, bool)
+    def __entries_ready(self, directory: str, names: list[str], _):
+        if directory == self.directory:
+            self.__add(names)
+
+    def __add(self, names: list[str]):
+        if self.dirs_only:
+            names = [name for name in names if name.endswith(os.sep)]
+        if not names:
+            return
+
+        row = self.entries.rowCount()
+        self.entries.insertRows(row, len(names))
+        for i, name in enumerate(names, row):
+            self.entries.setData(self.entries.index(i), f"{self.prefix}{name}")
+
+        if self.line_edit.hasFocus():
+            self.complete()
@@ -0,0 +1,368 @@
+""" Contains the ResultModel and ResultViewer classes. """
+from __future__ import annotations
+
+from collections.abc import Mapping
+import csv
+import itertools
+import json
+import threading
+import typing as t
+
+from PySide6.QtWidgets import (
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QTreeView,
+    QToolButton,
+    QLabel,
+    QFileDialog,
+)
+from PySide6.QtCore import (
+    QAbstractItemModel,
+    QModelIndex,
+    Qt,
+    Signal,
+    Slot,
+)
+
+#: Number of children that are created at once when the user scrolls/expands
+FETCH_BATCH_SIZE = 500
+#: Maximum length of a displayed value
+MAX_VALUE_LENGTH = 200
+
+
+def _is_frame(value: t.Any) -> bool:
+    """True, if **value** looks like a pandas DataFrame."""
+
+    return hasattr(value, "iloc") and hasattr(value, "columns")
+
+
+def _is_container(value: t.Any) -> bool:
+    return isinstance(value, (Mapping, list, tuple, set, frozenset)) or _is_frame(value)
+
+
+class _Node:
+    """A value of the result tree. Children are created on demand in batches."""
+
+    __slots__ = ("key", "value", "parent", "row", "children", "total", "__source")
+
+    def __init__(self, key: str, value: t.Any, parent: t.Optional[_Node], row: int):
+        self.key = key
+        self.value = value
+        self.parent = parent
+        self.row = row
+        self.children: list[_Node] = []
+        #: Number of children, None if not yet known
+        self.total: t.Optional[int] = None
+        self.__source: t.Optional[t.Iterator[tuple[str, t.Any]]] = None
+
+    def has_children(self) -> bool:
+        if not _is_container(self.value):
+            return False
+        return len(self.value) > 0
+
+    def can_fetch_more(self) -> bool:
+        return self.has_children() and (
+            self.total is None or len(self.children) < self.total
+        )
+
+    def fetch(self, count: int) -> list[_Node]:
+        """Creates up to **count** further children."""
+
+        if self.__source is None:
+            self.__source, self.total = self.__items()
+
+        start = len(self.children)
+        for row, (key, value) in enumerate(
+            itertools.islice(self.__source, count), start
+        ):
+            self.children.append(_Node(key, value, self, row))
+        return self.children[start:]
+
+    def __items(self) -> tuple[t.Iterator[tuple[str, t.Any]], int]:
+        value = self.value
+        if _is_frame(value):
+            return (
+                ((str(i), value.iloc[i].to_dict()) for i in range(len(value))),
+                len(value),
+            )
+        if isinstance(value, Mapping):
+            return ((str(k), v) for k, v in value.items()), len(value)
+        return ((f"[{i}]", v) for i, v in enumerate(value)), len(value)
+
+    def summary(self) -> str:
+        value = self.value
+        if _is_frame(value):
+            return f"{len(value)} rows × {len(value.columns)} columns"
+        if _is_container(value):
+            return f"{len(value)} items"
+        text = repr(value)
+        return (
+            text
+            if len(text) <= MAX_VALUE_LENGTH
+            else text[: MAX_VALUE_LENGTH - 1] + "…"
+        )
+
+
+class ResultModel(QAbstractItemModel):
+    """Lazy tree model of a Python object (dicts, lists, tuples, sets, DataFrames, ...).
+    Only the rows that are visible (= fetched via canFetchMore/fetchMore) are materialized.
+
+    :param result: The object that should be shown
+    """
+
+    HEADERS = ("Key", "Type", "Value")
+
+    def __init__(self, result: t.Any):
+        super().__init__()
+
+        # The root item shows the result itself
+        self.root = _Node("", {"result": result}, None, 0)
+        self.root.fetch(1)
+
+    def __node(self, index: QModelIndex) -> _Node:
+        return index.internalPointer() if index.isValid() else self.root
+
+    def index(
+        self, row: int, column: int, parent: QModelIndex = QModelIndex()
+    ) -> QModelIndex:
+        """Inherited from :class:`~PySide6.QtCore.QAbstractItemModel`"""
+
+        node = self.__node(parent)
+        if 0 <= row < len(node.children) and 0 <= column < len(self.HEADERS):
+            return self.createIndex(row, column, node.children[row])
+        return QModelIndex()
+
+    def parent(self, index: QModelIndex = QModelIndex()) -> QModelIndex:  # type: ignore[override]
+        """Inherited from :class:`~PySide6.QtCore.QAbstractItemModel`"""
+
+        if not index.isValid():
+            return QModelIndex()
+        parent = index.internalPointer().parent
+        if parent is None or parent is self.root:
+            return QModelIndex()
+        return self.createIndex(parent.row, 0, parent)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Inherited from :class:`~PySide6.QtCore.QAbstractItemModel`\n
+        Returns the number of children created so far."""
+
+        if parent.column() > 0:
+            return 0
+        return len(self.__node(parent).children)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Inherited from :class:`~PySide6.QtCore.QAbstractItemModel`"""
+
+        return len(self.HEADERS)
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        """Inherited from :class:`~PySide6.QtCore.QAbstractItemModel`"""
+
+        return parent.column() <= 0 and self.__node(parent).has_children()
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        """Inherited from :class:`~PySide6.QtCore.QAbstractItemModel`"""
+
+        return parent.column() <= 0 and self.__node(parent).can_fetch_more()
+
+    def fetchMore(self, parent: QModelIndex):
+        """Inherited from :class:`~PySide6.QtCore.QAbstractItemModel`\n
+        Creates the next :const:`~clickqt.core.resultviewer.FETCH_BATCH_SIZE` children of **parent**.
+        """
+
+        node = self.__node(parent)
+        if node.total is None:
+            node.fetch(0)  # Determine the number of children
+        first = len(node.children)
+        last = min(first + FETCH_BATCH_SIZE, node.total) - 1
+        if last < first:
+            return
+        self.beginInsertRows(parent, first, last)
+        node.fetch(last - first + 1)
+        self.endInsertRows()
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """Inherited from :class:`~PySide6.QtCore.QAbstractItemModel`"""
+
+        if not index.isValid() or role not in (
+            Qt.ItemDataRole.DisplayRole,
+            Qt.ItemDataRole.ToolTipRole,
+        ):
+            return None
+
+        node: _Node = index.internalPointer()
+        column = index.column()
+        if column == 0:
+            return node.key
+        if column == 1:
+            return type(node.value).__name__
+        return node.summary()
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ):
+        """Inherited from :class:`~PySide6.QtCore.QAbstractItemModel`"""
+
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+        ):
+            return self.HEADERS[section]
+        return None
+
+
+def _json_default(value: t.Any) -> t.Any:
+    if _is_frame(value):
+        return value.to_dict(orient="records")
+    if isinstance(value, (set, frozenset)):
+        return list(value)
+    if hasattr(value, "to_dict"):
+        return value.to_dict()
+    if hasattr(value, "tolist"):  # numpy
+        return value.tolist()
+    return str(value)
+
+
+def export_json(result: t.Any, path: str):
+    """Writes **result** as JSON to **path**. The JSON text is streamed to the file chunk by chunk.
+
+    :param result: The object that should be exported
+    :param path: Path of the file
+    """
+
+    encoder = json.JSONEncoder(default=_json_default, ensure_ascii=False, indent=1)
+    with open(path, "w", encoding="utf-8", buffering=1 << 20) as file:
+        for chunk in encoder.iterencode(result):
+            file.write(chunk)
+
+
+def export_csv(result: t.Any, path: str):
+    """Writes **result** as CSV to **path** row by row.
+    Sequences of mappings (records) get a header row, mappings are written as key/value rows.
+
+    :param result: The object that should be exported
+    :param path: Path of the file
+    """
+
+    if _is_frame(result):
+        result.to_csv(path, index=False)
+        return
+
+    with open(path, "w", encoding="utf-8", newline="", buffering=1 << 20) as file:
+        writer = csv.writer(file)
+        if isinstance(result, Mapping):
+            writer.writerows(result.items())
+        elif isinstance(result, (list, tuple, set, frozenset)) or hasattr(
+            result, "__next__"
+        ):
+            rows = iter(result)
+            first = next(rows, None)
+            if first is None:
+                return
+            rows = itertools.chain((first,), rows)
+            if isinstance(first, Mapping):
+                fieldnames = list(first.keys())
+                writer.writerow(fieldnames)
+                writer.writerows([row.get(key) for key in fieldnames] for row in rows)
+            elif isinstance(first, (list, tuple)):
+                writer.writerows(rows)
+            else:
+                writer.writerows([row] for row in rows)
+        else:
+            writer.writerow([result])
+
+
+class ResultViewer(QWidget):
+    """Shows the return value of the executed command in a :class:`~clickqt.core.resultviewer.ResultModel`
+    and exports it to JSON or CSV in a background thread."""
+
+    #: Internal Qt-Signal, which will be emitted when an export has finished (path, error message or "")
+    exportFinished: Signal = Signal(str, str)
+
+    def __init__(self):
+        super().__init__()
+
+        self.result: t.Any = None
+        self.model: t.Optional[ResultModel] = None
+
+        self.view = QTreeView()
+        self.view.setUniformRowHeights(True)
+        self.view.setAlternatingRowColors(True)
+        self.json_button = QToolButton()
+        self.json_button.setText("Export JSON")
+        self.csv_button = QToolButton()
+        self.csv_button.setText("Export CSV")
+        self.status_label = QLabel()
+
+        buttons = QWidget()
+        buttons.setLayout(QHBoxLayout())
+        buttons.layout().setContentsMargins(0, 0, 0, 0)
+        buttons.layout().addWidget(QLabel("Result:"))
+        buttons.layout().addWidget(self.status_label, 1)
+        buttons.layout().addWidget(self.json_button)
+        buttons.layout().addWidget(self.csv_button)
+
+        self.setLayout(QVBoxLayout())
+        self.layout().setContentsMargins(0, 0, 0, 0)
+        self.layout().addWidget(buttons)
+        self.layout().addWidget(self.view)
+
+        self.json_button.clicked.connect(lambda: self.__ask_export("JSON (*.json)"))
+        self.csv_button.clicked.connect(lambda: self.__ask_export("CSV (*.csv)"))
+        self.exportFinished.connect(self.__export_finished)
+        self.hide()
+
+    @Slot(object)
+    def set_result(self, result: t.Any):
+        """Shows **result**, the viewer is hidden if **result** is None."""
+
+        self.result = result
+        self.status_label.setText("")
+        if result is None:
+            self.model = None
+            self.view.setModel(None)
+            self.hide()
+            return
+
+        self.model = ResultModel(result)
+        self.view.setModel(self.model)
+        self.view.expand(self.model.index(0, 0))
+        self.show()
+
+    def export(self, path: str, export_format: str = "json") -> threading.Thread:
+        """Exports the result to **path** in a background thread.
+
+        :param path: Path of the file
+        :param export_format: 'json' or 'csv'
+        :return: The thread that writes the file
+        """
+
+        export = export_csv if export_format == "csv" else export_json
+        result = self.result
+        self.status_label.setText(f"Exporting to {path} ...")
+
+        def run():
+            try:
+                export(result, path)
+                self.exportFinished.emit(path, "")
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                self.exportFinished.emit(path, f"{type(e).__name__}: {e}")
+
+        thread = threading.Thread(target=run, name="clickqt-export", daemon=True)
+        thread.start()
+        return thread
+
+    def __ask_export(self, file_filter: str):  # pragma: no cover
+        path, _ = QFileDialog.getSaveFileName(self, "Export result", "", file_filter)
+        if path:
+            self.export(path, "csv" if file_filter.startswith("CSV") else "json")
+
+    @Slot(str, str)
+    def __export_finished(self, path: str, error: str):
+        self.status_label.setText(
+            f"Export failed: {error}" if error else f"Exported to {path}"
+        )
@@ -0,0 +1,470 @@
+""" Contains the LineIndex and SearchBar classes. """
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+import re
+import threading
+import time
+import typing as t
+
+from PySide6.QtWidgets import (
+    QWidget,
+    QHBoxLayout,
+    QLineEdit,
+    QToolButton,
+    QCheckBox,
+    QLabel,
+    QPlainTextEdit,
+    QTextEdit,
+)
+from PySide6.QtGui import (
+    QColor,
+    QKeySequence,
+    QShortcut,
+    QTextCharFormat,
+    QTextCursor,
+    QTextDocument,
+)
+from PySide6.QtCore import QObject, QTimer, Qt, Signal, Slot
+
+#: Number of lines that are searched at once, the search thread yields in between
+SEARCH_CHUNK_LINES = 20000
+
+_ASTRAL = re.compile(
+    "[\U00010000-\U0010ffff]"
+)  # Characters that are 2 UTF-16 code units long
+
+
+def line_matches(
+    pattern: re.Pattern, text: str, pos: int = 0, endpos: t.Optional[int] = None
+) -> t.Iterator[re.Match]:
+    """Yields the non-empty matches of **pattern** in the lines of **text** (between **pos** and **endpos**), a match never spans lines.
+    The lines are searched at once, only the lines of matches that contain a line end are searched again one by one.
+    """
+
+    endpos = len(text) if endpos is None else endpos
+    while pos < endpos:
+        restart = None
+        for match in pattern.finditer(text, pos, endpos):
+            if match.end() == match.start():
+                continue
+            line_end = text.find("\n", match.start(), match.end())
+            if line_end >= 0:  # Search the line of the match on its own
+                line_start = max(pos, text.rfind("\n", pos, match.start()) + 1)
+                for line_match in pattern.finditer(text, line_start, line_end):
+                    if line_match.end() > line_match.start():
+                        yield line_match
+                restart = line_end + 1
+                break
+            yield match
+            pos = match.end()
+        if restart is None:
+            return
+        pos = restart
+
+
+class LineIndex(QObject):
+    """Plain text copy of a QTextDocument, one entry per line (= text block) together with its start position.
+    The index is maintained while output arrives, appending output only reads the new lines. A search reads the lines
+    of the index in a background thread, the document is never copied at once.
+
+    :param document: The document that should be indexed
+    """
+
+    #: Qt-Signal, which will be emitted when the document has changed. The argument is the position of the first changed line.
+    changed: Signal = Signal(int)
+
+    def __init__(self, document: QTextDocument):
+        super().__init__(document)
+
+        self.document = document
+        self.lines: list[str] = []
+        #: Position of the first character of every line in the document
+        self.starts: list[int] = []
+
+        self.__update(0)
+        document.contentsChange.connect(self.__contents_change)
+
+    def end(self) -> int:
+        """Returns the position of the end of the document."""
+
+        return self.document.characterCount() - 1
+
+    def line_number(self, position: int) -> int:
+        """Returns the number of the line that contains **position**."""
+
+        return max(bisect_right(self.starts, position) - 1, 0)
+
+    def __contents_change(self, position: int, *_):
+        self.__update(self.document.findBlock(position).blockNumber())
+
+    def __update(self, first: int):
+        first = max(min(first, len(self.lines)), 0)
+        del self.lines[first:]
+        del self.starts[first:]
+
+        block = self.document.findBlockByNumber(first)
+        while block.isValid():
+            self.lines.append(block.text())
+            self.starts.append(block.position())
+            block = block.next()
+
+        self.changed.emit(self.starts[first] if first < len(self.starts) else 0)
+
+
+class SearchBar(QWidget):
+    """Incremental search for a :class:`~clickqt.core.output.TerminalOutput`.
+    The lines of the documents are kept in a :class:`~clickqt.core.search.LineIndex` while output arrives, the search runs in a background thread
+    over the lines of the index. Like grep, a match never spans lines. Output that arrives while a search is active is searched incrementally.
+    Jumping to the next/previous match only needs a binary search. Only the matches in the visible area are highlighted.
+
+    :param editor: The text edit whose content should be searched
+    """
+
+    #: Internal Qt-Signal, which delivers the results of the search thread (generation, first position, match starts, match lengths)
+    searchFinished: Signal = Signal(int, int, list, list)
+
+    def __init__(self, editor: QPlainTextEdit):
+        super().__init__()
+
+        self.editor = editor
+        self.pattern: t.Optional[re.Pattern] = None
+        #: Document position and length of all matches, sorted by position
+        self.match_starts: list[int] = []
+        self.match_lengths: list[int] = []
+        self.current = -1  # Index of the selected match
+
+        self.__generation = 0
+        self.__running = False
+        # End of the text covered by match_starts (after the running search)
+        self.__searched_end = 0
+        # Position of the first line that has to be searched again
+        self.__dirty: t.Optional[int] = None
+
+        self.input = QLineEdit()
+        self.input.setPlaceholderText("Search")
+        self.input.setClearButtonEnabled(True)
+        self.regex = QCheckBox("Regex")
+        self.case_sensitive = QCheckBox("Aa")
+        self.case_sensitive.setToolTip("Case sensitive")
+        self.count_label = QLabel()
+        self.prev_button = QToolButton()
+        self.prev_button.setArrowType(Qt.ArrowType.UpArrow)
+        self.prev_button.setToolTip("Previous match")
+        self.next_button = QToolButton()
+        self.next_button.setArrowType(Qt.ArrowType.DownArrow)
+        self.next_button.setToolTip("Next match (Enter)")
+        self.close_button = QToolButton()
+        self.close_button.setText("✕")
+
+        self.setLayout(QHBoxLayout())
+        self.layout().setContentsMargins(0, 0, 0, 0)
+        for widget in (
+            self.input,
+            self.regex,
+            self.case_sensitive,
+            self.count_label,
+            self.prev_button,
+            self.next_button,
+            self.close_button,
+        ):
+            self.layout().addWidget(widget)
+
+        self.highlight_format = QTextCharFormat()
+        self.highlight_format.setBackground(QColor("yellow"))
+        self.highlight_format.setForeground(QColor("black"))
+
+        # Collect fast arriving output before searching it
+        self.debounce = QTimer(self)
+        self.debounce.setSingleShot(True)
+        self.debounce.setInterval(100)
+        self.debounce.timeout.connect(self.__search_dirty)
+        # Search when the user stopped typing
+        self.input_timer = QTimer(self)
+        self.input_timer.setSingleShot(True)
+        self.input_timer.setInterval(200)
+        self.input_timer.timeout.connect(self.search)
+
+        self.input.textChanged.connect(self.input_timer.start)
+        self.input.returnPressed.connect(self.next_match)
+        self.regex.toggled.connect(self.search)
+        self.case_sensitive.toggled.connect(self.search)
+        self.next_button.clicked.connect(self.next_match)
+        self.prev_button.clicked.connect(self.previous_match)
+        self.close_button.clicked.connect(self.close_search)
+        self.searchFinished.connect(self.__search_finished)
+        self.editor.verticalScrollBar().valueChanged.connect(self.highlight_visible)
+        escape = QShortcut(QKeySequence(Qt.Key.Key_Escape), self)
+        escape.setContext(Qt.ShortcutContext.WidgetWithChildrenShortcut)
+        escape.activated.connect(self.close_search)
+
+        self.watch(editor.document())
+        self.hide()
+
+    def watch(self, document: QTextDocument) -> LineIndex:
+        """Indexes **document** from now on, so it can be searched once the editor shows it. Returns the index of **document**.
+
+        :param document: A document that receives output
+        """
+
+        # The index is a child of the document, it is deleted together with it
+        if (index := document.findChild(LineIndex)) is None:
+            index = LineIndex(document)
+            index.changed.connect(self.__document_changed)
+        return index
+
+    @property
+    def index(self) -> LineIndex:
+        """The index of the document that is currently shown in the editor (created on first use if it isn't watched)."""
+
+        return self.watch(self.editor.document())
+
+    @Slot()
+    def open_search(self):
+        """Shows the search bar and focuses the search input."""
+
+        self.show()
+        self.input.setFocus()
+        self.input.selectAll()
+        self.search()
+
+    @Slot()
+    def close_search(self):
+        """Hides the search bar and removes the highlights."""
+
+        self.hide()
+        self.input_timer.stop()
+        self.__generation += 1
+        self.__running = False
+        self.pattern = None
+        self.editor.setExtraSelections([])
+
+    @Slot()
+    def search(self):
+        """Starts a new search for the text of the search input in the whole document."""
+
+        self.input_timer.stop()
+        self.__generation += 1
+        self.__running = False
+        self.match_starts, self.match_lengths = [], []
+        self.current = -1
+        self.__searched_end = 0
+        self.__dirty = None
+        self.input.setStyleSheet("")
+
+        text = self.input.text()
+        self.pattern = None
+        if text and not self.isHidden():
+            # The lines are searched joined, '^' and '$' match at line boundaries
+            flags = re.MULTILINE
+            if not self.case_sensitive.isChecked():
+                flags |= re.IGNORECASE
+            try:
+                self.pattern = re.compile(
+                    text if self.regex.isChecked() else re.escape(text), flags
+                )
+            except re.error:
+                self.input.setStyleSheet("QLineEdit { color: red }")
+
+        if self.pattern is None:
+            self.__update_label()
+            self.editor.setExtraSelections([])
+            return
+
+        self.__start(0)
+
+    @property
+    def is_searching(self) -> bool:
+        """True, if a search is running or output that arrived during the search still has to be searched."""
+
+        return self.__running or self.debounce.isActive() or self.input_timer.isActive()
+
+    @Slot()
+    def document_changed(self):
+        """Qt-Slot, which has to be called when the editor shows another document, restarts the search."""
+
+        if not self.isHidden():
+            self.search()
+
+    def __start(self, first: int):
+        assert self.pattern is not None
+
+        self.__running = True
+        index = self.index
+        first_line = index.line_number(first)
+        self.__searched_end = index.end()
+        threading.Thread(
+            target=self.__search_thread,
+            args=(
+                self.pattern,
+                index,
+                first_line,
+                len(index.lines),
+                index.starts[first_line],
+                self.__generation,
+            ),
+            daemon=True,
+        ).start()
+
+    def __search_thread(
+        self,
+        pattern: re.Pattern,
+        index: LineIndex,
+        first_line: int,
+        count: int,
+        first: int,
+        generation: int,
+    ):
+        match_starts: list[int] = []
+        match_lengths: list[int] = []
+
+        # The lines are read from the index, lines that change meanwhile are searched again (see __document_changed)
+        line = first_line
+        while line < count:
+            if generation != self.__generation:  # Outdated, a new search was started
+                return
+
+            lines = index.lines[line : min(line + SEARCH_CHUNK_LINES, count)]
+            starts = index.starts[line : line + 1]
+            if not lines or not starts:  # The document was cleared
+                break
+            # The lines are searched joined, '^' and '$' match at line boundaries
+            text = "\n".join(lines)
+
+            # Document positions count UTF-16 code units, characters outside the BMP are 2 units long
+            astral = (
+                [] if text.isascii() else [m.start() for m in _ASTRAL.finditer(text)]
+            )
+            for match in line_matches(pattern, text):
+                start = starts[0] + match.start() + bisect_left(astral, match.start())
+                match_starts.append(start)
+                match_lengths.append(
+                    starts[0] + match.end() + bisect_left(astral, match.end()) - start
+                )
+            line += len(lines)
+            time.sleep(0)  # Let the GUI thread run
+
+        self.searchFinished.emit(generation, first, match_starts, match_lengths)
+
+    @Slot(int, int, list, list)
+    def __search_finished(
+        self,
+        generation: int,
+        first: int,
+        match_starts: list[int],
+        match_lengths: list[int],
+    ):
+        if generation != self.__generation:
+            return
+
+        self.__running = False
+        # Replace the matches of the searched text
+        self.__drop_matches(first)
+        self.match_starts.extend(match_starts)
+        self.match_lengths.extend(match_lengths)
+
+        if self.current == -1 and self.match_starts:
+            self.__select(0)
+        self.__update_label()
+        self.highlight_visible()
+
+        if self.__dirty is not None:
+            self.debounce.start()
+
+    @Slot(int)
+    def __document_changed(self, first: int):
+        index = self.index
+        if self.pattern is None or self.sender() is not index:
+            return
+
+        # Matches in changed lines are outdated, the last searched line might have been extended
+        first = min(first, index.starts[index.line_number(self.__searched_end)])
+        self.__drop_matches(first)
+        self.__dirty = first if self.__dirty is None else min(first, self.__dirty)
+        if not self.__running:
+            self.debounce.start()
+
+    def __drop_matches(self, first: int):
+        """Removes the matches starting at position **first** or later."""
+
+        keep = bisect_left(self.match_starts, first)
+        del self.match_starts[keep:]
+        del self.match_lengths[keep:]
+        self.current = min(self.current, len(self.match_starts) - 1)
+
+    @Slot()
+    def __search_dirty(self):
+        if self.pattern is None or self.__dirty is None or self.__running:
+            return
+
+        first, self.__dirty = self.__dirty, None
+        self.__start(first)
+
+    @Slot()
+    def next_match(self):
+        """Selects the next match after the cursor."""
+
+        if self.match_starts:
+            position = self.editor.textCursor().selectionStart()
+            i = bisect_right(self.match_starts, position)
+            self.__select(i % len(self.match_starts))
+
+    @Slot()
+    def previous_match(self):
+        """Selects the previous match before the cursor."""
+
+        if self.match_starts:
+            position = self.editor.textCursor().selectionStart()
+            i = bisect_left(self.match_starts, position) - 1
+            self.__select(i % len(self.match_starts))
+
+    def __select(self, i: int):
+        self.current = i
+        cursor = QTextCursor(self.editor.document())
+        cursor.setPosition(self.match_starts[i])
+        cursor.setPosition(
+            self.match_starts[i] + self.match_lengths[i],
+            QTextCursor.MoveMode.KeepAnchor,
+        )
+        self.editor.setTextCursor(cursor)
+        self.editor.ensureCursorVisible()
+        self.__update_label()
+        self.highlight_visible()
+
+    @Slot()
+    def highlight_visible(self):
+        """Highlights the matches in the visible area of the editor."""
+
+        if self.pattern is None or not self.match_starts:
+            self.editor.setExtraSelections([])
+            return
+
+        first_block = self.editor.firstVisibleBlock()
+        last_block = self.editor.cursorForPosition(
+            self.editor.viewport().rect().bottomRight()
+        ).block()
+        first = bisect_left(self.match_starts, first_block.position())
+        last = bisect_right(
+            self.match_starts, last_block.position() + last_block.length()
+        )
+
+        selections = []
+        for i in range(first, min(last, first + 1000)):
+            selection = QTextEdit.ExtraSelection()
+            selection.cursor = QTextCursor(self.editor.document())
+            selection.cursor.setPosition(self.match_starts[i])
+            selection.cursor.setPosition(
+                self.match_starts[i] + self.match_lengths[i],
+                QTextCursor.MoveMode.KeepAnchor,
+            )
+            selection.format = self.highlight_format
+            selections.append(selection)
+        self.editor.setExtraSelections(selections)
+
+    def __update_label(self):
+        if self.pattern is None:
+            self.count_label.setText("")
+        elif not self.match_starts:
+            self.count_label.setText("No matches")
+        else:
+            self.count_label.setText(f"{self.current + 1} / {len(self.match_starts)}")
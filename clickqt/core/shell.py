@@ -0,0 +1,85 @@
+""" Contains the Shell class. """
+from __future__ import annotations
+
+import typing as t
+
+from PySide6.QtWidgets import QApplication, QTabWidget
+from PySide6.QtGui import QScreen
+
+from clickqt.core.core import create_application
+from clickqt.core.output import install_output_streams, uninstall_output_streams
+
+if t.TYPE_CHECKING:
+    from clickqt.core.control import Control
+
+
+class Shell:
+    """A window that shows the GUIs of several commands as tabs. All GUIs share the QApplication, the widget classes,
+    the style resources and the imported modules, so an additional command costs little memory.
+    Every GUI shows the output of its runs in its own terminal output, other output (e.g. of validators) goes to the selected tab.
+
+    :param title: Title of the window and name of a new application, defaults to None (= name of the application)
+    :param window_icon: Path to the icon of a new application, defaults to None (= no icon)
+    """
+
+    def __init__(
+        self, title: t.Optional[str] = None, window_icon: t.Optional[str] = None
+    ):
+        create_application(title, window_icon)
+        self.window = QTabWidget()
+        self.window.setDocumentMode(True)
+        if title is not None:
+            self.window.setWindowTitle(title)
+        self.window.currentChanged.connect(self.tab_changed)
+        self.window.destroyed.connect(self.window_destroyed)
+
+        #: The controls of the tabs, in the order of the tabs
+        self.controls: list[Control] = []
+
+    def __call__(self):
+        """Shows the window"""
+
+        size_hint = self.window.sizeHint()
+        self.window.resize(size_hint.width(), size_hint.height())
+        center = QScreen.availableGeometry(QApplication.primaryScreen()).center()
+        geo = self.window.geometry()
+        geo.moveCenter(center)
+        self.window.move(geo.topLeft())
+
+        self.window.show()
+        QApplication.instance().exec()
+
+    def add(self, control: Control, title: t.Optional[str] = None) -> int:
+        """Adds the GUI of **control** as new tab.
+
+        :param control: The control of the GUI
+        :param title: Title of the tab, defaults to None (= name of the command of **control**)
+
+        :return: The index of the tab
+        """
+
+        self.controls.append(control)
+        index = self.window.addTab(control.gui.window, title or control.cmd.name)
+        self.tab_changed(
+            self.window.currentIndex()
+        )  # A new GUI takes the default output
+        return index
+
+    def current_control(self) -> t.Optional[Control]:
+        """Returns the control of the selected tab, None if there are no tabs."""
+
+        index = self.window.currentIndex()
+        return self.controls[index] if index >= 0 else None
+
+    def tab_changed(self, index: int):
+        """Sends the output that isn't routed elsewhere to the terminal output of the tab at **index**."""
+
+        if 0 <= index < len(self.controls):
+            install_output_streams(self.controls[index].gui.terminal_output)
+
+    def window_destroyed(self):
+        """Forgets the terminal outputs of the tabs of the deleted window as default outputs."""
+
+        for control in self.controls:
+            uninstall_output_streams(control.gui.terminal_output)
+        self.controls = []
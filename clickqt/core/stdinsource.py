@@ -0,0 +1,83 @@
+""" Contains the StdinSource class. """
+from __future__ import annotations
+
+import io
+import typing as t
+
+#: Size of the chunks that are read from the source at once
+CHUNK_SIZE = 1 << 16
+
+
+class StdinSource(io.RawIOBase):
+    """Raw, read-only stream of a file or a named pipe that replaces sys.stdin for a click.File('-') parameter.
+    The source is opened on the first read (= in the thread that executes the command), so a named pipe doesn't block
+    while the values are validated. Wrap it with :func:`~clickqt.core.stdinsource.open_stdin_source` to read it in chunks.
+
+    :param path: Path of the file or named pipe
+    """
+
+    def __init__(self, path: str):
+        super().__init__()
+
+        self.path = path
+        self.__file: t.Optional[t.BinaryIO] = None
+
+    @property
+    def name(self) -> str:
+        """The path of the source."""
+
+        return self.path
+
+    def readable(self) -> bool:
+        """Inherited from :class:`io.RawIOBase`"""
+
+        return True
+
+    def readinto(self, buffer: t.Any) -> int:
+        """Inherited from :class:`io.RawIOBase`\n
+        Opens the source if this is the first read."""
+
+        if self.closed:
+            raise ValueError("I/O operation on closed file.")
+        if self.__file is None:
+            self.__file = t.cast(t.BinaryIO, open(self.path, "rb", buffering=0))
+        return self.__file.readinto(buffer)  # type: ignore[attr-defined]
+
+    def close(self):
+        """Inherited from :class:`io.RawIOBase`\n
+        Closes the source if it was opened."""
+
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+        super().close()
+
+
+def open_stdin_source(
+    path: str,
+    mode: str = "r",
+    encoding: t.Optional[str] = None,
+    errors: t.Optional[str] = "strict",
+    chunk_size: int = CHUNK_SIZE,
+) -> t.IO[t.Any]:
+    """Returns a buffered stream of the file or named pipe **path** that reads the source in chunks of **chunk_size** bytes,
+    only the current chunk is held in memory. Nothing is opened until the first read.
+
+    :param path: Path of the file or named pipe
+    :param mode: The mode of the click.File parameter, 'b' in **mode** returns a binary stream, otherwise a text stream
+    :param encoding: Encoding of a text stream, defaults to None (= locale encoding)
+    :param errors: Error handling of a text stream, defaults to 'strict'
+    :param chunk_size: Size of the read buffer in bytes
+    """
+
+    stream = io.BufferedReader(StdinSource(path), chunk_size)
+    if "b" in mode:
+        return stream
+    return io.TextIOWrapper(stream, encoding=encoding, errors=errors)
+
+
+def stdin_source_path(stream: t.Any) -> t.Optional[str]:
+    """Returns the path of the source if **stream** was returned by :func:`~clickqt.core.stdinsource.open_stdin_source`, None otherwise."""
+
+    raw = getattr(getattr(stream, "buffer", stream), "raw", None)
+    return raw.path if isinstance(raw, StdinSource) else None
@@ -1,4 +1,5 @@
 from __future__ import annotations
+import sys
 from click import Parameter
 
 
@@ -11,3 +12,21 @@ def remove_prefix(text: str, prefix: str):
 
 def is_param_arg(parameter: Parameter):
     return not any(o.startswith("-") for o in parameter.opts)
+
+
+def is_option_group_title(parameter: Parameter) -> bool:
+    """Returns True, if **parameter** is the title of an option group of click_option_group.
+    click_option_group isn't imported here: A command that has option groups has already imported it.
+    """
+
+    core = sys.modules.get("click_option_group._core")
+    return core is not None and isinstance(
+        parameter, core._GroupTitleFakeOption  # pylint: disable=protected-access
+    )
+
+
+def is_grouped_option(parameter: Parameter) -> bool:
+    """Returns True, if **parameter** is an option of an option group of click_option_group."""
+
+    core = sys.modules.get("click_option_group._core")
+    return core is not None and isinstance(parameter, core.GroupedOption)
@@ -1,14 +1,65 @@
-from .basewidget import BaseWidget, NumericField, ComboBoxBase, MultiWidget
-from .checkbox import CheckBox
-from .textfield import TextField, PathField
-from .combobox import ComboBox, CheckableComboBox
-from .datetimeedit import DateTimeEdit
-from .numericfields import IntField, RealField
-from .passwordfield import PasswordField
-from .filepathfield import FilePathField
-from .filefield import FileField
-from .confirmationwidget import ConfirmationWidget
-from .messagebox import MessageBox
-from .tuplewidget import TupleWidget
-from .nvaluewidget import NValueWidget
-from .multivaluewidget import MultiValueWidget
+import importlib
+import typing as t
+
+if t.TYPE_CHECKING:
+    from .basewidget import BaseWidget, NumericField, ComboBoxBase, MultiWidget
+    from .checkbox import CheckBox
+    from .textfield import TextField, PathField
+    from .combobox import ComboBox, CheckableComboBox
+    from .datetimeedit import DateTimeEdit
+    from .numericfields import IntField, RealField
+    from .passwordfield import PasswordField
+    from .filepathfield import FilePathField
+    from .filefield import FileField
+    from .confirmationwidget import ConfirmationWidget
+    from .messagebox import MessageBox
+    from .tuplewidget import TupleWidget
+    from .nvaluewidget import NValueWidget
+    from .multivaluewidget import MultiValueWidget
+    from .listeditwidget import ListEditWidget
+    from .tupletablewidget import TupleTableWidget
+    from .customwidget import CustomWidget
+    from .optiongrouptitlewidget import OptionGroupTitleWidget
+
+# Widget class -> module, a widget module is imported when its class is used for the first time
+_WIDGET_MODULES = {
+    "BaseWidget": "basewidget",
+    "NumericField": "basewidget",
+    "ComboBoxBase": "basewidget",
+    "MultiWidget": "basewidget",
+    "CheckBox": "checkbox",
+    "TextField": "textfield",
+    "PathField": "textfield",
+    "ComboBox": "combobox",
+    "CheckableComboBox": "combobox",
+    "DateTimeEdit": "datetimeedit",
+    "IntField": "numericfields",
+    "RealField": "numericfields",
+    "PasswordField": "passwordfield",
+    "FilePathField": "filepathfield",
+    "FileField": "filefield",
+    "ConfirmationWidget": "confirmationwidget",
+    "MessageBox": "messagebox",
+    "TupleWidget": "tuplewidget",
+    "NValueWidget": "nvaluewidget",
+    "MultiValueWidget": "multivaluewidget",
+    "ListEditWidget": "listeditwidget",
+    "TupleTableWidget": "tupletablewidget",
+    "CustomWidget": "customwidget",
+    "OptionGroupTitleWidget": "optiongrouptitlewidget",
+}
+
+__all__ = list(_WIDGET_MODULES)
+
+
+def __getattr__(name: str) -> t.Any:
+    if name in _WIDGET_MODULES:
+        module = importlib.import_module(f"{__name__}.{_WIDGET_MODULES[name]}")
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> t.List[str]:
+    return sorted(set(globals()) | set(_WIDGET_MODULES))
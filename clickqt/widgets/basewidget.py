@@ -24,6 +24,7 @@ from clickqt.widgets.styles import (
 )
 
 from clickqt.core.error import ClickQtError
+from clickqt.core.choiceindex import ChoiceIndex, choice_index
 import clickqt.core  # FocusOutValidator
 
 
@@ -36,6 +37,7 @@ class BaseWidget(ABC):
     :param parent: The parent BaseWidget of **otype**, defaults to None. Needed for :class:`~clickqt.widgets.basewidget.MultiWidget`-widgets
     :param kwargs: Additionally parameters ('widgetsource', 'com', 'label') needed for
                     :class:`~clickqt.widgets.basewidget.MultiWidget`- / :class:`~clickqt.widgets.confirmationwidget.ConfirmationWidget`-widgets
+                    and 'working_directory' (see :attr:`~clickqt.widgets.basewidget.BaseWidget.working_directory`)
     """
 
     widget_type: t.ClassVar[t.Type]  #: The Qt-type of this widget.
@@ -55,6 +57,8 @@ class BaseWidget(ABC):
         self.param = param
         self.parent_widget = parent
         self.click_command: click.Command = kwargs.get("com")
+        #: Directory to which relative paths are relative, None = the working directory of the process
+        self.working_directory: t.Optional[str] = kwargs.get("working_directory")
         self.widget_name = param.name
         self.container = QWidget()
         self.layout = (
@@ -206,17 +210,11 @@ class BaseWidget(ABC):
         is_tuple = isinstance(self.type, click.Tuple)
         primitive_nargs = self.param.nargs > 1 and not is_tuple
 
-        # conversion from widget contents to click data type
-        def convert(value):
-            return self.type.convert(
-                value, self.param, click.Context(self.click_command)
-            )
-
         try:
             if multiple or primitive_nargs:
-                value = tuple((convert(value) for value in raw_value))
+                value = tuple((self.convert_value(value) for value in raw_value))
             else:
-                value = convert(self.get_widget_value())
+                value = self.convert_value(self.get_widget_value())
 
         except Exception as e:  # pylint: disable=broad-exception-caught
             self.handle_valid(False)
@@ -228,6 +226,93 @@ class BaseWidget(ABC):
             )
         return self.handle_callback(value)
 
+    def convert_value(self, value: t.Any) -> t.Any:
+        """Converts **value** (e.g. the widget value) from the widget contents to the click data type.
+
+        :param value: The value that should be converted
+
+        :return: The converted value, raises an exception (e.g. click.BadParameter) if **value** is invalid
+        """
+
+        if isinstance(self.type, (click.Path, click.File)):
+            value = self.resolve_path(value)
+        return self.type.convert(value, self.param, click.Context(self.click_command))
+
+    def resolve_path(self, value: t.Any) -> t.Any:
+        """Returns **value** relative to :attr:`~clickqt.widgets.basewidget.BaseWidget.working_directory` if it is a relative path,
+        **value** otherwise ('' and '-' included).
+
+        :param value: The path (e.g. the widget value)
+        """
+
+        if (
+            self.working_directory is None
+            or not isinstance(value, str)
+            or value in ("", "-")
+            or os.path.isabs(value)
+        ):
+            return value
+        return os.path.join(self.working_directory, value)
+
+    def convert_values(
+        self, raw_values: t.Iterable[t.Any]
+    ) -> tuple[list[t.Any], dict[int, str]]:
+        """Converts every value of **raw_values** (e.g. the entries of a multiple parameter) with
+        :func:`~clickqt.widgets.basewidget.BaseWidget.convert_value`.
+
+        :param raw_values: The values that should be converted
+
+        :return: The converted values of the valid entries and the error message of every invalid entry (index -> message)
+        """
+
+        values: list[t.Any] = []
+        errors: dict[int, str] = {}
+        for i, raw_value in enumerate(raw_values):
+            try:  # Try to convert the provided value into the corresponding click object type
+                values.append(self.convert_value(raw_value))
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                errors[i] = str(e)
+        return values, errors
+
+    def converting_error(self, messages: t.Sequence[str]) -> ClickQtError:
+        """Returns the error of invalid entries (see :func:`~clickqt.widgets.basewidget.BaseWidget.convert_values`),
+        several messages are joined.
+
+        :param messages: The error messages of the invalid entries
+        """
+
+        joined = ", ".join(messages)
+        return ClickQtError(
+            ClickQtError.ErrorType.CONVERTING_ERROR,
+            self.widget_name,
+            joined if len(messages) == 1 else joined.join(["[", "]"]),
+        )
+
+    def process_value(self, ctx: click.Context, value: t.Any) -> t.Any:
+        """Processes **value** like click does before it is passed to the command: click.Parameter.process_value converts it
+        (again), checks whether a required value is missing and calls the user-defined callback.
+
+        :param ctx: The context of the command
+        :param value: The converted value
+        """
+
+        return self.param.process_value(ctx, value)
+
+    def process_converted_value(self, ctx: click.Context, value: t.Any) -> t.Any:
+        """Like click.Parameter.process_value, but **value** has already been converted by
+        :func:`~clickqt.widgets.basewidget.BaseWidget.convert_value` and isn't converted again.
+        Checks whether a required value is missing and calls the user-defined callback.
+
+        :param ctx: The context of the command
+        :param value: The converted value
+        """
+
+        if self.param.required and self.param.value_is_missing(value):
+            raise click.MissingParameter(ctx=ctx, param=self.param)
+        if self.param.callback is not None:
+            value = self.param.callback(ctx, self.param, value)
+        return value
+
     def handle_callback(self, value: t.Any) -> tuple[t.Any, ClickQtError]:
         """Validates **value** in the user-defined callback (if provided) and returns the result.
 
@@ -240,7 +325,7 @@ class BaseWidget(ABC):
 
         try:  # Consider callbacks
             ret_val = (
-                self.param.process_value(click.Context(self.click_command), value),
+                self.process_value(click.Context(self.click_command), value),
                 ClickQtError(),
             )
             self.handle_valid(True)
@@ -353,6 +438,29 @@ class ComboBoxBase(BaseWidget):
 
         self.add_items(otype.choices)
 
+    @property
+    def choice_index(self) -> ChoiceIndex:
+        """The :class:`~clickqt.core.choiceindex.ChoiceIndex` of the choices, valid values are looked up in O(1)."""
+
+        return choice_index(self.type, click.Context(self.click_command))
+
+    def convert_value(self, value: t.Any) -> t.Any:
+        """Looks up a valid **value** in the :class:`~clickqt.core.choiceindex.ChoiceIndex`.
+        Subclasses of click.Choice with their own convert method convert the value themselves.
+        """
+
+        if type(self.type).convert is not click.Choice.convert:
+            return super().convert_value(value)
+        ctx = click.Context(self.click_command)
+        return choice_index(self.type, ctx).convert(value, self.param, ctx)
+
+    def process_value(self, ctx: click.Context, value: t.Any) -> t.Any:
+        """The values have been looked up by :func:`~clickqt.widgets.basewidget.ComboBoxBase.convert_value`,
+        click would convert them again by comparing them with all choices.
+        """
+
+        return self.process_converted_value(ctx, value)
+
     @abstractmethod
     def add_items(self, items: t.Iterable[str]):
         """Adds each of the strings in **items** to the checkable combobox."""
@@ -2,14 +2,14 @@ from __future__ import annotations
 
 import typing as t
 import click
-from PySide6.QtWidgets import QComboBox
 
 from clickqt.widgets.basewidget import ComboBoxBase, BaseWidget
 from clickqt.widgets.core.QCheckableCombobox import QCheckableComboBox
+from clickqt.widgets.core.QChoiceComboBox import QChoiceComboBox
 
 
 class ComboBox(ComboBoxBase):
-    """Represents a click.types.Choice object.
+    """Represents a click.types.Choice object. The choices are added lazily to the popup and typed text is completed.
 
     :param otype: The type which specifies the clickqt widget type. This type may be different compared to **param**.type when dealing with click.types.CompositeParamType-objects
     :param param: The parameter from which **otype** came from
@@ -17,7 +17,7 @@ class ComboBox(ComboBoxBase):
                     :class:`~clickqt.widgets.basewidget.MultiWidget`- / :class:`~clickqt.widgets.confirmationwidget.ConfirmationWidget`-widgets
     """
 
-    widget_type = QComboBox  #: The Qt-type of this widget.
+    widget_type = QChoiceComboBox  #: The Qt-type of this widget.
 
     def __init__(self, otype: click.ParamType, param: click.Parameter, **kwargs):
         super().__init__(otype, param, **kwargs)
@@ -29,16 +29,16 @@ class ComboBox(ComboBoxBase):
             self.set_value(default)
 
     def set_value(self, value: t.Any):
-        self.widget.setCurrentText(
+        self.widget.select_text(
             str(
-                self.type.convert(
+                self.choice_index.convert(
                     str(value), self.click_command, click.Context(self.click_command)
                 )
             )
         )
 
-    def add_items(self, items: t.Iterable[str]):
-        self.widget.addItems(items)
+    def add_items(self, items: t.Sequence[str]):
+        self.widget.set_choices(items, self.choice_index)
 
     def get_widget_value(self) -> str:
         return self.widget.currentText()
@@ -65,14 +65,10 @@ class CheckableComboBox(ComboBoxBase):
 
     def set_value(self, value: t.Iterable[t.Any]):
         check_values: list[str] = []
+        index = self.choice_index
+        ctx = click.Context(self.click_command)
         for v in value:
-            check_values.append(
-                str(
-                    self.type.convert(
-                        str(v), self.click_command, click.Context(self.click_command)
-                    )
-                )
-            )
+            check_values.append(str(index.convert(str(v), self.click_command, ctx)))
 
         self.widget.checkItems(check_values)
 
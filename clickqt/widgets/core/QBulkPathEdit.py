@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import glob
+import os
+import threading
+import typing as t
+
+from PySide6.QtWidgets import QWidget, QLineEdit, QCheckBox, QToolButton
+from PySide6.QtCore import Signal, Slot
+
+from clickqt.widgets.core.QValueListEdit import QValueListEdit
+
+#: Number of paths that are added to the list at once while a pattern is expanded
+EXPANSION_BATCH_SIZE = 1000
+
+
+def expand_pattern(
+    pattern: str, recursive: bool, root_dir: t.Optional[str] = None
+) -> t.Iterator[str]:
+    """Yields the paths **pattern** stands for: The matches of a glob pattern ('**' matches subdirectories if **recursive**),
+    the files of a directory (of all subdirectories if **recursive**) or the path itself. Accesses the filesystem.
+
+    :param pattern: A glob pattern, a directory or a path
+    :param recursive: Whether subdirectories should be considered
+    :param root_dir: Directory to which a relative **pattern** is relative, defaults to None (= the working directory of the process).
+                     The yielded paths are relative to it as well
+    """
+
+    prefix = (
+        os.path.join(root_dir, "") if root_dir and not os.path.isabs(pattern) else ""
+    )
+    if glob.has_magic(pattern):
+        paths = glob.iglob(glob.escape(prefix) + pattern, recursive=recursive)
+    elif os.path.isdir(prefix + pattern):
+        paths = _directory_files(prefix + pattern, recursive)
+    else:
+        if pattern:
+            yield pattern
+        return
+    for path in paths:
+        yield path[len(prefix) :]
+
+
+def _directory_files(directory: str, recursive: bool) -> t.Iterator[str]:
+    if recursive:
+        for root, _, files in os.walk(directory):
+            for name in files:
+                yield os.path.join(root, name)
+    else:
+        with os.scandir(directory) as it:
+            for entry in it:
+                yield os.path.join(directory, entry.name)
+
+
+class QBulkPathEdit(QValueListEdit):
+    """A :class:`~clickqt.widgets.core.QValueListEdit.QValueListEdit` for paths. Paths are also added by glob patterns and
+    directories (expanded in a background thread) or by dropping files on the list.
+
+    :param parent: The parent widget, defaults to None
+    :param working_directory: Directory to which the patterns are relative, defaults to None (= the working directory of the process)
+    """
+
+    #: Internal Qt-Signal, which delivers the paths of the expansion thread (generation, paths, finished, error)
+    pathsFound: Signal = Signal(int, list, bool, str)
+
+    item_name = "path"
+
+    def __init__(
+        self,
+        parent: t.Optional[QWidget] = None,
+        working_directory: t.Optional[str] = None,
+    ):
+        self.__generation = 0  # Incremented when the list is replaced, running expansions are outdated then
+        self.__running = 0  # Number of running expansions
+        self.__error = ""  # Error of the last expansion
+        self.working_directory = working_directory
+
+        super().__init__(parent)
+
+        # The expansion threads outlive the widget, they must not emit pathsFound after it is deleted
+        self.__deleted = threading.Event()
+        self.__emit_lock = threading.Lock()
+        deleted, emit_lock = self.__deleted, self.__emit_lock
+
+        def mark_deleted(*_):
+            with emit_lock:
+                deleted.set()
+
+        self.destroyed.connect(mark_deleted)
+
+        self.pattern = QLineEdit()
+        self.pattern.setPlaceholderText(
+            "Glob pattern, directory or path (Enter to add)"
+        )
+        self.recursive = QCheckBox("Recursive")
+        self.expand_button = QToolButton()
+        self.expand_button.setText("Add")
+        for i, widget in enumerate((self.pattern, self.recursive, self.expand_button)):
+            self.controls.insertWidget(i, widget)
+
+        self.pattern.returnPressed.connect(self.add_pattern)
+        self.expand_button.clicked.connect(self.add_pattern)
+        self.pathsFound.connect(self.__paths_found)
+
+    @property
+    def is_expanding(self) -> bool:
+        """True, if a pattern is being expanded."""
+
+        return self.__running > 0
+
+    def set_values(self, values: t.Iterable[str]):
+        """Replaces the paths of the list and stops running expansions."""
+
+        self.__generation += 1
+        self.__running = 0
+        self.__error = ""
+        super().set_values(values)
+
+    @Slot()
+    def add_pattern(self):
+        """Expands the pattern of the input in a background thread and appends the paths while they are found."""
+
+        pattern = self.pattern.text().strip()
+        if not pattern:
+            return
+        self.pattern.clear()
+
+        self.__running += 1
+        self.__error = ""
+        self.update_label()
+        threading.Thread(
+            target=self.__expand,
+            args=(
+                pattern,
+                self.recursive.isChecked(),
+                self.working_directory,
+                self.__generation,
+            ),
+            name="clickqt-glob",
+            daemon=True,
+        ).start()
+
+    def __expand(
+        self,
+        pattern: str,
+        recursive: bool,
+        root_dir: t.Optional[str],
+        generation: int,
+    ):
+        batch: list[str] = []
+        error = ""
+        try:
+            for path in expand_pattern(pattern, recursive, root_dir):
+                if generation != self.__generation:  # Outdated
+                    return
+                batch.append(path)
+                if len(batch) == EXPANSION_BATCH_SIZE:
+                    if not self.__emit(generation, batch, False, ""):
+                        return
+                    batch = []
+        except OSError as e:
+            error = f"{pattern}: {e.strerror or e}"
+        self.__emit(generation, batch, True, error)
+
+    def __emit(self, generation: int, paths: list[str], finished: bool, error: str):
+        """Emits :attr:`pathsFound` from the expansion thread, returns False if the widget has been deleted."""
+
+        with self.__emit_lock:
+            if self.__deleted.is_set():
+                return False
+            self.pathsFound.emit(generation, paths, finished, error)
+            return True
+
+    @Slot(int, list, bool, str)
+    def __paths_found(
+        self, generation: int, paths: list[str], finished: bool, error: str
+    ):
+        if generation != self.__generation:
+            return
+        if finished:
+            self.__running -= 1
+        if error:
+            self.__error = error
+        self.add_values(paths)
+        self.update_label()
+
+    def label_text(self) -> str:
+        text = super().label_text()
+        if self.__error:
+            text = f"{text} ({self.__error})"
+        return f"{text} ..." if self.is_expanding else text
+
+    def drop_urls(self, urls: list) -> bool:
+        self.add_values([url.toLocalFile() for url in urls if url.isLocalFile()])
+        return True
@@ -3,13 +3,137 @@ from __future__ import annotations
 
 import typing as t
 
-from PySide6.QtWidgets import QComboBox, QStyledItemDelegate
-from PySide6.QtCore import Qt, QEvent, QObject
-from PySide6.QtGui import QStandardItem
+from PySide6.QtWidgets import (
+    QComboBox,
+    QStyledItemDelegate,
+    QWidget,
+    QHBoxLayout,
+    QLineEdit,
+    QToolButton,
+    QListView,
+)
+from PySide6.QtCore import (
+    Qt,
+    QEvent,
+    QObject,
+    QAbstractListModel,
+    QModelIndex,
+    QSortFilterProxyModel,
+    Signal,
+)
+
+
+class CheckableListModel(QAbstractListModel):
+    """List of checkable items. The check state is stored as set of checked rows and changed in batches,
+    every batch emits :attr:`~clickqt.widgets.core.QCheckableCombobox.CheckableListModel.checkedChanged` once.
+    """
+
+    #: Qt-Signal, which will be emitted once after check states were changed
+    checkedChanged: Signal = Signal()
+
+    def __init__(self, parent: t.Optional[QObject] = None):
+        super().__init__(parent)
+
+        self.items: list[str] = []
+        self.rows: dict[str, int] = {}  # item -> row
+        self.checked: set[int] = set()  # Rows of the checked items
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Inherited from :class:`~PySide6.QtCore.QAbstractListModel`"""
+
+        return 0 if parent.isValid() else len(self.items)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """Inherited from :class:`~PySide6.QtCore.QAbstractListModel`"""
+
+        if not index.isValid():
+            return None
+        if role in (
+            Qt.ItemDataRole.DisplayRole,
+            Qt.ItemDataRole.EditRole,
+            Qt.ItemDataRole.UserRole + 1,
+        ):
+            return self.items[index.row()]
+        if role == Qt.ItemDataRole.CheckStateRole:
+            return (
+                Qt.CheckState.Checked
+                if index.row() in self.checked
+                else Qt.CheckState.Unchecked
+            )
+        return None
+
+    def setData(
+        self,
+        index: QModelIndex,
+        value: t.Any,
+        role: int = Qt.ItemDataRole.CheckStateRole,
+    ) -> bool:
+        """Inherited from :class:`~PySide6.QtCore.QAbstractListModel`\n
+        Only the check state can be changed."""
+
+        if not index.isValid() or role != Qt.ItemDataRole.CheckStateRole:
+            return False
+        checked = Qt.CheckState(value) == Qt.CheckState.Checked
+        self.setRowsChecked([index.row()], checked)
+        return True
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        """Inherited from :class:`~PySide6.QtCore.QAbstractListModel`"""
+
+        return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable
+
+    def appendItems(self, texts: t.Iterable[str]):
+        """Appends the unchecked items **texts** at once."""
+
+        texts = list(texts)
+        if not texts:
+            return
+        first = len(self.items)
+        self.beginInsertRows(QModelIndex(), first, first + len(texts) - 1)
+        self.items.extend(texts)
+        for row, text in enumerate(texts, first):
+            self.rows.setdefault(text, row)
+        self.endInsertRows()
+
+    def checkedItems(self) -> list[str]:
+        """Returns the checked items in the order of the list."""
+
+        return [self.items[row] for row in sorted(self.checked)]
+
+    def setCheckedRows(self, rows: t.Iterable[int]):
+        """Checks the items in **rows**, all other items will be unchecked."""
+
+        checked = set(rows)
+        changed = checked ^ self.checked
+        self.checked = checked
+        self.__emit_changed(changed)
+
+    def setRowsChecked(self, rows: t.Iterable[int], checked: bool):
+        """Checks (**checked** = True) or unchecks the items in **rows**, all other items keep their state."""
+
+        rows = set(rows)
+        changed = rows - self.checked if checked else rows & self.checked
+        if checked:
+            self.checked |= changed
+        else:
+            self.checked -= changed
+        self.__emit_changed(changed)
+
+    def __emit_changed(self, changed: set[int]):
+        # One signal for the range of all changed rows
+        if changed:
+            self.dataChanged.emit(
+                self.index(min(changed)),
+                self.index(max(changed)),
+                [Qt.ItemDataRole.CheckStateRole],
+            )
+            self.checkedChanged.emit()
 
 
 class QCheckableComboBox(QComboBox):
-    """Combobox with checkable items."""
+    """Combobox with checkable items. The items are stored in a :class:`~clickqt.widgets.core.QCheckableCombobox.CheckableListModel`,
+    text typed into the filter line of the popup shows only the items that contain the text.
+    """
 
     # Subclass Delegate to increase item height
     class Delegate(QStyledItemDelegate):
@@ -21,15 +145,54 @@ class QCheckableComboBox(QComboBox):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
+        #: The items and their check state
+        self.items = CheckableListModel(self)
+        #: Shows the items that match the filter text
+        self.proxy = QSortFilterProxyModel(self)
+        self.proxy.setSourceModel(self.items)
+        self.proxy.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.proxy.setDynamicSortFilter(False)  # The texts never change
+        self.setModel(self.proxy)
+
         # Make the combo editable to set a custom text, but readonly
         self.setEditable(True)
         self.lineEdit().setReadOnly(True)
+        self.setCompleter(None)
+        # Don't measure every item
+        self.setSizeAdjustPolicy(
+            QComboBox.SizeAdjustPolicy.AdjustToMinimumContentsLengthWithIcon
+        )
+        self.setMinimumContentsLength(20)
 
-        # Use custom delegate
+        # Use custom delegate, all items have the same height
         self.setItemDelegate(QCheckableComboBox.Delegate())
+        view = QListView()
+        view.setUniformItemSizes(True)
+        self.setView(view)
 
-        # Update the text when an item is toggled
-        self.model().dataChanged.connect(self.updateText)
+        # Filter and (un)check the shown items in the popup
+        self.filterEdit = QLineEdit()
+        self.filterEdit.setPlaceholderText("Type to filter")
+        self.filterEdit.setClearButtonEnabled(True)
+        self.filterEdit.textChanged.connect(self.proxy.setFilterFixedString)
+        check_all = QToolButton()
+        check_all.setText("All")
+        check_all.setToolTip("Check the shown items")
+        check_all.clicked.connect(lambda: self.setShownChecked(True))
+        check_none = QToolButton()
+        check_none.setText("None")
+        check_none.setToolTip("Uncheck the shown items")
+        check_none.clicked.connect(lambda: self.setShownChecked(False))
+        self.filterBar = QWidget()
+        self.filterBar.setLayout(QHBoxLayout())
+        self.filterBar.layout().setContentsMargins(2, 2, 2, 2)
+        for widget in (self.filterEdit, check_all, check_none):
+            self.filterBar.layout().addWidget(widget)
+        container = self.view().parentWidget()  # The popup
+        container.layout().insertWidget(0, self.filterBar)
+
+        # Update the text once per change
+        self.items.checkedChanged.connect(self.updateText)
 
         # Hide and show popup when clicking the line edit
         self.lineEdit().installEventFilter(self)
@@ -56,12 +219,9 @@ class QCheckableComboBox(QComboBox):
         if obj == self.view().viewport():
             if event.type() == QEvent.Type.MouseButtonRelease:
                 index = self.view().indexAt(event.pos())
-                item = self.model().item(index.row())
-
-                if item.checkState() == Qt.CheckState.Checked:
-                    item.setCheckState(Qt.CheckState.Unchecked)
-                else:
-                    item.setCheckState(Qt.CheckState.Checked)
+                if index.isValid():
+                    row = self.proxy.mapToSource(index).row()
+                    self.items.setRowsChecked([row], row not in self.items.checked)
                 return True
         return False
 
@@ -69,11 +229,13 @@ class QCheckableComboBox(QComboBox):
         super().showPopup()
         # When the popup is displayed, a click on the lineedit should close it
         self.closeOnLineEditClick = True
+        self.filterEdit.setFocus()
 
     def hidePopup(self):
         super().hidePopup()
         # Used to prevent immediate reopening when clicking on the lineEdit
         self.startTimer(100)
+        self.filterEdit.clear()
         # Refresh the display text when closing
         self.updateText()
 
@@ -85,12 +247,7 @@ class QCheckableComboBox(QComboBox):
     def updateText(self):
         """Updates the text displayed in the combobox."""
 
-        texts = []
-        for i in range(self.model().rowCount()):
-            if self.model().item(i).checkState() == Qt.CheckState.Checked:
-                texts.append(self.model().item(i).text())
-
-        self.lineEdit().setText(", ".join(texts))
+        self.lineEdit().setText(", ".join(self.items.checkedItems()))
 
         # Compute elided text (with "...")
         # metrics = QFontMetrics(self.lineEdit().font())
@@ -100,35 +257,32 @@ class QCheckableComboBox(QComboBox):
     def addItem(self, text: str):
         """Adds the string in **text** to the checkable combobox and unchecks the added item."""
 
-        item = QStandardItem()
-        item.setText(text)
-        item.setData(text)
-        item.setFlags(Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsUserCheckable)
-        item.setData(Qt.CheckState.Unchecked, Qt.ItemDataRole.CheckStateRole)
-        self.model().appendRow(item)
+        self.items.appendItems([text])
 
     def addItems(self, texts: t.Iterable[str]):
-        """Adds each of the strings in **texts** to the checkable combobox."""
+        """Adds each of the strings in **texts** to the checkable combobox at once."""
 
-        for text in texts:
-            self.addItem(text)
+        self.items.appendItems(texts)
 
     def checkItems(self, texts: t.Iterable[str]):
         """Checks every item in **texts**, all other items will be unchecked."""
 
-        for i in range(self.model().rowCount()):
-            if self.model().item(i).data().upper() in texts:
-                self.model().item(i).setCheckState(Qt.CheckState.Checked)
-            else:
-                self.model().item(i).setCheckState(Qt.CheckState.Unchecked)
-
+        rows = self.items.rows
+        self.items.setCheckedRows(rows[text] for text in texts if text in rows)
         self.updateText()
 
+    def setShownChecked(self, checked: bool):
+        """Checks (**checked** = True) or unchecks all items that match the filter text."""
+
+        self.items.setRowsChecked(
+            (
+                self.proxy.mapToSource(self.proxy.index(row, 0)).row()
+                for row in range(self.proxy.rowCount())
+            ),
+            checked,
+        )
+
     def getData(self) -> t.Iterable[str]:
         """Returns the names of all checked items."""
 
-        res = []
-        for i in range(self.model().rowCount()):
-            if self.model().item(i).checkState() == Qt.CheckState.Checked:
-                res.append(self.model().item(i).data())
-        return res
+        return self.items.checkedItems()
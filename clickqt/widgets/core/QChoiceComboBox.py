@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import typing as t
+
+from PySide6.QtWidgets import QComboBox, QCompleter, QListView, QWidget
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QModelIndex,
+    QObject,
+    QStringListModel,
+    Qt,
+    Slot,
+)
+
+from clickqt.core.choiceindex import ChoiceIndex
+
+#: Number of choices that are added to the model at once while the popup is scrolled
+FETCH_BATCH_SIZE = 256
+
+
+class ChoiceListModel(QAbstractListModel):
+    """List of choices that is filled lazily: The view fetches the next batch of choices when it scrolls to the end of the list."""
+
+    def __init__(self, parent: t.Optional[QObject] = None):
+        super().__init__(parent)
+
+        self.choices: t.Sequence[str] = []
+        self.fetched = 0  # Number of rows the views know
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Inherited from :class:`~PySide6.QtCore.QAbstractListModel`"""
+
+        return 0 if parent.isValid() else self.fetched
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """Inherited from :class:`~PySide6.QtCore.QAbstractListModel`"""
+
+        if index.isValid() and role in (
+            Qt.ItemDataRole.DisplayRole,
+            Qt.ItemDataRole.EditRole,
+        ):
+            return self.choices[index.row()]
+        return None
+
+    def canFetchMore(self, parent: QModelIndex) -> bool:
+        """Inherited from :class:`~PySide6.QtCore.QAbstractListModel`"""
+
+        return not parent.isValid() and self.fetched < len(self.choices)
+
+    def fetchMore(self, parent: QModelIndex):
+        """Inherited from :class:`~PySide6.QtCore.QAbstractListModel`"""
+
+        if self.canFetchMore(parent):
+            self.fetch_to(self.fetched + FETCH_BATCH_SIZE - 1)
+
+    def fetch_to(self, row: int):
+        """Makes sure that the rows up to **row** are known."""
+
+        last = min(row, len(self.choices) - 1)
+        if last >= self.fetched:
+            self.beginInsertRows(QModelIndex(), self.fetched, last)
+            self.fetched = last + 1
+            self.endInsertRows()
+
+    def set_choices(self, choices: t.Sequence[str]):
+        """Replaces the choices, only the first batch is fetched."""
+
+        self.beginResetModel()
+        self.choices = choices
+        self.fetched = 0
+        self.endResetModel()
+        self.fetchMore(QModelIndex())
+
+
+class QChoiceComboBox(QComboBox):
+    """Combobox for a huge number of choices. The choices are added lazily to the list of the popup,
+    the text field completes typed text with the choices that start with the text or contain its characters (fuzzy)
+    using a :class:`~clickqt.core.choiceindex.ChoiceIndex`.
+    """
+
+    def __init__(self, parent: t.Optional[QWidget] = None):
+        super().__init__(parent)
+
+        #: The choices shown in the popup
+        self.choices = ChoiceListModel(self)
+        self.index: t.Optional[ChoiceIndex] = None
+        self.setModel(self.choices)
+
+        self.setEditable(True)
+        self.setInsertPolicy(QComboBox.InsertPolicy.NoInsert)
+        # Don't measure every choice
+        self.setSizeAdjustPolicy(
+            QComboBox.SizeAdjustPolicy.AdjustToMinimumContentsLengthWithIcon
+        )
+        self.setMinimumContentsLength(20)
+        view = QListView()
+        view.setUniformItemSizes(True)
+        self.setView(view)
+
+        #: The proposed choices for the typed text
+        self.matches = QStringListModel(self)
+        completer = QCompleter(self.matches, self)
+        completer.setCompletionMode(QCompleter.CompletionMode.UnfilteredPopupCompletion)
+        self.setCompleter(completer)
+        completer.activated.connect(self.select_text)
+
+        self.lineEdit().textEdited.connect(self.update_matches)
+        self.lineEdit().editingFinished.connect(
+            lambda: self.select_text(self.currentText())
+        )
+
+    def set_choices(self, choices: t.Sequence[str], index: ChoiceIndex):
+        """Replaces the choices.
+
+        :param choices: The choices in the order of the popup
+        :param index: The index of **choices**
+        """
+
+        self.index = index
+        self.choices.set_choices(choices)
+
+    def select(self, row: int):
+        """Selects the choice in **row**. A choice that wasn't fetched yet is only shown in the text field."""
+
+        if row < self.choices.fetched:
+            self.setCurrentIndex(row)
+        else:
+            self.setCurrentIndex(-1)
+            self.setEditText(self.choices.choices[row])
+
+    @Slot(str)
+    def select_text(self, text: str):
+        """Selects the choice **text** stands for (e.g. other case), the text is kept if it isn't a valid choice."""
+
+        if self.index is not None and (row := self.index.find(text)) is not None:
+            self.select(row)
+
+    @Slot(str)
+    def update_matches(self, text: str):
+        """Proposes the choices that match **text**."""
+
+        if self.index is None:
+            return
+        self.matches.setStringList(self.index.match(text) if text else [])
+        if self.hasFocus() or self.lineEdit().hasFocus():
+            self.completer().complete()
@@ -0,0 +1,365 @@
+from __future__ import annotations
+
+import csv
+import typing as t
+
+from PySide6.QtWidgets import (
+    QApplication,
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QToolButton,
+    QLabel,
+    QTableView,
+    QAbstractItemView,
+    QHeaderView,
+)
+from PySide6.QtCore import (
+    QAbstractTableModel,
+    QEvent,
+    QModelIndex,
+    QObject,
+    Qt,
+    Signal,
+    Slot,
+)
+from PySide6.QtGui import QColor, QKeySequence, QShortcut
+
+
+def split_rows(text: str, columns: int) -> list[list[str]]:
+    """Splits pasted CSV or TSV text (tab separated if the text contains a tab) into rows of **columns** fields.
+    Blank lines are skipped, missing fields are empty and surplus fields are joined into the last field.
+
+    :param text: The pasted text, one row per line
+    :param columns: The number of fields per row
+    """
+
+    delimiter = "\t" if "\t" in text else ","
+    rows: list[list[str]] = []
+    for fields in csv.reader(text.splitlines(), delimiter=delimiter):
+        fields = [field.strip() for field in fields]
+        if not any(fields):
+            continue
+        if len(fields) > columns:
+            fields[columns - 1 :] = [delimiter.join(fields[columns - 1 :])]
+        rows.append(fields + [""] * (columns - len(fields)))
+    return rows
+
+
+class TupleTableModel(QAbstractTableModel):
+    """Table of raw (text) tuples, stored column by column (one list per tuple component).
+    Rows are inserted and removed in batches, invalid cells are shown in red.
+
+    :param headers: The header of every column
+    :param parent: The parent object, defaults to None
+    """
+
+    def __init__(self, headers: t.Sequence[str], parent: t.Optional[QObject] = None):
+        super().__init__(parent)
+
+        self.headers = list(headers)
+        self.columns: list[list[str]] = [[] for _ in self.headers]
+        self.errors: dict[tuple[int, int], str] = {}  # (row, column) -> error message
+        #: Sort key of every column (None = sorted by text), the key gets the text of a cell
+        self.sort_keys: list[t.Optional[t.Callable[[str], t.Any]]] = [
+            None for _ in self.headers
+        ]
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Inherited from :class:`~PySide6.QtCore.QAbstractTableModel`"""
+
+        return 0 if parent.isValid() else len(self.columns[0])
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Inherited from :class:`~PySide6.QtCore.QAbstractTableModel`"""
+
+        return 0 if parent.isValid() else len(self.columns)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """Inherited from :class:`~PySide6.QtCore.QAbstractTableModel`"""
+
+        if not index.isValid():
+            return None
+        cell = (index.row(), index.column())
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return self.columns[cell[1]][cell[0]]
+        if role == Qt.ItemDataRole.ForegroundRole and cell in self.errors:
+            return QColor("red")
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return self.errors.get(cell)
+        return None
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ):
+        """Inherited from :class:`~PySide6.QtCore.QAbstractTableModel`"""
+
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.headers[section]
+        return str(section + 1)
+
+    def setData(
+        self, index: QModelIndex, value: t.Any, role: int = Qt.ItemDataRole.EditRole
+    ) -> bool:
+        """Inherited from :class:`~PySide6.QtCore.QAbstractTableModel`"""
+
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        self.columns[index.column()][index.row()] = str(value)
+        self.errors.pop((index.row(), index.column()), None)
+        self.dataChanged.emit(index, index)
+        return True
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        """Inherited from :class:`~PySide6.QtCore.QAbstractTableModel`"""
+
+        return super().flags(index) | Qt.ItemFlag.ItemIsEditable
+
+    def rows(self) -> list[tuple[str, ...]]:
+        """Returns the rows of the table."""
+
+        return list(zip(*self.columns))
+
+    def set_rows(self, rows: t.Iterable[t.Sequence[str]]):
+        """Replaces all rows, every row needs one value per column."""
+
+        self.beginResetModel()
+        self.columns = self.__transpose(list(rows))
+        self.errors = {}
+        self.endResetModel()
+
+    def insert_rows(self, row: int, rows: t.Sequence[t.Sequence[str]]):
+        """Inserts **rows** before **row** at once."""
+
+        if not rows:
+            return
+        self.beginInsertRows(QModelIndex(), row, row + len(rows) - 1)
+        for column, values in zip(self.columns, self.__transpose(rows)):
+            column[row:row] = values
+        if self.errors:  # Rows behind the inserted rows moved
+            self.errors = {
+                (r + len(rows) if r >= row else r, c): e
+                for (r, c), e in self.errors.items()
+            }
+        self.endInsertRows()
+
+    def remove_rows(self, rows: t.Iterable[int]):
+        """Removes **rows**, every contiguous range of rows is removed at once."""
+
+        rows = sorted(set(rows), reverse=True)
+        i = 0
+        while i < len(rows):
+            last = first = rows[i]
+            while i + 1 < len(rows) and rows[i + 1] == first - 1:
+                i += 1
+                first = rows[i]
+            self.beginRemoveRows(QModelIndex(), first, last)
+            for column in self.columns:
+                del column[first : last + 1]
+            self.endRemoveRows()
+            i += 1
+        self.errors = {}
+
+    def set_errors(self, errors: dict[tuple[int, int], str]):
+        """Marks the cells of **errors** as invalid (all other cells as valid).
+
+        :param errors: (Row, column) to error message
+        """
+
+        self.errors = errors
+        if self.rowCount() > 0:
+            self.dataChanged.emit(
+                self.index(0, 0), self.index(self.rowCount() - 1, len(self.columns) - 1)
+            )
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
+        """Inherited from :class:`~PySide6.QtCore.QAbstractTableModel`\n
+        Sorts the rows by the sort key of **column**, cells without a valid key are placed behind the others.
+        """
+
+        if not 0 <= column < len(self.columns) or self.rowCount() == 0:
+            return
+
+        texts = self.columns[column]
+        if (sort_key := self.sort_keys[column]) is None:
+            keys: list[t.Any] = texts
+        else:
+            keys = []
+            for text in texts:
+                try:
+                    keys.append((0, sort_key(text)))
+                except Exception:  # pylint: disable=broad-exception-caught
+                    keys.append((1, text))
+        try:
+            order_rows = sorted(range(len(texts)), key=keys.__getitem__)
+        except TypeError:  # Keys are not comparable
+            order_rows = sorted(range(len(texts)), key=texts.__getitem__)
+        if order == Qt.SortOrder.DescendingOrder:
+            order_rows.reverse()
+
+        self.beginResetModel()
+        self.columns = [[values[r] for r in order_rows] for values in self.columns]
+        self.errors = {}
+        self.endResetModel()
+
+    def __transpose(self, rows: t.Sequence[t.Sequence[str]]) -> list[list[str]]:
+        columns: list[list[str]] = [[] for _ in self.headers]
+        for row in rows:
+            assert len(row) == len(
+                columns
+            ), f"Row {row} has {len(row)} values instead of {len(columns)}."
+            for column, value in zip(columns, row):
+                column.append(value)
+        return columns
+
+
+class QTupleTableEdit(QWidget):
+    """Edits a long list of tuples in a table with one column per tuple component, without a widget per value.
+    The values are stored as text in a :class:`~clickqt.widgets.core.QTupleTableEdit.TupleTableModel` and edited in place (double click).
+    Rows can be added one by one, pasted (Ctrl+V in the table, CSV or TSV) or dropped as text, the table is sorted by clicking on a header.
+
+    :param headers: The header of every column
+    :param parent: The parent widget, defaults to None
+    """
+
+    #: Qt-Signal, which will be emitted when rows were added, removed, sorted or edited
+    valuesChanged: Signal = Signal()
+
+    def __init__(self, headers: t.Sequence[str], parent: t.Optional[QWidget] = None):
+        super().__init__(parent)
+
+        self.model = TupleTableModel(headers, self)
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)  # Red border
+
+        self.add_button = QToolButton()
+        self.add_button.setText("+")
+        self.add_button.setToolTip("Add a row")
+        self.remove_button = QToolButton()
+        self.remove_button.setText("-")
+        self.remove_button.setToolTip("Remove the selected rows (Del)")
+        self.clear_button = QToolButton()
+        self.clear_button.setText("Clear")
+        self.count_label = QLabel()
+        self.view = QTableView()
+        self.view.setModel(self.model)
+        self.view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.view.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.view.setEditTriggers(
+            QAbstractItemView.EditTrigger.DoubleClicked
+            | QAbstractItemView.EditTrigger.EditKeyPressed
+        )
+        self.view.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.view.horizontalHeader().setSectionResizeMode(
+            QHeaderView.ResizeMode.Stretch
+        )
+        self.view.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        self.view.setSortingEnabled(True)
+        self.view.setAcceptDrops(True)
+        self.view.viewport().setAcceptDrops(True)
+        self.view.viewport().installEventFilter(self)
+
+        #: Layout of the controls above the table
+        self.controls = QHBoxLayout()
+        self.controls.setContentsMargins(0, 0, 0, 0)
+        for widget in (
+            self.add_button,
+            self.remove_button,
+            self.count_label,
+            self.clear_button,
+        ):
+            self.controls.addWidget(widget)
+        self.controls.insertStretch(3)
+
+        self.setLayout(QVBoxLayout())
+        self.layout().setContentsMargins(0, 0, 0, 0)
+        self.layout().addLayout(self.controls)
+        self.layout().addWidget(self.view)
+
+        self.add_button.clicked.connect(self.add_empty)
+        self.remove_button.clicked.connect(self.remove_selected)
+        self.clear_button.clicked.connect(lambda: self.set_values([]))
+        self.model.rowsInserted.connect(self.__changed)
+        self.model.rowsRemoved.connect(self.__changed)
+        self.model.modelReset.connect(self.__changed)
+        self.model.dataChanged.connect(lambda *_: self.valuesChanged.emit())
+        paste = QShortcut(QKeySequence.StandardKey.Paste, self.view)
+        paste.setContext(Qt.ShortcutContext.WidgetShortcut)
+        paste.activated.connect(lambda: self.add_text(QApplication.clipboard().text()))
+        remove = QShortcut(QKeySequence.StandardKey.Delete, self.view)
+        remove.setContext(Qt.ShortcutContext.WidgetShortcut)
+        remove.activated.connect(self.remove_selected)
+
+        self.update_label()
+
+    def __len__(self) -> int:
+        return self.model.rowCount()
+
+    def values(self) -> list[tuple[str, ...]]:
+        """Returns the rows of the table."""
+
+        return self.model.rows()
+
+    def set_values(self, values: t.Iterable[t.Sequence[str]]):
+        """Replaces the rows of the table."""
+
+        self.view.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+        self.model.set_rows(values)
+
+    def add_values(self, values: t.Sequence[t.Sequence[str]]):
+        """Appends the rows **values** to the table at once."""
+
+        self.model.insert_rows(self.model.rowCount(), values)
+
+    def add_text(self, text: str):
+        """Appends the rows of CSV or TSV **text** (e.g. a pasted spreadsheet range), see :func:`~clickqt.widgets.core.QTupleTableEdit.split_rows`."""
+
+        self.add_values(split_rows(text, self.model.columnCount()))
+
+    @Slot()
+    def add_empty(self):
+        """Appends an empty row and starts editing its first cell."""
+
+        self.add_values([[""] * self.model.columnCount()])
+        index = self.model.index(self.model.rowCount() - 1, 0)
+        self.view.setCurrentIndex(index)
+        self.view.edit(index)
+
+    @Slot()
+    def remove_selected(self):
+        """Removes the selected rows."""
+
+        self.model.remove_rows(
+            index.row() for index in self.view.selectionModel().selectedRows()
+        )
+
+    @Slot()
+    def __changed(self):
+        self.update_label()
+        self.valuesChanged.emit()
+
+    def update_label(self):
+        """Updates the counter label."""
+
+        count = self.model.rowCount()
+        self.count_label.setText(f"{count} row{'' if count == 1 else 's'}")
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        """Inherited from :class:`~PySide6.QtWidgets.QWidget`\n
+        Accepts text dropped on the table."""
+
+        if event.type() in (QEvent.Type.DragEnter, QEvent.Type.DragMove):
+            if event.mimeData().hasText():
+                event.acceptProposedAction()
+                return True
+        elif event.type() == QEvent.Type.Drop:
+            if event.mimeData().hasText():
+                self.add_text(event.mimeData().text())
+            event.acceptProposedAction()
+            return True
+
+        return super().eventFilter(watched, event)
@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import typing as t
+
+from PySide6.QtWidgets import (
+    QApplication,
+    QWidget,
+    QVBoxLayout,
+    QHBoxLayout,
+    QToolButton,
+    QLabel,
+    QListView,
+    QAbstractItemView,
+)
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QEvent,
+    QModelIndex,
+    QObject,
+    Qt,
+    Signal,
+    Slot,
+)
+from PySide6.QtGui import QColor, QKeySequence, QShortcut
+
+
+class ValueListModel(QAbstractListModel):
+    """Flat list of raw (text) values. Rows are inserted and removed in batches, invalid rows are shown in red."""
+
+    def __init__(self, parent: t.Optional[QObject] = None):
+        super().__init__(parent)
+
+        self.values: list[str] = []
+        self.errors: dict[int, str] = {}  # row -> error message
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        """Inherited from :class:`~PySide6.QtCore.QAbstractListModel`"""
+
+        return 0 if parent.isValid() else len(self.values)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """Inherited from :class:`~PySide6.QtCore.QAbstractListModel`"""
+
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role in (Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole):
+            return self.values[row]
+        if role == Qt.ItemDataRole.ForegroundRole and row in self.errors:
+            return QColor("red")
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return self.errors.get(row)
+        return None
+
+    def setData(
+        self, index: QModelIndex, value: t.Any, role: int = Qt.ItemDataRole.EditRole
+    ) -> bool:
+        """Inherited from :class:`~PySide6.QtCore.QAbstractListModel`"""
+
+        if not index.isValid() or role != Qt.ItemDataRole.EditRole:
+            return False
+        self.values[index.row()] = str(value)
+        self.errors.pop(index.row(), None)
+        self.dataChanged.emit(index, index)
+        return True
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        """Inherited from :class:`~PySide6.QtCore.QAbstractListModel`"""
+
+        return super().flags(index) | Qt.ItemFlag.ItemIsEditable
+
+    def set_values(self, values: t.Iterable[str]):
+        """Replaces all values."""
+
+        self.beginResetModel()
+        self.values = list(values)
+        self.errors = {}
+        self.endResetModel()
+
+    def insert_values(self, row: int, values: t.Sequence[str]):
+        """Inserts **values** before **row** at once."""
+
+        if not values:
+            return
+        self.beginInsertRows(QModelIndex(), row, row + len(values) - 1)
+        self.values[row:row] = values
+        if self.errors:  # Rows behind the inserted rows moved
+            self.errors = {
+                r + len(values) if r >= row else r: e for r, e in self.errors.items()
+            }
+        self.endInsertRows()
+
+    def remove_rows(self, rows: t.Iterable[int]):
+        """Removes **rows**, every contiguous range of rows is removed at once."""
+
+        rows = sorted(set(rows), reverse=True)
+        i = 0
+        while i < len(rows):
+            last = first = rows[i]
+            while i + 1 < len(rows) and rows[i + 1] == first - 1:
+                i += 1
+                first = rows[i]
+            self.beginRemoveRows(QModelIndex(), first, last)
+            del self.values[first : last + 1]
+            self.endRemoveRows()
+            i += 1
+        self.errors = {}
+
+    def set_errors(self, errors: dict[int, str]):
+        """Marks the rows of **errors** as invalid (all other rows as valid).
+
+        :param errors: Row to error message
+        """
+
+        self.errors = errors
+        if self.values:
+            self.dataChanged.emit(self.index(0), self.index(len(self.values) - 1))
+
+
+class QValueListEdit(QWidget):
+    """Edits a long list of values without a widget per value. The values are stored as text in a
+    :class:`~clickqt.widgets.core.QValueListEdit.ValueListModel` and edited in place (double click) by the delegate of the view.
+    Values can be added one by one, pasted (Ctrl+V in the list, one value per line) or dropped as text.
+    """
+
+    #: Qt-Signal, which will be emitted when values were added, removed or edited
+    valuesChanged: Signal = Signal()
+
+    item_name = "value"  #: Name of a value in the counter label
+
+    def __init__(self, parent: t.Optional[QWidget] = None):
+        super().__init__(parent)
+
+        self.model = ValueListModel(self)
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)  # Red border
+
+        self.add_button = QToolButton()
+        self.add_button.setText("+")
+        self.add_button.setToolTip("Add a value")
+        self.remove_button = QToolButton()
+        self.remove_button.setText("-")
+        self.remove_button.setToolTip("Remove the selected values (Del)")
+        self.clear_button = QToolButton()
+        self.clear_button.setText("Clear")
+        self.count_label = QLabel()
+        self.view = QListView()
+        self.view.setModel(self.model)
+        self.view.setUniformItemSizes(True)
+        self.view.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
+        self.view.setEditTriggers(
+            QAbstractItemView.EditTrigger.DoubleClicked
+            | QAbstractItemView.EditTrigger.EditKeyPressed
+        )
+        self.view.setAcceptDrops(True)
+        self.view.viewport().setAcceptDrops(True)
+        self.view.viewport().installEventFilter(self)
+
+        #: Layout of the controls above the list
+        self.controls = QHBoxLayout()
+        self.controls.setContentsMargins(0, 0, 0, 0)
+        for widget in (
+            self.add_button,
+            self.remove_button,
+            self.count_label,
+            self.clear_button,
+        ):
+            self.controls.addWidget(widget)
+        self.controls.insertStretch(3)
+
+        self.setLayout(QVBoxLayout())
+        self.layout().setContentsMargins(0, 0, 0, 0)
+        self.layout().addLayout(self.controls)
+        self.layout().addWidget(self.view)
+
+        self.add_button.clicked.connect(self.add_empty)
+        self.remove_button.clicked.connect(self.remove_selected)
+        self.clear_button.clicked.connect(lambda: self.set_values([]))
+        self.model.rowsInserted.connect(self.__changed)
+        self.model.rowsRemoved.connect(self.__changed)
+        self.model.modelReset.connect(self.__changed)
+        self.model.dataChanged.connect(lambda *_: self.valuesChanged.emit())
+        paste = QShortcut(QKeySequence.StandardKey.Paste, self.view)
+        paste.setContext(Qt.ShortcutContext.WidgetShortcut)
+        paste.activated.connect(lambda: self.add_text(QApplication.clipboard().text()))
+        remove = QShortcut(QKeySequence.StandardKey.Delete, self.view)
+        remove.setContext(Qt.ShortcutContext.WidgetShortcut)
+        remove.activated.connect(self.remove_selected)
+
+        self.update_label()
+
+    def __len__(self) -> int:
+        return len(self.model.values)
+
+    def values(self) -> list[str]:
+        """Returns a copy of the values of the list."""
+
+        return list(self.model.values)
+
+    def set_values(self, values: t.Iterable[str]):
+        """Replaces the values of the list."""
+
+        self.model.set_values(values)
+
+    def add_values(self, values: t.Sequence[str]):
+        """Appends **values** to the list at once."""
+
+        self.model.insert_values(len(self.model.values), list(values))
+
+    def add_text(self, text: str):
+        """Appends every non-empty line of **text** as value (e.g. a pasted list)."""
+
+        self.add_values([line.strip() for line in text.splitlines() if line.strip()])
+
+    @Slot()
+    def add_empty(self):
+        """Appends an empty value and starts editing it."""
+
+        self.add_values([""])
+        index = self.model.index(len(self.model.values) - 1)
+        self.view.setCurrentIndex(index)
+        self.view.edit(index)
+
+    @Slot()
+    def remove_selected(self):
+        """Removes the selected values."""
+
+        self.model.remove_rows(
+            index.row() for index in self.view.selectionModel().selectedRows()
+        )
+
+    @Slot()
+    def __changed(self):
+        self.update_label()
+        self.valuesChanged.emit()
+
+    def label_text(self) -> str:
+        """Returns the text of the counter label."""
+
+        count = len(self.model.values)
+        return f"{count} {self.item_name}{'' if count == 1 else 's'}"
+
+    def update_label(self):
+        """Updates the counter label."""
+
+        self.count_label.setText(self.label_text())
+
+    def drop_urls(self, urls: list) -> bool:
+        """Handles dropped URLs, returns True if they were accepted. Subclasses may override this method."""
+
+        return False
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:
+        """Inherited from :class:`~PySide6.QtWidgets.QWidget`\n
+        Accepts text dropped on the list."""
+
+        if event.type() in (QEvent.Type.DragEnter, QEvent.Type.DragMove):
+            if event.mimeData().hasUrls() or event.mimeData().hasText():
+                event.acceptProposedAction()
+                return True
+        elif event.type() == QEvent.Type.Drop:
+            mime = event.mimeData()
+            if not (mime.hasUrls() and self.drop_urls(mime.urls())) and mime.hasText():
+                self.add_text(mime.text())
+            event.acceptProposedAction()
+            return True
+
+        return super().eventFilter(watched, event)
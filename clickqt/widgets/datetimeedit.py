@@ -89,4 +89,4 @@ class DateTimeEdit(BaseWidget):
         return self.widget.dateTime().toPython()
 
     def get_widget_value_cmdline(self) -> str:
-        return f"{self.get_preferable_opt()} '{self.get_widget_value()}'"
+        return f"{self.get_preferable_opt()} '{self.get_widget_value()}' "
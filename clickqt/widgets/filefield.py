@@ -6,9 +6,18 @@ from io import StringIO, BytesIO
 import typing as t
 
 import click
-from PySide6.QtWidgets import QLineEdit, QInputDialog
+from PySide6.QtWidgets import (
+    QLineEdit,
+    QInputDialog,
+    QToolButton,
+    QMenu,
+    QFileDialog,
+)
+from PySide6.QtCore import QDir
 
 from clickqt.core.error import ClickQtError
+from clickqt.core.pathservice import PathInfo
+from clickqt.core.stdinsource import open_stdin_source, stdin_source_path
 from clickqt.widgets.textfield import PathField
 
 
@@ -36,11 +45,114 @@ class FileField(PathField):
             PathField.FileType.File
         )  #: File type is a :attr:`~clickqt.widgets.textfield.PathField.FileType.File`.
 
+        #: File or named pipe that is streamed as stdin if the value is '-', None = the user enters the input in a dialog
+        self.stdin_source: t.Optional[str] = None
+
+        if "r" in self.type.mode:
+            self.stdin_btn = QToolButton()
+            self.stdin_btn.setText("Stdin")
+            self.stdin_btn.setPopupMode(QToolButton.ToolButtonPopupMode.InstantPopup)
+            menu = QMenu(self.stdin_btn)
+            menu.addAction("Enter text ...", lambda: self.set_stdin_source(None))
+            menu.addAction("Stream from file or pipe ...", self.browse_stdin_source)
+            self.stdin_btn.setMenu(menu)
+            self.browse_btn.parentWidget().layout().addWidget(self.stdin_btn)
+
+    def set_value(self, value: t.Any):
+        if (path := stdin_source_path(value)) is not None:
+            self.set_stdin_source(path)
+        else:
+            self.set_stdin_source(None, text=None)
+            super().set_value(value)
+
+    def set_stdin_source(self, path: t.Optional[str], text: t.Optional[str] = "-"):
+        """Sets the file or named pipe that is streamed as stdin.
+
+        :param path: Path of the file or named pipe, None = the user enters the input in a dialog
+        :param text: The new value of the widget, defaults to '-', None = keep the value
+        """
+
+        self.stdin_source = path
+        self.widget.setToolTip(f"Stdin: {path}" if path is not None else "")
+        if text is not None:
+            self.widget.setText(text)
+            self.handle_valid(True)
+
+    def path_error(self, path: str, info: PathInfo) -> t.Optional[str]:
+        """A file for reading has to exist and be readable, an existing file for writing has to be writable."""
+
+        if not info.exists:
+            if "r" in self.type.mode and not info.error:
+                return f"{path!r}: No such file or directory"
+            return info.error or None
+        if info.is_dir:
+            return f"{path!r}: Is a directory"
+        if ("r" in self.type.mode and not info.readable) or (
+            "r" not in self.type.mode and not info.writable
+        ):
+            return f"{path!r}: Permission denied"
+        return None
+
+    def convert_checked(self, path: str) -> t.Any:
+        """Returns a file that is opened in the thread that executes the command: A file for reading is opened on the first read
+        (see :func:`~clickqt.core.stdinsource.open_stdin_source`), other files are opened lazily by click.utils.LazyFile.
+        Files for reading and writing ('+' in the mode) are opened by click.types.File.
+        """
+
+        if "+" in self.type.mode:
+            return super().convert_checked(path)
+        if "r" in self.type.mode:
+            return open_stdin_source(
+                path, self.type.mode, self.type.encoding, self.type.errors
+            )
+        return click.utils.LazyFile(
+            path,
+            self.type.mode,
+            self.type.encoding,
+            self.type.errors,
+            atomic=self.type.atomic,
+        )
+
+    def browse_stdin_source(self):  # pragma: no cover
+        """Opens a :class:`~PySide6.QtWidgets.QFileDialog` to select the file or named pipe that is streamed as stdin."""
+
+        path, _ = QFileDialog.getOpenFileName(
+            self.widget, "Stdin source", self.working_directory or QDir.currentPath()
+        )
+        if path:
+            self.set_stdin_source(path)
+
+    def stdin_stream(self) -> t.Optional[t.IO[t.Any]]:
+        """Returns the stream that is passed to the command instead of sys.stdin:
+        A chunked reader of :attr:`~clickqt.widgets.filefield.FileField.stdin_source`, which is opened on the first read,
+        or the text the user entered in an input dialog. None, if the user quit the dialog.
+        """
+
+        if self.stdin_source is not None:
+            return open_stdin_source(
+                self.resolve_path(self.stdin_source),
+                self.type.mode,
+                self.type.encoding,
+                self.type.errors,
+            )
+
+        user_input, is_ok = QInputDialog.getMultiLineText(
+            self.widget, "Stdin Input", self.label.text()
+        )
+        if not is_ok:
+            return None
+        if "b" in self.type.mode:
+            return BytesIO(
+                user_input.encode(self.type.encoding or sys.getdefaultencoding())
+            )
+        return StringIO(user_input)
+
     def get_value(self) -> tuple[t.Any, ClickQtError]:
         """
-        Opens an input dialogue that represents sys.stdin if 'r' is in **otype**.mode
-            and the current widget value is '-', passes the input to
-        :func:`~clickqt.widgets.basewidget.BaseWidget.get_value`, and returns the result.
+        Returns a function that provides the stdin stream (see :func:`~clickqt.widgets.filefield.FileField.stdin_stream`)
+            if 'r' is in **otype**.mode and the current widget value is '-'. The function passes the stream to the
+            callback of the parameter and returns the result. sys.stdin is never replaced.
+        Otherwise the result of :func:`~clickqt.widgets.basewidget.BaseWidget.get_value` is returned.
 
         :return:
             Valid: (widget value or the value of a callback,
@@ -53,24 +165,11 @@ class FileField(PathField):
         if "r" in self.type.mode and self.widget.text() == "-":
             self.handle_valid(True)
 
-            def ret():  # FocusOutValidator should not open this dialog
-                user_input, is_ok = QInputDialog.getMultiLineText(
-                    self.widget, "Stdin Input", self.label.text()
-                )
-                if not is_ok:
+            def ret():  # FocusOutValidator should not open the dialog or the source
+                if (stream := self.stdin_stream()) is None:
                     return (None, ClickQtError(ClickQtError.ErrorType.ABORTED_ERROR))
-
-                old_stdin = sys.stdin
-                sys.stdin = (
-                    BytesIO(user_input.encode(sys.stdin.encoding))
-                    if "b" in self.type.mode
-                    else StringIO(user_input)
-                )
-                val = super(  # pylint: disable=super-with-arguments
-                    FileField, self
-                ).get_value()
-                sys.stdin = old_stdin
-                return val
+                # click.File passes file-like objects through unchanged
+                return self.handle_callback(stream)
 
             return (ret, ClickQtError())
         return super().get_value()
@@ -1,9 +1,12 @@
 """ Contains the FilePathField class """
 from __future__ import annotations
 
+import typing as t
+
 import click
 from PySide6.QtWidgets import QLineEdit
 
+from clickqt.core.pathservice import PathInfo
 from clickqt.widgets.textfield import PathField
 
 
@@ -41,3 +44,32 @@ class FilePathField(PathField):
         assert (
             self.file_type != PathField.FileType.Unknown
         ), f"Neither 'file_okay' nor 'dir_okay' in option '{self.widget_name}' is set"
+
+    def path_error(self, path: str, info: PathInfo) -> t.Optional[str]:
+        """Applies the checks of click.types.Path to the checked path."""
+
+        name = self.type.name.title()
+        if not info.exists:
+            if self.type.exists and not info.error:
+                return f"{name} {path!r} does not exist."
+            return info.error or None
+        if not self.type.file_okay and not info.is_dir:
+            return f"{name} {path!r} is a file."
+        if not self.type.dir_okay and info.is_dir:
+            return f"{name} {path!r} is a directory."
+        if self.type.readable and not info.readable:
+            return f"{name} {path!r} is not readable."
+        if self.type.writable and not info.writable:
+            return f"{name} {path!r} is not writable."
+        if self.type.executable and not info.executable:
+            return f"{name} {path!r} is not executable."
+        return None
+
+    def convert_checked(self, path: str) -> t.Any:
+        """Returns **path** in the type of click.types.Path.path_type. A resolved path is converted by click.types.Path,
+        resolving it accesses the filesystem.
+        """
+
+        if self.type.resolve_path:
+            return super().convert_checked(path)
+        return self.type.coerce_path_result(path)
@@ -0,0 +1,134 @@
+""" Contains the ListEditWidget class """
+from __future__ import annotations
+
+import shlex
+import typing as t
+
+import click
+
+from clickqt.core.error import ClickQtError
+from clickqt.widgets.basewidget import BaseWidget
+from clickqt.widgets.core.QValueListEdit import QValueListEdit
+from clickqt.widgets.core.QBulkPathEdit import QBulkPathEdit
+
+
+def value_to_text(value: t.Any) -> str:
+    """Returns the text that represents **value** in a list editor, e.g. the name of a file object."""
+
+    if isinstance(value, str):
+        return value
+    if hasattr(value, "read") and hasattr(value, "name"):
+        return str(value.name)
+    return str(value)
+
+
+class ListEditWidget(BaseWidget):
+    """Represents a multiple click.Parameter-object like :class:`~clickqt.widgets.nvaluewidget.NValueWidget`,
+    but the values are stored as text in a flat list model and edited in place instead of in one child widget per value.
+    Paths (click.types.Path) get a :class:`~clickqt.widgets.core.QBulkPathEdit.QBulkPathEdit`,
+    tuples are edited in a :class:`~clickqt.widgets.tupletablewidget.TupleTableWidget`.
+
+    :param otype: The type which specifies the clickqt widget type. This type may be different compared to **param**.type when dealing with click.types.CompositeParamType-objects
+    :param param: The parameter from which **otype** came from
+    :param kwargs: Additionally parameters ('parent', 'widgetsource', 'com', 'label') needed for
+                    :class:`~clickqt.widgets.basewidget.MultiWidget`- / :class:`~clickqt.widgets.confirmationwidget.ConfirmationWidget`-widgets
+    """
+
+    widget_type = QValueListEdit  #: The Qt-type of this widget.
+
+    def __init__(self, otype: click.ParamType, param: click.Parameter, **kwargs):
+        kwargs.pop("widgetsource", None)
+        super().__init__(otype, param, **kwargs)
+
+        assert not isinstance(
+            otype, (click.Choice, click.Tuple)
+        ), f"'otype' is of type '{type(otype)}', but there is a better version for this type"
+        assert param.multiple, "'param.multiple' should be True"
+
+        self.widget.valuesChanged.connect(self.__values_changed)
+
+        if self.parent_widget is None:
+            ctx = click.Context(self.click_command)
+            if (envvar_values := self.param.value_from_envvar(ctx)) is not None:
+                self.set_value(envvar_values)
+            elif (
+                default := BaseWidget.get_param_default(self.param, None)
+            ) is not None:
+                self.set_value(default)
+        if len(self.widget) == 0 and self.can_change_enabled:
+            self.set_enabled_changeable(enabled=False)
+
+    def create_widget(self) -> QValueListEdit:
+        return (
+            QBulkPathEdit(working_directory=self.working_directory)
+            if isinstance(self.type, click.Path)
+            else QValueListEdit()
+        )
+
+    def __values_changed(self):
+        if len(self.widget) > 0 and not self.is_enabled and self.can_change_enabled:
+            self.set_enabled_changeable(enabled=True)
+
+    def set_value(self, value: t.Iterable[t.Any]):
+        """Replaces the values of the list.
+
+        :param value: The new values
+        """
+
+        self.widget.set_values([value_to_text(v) for v in value])
+
+    def is_empty(self) -> bool:
+        return len(self.widget) == 0
+
+    def get_widget_value(self) -> list[str]:
+        return self.widget.values()
+
+    def get_value(self) -> tuple[t.Any, ClickQtError]:
+        """Converts every value of the list like :func:`~clickqt.widgets.nvaluewidget.NValueWidget.get_value` does and returns the result.
+        Invalid values are marked in the list. If multiple errors occured then they will be concatenated and returned.
+
+        :return: Valid: (converted values or the value of a callback, :class:`~clickqt.core.error.ClickQtError.ErrorType.NO_ERROR`)\n
+                 Invalid: (None, :class:`~clickqt.core.error.ClickQtError.ErrorType.CONVERTING_ERROR` or
+                 :class:`~clickqt.core.error.ClickQtError.ErrorType.PROCESSING_VALUE_ERROR` or :class:`~clickqt.core.error.ClickQtError.ErrorType.REQUIRED_ERROR`)
+        """
+
+        ctx = click.Context(self.click_command)
+        if len(self.widget) == 0 or not self.is_enabled:
+            default = BaseWidget.get_param_default(self.param, None)
+
+            if self.param.required and default is None:
+                self.handle_valid(False)
+                return (
+                    None,
+                    ClickQtError(
+                        ClickQtError.ErrorType.REQUIRED_ERROR,
+                        self.widget_name,
+                        self.param.param_type_name,
+                    ),
+                )
+            if (envvar_values := self.param.value_from_envvar(ctx)) is not None:
+                self.set_value(envvar_values)
+            elif default is not None:
+                self.set_value(default)
+            else:  # param is not required and there is no default -> value is None
+                return self.handle_callback(None)  # But callback should be considered
+
+        values: t.Optional[list[t.Any]]
+        values, errors = self.convert_values(self.widget.model.values)
+        self.widget.model.set_errors(errors)
+        self.handle_valid(len(errors) == 0)
+        if len(errors) > 0:  # Join all error messages and return them
+            return (None, self.converting_error(list(errors.values())))
+        if len(values) == 0:
+            values = None
+
+        return self.handle_callback(values)
+
+    def get_widget_value_cmdline(self) -> str:
+        # Same as the command line of a NValueWidget with these values
+        opt = self.get_preferable_opt()
+        return "".join(
+            f"{opt} {shlex.quote(value)} ".lstrip()
+            for value in self.widget.model.values
+            if value != ""
+        )
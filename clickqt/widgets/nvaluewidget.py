@@ -1,17 +1,27 @@
 from __future__ import annotations
 
+import shlex
 import typing as t
 import click
-from PySide6.QtWidgets import QVBoxLayout, QScrollArea, QPushButton, QWidget
+from PySide6.QtWidgets import (
+    QVBoxLayout,
+    QScrollArea,
+    QPushButton,
+    QToolButton,
+    QWidget,
+)
 from PySide6.QtCore import Qt
 
 from clickqt.widgets.basewidget import BaseWidget, MultiWidget
+from clickqt.widgets.core.QBulkPathEdit import QBulkPathEdit
 from clickqt.core.error import ClickQtError
 
 
 class NValueWidget(MultiWidget):
     """Represents a multiple click.Parameter-object.
     The child widgets are set according to :func:`~clickqt.widgets.basewidget.MultiWidget.init`.
+    Paths (click.types.Path) can be entered in bulk mode instead, which stores the values in a
+    :class:`~clickqt.widgets.core.QBulkPathEdit.QBulkPathEdit` rather than in child widgets.
 
     :param otype: The type which specifies the clickqt widget type. This type may be different compared to **param**.type when dealing with click.types.CompositeParamType-objects
     :param param: The parameter from which **otype** came from
@@ -48,9 +58,23 @@ class NValueWidget(MultiWidget):
         # Add an empty widget
         addfieldbtn.clicked.connect(lambda: self.add_pair()
         )  # pylint: disable=unnecessary-lambda
+        self.addfieldbtn = addfieldbtn
         self.vbox.layout().addWidget(addfieldbtn)
         self.widget.setWidget(self.vbox)
         self.buttondict: dict[QPushButton, BaseWidget] = {}
+        #: Editor of the values in bulk mode, None = every value has its own child widget
+        self.bulk_edit: t.Optional[QBulkPathEdit] = None
+        self.__bulk_editor: t.Optional[QBulkPathEdit] = None
+
+        if isinstance(otype, click.Path):
+            self.bulkbtn = QToolButton(self.widget)
+            self.bulkbtn.setText("Bulk")
+            self.bulkbtn.setToolTip(
+                "Enter many paths by glob pattern, directory, paste or drop"
+            )
+            self.bulkbtn.setCheckable(True)
+            self.bulkbtn.toggled.connect(self.set_bulk_mode)
+            self.vbox.layout().addWidget(self.bulkbtn)
 
         self.children = self.buttondict.values()
 
@@ -92,6 +116,62 @@ class NValueWidget(MultiWidget):
         if not self.is_enabled and self.can_change_enabled:
             self.set_enabled_changeable(enabled=True)
 
+    def set_bulk_mode(self, enabled: bool):
+        """Switches between the bulk mode and one child widget per value. The values are kept.
+
+        :param enabled: True = bulk mode, False = child widgets
+        """
+
+        if enabled and self.bulk_edit is None:
+            values = [
+                str(c.get_widget_value()) for c in self.children if not c.is_empty()
+            ]
+            for btn in list(self.buttondict.keys()):
+                self.remove_button_pair(btn)
+            if self.__bulk_editor is None:
+                self.__bulk_editor = QBulkPathEdit(
+                    working_directory=self.working_directory
+                )
+                self.__bulk_editor.valuesChanged.connect(self.__bulk_changed)
+                self.vbox.layout().addWidget(self.__bulk_editor)
+            self.bulk_edit = self.__bulk_editor
+            self.bulk_edit.set_values(values)
+            self.bulk_edit.show()
+            self.addfieldbtn.hide()
+        elif not enabled and self.bulk_edit is not None:
+            paths = self.bulk_edit.values()
+            self.bulk_edit.set_values([])
+            self.bulk_edit.hide()
+            self.bulk_edit = None
+            self.addfieldbtn.show()
+            for path in paths:
+                self.add_pair(path)
+
+        if self.bulkbtn.isChecked() != enabled:
+            self.bulkbtn.setChecked(enabled)
+
+    def __bulk_changed(self):
+        if self.bulk_edit is not None and len(self.bulk_edit) > 0:
+            self.handle_valid(True)
+            if not self.is_enabled and self.can_change_enabled:
+                self.set_enabled_changeable(enabled=True)
+
+    def __count(self) -> int:
+        return len(self.bulk_edit) if self.bulk_edit is not None else len(self.children)
+
+    def __append(self, value: t.Any):
+        if self.bulk_edit is not None:
+            self.bulk_edit.add_values([str(value)])
+        else:
+            self.add_pair(value)
+
+    def __entries(self) -> list[tuple[t.Optional[BaseWidget], t.Any]]:
+        """Returns the child widget (None in bulk mode) and the value of every entry."""
+
+        if self.bulk_edit is not None:
+            return [(None, path) for path in self.bulk_edit.values()]
+        return [(c, c.get_widget_value()) for c in self.children]
+
     def remove_button_pair(self, btn_to_remove: QPushButton):
         """Removes the widget assoziated with **btn_to_remove**.
 
@@ -115,7 +195,7 @@ class NValueWidget(MultiWidget):
         """
 
         value_missing = False
-        if len(self.children) == 0 or not self.is_enabled:
+        if self.__count() == 0 or not self.is_enabled:
             default = BaseWidget.get_param_default(self.param, None)
 
             if self.param.required and default is None:
@@ -134,52 +214,30 @@ class NValueWidget(MultiWidget):
                 )
             ) is not None:
                 for ev in envvar_values:
-                    self.add_pair(ev)
+                    self.__append(ev)
             elif default is not None:  # Add new pairs
                 for (
                     value
                 ) in (
                     default
                 ):  # All defaults will be considered if len(self.children)) == 0
-                    self.add_pair(value)
+                    self.__append(value)
             else:  # param is not required and there is no default -> value is None
                 value_missing = True  # But callback should be considered
 
         values: t.Optional[t.Iterable] = None
 
         if not value_missing:
-            values = []
-            err_messages: list[str] = []
-            default = BaseWidget.get_param_default(self.param, None)
-
-            # len(self.children)) < len(default): We set at most len(self.children)) defaults
-            # len(self.children)) >= len(default): All defaults will be considered
-            for child in self.children:
-                try:  # Try to convert the provided value into the corresponding click object type
-                    values.append(
-                        self.type.convert(
-                            value=child.get_widget_value(),
-                            param=self.param,
-                            ctx=click.Context(self.click_command),
-                        )
-                    )
-                    child.handle_valid(True)
-                except Exception as e:  # pylint: disable=broad-exception-caught
-                    child.handle_valid(False)
-                    err_messages.append(str(e))
-
-            if len(err_messages) > 0:  # Join all error messages and return them
-                messages = ", ".join(err_messages)
-                return (
-                    None,
-                    ClickQtError(
-                        ClickQtError.ErrorType.CONVERTING_ERROR,
-                        self.widget_name,
-                        messages
-                        if len(err_messages) == 1
-                        else messages.join(["[", "]"]),
-                    ),
-                )
+            entries = self.__entries()
+            values, errors = self.convert_values(raw_value for _, raw_value in entries)
+            for i, (child, _) in enumerate(entries):
+                if child is not None:
+                    child.handle_valid(i not in errors)
+            if self.bulk_edit is not None:
+                self.handle_valid(len(errors) == 0)
+
+            if len(errors) > 0:  # Join all error messages and return them
+                return (None, self.converting_error(list(errors.values())))
             if len(values) == 0:  # All widgets are empty
                 values = None
 
@@ -192,6 +250,12 @@ class NValueWidget(MultiWidget):
         :param value: The list of new values that should be stored in the (child-)widgets
         """
 
+        if self.bulk_edit is not None:
+            self.bulk_edit.set_values([str(v) for v in value])
+            if len(value) > 0 and not self.is_enabled and self.can_change_enabled:
+                self.set_enabled_changeable(enabled=True)
+            return
+
         if len(value) < len(self.children):  # Remove pairs
             for btns in list(self.buttondict.keys())[len(value) :]:
                 self.remove_button_pair(btns)
@@ -208,6 +272,24 @@ class NValueWidget(MultiWidget):
         else:
             super().handle_valid(valid)
 
+    def is_empty(self) -> bool:
+        if self.bulk_edit is not None:
+            return len(self.bulk_edit) == 0
+        return super().is_empty()
+
+    def get_widget_value(self) -> t.Iterable[t.Any]:
+        if self.bulk_edit is not None:
+            return self.bulk_edit.values()
+        return super().get_widget_value()
+
     def get_widget_value_cmdline(self) -> str:
+        if self.bulk_edit is not None:
+            # Same as the command line of child widgets with these values
+            opt = self.get_preferable_opt()
+            return "".join(
+                f"{opt} {shlex.quote(path)} ".lstrip()
+                for path in self.bulk_edit.values()
+                if path != ""
+            )
         cmdstr = "".join([c.get_widget_value_cmdline() for c in self.children])
         return cmdstr
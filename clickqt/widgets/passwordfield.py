@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from functools import lru_cache
+import os
+
 import click
 from PySide6.QtWidgets import QLineEdit
 from PySide6.QtGui import QIcon, QAction
@@ -7,6 +10,17 @@ from PySide6.QtGui import QIcon, QAction
 from clickqt.widgets.textfield import TextField
 
 
+@lru_cache(maxsize=None)
+def password_icons() -> tuple[tuple[QIcon, str], tuple[QIcon, str]]:
+    """Returns the icons and texts of the show/hide action, they are loaded only once per process and shared by all PasswordFields."""
+
+    images = os.path.join(os.path.dirname(os.path.dirname(__file__)), "images")
+    return (
+        (QIcon(os.path.join(images, "eye-show.png")), "Show password"),
+        (QIcon(os.path.join(images, "eye-hide.png")), "Hide password"),
+    )
+
+
 class PasswordField(TextField):
     """Represents a click.types.StringParamType-object with hide_input==True.
     The input will be hidden by default, but can be made visible by clicking on the "eye-show" icon.
@@ -26,10 +40,7 @@ class PasswordField(TextField):
             hasattr(param, "hide_input") and param.hide_input
         ), "'param.hide_input' should be True"
 
-        self.icon_text = (
-            (QIcon("clickqt\\images\\eye-show.png"), "Show password"),
-            (QIcon("clickqt\\images\\eye-hide.png"), "Hide password"),
-        )
+        self.icon_text = password_icons()
         self.show_hide_action = QAction(
             icon=self.icon_text[0][0], text=self.icon_text[0][1]
         )
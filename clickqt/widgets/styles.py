@@ -1,3 +1,8 @@
+"""Style sheets of the widgets, every style sheet is created only once per process and shared by all GUIs."""
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
 def BLOB_BUTTON_STYLE_ENABLED(btnsizehalfpx: int):
     return f"""
         QToolButton {{
@@ -12,6 +17,7 @@ def BLOB_BUTTON_STYLE_ENABLED(btnsizehalfpx: int):
     """
 
 
+@lru_cache(maxsize=None)
 def BLOB_BUTTON_STYLE_DISABLED(btnsizehalfpx: int):
     return f"""
         QToolButton {{
@@ -25,6 +31,7 @@ def BLOB_BUTTON_STYLE_DISABLED(btnsizehalfpx: int):
         }}
     """
 
+@lru_cache(maxsize=None)
 def BLOB_BUTTON_STYLE_ENABLED_FORCED(btnsizehalfpx: int):
     return f"""
         QToolButton {{
@@ -38,6 +45,7 @@ def BLOB_BUTTON_STYLE_ENABLED_FORCED(btnsizehalfpx: int):
         }}
     """
 
+@lru_cache(maxsize=None)
 def BLOB_BUTTON_STYLE_DISABLED_FORCED(btnsizehalfpx: int):
     return f"""
         QToolButton {{
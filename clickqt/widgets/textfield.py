@@ -1,4 +1,5 @@
 from __future__ import annotations
+import os
 import shlex
 
 from enum import IntFlag
@@ -7,8 +8,9 @@ from io import TextIOWrapper, BufferedReader
 
 import click
 from PySide6.QtWidgets import QLineEdit, QPushButton, QFileDialog, QHBoxLayout, QWidget
-from PySide6.QtCore import QDir
+from PySide6.QtCore import QDir, QTimer
 
+from clickqt.core.pathservice import PathInfo, PathCompleter, path_service
 from clickqt.widgets.core.QPathDialog import QPathDialog
 from clickqt.widgets.basewidget import BaseWidget
 
@@ -101,6 +103,117 @@ class PathField(TextField):
         input_btn_container.layout().addWidget(self.browse_btn)
         self.layout.addWidget(input_btn_container)
 
+        # The filesystem is only accessed in the threads of the path service
+        self.path_service = path_service()
+        self.widget.setCompleter(
+            PathCompleter(
+                self.widget, self.path_service, base_directory=self.working_directory
+            )
+        )
+        self.__checked_path: t.Optional[str] = None
+        self.__on_result: list[t.Callable[[bool], t.Any]] = []
+        # The path service outlives the widget, results must not arrive after it is deleted
+        self.widget.destroyed.connect(self.__disconnect)
+        # Check the path shortly after the user stopped typing
+        self.check_timer = QTimer(self.widget)
+        self.check_timer.setSingleShot(True)
+        self.check_timer.setInterval(300)
+        self.check_timer.timeout.connect(self.check_path)
+        self.widget.textChanged.connect(self.check_timer.start)
+
+    def path_error(self, path: str, info: PathInfo) -> t.Optional[str]:
+        """Returns why **path** is not accepted by the click type or None if it is accepted (or can't be decided without opening it).
+
+        :param path: The path that was checked
+        :param info: The result of the check
+        """
+
+        return info.error or None
+
+    def check_path(self, on_result: t.Optional[t.Callable[[bool], t.Any]] = None):
+        """Checks the path of the widget in the background and marks the widget as valid/invalid when the result has arrived.
+        Results of the last seconds are reused (see :class:`~clickqt.core.pathservice.PathService`).
+
+        :param on_result: Function that is called with True (path accepted) or False when the check is done, defaults to None
+        """
+
+        path = self.resolve_path(self.get_widget_value())
+        self.__checked_path = path
+        if on_result is not None:
+            self.__on_result.append(on_result)
+        if path in ("", "-"):  # Nothing to check
+            self.__apply(path, PathInfo(True))
+        elif (info := self.path_service.cached_stat(path)) is not None:
+            self.__apply(path, info)
+        else:
+            self.path_service.request_stat(path, self.__stat_ready)
+
+    def convert_value(self, value: t.Any) -> t.Any:
+        """Converts **value** with the last result of :func:`~clickqt.widgets.textfield.PathField.check_path`, so the filesystem
+        isn't accessed in the GUI thread (see :func:`~clickqt.widgets.textfield.PathField.convert_checked`).
+        An outdated result is checked again in the background. Paths that were never checked (e.g. defaults or imported
+        command lines) are checked by the path service, which waits at most :data:`~clickqt.core.pathservice.STAT_TIMEOUT` seconds.
+        """
+
+        value = self.resolve_path(value)
+        if not isinstance(value, str) or value in ("", "-"):
+            return super().convert_value(value)
+        if (info := self.path_service.last_stat(value)) is None:
+            info = self.path_service.stat(value)
+
+        if self.path_service.cached_stat(value) is None and value == self.resolve_path(
+            self.get_widget_value()
+        ):  # Outdated, the widget shows the new result
+            self.check_path()
+        if (error := self.path_error(value, info)) is not None:
+            raise click.BadParameter(
+                error, click.Context(self.click_command), self.param
+            )
+        return self.convert_checked(value)
+
+    def convert_checked(self, path: str) -> t.Any:
+        """Converts **path**, which is accepted by :func:`~clickqt.widgets.textfield.PathField.path_error`, without accessing the filesystem.
+
+        :param path: The checked path
+        """
+
+        return super().convert_value(path)
+
+    def process_value(self, ctx: click.Context, value: t.Any) -> t.Any:
+        """Like click.Parameter.process_value, but **value** isn't converted again: Converting a path accesses the filesystem
+        and a file returned by :func:`~clickqt.widgets.textfield.PathField.convert_checked` must not be opened yet.
+        """
+
+        return self.process_converted_value(ctx, value)
+
+    def __disconnect(self):
+        self.path_service.cancel_stat(self.__stat_ready)
+
+    def __stat_ready(self, path: str, info: PathInfo):
+        if path == self.__checked_path:
+            self.__apply(path, info)
+
+    def __apply(self, path: str, info: PathInfo):
+        self.__checked_path = None
+        error = None if path in ("", "-") else self.path_error(path, info)
+        self.handle_valid(error is None)
+        if path != "-":  # The tooltip of '-' may describe the stdin source
+            self.widget.setToolTip(error or "")
+        on_result, self.__on_result = self.__on_result, []
+        for function in on_result:
+            function(error is None)
+
+    def start_directory(self) -> str:
+        """Returns the directory in which the browse dialog starts: The (parent) directory of the current value if it is known
+        to exist, the working directory otherwise."""
+
+        path = self.resolve_path(self.get_widget_value())
+        for directory in (path, os.path.dirname(path)):
+            if directory and (info := self.path_service.cached_stat(directory)):
+                if info.is_dir:
+                    return directory
+        return self.working_directory or QDir.currentPath()
+
     def set_value(self, value: t.Any):
         if isinstance(value, BufferedReader):
             self.widget.setText("-")
@@ -126,13 +239,13 @@ class PathField(TextField):
             and self.file_type & PathField.FileType.Directory
         ):
             dialog = QPathDialog(
-                None, directory=QDir.currentPath(), exist=self.type.exists
+                None, directory=self.start_directory(), exist=self.type.exists
             )
             if dialog.exec():
                 self.set_value(dialog.selectedPath())
                 self.handle_valid(True)
         else:
-            dialog = QFileDialog(directory=QDir.currentPath())
+            dialog = QFileDialog(directory=self.start_directory())
             dialog.setViewMode(QFileDialog.ViewMode.Detail)
             dialog.setOption(QFileDialog.Option.DontUseNativeDialog, True)
             # File or directory selectable
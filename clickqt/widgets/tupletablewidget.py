@@ -0,0 +1,181 @@
+""" Contains the TupleTableWidget class """
+from __future__ import annotations
+
+import shlex
+import typing as t
+from functools import partial
+
+import click
+
+from clickqt.core.error import ClickQtError
+from clickqt.widgets.basewidget import BaseWidget
+from clickqt.widgets.core.QTupleTableEdit import QTupleTableEdit
+from clickqt.widgets.listeditwidget import value_to_text
+
+#: Column types whose cells are sorted by their converted value instead of their text
+SORTED_BY_VALUE = (
+    click.types.IntParamType,
+    click.types.FloatParamType,
+    click.types.BoolParamType,
+    click.DateTime,
+)
+
+
+class TupleTableWidget(BaseWidget):
+    """Represents a multiple click.Parameter-object with tuple values (click.types.Tuple or **param**.nargs >= 2) in a table
+    with one column per tuple component instead of a :class:`~clickqt.widgets.nvaluewidget.NValueWidget` with one
+    :class:`~clickqt.widgets.tuplewidget.TupleWidget` per value. Every column is converted by the type of its component.
+
+    :param otype: The type which specifies the clickqt widget type. This type may be different compared to **param**.type when dealing with click.types.CompositeParamType-objects
+    :param param: The parameter from which **otype** came from
+    :param kwargs: Additionally parameters ('parent', 'widgetsource', 'com', 'label') needed for
+                    :class:`~clickqt.widgets.basewidget.MultiWidget`- / :class:`~clickqt.widgets.confirmationwidget.ConfirmationWidget`-widgets
+    """
+
+    widget_type = QTupleTableEdit  #: The Qt-type of this widget.
+
+    def __init__(self, otype: click.ParamType, param: click.Parameter, **kwargs):
+        kwargs.pop("widgetsource", None)
+        assert param.multiple, "'param.multiple' should be True"
+        assert (
+            isinstance(otype, click.Tuple) or param.nargs >= 2
+        ), f"'otype' should be of type '{click.Tuple}' or 'param.nargs' should be >= 2"
+
+        #: The type of every column
+        self.column_types: list[click.ParamType] = (
+            list(otype.types)
+            if isinstance(otype, click.Tuple)
+            else [otype] * param.nargs
+        )
+
+        super().__init__(otype, param, **kwargs)
+
+        model = self.widget.model
+        ctx = click.Context(self.click_command)
+        for i, column_type in enumerate(self.column_types):
+            if isinstance(column_type, SORTED_BY_VALUE):
+                model.sort_keys[i] = partial(
+                    column_type.convert, param=self.param, ctx=ctx
+                )
+
+        self.widget.valuesChanged.connect(self.__values_changed)
+
+        if self.parent_widget is None:
+            ctx = click.Context(self.click_command)
+            if (envvar_values := self.param.value_from_envvar(ctx)) is not None:
+                self.set_value(envvar_values)
+            elif (
+                default := BaseWidget.get_param_default(self.param, None)
+            ) is not None:
+                self.set_value(default)
+        if len(self.widget) == 0 and self.can_change_enabled:
+            self.set_enabled_changeable(enabled=False)
+
+    def create_widget(self) -> QTupleTableEdit:
+        metavar = self.param.metavar
+        if isinstance(metavar, (tuple, list)) and len(metavar) == len(
+            self.column_types
+        ):
+            headers = [str(name) for name in metavar]
+        else:
+            headers = [column_type.name for column_type in self.column_types]
+        return QTupleTableEdit(headers)
+
+    def __values_changed(self):
+        if len(self.widget) > 0 and not self.is_enabled and self.can_change_enabled:
+            self.set_enabled_changeable(enabled=True)
+
+    def set_value(self, value: t.Iterable[t.Sequence[t.Any]]):
+        """Replaces the rows of the table.
+
+        :param value: The new tuples, one value per column
+        """
+
+        self.widget.set_values([[value_to_text(v) for v in row] for row in value])
+
+    def is_empty(self) -> bool:
+        return len(self.widget) == 0
+
+    def get_widget_value(self) -> list[tuple[str, ...]]:
+        return self.widget.values()
+
+    def get_value(self) -> tuple[t.Any, ClickQtError]:
+        """Converts the table column by column with the type of every column and returns the tuples.
+        Invalid cells are marked in the table. If multiple errors occured then they will be concatenated and returned.
+
+        :return: Valid: (converted tuples or the value of a callback, :class:`~clickqt.core.error.ClickQtError.ErrorType.NO_ERROR`)\n
+                 Invalid: (None, :class:`~clickqt.core.error.ClickQtError.ErrorType.CONVERTING_ERROR` or
+                 :class:`~clickqt.core.error.ClickQtError.ErrorType.PROCESSING_VALUE_ERROR` or :class:`~clickqt.core.error.ClickQtError.ErrorType.REQUIRED_ERROR`)
+        """
+
+        ctx = click.Context(self.click_command)
+        if len(self.widget) == 0 or not self.is_enabled:
+            default = BaseWidget.get_param_default(self.param, None)
+
+            if self.param.required and default is None:
+                self.handle_valid(False)
+                return (
+                    None,
+                    ClickQtError(
+                        ClickQtError.ErrorType.REQUIRED_ERROR,
+                        self.widget_name,
+                        self.param.param_type_name,
+                    ),
+                )
+            if (envvar_values := self.param.value_from_envvar(ctx)) is not None:
+                self.set_value(envvar_values)
+            elif default is not None:
+                self.set_value(default)
+            else:  # param is not required and there is no default -> value is None
+                return self.handle_callback(None)  # But callback should be considered
+
+        columns: list[list[t.Any]] = []
+        errors: dict[tuple[int, int], str] = {}
+        for c, (column_type, texts) in enumerate(
+            zip(self.column_types, self.widget.model.columns)
+        ):
+            convert = column_type.convert
+            is_path = isinstance(column_type, (click.Path, click.File))
+            column: list[t.Any] = []
+            for r, text in enumerate(texts):
+                try:  # Try to convert the provided value into the corresponding click object type
+                    if is_path:
+                        text = self.resolve_path(text)
+                    column.append(convert(text, self.param, ctx))
+                except Exception as e:  # pylint: disable=broad-exception-caught
+                    errors[(r, c)] = str(e)
+            columns.append(column)
+
+        self.widget.model.set_errors(errors)
+        self.handle_valid(len(errors) == 0)
+        if len(errors) > 0:  # Join all error messages (row by row) and return them
+            messages = ", ".join(errors[cell] for cell in sorted(errors))
+            return (
+                None,
+                ClickQtError(
+                    ClickQtError.ErrorType.CONVERTING_ERROR,
+                    self.widget_name,
+                    messages if len(errors) == 1 else messages.join(["[", "]"]),
+                ),
+            )
+
+        values = list(zip(*columns))
+        return self.handle_callback(values if len(values) > 0 else None)
+
+    def get_widget_value_cmdline(self) -> str:
+        # Same arguments as the command line of a NValueWidget with these tuples:
+        # Empty cells of path and file columns are left out like the value of an empty PathField
+        opt = self.get_preferable_opt()
+        paths = [
+            isinstance(column_type, (click.Path, click.File))
+            for column_type in self.column_types
+        ]
+        cmdline = ""
+        for row in self.widget.values():
+            values = [
+                shlex.quote(value)
+                for value, path in zip(row, paths)
+                if value != "" or not path
+            ]
+            cmdline += f"{opt} {' '.join(values)} "
+        return cmdline
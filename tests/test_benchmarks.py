@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import json
+import sys
+
+import click
+import pytest
+
+from benchmarks import common, construction, imports, output, roundtrip
+from benchmarks.synthetic import ALL_KINDS, count_params, synthetic_cli
+
+
+def test_synthetic_cli():
+    cli = synthetic_cli(depth=2, fanout=2, params=len(ALL_KINDS), group_params=1)
+    assert isinstance(cli, click.Group)
+    assert count_params(cli) == 1 + 2 * (1 + 2 * len(ALL_KINDS))
+
+    cmd = synthetic_cli(params=20, option_groups=2)
+    assert not isinstance(cmd, click.Group)
+    assert sum(isinstance(param, click.Option) for param in cmd.params) >= 20
+
+    with pytest.raises(ValueError):
+        synthetic_cli(kinds=["unknown"])
+
+
+def test_construction_benchmark(tmp_path, monkeypatch):
+    monkeypatch.setitem(
+        construction.CASES, "tiny", {"depth": 1, "fanout": 2, "params": 4}
+    )
+    output = tmp_path / "result.json"
+    streams = sys.stdout, sys.stderr
+
+    assert (
+        construction.main(["--case", "tiny", "--repeat", "1", "--output", str(output)])
+        == 0
+    )
+    assert (sys.stdout, sys.stderr) == streams
+
+    report = json.loads(output.read_text(encoding="utf-8"))
+    assert report["benchmark"] == "construction"
+    metrics = report["results"]["tiny"]
+    assert metrics["params"] == metrics["widgets"] == 8
+    assert 0 < metrics["parse_cmd_s"] <= metrics["total_s"]
+
+    # Comparison with a baseline
+    assert (
+        construction.main(
+            [
+                "--case",
+                "tiny",
+                "--repeat",
+                "1",
+                "--output",
+                str(output),
+                "-b",
+                str(output),
+                "--tolerance",
+                "100",
+            ]
+        )
+        == 0
+    )
+    baseline = {"tiny": {**metrics, "total_s": metrics["total_s"] / 10}}
+    regressions = common.compare(report["results"], baseline, 0.2)
+    assert len(regressions) == 1 and regressions[0].startswith("tiny.total_s")
+    assert common.compare({"a": {"ops_per_s": 50.0}}, {"a": {"ops_per_s": 100.0}}, 0.2)
+    assert not common.compare(
+        {"a": {"ops_per_s": 90.0}}, {"a": {"ops_per_s": 100.0}}, 0.2
+    )
+
+
+def test_output_benchmark():
+    messages = output.make_messages(
+        {"writes": 4, "lines": 2, "width": 20, "style": "ansi", "stderr": 2}
+    )
+    assert [stream for stream, _ in messages] == [1, 2, 1, 2]
+    assert all(message.count("\n") == 2 for _, message in messages)
+
+    binary = output.make_messages({"writes": 3, "style": "binary"})
+    assert all(isinstance(message, bytes) for _, message in binary)
+
+    streams = sys.stdout, sys.stderr
+    metrics = output.run_case(
+        {"writes": 50, "lines": 3, "width": 30, "style": "ansi", "stderr": 3}, 1
+    )
+    assert (sys.stdout, sys.stderr) == streams
+    assert metrics["lines"] == 150
+    assert metrics["document_blocks"] == 151  # Trailing newline
+    assert metrics["lines_per_s"] > 0
+    assert 0 <= metrics["latency_p50_ms"] <= metrics["latency_max_ms"]
+    assert metrics["max_stall_ms"] >= 0
+
+
+def test_roundtrip_benchmark():
+    streams = sys.stdout, sys.stderr
+    config = {"params": 2 * len(roundtrip.FORM_KINDS), "kinds": roundtrip.FORM_KINDS}
+    metrics = roundtrip.run_case(config, 2)  # Asserts the round trip
+    assert (sys.stdout, sys.stderr) == streams
+    assert metrics["params"] == config["params"]
+    assert metrics["cmdline_chars"] > 0
+    assert all(
+        metrics[metric] >= 0 for metric in ("validation_s", "export_s", "import_s")
+    )
+
+
+def test_imports_benchmark():
+    metrics = imports.run_case({"module": "clickqt", "budget_ms": 10**6}, 1)
+    assert 0 < metrics["clickqt_ms"] <= metrics["total_ms"]
+    assert metrics["modules"] > 0
+
+    with pytest.raises(AssertionError, match="budget"):
+        imports.run_case({"module": "clickqt", "budget_ms": 0}, 1)
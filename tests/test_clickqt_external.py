@@ -3,14 +3,27 @@ Tests the external use of clickqt.
 """
 from __future__ import annotations
 
+import sys
+import threading
+
 import pytest
 import click
+from click.testing import CliRunner
 from clickqt.__main__ import (
+    MODULE_NAME,
+    TARGET_THREAD,
+    WAIT_PHASE,
+    StartupTimer,
+    clickqtfy,
+    forget_targets,
     get_command_from_entrypoint,
     get_command_from_path,
     get_gui_specs_from_entrypoint,
     get_gui_specs_from_path,
+    imports_qt,
+    installed_entrypoints,
 )
+from clickqt.core.control import Control
 
 
 def test_clickqt_external():
@@ -58,3 +71,120 @@ def test_clickqt_external_gui_specs():
     assert isinstance(
         get_gui_specs_from_path("example/example/__main__.py", "gui"), dict
     )
+
+
+def test_clickqtfy_timing(monkeypatch):
+    monkeypatch.setattr(Control, "__call__", lambda self: None)  # Don't show the GUI
+
+    result = CliRunner().invoke(
+        clickqtfy, ["--timing", "example/example/afwizard.py", "main"]
+    )
+    assert result.exit_code == 0, result.output
+    for phase in (
+        "resolve target",
+        "import GUI",
+        "create QApplication",
+        "wait for target",
+        "load target",
+        "build Control",
+        "critical path:",
+    ):
+        assert phase in result.output
+    assert TARGET_THREAD in result.output
+
+    # Errors of the background thread are raised in the main thread
+    result = CliRunner().invoke(clickqtfy, ["no_such_entry_point_for_clickqtfy"])
+    assert isinstance(result.exception, ImportError)
+
+
+def test_startup_timer_critical_path():
+    timer = StartupTimer()
+    main = threading.current_thread().name
+    timer.phases = [
+        ("resolve target", TARGET_THREAD, 0.0, 0.5),
+        ("import GUI", main, 0.0, 0.3),
+        (WAIT_PHASE, main, 0.3, 0.5),
+        ("build Control", main, 0.5, 0.6),
+    ]
+    # The main thread waited: The target is on the critical path
+    assert [phase[0] for phase in timer.critical_path()] == [
+        "resolve target",
+        "build Control",
+    ]
+    assert "resolve target -> build Control = 600.0 ms" in timer.report()
+
+    timer.phases[0] = ("resolve target", TARGET_THREAD, 0.0, 0.1)
+    timer.phases[2] = (WAIT_PHASE, main, 0.3, 0.3)
+    assert [phase[0] for phase in timer.critical_path()] == [
+        "import GUI",
+        "build Control",
+    ]
+
+
+def test_clickqtfy_module_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(Control, "__call__", lambda self: None)  # Don't show the GUI
+
+    runs = tmp_path / "runs.txt"
+    target = tmp_path / "target.py"
+    target.write_text(
+        f"""
+import click
+import clickqt
+
+with open({str(runs)!r}, "a") as file:
+    file.write("run\\n")
+
+@click.command()
+@click.option("--value", type=int)
+def main(value):
+    pass
+
+gui = clickqt.qtgui_from_click(main)
+""",
+        encoding="utf-8",
+    )
+
+    result = CliRunner().invoke(clickqtfy, ["--custom-gui", "gui", str(target), "main"])
+    assert result.exit_code == 0, result.output
+    assert isinstance(get_command_from_path(str(target), "main"), click.Command)
+    get_gui_specs_from_path(str(target), "gui")  # A Control without custom mapping
+    assert runs.read_text(encoding="utf-8") == "run\n"  # The file ran only once
+
+    # The installed packages are scanned only once
+    assert get_command_from_entrypoint("example_cli") is get_command_from_entrypoint(
+        "example_cli"
+    )
+    assert installed_entrypoints.cache_info().misses <= 1
+
+
+@pytest.mark.parametrize(
+    "imports, thread",
+    [("import click", TARGET_THREAD), ("import click\nimport clickqt", "MainThread")],
+)
+def test_clickqtfy_import_thread(tmp_path, monkeypatch, imports, thread):
+    monkeypatch.setattr(Control, "__call__", lambda self: None)  # Don't show the GUI
+
+    target = tmp_path / "target.py"
+    target.write_text(
+        f"""{imports}
+import threading
+
+THREAD = threading.current_thread().name
+
+@click.command()
+def main():
+    pass
+""",
+        encoding="utf-8",
+    )
+
+    # Targets that may create Qt objects when they are imported are imported by the main thread
+    result = CliRunner().invoke(clickqtfy, ["--timing", str(target), "main"])
+    assert result.exit_code == 0, result.output
+    assert sys.modules[MODULE_NAME].THREAD == thread
+    assert ("import target" in result.output) == (thread == TARGET_THREAD)
+    forget_targets()
+
+    assert imports_qt(compile("from PySide6.QtWidgets import QWidget", "", "exec"))
+    assert not imports_qt(compile("import os.path", "", "exec"))
+    assert imports_qt(None)
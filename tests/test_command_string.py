@@ -128,3 +128,26 @@ def test_command(eptype: EPTYPE, click_attrs: dict, value: t.Any, expected_param
     # Simulate clipboard behavior using QApplication.clipboard()
     clipboard = QApplication.clipboard()
     assert clipboard.text(QClipboard.Clipboard) == expected_output
+
+
+def test_command_datetime_followed_by_option():
+    cli = click.Command(
+        "cli",
+        params=[
+            click.Option(["--d"], type=click.DateTime()),
+            click.Option(["--n"], type=int),
+        ],
+    )
+    control = clickqt.qtgui_from_click(cli)
+    control.set_ep_or_path("cli")
+    widgets = control.widget_registry[cli.name]
+    widgets["d"].set_value("2000-01-02 03:04:05")
+    widgets["n"].set_value(3)
+    for widget in widgets.values():
+        widget.set_enabled_changeable(enabled=True)
+
+    # The next option must not be glued to the date
+    assert (
+        control.command_to_cli_string([cli.name])
+        == "cli --d '2000-01-02 03:04:05' --n 3"
+    )
@@ -0,0 +1,161 @@
+"""
+Tests the resident daemon of clickqtfy.
+"""
+from __future__ import annotations
+
+import os
+import socket
+import stat
+import threading
+
+import pytest
+from PySide6.QtCore import QEvent
+from PySide6.QtWidgets import QApplication
+from pytestqt.qtbot import QtBot
+
+from clickqt.__main__ import (
+    daemon_socket_path,
+    forget_targets,
+    open_in_daemon,
+    request_daemon,
+)
+from clickqt.core.daemon import LauncherDaemon
+
+pytestmark = pytest.mark.skipif(
+    os.name == "nt", reason="The daemon uses Unix domain sockets"
+)
+
+TARGET = """
+import click
+
+with open({runs!r}, "a", encoding="utf-8") as runs:
+    runs.write("run\\n")
+
+@click.command()
+@click.option("--{option}")
+def main(**kwargs):
+    pass
+"""
+
+
+def write_target(path, runs, option: str):
+    path.write_text(TARGET.format(runs=str(runs), option=option), encoding="utf-8")
+    # Changes within the resolution of the file system time stamps are detected by the size
+    os.utime(path, ns=(os.stat(path).st_atime_ns, os.stat(path).st_mtime_ns + 10**9))
+
+
+def request(qtbot: QtBot, request_: dict, path: str) -> dict:
+    """Sends **request_** from another thread, the daemon answers in the event loop of this thread."""
+
+    replies = []
+    client = threading.Thread(
+        target=lambda: replies.append(request_daemon(request_, path, timeout=30))
+    )
+    client.start()
+    qtbot.waitUntil(lambda: not client.is_alive(), timeout=30000)
+    return replies[0]
+
+
+def test_daemon(qtbot: QtBot, tmp_path):
+    cwd = os.getcwd()
+    target = tmp_path / "cli.py"
+    runs = tmp_path / "runs.txt"
+    write_target(target, runs, "name")
+    path = str(tmp_path / "daemon.sock")
+
+    daemon = LauncherDaemon(path, idle_timeout=None)
+    assert daemon.listen()
+    try:
+        open_request = {
+            "entrypoint": "cli.py",
+            "funcname": "main",
+            "cwd": str(tmp_path),
+        }
+        assert request(qtbot, {"ping": True}, path) == {"ok": True}
+        assert request(qtbot, open_request, path) == {"ok": True}
+        assert request(qtbot, open_request, path) == {"ok": True}
+
+        # Two windows, but the file was run only once
+        assert len(daemon.controls) == 2
+        assert runs.read_text(encoding="utf-8") == "run\n"
+        first = daemon.controls[0]
+        assert first.gui.window.windowTitle() == "cli.py - main"
+        assert first.ep_or_path == "cli.py" and not first.is_ep
+        assert "name" in first.command_tree.root.widgets
+        # Paths are relative to the directory of the client, the daemon stays in its directory
+        assert first.gui.working_directory == str(tmp_path)
+        assert os.getcwd() == cwd
+
+        # A changed file is run again
+        write_target(target, runs, "other")
+        assert request(qtbot, open_request, path) == {"ok": True}
+        assert runs.read_text(encoding="utf-8") == "run\nrun\n"
+        assert "other" in daemon.controls[-1].command_tree.root.widgets
+        assert "name" in first.command_tree.root.widgets
+
+        reply = request(qtbot, {**open_request, "funcname": "missing"}, path)
+        assert not reply["ok"] and reply["error"].startswith("ImportError")
+        reply = request(qtbot, {"entrypoint": "no_such_entry_point"}, path)
+        assert not reply["ok"] and "no_such_entry_point" in reply["error"]
+
+        # Closed windows are forgotten
+        for control in list(daemon.controls):
+            control.gui.window.close()
+        QApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+        assert not daemon.controls
+    finally:
+        daemon.server.close()
+        forget_targets()
+
+
+def test_daemon_process(tmp_path, monkeypatch):
+    monkeypatch.setenv("QT_QPA_PLATFORM", "offscreen")
+    path = str(tmp_path / "daemon.sock")
+    assert request_daemon({"ping": True}, path) is None
+
+    try:
+        # The first request starts the daemon
+        assert open_in_daemon("example_cli", None, path=path)
+        assert request_daemon({"ping": True}, path) == {"ok": True}
+        assert open_in_daemon("example_cli", None, path=path)
+    finally:
+        request_daemon({"stop": True}, path)
+
+
+def test_daemon_socket_private(tmp_path, monkeypatch):
+    monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+    monkeypatch.setattr("tempfile.gettempdir", lambda: str(tmp_path))
+    directory = tmp_path / f"clickqtfy-{os.getuid()}"
+
+    # Without a runtime directory, the socket is in a directory only the user can access
+    assert os.path.dirname(daemon_socket_path()) == str(directory)
+    assert stat.S_IMODE(os.stat(directory).st_mode) == 0o700
+    directory.chmod(0o755)
+    daemon_socket_path()
+    assert stat.S_IMODE(os.stat(directory).st_mode) == 0o700
+
+    # A link could point to the directory of another user
+    directory.rmdir()
+    (tmp_path / "other").mkdir()
+    directory.symlink_to(tmp_path / "other")
+    with pytest.raises(PermissionError):
+        daemon_socket_path()
+
+
+def test_daemon_of_other_user(tmp_path, monkeypatch):
+    path = str(tmp_path / "daemon.sock")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(path)
+        server.listen()
+        uid = os.getuid()
+        monkeypatch.setattr("os.getuid", lambda: uid + 1)
+
+        # The request isn't sent to a daemon of another user
+        with pytest.raises(PermissionError):
+            request_daemon({"ping": True}, path, timeout=5)
+        assert not open_in_daemon("example_cli", None, path=path)
+        server.settimeout(0.1)
+        connection, _ = server.accept()
+        with connection:
+            connection.settimeout(0.1)
+            assert connection.recv(1024) == b""
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import os
+import threading
 import typing as t
 
 import pytest
@@ -8,9 +9,12 @@ import click
 from click.testing import CliRunner
 from pytest import MonkeyPatch
 from PySide6.QtWidgets import QMessageBox, QInputDialog
+from PySide6.QtCore import QEvent
 
 import clickqt.widgets
 from clickqt.core.error import ClickQtError
+from clickqt.core.executionplan import WidgetKind
+from clickqt.core.output import route_output
 from tests.testutils import ClickAttrs, clcoancl, raise_, wait_process_Events
 
 clickqt_res: t.Any = None
@@ -415,6 +419,175 @@ def test_execution_context():
     )
 
 
+def test_execution_context_chain():
+    clickqt_res: list = []
+    closed: list = []
+
+    @click.group()
+    @click.option("--name", default="x")
+    @click.pass_context
+    def cli(ctx, name):
+        ctx.ensure_object(dict)["name"] = name
+        ctx.call_on_close(lambda: closed.append("cli"))
+        clickqt_res.append(ctx.invoked_subcommand)
+
+    @cli.group()
+    @click.pass_context
+    def sub(ctx):
+        ctx.call_on_close(lambda: closed.append("sub"))
+
+    @sub.command()
+    @click.argument("value", default="v")
+    @click.pass_context
+    def cmd(ctx, value):
+        clickqt_res.append(
+            (
+                [c.info_name for c in (ctx, ctx.parent, ctx.parent.parent)],
+                ctx.find_object(dict),
+                ctx.find_root().params,
+                ctx.params,
+                click.get_current_context() is ctx,
+            )
+        )
+
+    control = clickqt.qtgui_from_click(cli)
+    control.gui.run_button.click()
+
+    wait_process_Events(200)  # Wait for worker thread to finish the execution
+
+    assert clickqt_res == [
+        "sub",
+        (["cmd", "sub", "cli"], {"name": "x"}, {"name": "x"}, {"value": "v"}, True),
+    ]
+    assert closed == ["sub", "cli"]  # Contexts are closed from the innermost one
+
+
+def test_execution_stops_on_error():
+    clickqt_res: list = []
+
+    @click.group()
+    def cli():
+        clickqt_res.append("cli")
+        raise click.exceptions.Exit(2)
+
+    @cli.command()
+    def cmd():
+        clickqt_res.append("cmd")
+
+    control = clickqt.qtgui_from_click(cli)
+    control.gui.run_button.click()
+
+    wait_process_Events(200)  # Wait for worker thread to finish the execution
+
+    assert clickqt_res == ["cli"]
+    assert "return code: 2" in control.gui.terminal_output.toPlainText()
+
+
+def test_execution_output_isolation():
+    class Sink:
+        def __init__(self):
+            self.messages: list[str] = []
+            self.newMessage = self  # Only emit is needed
+
+        def emit(self, message: str, _):
+            self.messages.append(message)
+
+    def f(p):
+        for i in range(50):
+            print(f"cmd {i}")
+
+    param = click.Option(
+        ["--p"],
+        type=int,
+        default=1,
+        callback=lambda ctx, param, value: print("validation") or value,
+    )
+    cli = click.Command("cli", params=[param], callback=f)
+    control = clickqt.qtgui_from_click(cli)
+    widget = control.widget_registry["cli"]["p"]
+
+    # Focus-out validation in the main thread doesn't swallow the output of the worker
+    control.gui.run_button.click()
+    for _ in range(20):
+        widget.focus_out_validator.eventFilter(
+            widget.widget, QEvent(QEvent.Type.FocusOut)
+        )
+    wait_process_Events(100)
+
+    output = control.gui.terminal_output.toPlainText()
+    assert all(f"cmd {i}\n" in output for i in range(50))
+    assert output.count("validation") == 1  # Only the validation of the run
+
+    # Every thread writes to its own sink
+    sinks = [Sink(), Sink()]
+
+    def write(sink: Sink, name: str):
+        with route_output(sink):
+            for i in range(100):
+                print(f"{name}{i}")
+
+    threads = [
+        threading.Thread(target=write, args=(sink, name))
+        for sink, name in zip(sinks, "ab")
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for sink, name, other in zip(sinks, "ab", "ba"):
+        text = "".join(sink.messages)
+        assert all(f"{name}{i}\n" in text for i in range(100))
+        assert other not in text
+
+
+@pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="Named pipes not supported")
+def test_execution_stdin_source(tmp_path):
+    streams: list[t.IO[t.Any]] = []
+
+    def f(p):
+        streams.append(p)
+        return sum(1 for _ in p)
+
+    param = click.Option(["--p"], type=click.File("r"))
+    cli = click.Command("cli", params=[param], callback=f)
+    control = clickqt.qtgui_from_click(cli)
+    widget = control.widget_registry["cli"]["p"]
+
+    # Regular file
+    path = tmp_path / "input.txt"
+    path.write_text("".join(f"line {i}\n" for i in range(10000)))
+    widget.set_stdin_source(str(path))
+    widget.set_enabled_changeable(enabled=True)
+    assert widget.get_widget_value() == "-"
+    control.gui.run_button.click()
+    wait_process_Events(100)
+    assert control.gui.result_viewer.result == 10000
+    assert streams[-1].closed  # Scoped to the run
+
+    # Named pipe: Validation doesn't block, the worker opens the pipe on the first read
+    fifo = tmp_path / "fifo"
+    os.mkfifo(fifo)
+    widget.set_value(str(path))
+    assert widget.stdin_source is None and widget.get_widget_value() == str(path)
+    widget.set_stdin_source(str(fifo))
+    val, _ = widget.get_value()
+    assert callable(val)
+
+    def write():
+        with open(fifo, "w", encoding="utf-8") as file:
+            for i in range(100):
+                file.write(f"{i}\n")
+
+    writer = threading.Thread(target=write)
+    writer.start()
+    control.gui.run_button.click()
+    wait_process_Events(100)
+    writer.join(5)
+    assert control.gui.result_viewer.result == 100
+    assert streams[-1].closed and streams[-1].name == str(fifo)
+
+
 def test_execution_expose_value_kwargs():
     clickqt_res: dict = None
 
@@ -439,3 +612,47 @@ def test_execution_expose_value_kwargs():
 
     assert len(clickqt_res.values()) == 1
     assert clickqt_res.get("p3") == "c"
+
+
+def test_execution_plan():
+    clickqt_res: list = []
+
+    def f(p2, p1, **kwargs):
+        clickqt_res.append((p1, p2, kwargs))
+
+    cli = click.Group(
+        "cli",
+        commands=[
+            click.Command(
+                "cmd",
+                params=[
+                    click.Option(["--p1"], default="a"),
+                    click.Option(["--p2"], default="b"),
+                    click.Option(["--p3"], default="c"),
+                    click.Option(["--p4"], **ClickAttrs.messagebox(prompt="Sure?")),
+                ],
+                callback=f,
+            )
+        ],
+    )  # Group without callback
+
+    control = clickqt.qtgui_from_click(cli)
+    node = control.command_tree[("cli", "cmd")]
+    plan = control.execution_plan(node)
+
+    assert plan.callback_args == ("p2", "p1")
+    assert [(e[0], e[2]) for e in plan.entries] == [
+        ("p1", WidgetKind.VALUE),
+        ("p2", WidgetKind.VALUE),
+        ("p3", WidgetKind.VALUE),
+        ("p4", WidgetKind.DIALOG),
+    ]
+    assert control.execution_plan(control.command_tree.root).callback is None
+
+    node.widgets["p4"].set_enabled_changeable(enabled=False)
+    for _ in range(2):
+        control.gui.run_button.click()
+        wait_process_Events(100)  # Wait for worker thread to finish the execution
+        assert control.execution_plan(node) is plan  # Built only once
+
+    assert clickqt_res == [("a", "b", {"p3": "c", "p4": False})] * 2
@@ -1,13 +1,26 @@
 from __future__ import annotations
 
+import sys
+import threading
+import time
 import typing as t
 
 import click
 import pytest
-from PySide6.QtCore import QEvent
+from PySide6.QtCore import QCoreApplication, QEvent
 
 import clickqt.widgets
-from tests.testutils import ClickAttrs, raise_
+from clickqt.core import pathservice
+from clickqt.core.pathservice import path_service
+from tests.testutils import ClickAttrs, raise_, wait_process_Events
+
+
+def wait_path_checks():
+    # Paths are checked in the background, the result arrives via the event loop
+    end = time.monotonic() + 5
+    while path_service().is_busy and time.monotonic() < end:
+        wait_process_Events(5, 1)
+    wait_process_Events(0, 1)
 
 
 def evaluate(
@@ -29,6 +42,7 @@ def evaluate(
         clickqt_child_widget.focus_out_validator.eventFilter(
             clickqt_child_widget.widget, QEvent(QEvent.Type.FocusOut)
         )  # widget goes out of focus
+        wait_path_checks()
         if (
             clickqt_widget == clickqt_child_widget
             and isinstance(clickqt_widget, clickqt.widgets.MultiWidget)
@@ -136,3 +150,158 @@ def test_focus_out_validation_child(
     evaluate(
         clickqt_widget, list(clickqt_widget.children)[1], invalid_value, valid_value
     )  # We check the first child
+
+
+def test_path_service_completer(tmp_path):
+    for i in range(600):
+        (tmp_path / f"file{i}.txt").touch()
+    (tmp_path / "subdir").mkdir()
+
+    param = click.Option(["--test"], type=click.Path(exists=True, dir_okay=False))
+    cli = click.Command("cli", params=[param])
+    control = clickqt.qtgui_from_click(cli)
+    widget = control.widget_registry[cli.name][param.name]
+    service = path_service()
+
+    # Inline indicator: Checked in the background after typing, the result is cached
+    directory = str(tmp_path)
+    widget.set_value(directory)
+    widget.check_path()
+    wait_path_checks()
+    assert "red" in widget.widget.styleSheet()
+    assert widget.widget.toolTip() == f"File {directory!r} is a directory."
+    assert service.cached_stat(directory).is_dir
+    assert widget.start_directory() == directory
+
+    widget.set_value(str(tmp_path / "file1.txt"))
+    widget.check_path()
+    wait_path_checks()
+    assert "red" not in widget.widget.styleSheet() and widget.widget.toolTip() == ""
+
+    # The completer proposes the entries of the typed directory, they arrive in batches
+    completer = widget.widget.completer()
+    completer.update_prefix(f"{directory}/fi")
+    wait_path_checks()
+    entries = completer.entries.stringList()
+    assert len(entries) == 601
+    assert f"{directory}/subdir/" in entries and f"{directory}/file599.txt" in entries
+    assert service.cached_listing(f"{directory}/") is not None
+
+    completer.update_prefix(f"{directory}/file")  # Same directory: Not listed again
+    assert completer.entries.rowCount() == 601
+
+
+def test_path_check_after_widget_deletion(tmp_path, monkeypatch):
+    errors: list[BaseException] = []
+    monkeypatch.setattr(sys, "excepthook", lambda *args: errors.append(args[1]))
+    param = click.Option(["--test"], type=click.Path(exists=True))
+    cli = click.Command("cli", params=[param])
+    control = clickqt.qtgui_from_click(cli)
+    widget = control.widget_registry[cli.name][param.name]
+
+    # The result of the check arrives after the widget was deleted
+    widget.set_value(str(tmp_path / "missing"))
+    widget.check_path()
+    widget.widget.deleteLater()
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    wait_path_checks()
+    assert not errors
+
+
+def test_path_conversion_uses_check(tmp_path, monkeypatch):
+    (tmp_path / "file.txt").write_text("content")
+    path_param = click.Option(["--path"], type=click.Path(exists=True))
+    file_param = click.Option(["--file"], type=click.File("r"))
+    cli = click.Command("cli", params=[path_param, file_param])
+    control = clickqt.qtgui_from_click(cli)
+    path_widget = control.widget_registry[cli.name][path_param.name]
+    file_widget = control.widget_registry[cli.name][file_param.name]
+
+    # Every check result only arrives at the function that requested it
+    received: list[str] = []
+    service = path_service()
+    service.request_stat(str(tmp_path), lambda path, info: received.append(path))
+    for widget in (path_widget, file_widget):
+        widget.set_value(str(tmp_path / "file.txt"))
+        widget.check_path()
+    wait_path_checks()
+    assert received == [str(tmp_path)]
+
+    # The checked paths are converted without accessing the filesystem in the GUI thread
+    def fail(*args, **kwargs):
+        raise AssertionError("Filesystem accessed")
+
+    with monkeypatch.context() as patch:
+        patch.setattr("os.stat", fail)
+        patch.setattr("builtins.open", fail)
+        assert path_widget.get_value()[0] == str(tmp_path / "file.txt")
+        file, err = file_widget.get_value()
+        assert err.type == clickqt.core.error.ClickQtError.ErrorType.NO_ERROR
+    assert file.read() == "content"  # Opened on the first read
+    file.close()
+
+
+def test_path_conversion_without_check(tmp_path, monkeypatch):
+    (tmp_path / "file.txt").write_text("content")
+    param = click.Option(["--path"], type=click.Path(exists=True))
+    cli = click.Command("cli", params=[param])
+    control = clickqt.qtgui_from_click(cli)
+    widget = control.widget_registry[cli.name][param.name]
+    service = path_service()
+
+    # A path that was never checked (e.g. an imported command line) is checked by the path service
+    threads: list[str] = []
+    stat_path_ = pathservice.stat_path
+
+    def stat_path(path):
+        threads.append(threading.current_thread().name)
+        return stat_path_(path)
+
+    monkeypatch.setattr(pathservice, "stat_path", stat_path)
+    service.invalidate()
+    widget.set_value(str(tmp_path / "file.txt"))
+    assert widget.get_value()[0] == str(tmp_path / "file.txt")
+    assert threads and all(name.startswith("clickqt-path") for name in threads)
+
+    # The GUI thread doesn't wait for a hung filesystem, the threads of the service don't delay the exit
+    release = threading.Event()
+
+    def hung_stat_path(path):
+        release.wait(5)
+        return stat_path_(path)
+
+    monkeypatch.setattr(pathservice, "stat_path", hung_stat_path)
+    path = str(tmp_path / "hung.txt")
+    assert "took longer than 0.05 s" in service.stat(path, timeout=0.05).error
+    release.set()
+    wait_path_checks()
+    assert service.cached_stat(path) == pathservice.PathInfo(False)
+    assert all(
+        thread.daemon
+        for thread in threading.enumerate()
+        if thread.name.startswith("clickqt-path")
+    )
+
+
+def test_paths_relative_to_working_directory(tmp_path):
+    (tmp_path / "file.txt").write_text("content")
+    path_param = click.Option(["--path"], type=click.Path(exists=True))
+    file_param = click.Option(["--file"], type=click.File("r"))
+    paths_param = click.Option(["--paths"], type=click.Path(exists=True), multiple=True)
+    cli = click.Command("cli", params=[path_param, file_param, paths_param])
+    control = clickqt.qtgui_from_click(cli, working_directory=str(tmp_path))
+    widgets = control.widget_registry[cli.name]
+
+    widgets[path_param.name].set_value("file.txt")
+    widgets[path_param.name].check_path()
+    widgets[file_param.name].set_value("file.txt")
+    widgets[paths_param.name].set_value(["file.txt"])
+    wait_path_checks()
+    assert widgets[path_param.name].get_value()[0] == str(tmp_path / "file.txt")
+    file, err = widgets[file_param.name].get_value()
+    assert err.type == clickqt.core.error.ClickQtError.ErrorType.NO_ERROR
+    assert file.read() == "content"
+    file.close()
+    assert widgets[paths_param.name].get_value()[0] == (str(tmp_path / "file.txt"),)
+    # The command line keeps the relative path, it is run in the working directory
+    assert widgets[path_param.name].get_widget_value_cmdline() == "--path file.txt "
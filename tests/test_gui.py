@@ -1,17 +1,21 @@
 from __future__ import annotations
 
+import os
 import sys
 import typing as t
 
 import pytest
 import click
-from PySide6.QtWidgets import QTabWidget, QPushButton, QSplitter, QWidget
-from PySide6.QtCore import Qt, QThread
+from PySide6.QtWidgets import QApplication, QTabWidget, QPushButton, QSplitter, QWidget
+from PySide6.QtCore import QEvent, Qt, QThread
 
 import clickqt
 from tests.testutils import ClickAttrs, raise_, wait_process_Events
 from clickqt.core.output import TerminalOutput
 from clickqt.core.control import Control
+from clickqt.core.gui import GUI
+from clickqt.core.jobmanager import JobStatus
+from clickqt.core.search import LineIndex
 import clickqt.widgets
 
 
@@ -461,6 +465,112 @@ def test_gui_start_stop_execution():
     assert control.worker is None and control.worker_thread is None
 
 
+def test_gui_job_manager(tmp_path):
+    def f(p):
+        print(f"run {p}")
+        QThread.msleep(200)
+
+    param = click.Option(
+        param_decls=["--p"],
+        type=int,
+        default=1,
+        callback=lambda ctx, param, value: raise_(click.BadParameter("Invalid"))
+        if value == 99
+        else value,
+    )
+    cli = click.Command("cli", params=[param], callback=f)
+
+    control = clickqt.qtgui_from_click(
+        cli, job_limit=2, log_tee=clickqt.LogTee(tmp_path)
+    )
+    manager = control.job_manager
+    panel = control.gui.job_panel
+    widget = control.widget_registry["cli"]["p"]
+    assert control.gui.splitter.indexOf(panel) == 2
+
+    for i in range(3):
+        widget.set_value(i)
+        control.gui.run_button.click()
+    assert control.gui.run_button.isEnabled() and control.gui.stop_button.isEnabled()
+
+    jobs = manager.jobs
+    assert [job.status for job in jobs] == [
+        JobStatus.RUNNING,
+        JobStatus.RUNNING,
+        JobStatus.QUEUED,
+    ]
+    assert panel.table.rowCount() == 3 and panel.table.currentRow() == 2
+    assert control.gui.terminal_output.document() is jobs[2].document
+
+    panel.table.cellWidget(2, 3).click()  # Cancel the queued job
+    assert jobs[2].status == JobStatus.CANCELLED
+    assert jobs[2].log is None  # Logs are opened when the jobs start
+
+    wait_process_Events(100, 10)  # Wait for the jobs to finish
+
+    assert [job.status for job in jobs[:2]] == [JobStatus.FINISHED] * 2
+    assert not manager.is_active() and not control.gui.stop_button.isEnabled()
+    for i, job in enumerate(jobs[:2]):
+        assert f"run {i}" in job.document.toPlainText()
+        assert f"run {1 - i}" not in job.document.toPlainText()
+        assert job.elapsed() >= 0.2
+        assert job.log.wait(5)
+        with open(job.log.paths[0], encoding="utf-8") as log:
+            assert f"run {i}" in log.read()
+        # The output was indexed for the search while it arrived
+        index = job.document.findChild(LineIndex)
+        assert any(f"run {i}" in line for line in index.lines)
+
+    # Invalid value -> Job failed without running
+    widget.set_value(99)
+    control.gui.run_button.click()
+    assert manager.jobs[-1].status == JobStatus.FAILED
+    assert "Invalid" in manager.jobs[-1].document.toPlainText()
+
+    # The messages of the 'Copy'-button don't replace the output of the shown job
+    job_output = manager.jobs[-1].document.toPlainText()
+    control.set_ep_or_path("cli")
+    control.gui.copy_button.click()
+    assert manager.jobs[-1].document.toPlainText() == job_output
+    assert control.gui.terminal_output.document() is control.message_document
+    message = control.message_document.toPlainText()
+    assert "Copied to clipboard: 'cli --p 99'" in message
+    assert len(os.listdir(tmp_path)) == 2  # Only the runs were logged
+
+
+def test_job_retention():
+    param = click.Option(
+        ["--p"],
+        type=int,
+        default=1,
+        callback=lambda ctx, param, value: raise_(click.BadParameter("Invalid")),
+    )
+    control = clickqt.qtgui_from_click(click.Command("cli", params=[param]), job_limit=1)
+    manager = control.job_manager
+    manager.retention = 2
+    panel = control.gui.job_panel
+
+    # Only the last done jobs are kept
+    for _ in range(4):
+        control.gui.run_button.click()
+    assert len(manager.jobs) == 2 and panel.table.rowCount() == 2
+    assert panel.rows == {job: row for row, job in enumerate(manager.jobs)}
+    assert control.shown_job is manager.jobs[-1]
+
+    # A removed job isn't shown anymore
+    panel.table.selectRow(0)
+    assert control.shown_job is manager.jobs[0]
+    manager.retention = 1
+    manager.prune()
+    QApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    assert len(manager.jobs) == 1 and panel.table.rowCount() == 1
+    assert control.gui.terminal_output.document() in (
+        manager.jobs[0].document,
+        control.message_document,
+    )
+
+
+
 @pytest.mark.parametrize(
     ("exception", "output_expected"),
     [
@@ -484,3 +594,73 @@ def test_gui_exception(exception: Exception, output_expected: str):
 
     # Worker thread does not sleep so no need to wait for thread to finish
     assert output_expected in control.gui.terminal_output.toPlainText()
+
+
+def test_gui_tree_navigator():
+    param = click.Option(param_decls=["--p"], **ClickAttrs.intfield(default=3))
+    cli = click.Group(
+        "root_group",
+        params=[click.Option(param_decls=["--root"], **ClickAttrs.textfield())],
+        commands=[
+            click.Command(f"cli{i}", params=[param], callback=lambda p: None)
+            for i in range(200)
+        ]
+        + [
+            click.Group(
+                "sub_group", commands=[click.Command("sub_cli", params=[param])]
+            )
+        ],
+    )
+
+    control = clickqt.qtgui_from_click(cli, tree_navigator=True)
+    navigator = control.navigator
+
+    assert navigator == control.gui.widgets_container
+    assert navigator.nodes[("root_group",)] == control.command_tree.root
+    assert len(findChildren(control.gui.splitter, QTabWidget)) == 0
+
+    # The first command is selected, only its page and the page of the root group exist
+    assert control.get_hierarchy() == ["root_group", "cli0"]
+    assert set(navigator.pages.keys()) == {("root_group",), ("root_group", "cli0")}
+    assert set(control.widget_registry.keys()) == {"root_group", "root_group:cli0"}
+
+    # Path <-> page mapping
+    fulfilled, page = control.select_current_command_hierarchy(
+        ["sub_group", "sub_cli", "--p"]
+    )
+    assert fulfilled == ["sub_group", "sub_cli"]
+    assert navigator.path_of(page) == ("root_group", "sub_group", "sub_cli")
+    assert navigator.stack.currentWidget() == page
+    assert control.get_hierarchy() == ["root_group", "sub_group", "sub_cli"]
+    widget = control.widget_registry["root_group:sub_group:sub_cli"]["p"]
+    assert widget.get_widget_value() == 3
+
+    fulfilled, page = control.select_current_command_hierarchy(["cli199", "cli1"])
+    assert fulfilled == ["cli199"]
+    assert navigator.path_of(page) == ("root_group", "cli199")
+    assert len(navigator.pages) == 5
+
+    # A group without subcommand can't be executed
+    control.select_current_command_hierarchy(["sub_group"])
+    control.gui.run_button.click()
+    assert "Error: Missing command." in control.gui.terminal_output.toPlainText()
+    assert control.worker is None
+
+
+def test_gui_typedict():
+    # The entries are widget classes, even if they haven't been imported yet
+    assert GUI.typedict[click.types.Path] is clickqt.widgets.FilePathField
+    assert GUI.typedict.get(click.types.DateTime) is clickqt.widgets.DateTimeEdit
+    assert GUI.typedict.get(click.types.ParamType) is None
+    assert all(isinstance(widget, type) for widget in GUI.typedict.values())
+    assert dict(GUI.typedict.items())[click.types.File] is clickqt.widgets.FileField
+    # Copies and merges contain the classes, too
+    for copy in (
+        dict(GUI.typedict),
+        GUI.typedict.copy(),
+        {**GUI.typedict},
+        GUI.typedict | {},
+        {} | GUI.typedict,
+    ):
+        assert copy[click.types.Path] is clickqt.widgets.FilePathField
+    assert GUI.typedict == dict(GUI.typedict.items())
@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+from benchmarks.imports import import_times
+
+#: Modules that must not be imported by "import clickqt" or "clickqtfy --help"
+HEAVY_MODULES = ("PySide6", "click_option_group", "qt_collapsible_section")
+
+
+def run_python(code: str) -> subprocess.CompletedProcess:
+    env = {**os.environ, "QT_QPA_PLATFORM": "offscreen"}
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+
+
+@pytest.mark.parametrize("module", ["clickqt", "clickqt.__main__"])
+def test_heavy_modules(module: str):
+    times = import_times(module)
+    assert module in times
+
+    heavy = [name for name in times if name.split(".")[0] in HEAVY_MODULES]
+    assert not heavy, f"'import {module}' imports {heavy[:5]}"
+    assert not any(
+        name.startswith(("clickqt.core", "clickqt.widgets")) for name in times
+    )
+
+
+def test_lazy_attributes():
+    output = run_python(
+        """
+import json
+import sys
+import click
+import clickqt
+
+assert "qtgui_from_click" in dir(clickqt) and "PySide6" not in sys.modules
+control = clickqt.qtgui_from_click(click.Command("cli", params=[click.Option(["--a"], type=int)]))
+assert isinstance(clickqt.LogTee, type)
+print(json.dumps(sorted(name for name in sys.modules if name.startswith(("click_option_group", "qt_collapsible_section", "clickqt.widgets.")))))
+"""
+    ).stdout
+    imported = json.loads(output.splitlines()[-1])
+    assert "clickqt.widgets.numericfields" in imported
+    assert not any(
+        name.startswith(("click_option_group", "qt_collapsible_section"))
+        for name in imported
+    )
+    assert "clickqt.widgets.optiongrouptitlewidget" not in imported
+    assert "clickqt.widgets.datetimeedit" not in imported
@@ -0,0 +1,350 @@
+from __future__ import annotations
+
+import gzip
+import io
+import json
+import os
+import re
+import sys
+import time
+
+import click
+from PySide6.QtGui import QColor, QFont, QTextCursor
+
+import clickqt
+from clickqt.core.ansi import AnsiParser
+from clickqt.core import search
+from clickqt.core.logtee import LogTee, RunLog
+from clickqt.core.output import (
+    OutputStream,
+    TerminalOutput,
+    install_output_streams,
+    uninstall_output_streams,
+)
+from tests.testutils import wait_process_Events
+
+
+def test_ansi_parser():
+    parser = AnsiParser(QColor("black"))
+
+    runs = parser.feed("plain \x1b[1;31mred")
+    assert [text for text, _ in runs] == ["plain ", "red"]
+    assert runs[0][1].foreground().color() == QColor("black")
+    assert runs[1][1].foreground().color() == QColor(205, 0, 0)
+    assert runs[1][1].fontWeight() == QFont.Weight.Bold
+
+    # Escape sequence split over several chunks, the style persists
+    assert parser.feed("\x1b[") == []
+    assert parser.feed("38;5") == []
+    runs = parser.feed(";21mblue\x1b[0m\x1b[2Kreset")
+    assert [text for text, _ in runs] == ["blue", "reset"]
+    assert runs[0][1].foreground().color() == QColor(0, 0, 255)
+    assert runs[0][1].fontWeight() == QFont.Weight.Bold
+    assert runs[1][1].foreground().color() == QColor("black")
+    assert runs[1][1].fontWeight() != QFont.Weight.Bold
+
+    # Same style -> same format object
+    assert parser.feed("a")[0][1] is parser.feed("\x1b[0mb")[0][1]
+
+    # '\r\n' is a line break (even if split), a single '\r' overwrites the line
+    assert parser.feed("line\r") == [("line", runs[1][1])]
+    assert parser.feed("\nnext") == [("\nnext", runs[1][1])]
+    assert [fmt is None for _, fmt in parser.feed("10%\r20%\n")] == [
+        False,
+        True,
+        False,
+    ]
+
+    # Private sequences are ignored
+    runs = parser.feed("a\x1b[?1mb\x1b[?25l")
+    assert runs == [("a", runs[0][1]), ("b", runs[0][1])]
+    assert runs[0][1].fontWeight() != QFont.Weight.Bold
+
+    # A carriage return at the end of a stream doesn't overwrite the output of the next one
+    assert parser.feed("50%\r") == [("50%", runs[0][1])]
+    parser.flush()
+    assert parser.feed("next") == [("next", runs[0][1])]
+
+
+def test_ansi_terminal_output():
+    def f():
+        click.secho("error", fg="green", bold=True)
+        for i in range(3):
+            click.echo(f"\r{i}0%", nl=False)
+        click.echo()
+
+    cli = click.Command("cli", callback=f)
+    control = clickqt.qtgui_from_click(cli)
+    control.gui.run_button.click()
+    wait_process_Events(100)
+
+    terminal = control.gui.terminal_output
+    assert terminal.toPlainText() == "error\n20%\n"
+
+    cursor = QTextCursor(terminal.document())
+    cursor.setPosition(1)
+    assert cursor.charFormat().foreground().color() == QColor(0, 205, 0)
+    assert cursor.charFormat().fontWeight() == QFont.Weight.Bold
+
+
+def test_log_tee(tmp_path):
+    def f(count):
+        for i in range(count):
+            print(f"line {i}")
+        click.secho("done", fg="red", err=True)
+
+    cli = click.Group(
+        "cli",
+        commands=[
+            click.Command(
+                "cmd", params=[click.Option(["--count"], default=100)], callback=f
+            )
+        ],
+    )
+    control = clickqt.qtgui_from_click(cli, log_tee=clickqt.LogTee(tmp_path))
+    control.gui.run_button.click()
+    log = control.run_log
+    wait_process_Events(100)
+
+    assert log.wait(5) and len(log.paths) == 1
+    assert os.path.basename(log.paths[0]).startswith("cli-cmd_")
+    with open(log.paths[0], encoding="utf-8") as file:
+        content = file.read()
+    assert content.startswith("$ ") and "--count 100" in content.splitlines()[0]
+    assert all(f"line {i}\n" in content for i in range(100))
+    assert "\x1b[31mdone\x1b[0m\n" in content
+
+    # Rotation + compression
+    log = LogTee(tmp_path / "gz", max_bytes=1000, compress=True).open_run(["a:b"])
+    for i in range(1000):
+        log.write(f"{i:09d}\n")
+        if i % 100 == 0:  # Let the writer catch up, rotation happens between batches
+            time.sleep(0.01)
+    log.close()
+
+    assert log.wait(5) and len(log.paths) > 1
+    assert all(path.endswith(".gz") and "a_b_" in path for path in log.paths)
+    content = b"".join(gzip.open(path).read() for path in log.paths).decode()
+    assert content == "".join(f"{i:09d}\n" for i in range(1000))
+
+
+def test_search_bar():
+    control = clickqt.qtgui_from_click(click.Command("cli"))
+    terminal = control.gui.terminal_output
+    search_bar = control.gui.search_bar
+    color = QColor("black")
+
+    def wait_search():
+        end = time.monotonic() + 5
+        while search_bar.is_searching and time.monotonic() < end:
+            wait_process_Events(5, 1)
+
+    terminal.writeText("".join(f"line {i}\n" for i in range(50000)), color)
+
+    search_bar.open_search()
+    assert not search_bar.isHidden()
+    search_bar.input.setText("line 4999")
+    wait_search()
+    assert len(search_bar.match_starts) == 11  # 4999, 49990 - 49999
+    assert search_bar.count_label.text() == "1 / 11"
+    assert terminal.textCursor().selectedText() == "line 4999"
+
+    search_bar.next_match()
+    assert terminal.textCursor().block().text() == "line 49990"
+    search_bar.previous_match()
+    search_bar.previous_match()  # Wraps around
+    assert terminal.textCursor().block().text() == "line 49999"
+
+    search_bar.regex.setChecked(True)
+    search_bar.input.setText(r"^line 1\d$")
+    wait_search()
+    assert len(search_bar.match_starts) == 10
+
+    # New output is searched incrementally
+    terminal.writeText("line 11\nline 12 \n", color)
+    wait_search()
+    assert len(search_bar.match_starts) == 11
+
+    search_bar.input.setText("(")  # Invalid regex
+    wait_search()
+    assert search_bar.pattern is None and search_bar.count_label.text() == ""
+
+    search_bar.input.setText("line")
+    wait_search()
+    terminal.clear()
+    wait_search()
+    assert (
+        search_bar.match_starts == [] and search_bar.count_label.text() == "No matches"
+    )
+
+    search_bar.close_search()
+    assert search_bar.isHidden() and terminal.extraSelections() == []
+
+
+def test_search_bar_positions(monkeypatch):
+    monkeypatch.setattr(search, "SEARCH_CHUNK_LINES", 1)
+    control = clickqt.qtgui_from_click(click.Command("cli"))
+    terminal = control.gui.terminal_output
+    search_bar = control.gui.search_bar
+
+    def wait_search():
+        end = time.monotonic() + 5
+        while search_bar.is_searching and time.monotonic() < end:
+            wait_process_Events(5, 1)
+
+    # Characters outside the BMP are 2 positions long in the document
+    terminal.writeText("\U0001F600 first\nsecond \U0001F600 first\n", QColor("black"))
+    search_bar.open_search()
+    search_bar.input.setText("first")
+    assert search_bar.match_starts == []  # Searched when the user stopped typing
+    wait_search()
+    assert search_bar.match_starts == [3, 19]
+    assert terminal.textCursor().selectedText() == "first"
+    search_bar.next_match()
+    assert terminal.textCursor().selectedText() == "first"
+
+    # Like grep, matches never span lines, so every chunk of lines is searched on its own
+    search_bar.regex.setChecked(True)
+    search_bar.input.setText(r"\s+")
+    wait_search()
+    assert search_bar.match_starts == [2, 15, 18]
+    assert search_bar.match_lengths == [1, 1, 1]
+    search_bar.input.setText(r"first\nsecond")
+    wait_search()
+    assert search_bar.match_starts == []
+    pattern = re.compile(r"b\s+|^c", re.MULTILINE)
+    text = "ab \n c\nc b \nb"
+    assert [m.group() for m in search.line_matches(pattern, text)] == ["b ", "c", "b "]
+
+
+def test_result_viewer(tmp_path):
+    records = [{"id": i, "name": f"n{i}"} for i in range(10000)]
+    cli = click.Command("cli", callback=lambda: records)
+
+    control = clickqt.qtgui_from_click(cli)
+    viewer = control.gui.result_viewer
+    assert viewer.isHidden()
+
+    control.gui.run_button.click()
+    wait_process_Events(100)
+
+    assert not viewer.isHidden() and viewer.result is records
+    model = viewer.model
+    root = model.index(0, 0)
+    assert model.data(root) == "result"
+    assert model.data(model.index(0, 2)) == "10000 items"
+
+    # Only fetched rows exist
+    assert model.canFetchMore(root)
+    while model.rowCount(root) == 0 or model.canFetchMore(root):
+        model.fetchMore(root)
+        if model.rowCount(root) >= 1000:
+            break
+    assert model.rowCount(root) == 1000
+    row = model.index(999, 0, root)
+    assert model.data(row) == "[999]" and model.rowCount(row) == 0
+    model.fetchMore(row)
+    assert model.data(model.index(1, 2, row)) == "'n999'"
+    assert model.parent(model.index(1, 2, row)) == row
+
+    viewer.export(str(tmp_path / "result.json")).join(5)
+    with open(tmp_path / "result.json", encoding="utf-8") as file:
+        assert json.load(file) == records
+
+    viewer.export(str(tmp_path / "result.csv"), "csv").join(5)
+    with open(tmp_path / "result.csv", encoding="utf-8") as file:
+        lines = file.read().splitlines()
+    assert lines[0] == "id,name" and lines[1] == "0,n0" and len(lines) == 10001
+
+    wait_process_Events(10, 1)
+    assert viewer.status_label.text().startswith("Exported to")
+
+    # A new run without return value hides the viewer
+    cli.callback = lambda: None
+    control.gui.run_button.click()
+    wait_process_Events(100)
+    assert viewer.isHidden()
+
+
+def test_output_of_several_guis():
+    first = clickqt.qtgui_from_click(
+        click.Command("first", callback=lambda: print("first run"))
+    )
+    second = clickqt.qtgui_from_click(
+        click.Command("second", callback=lambda: print("second run"))
+    )
+    first.set_ep_or_path("first")
+
+    # Every GUI shows its own output, not the terminal of the newest GUI
+    first.construct_command_string()
+    first.gui.run_button.click()
+    wait_process_Events(100)
+    text = first.gui.terminal_output.toPlainText()
+    assert "first run" in text
+    assert "Copied to clipboard: 'first'" not in text  # Cleared by the run
+    assert second.gui.terminal_output.toPlainText() == ""
+
+    second.gui.run_button.click()
+    wait_process_Events(100)
+    assert "second run" in second.gui.terminal_output.toPlainText()
+    assert "second run" not in first.gui.terminal_output.toPlainText()
+
+
+def test_default_output_falls_back():
+    first = TerminalOutput()
+    second = TerminalOutput()
+    install_output_streams(first)
+    install_output_streams(second)
+    try:
+        assert sys.stdout.output is second
+
+        # Removing the newest output falls back to an output that still exists
+        uninstall_output_streams(second)
+        assert sys.stdout.output is first
+        assert sys.stderr.output is first
+
+        # Removing an output that isn't the current one keeps the current one
+        install_output_streams(second)
+        uninstall_output_streams(first)
+        assert sys.stdout.output is second
+    finally:
+        uninstall_output_streams(first)
+        uninstall_output_streams(second)
+
+
+def test_output_stream_tty():
+    terminal = TerminalOutput()
+    terminal.newMessage.connect(terminal.writeText)
+    stream = io.StringIO()
+    output = OutputStream(terminal, stream, QColor("black"))
+    assert not output.isatty()
+
+    # Styles are rendered by the terminal output and removed from a stream which isn't a terminal
+    output.write(click.style("green", fg="green"))
+    assert stream.getvalue() == "green"
+    assert terminal.toPlainText() == "green"
+    cursor = QTextCursor(terminal.document())
+    cursor.setPosition(1)
+    assert cursor.charFormat().foreground().color() == QColor(0, 205, 0)
+
+
+def test_log_tee_errors(tmp_path):
+    # Runs that start at the same time don't overwrite each other's log
+    tee = LogTee(tmp_path)
+    logs = [tee.open_run(["cli"]) for _ in range(3)]
+    logs += [RunLog(tee, logs[0].name) for _ in range(2)]
+    for i, log in enumerate(logs):
+        log.write(f"run {i}\n")
+        log.close()
+    assert all(log.wait(5) and log.error is None for log in logs)
+    assert len({log.paths[0] for log in logs}) == 5
+    for i, log in enumerate(logs):
+        with open(log.paths[0], encoding="utf-8") as file:
+            assert file.read() == f"run {i}\n"
+
+    # A log that cannot be written stops, the error is kept
+    (tmp_path / "file").write_text("")
+    log = LogTee(tmp_path / "file").open_run(["cli"])
+    assert log.wait(5) and isinstance(log.error, OSError)
+    log.write("ignored\n")
+    log.close()
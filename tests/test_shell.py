@@ -0,0 +1,100 @@
+"""
+Tests the GUIs of several commands in one shell window.
+"""
+from __future__ import annotations
+
+import click
+from PySide6.QtCore import QEvent
+from PySide6.QtWidgets import QApplication
+
+import clickqt
+from clickqt.core.gui import GUI
+from clickqt.widgets.passwordfield import PasswordField
+from tests.testutils import wait_process_Events
+
+
+def test_shell():
+    shell = clickqt.Shell("tools")
+    first = clickqt.qtgui_from_click(
+        click.Command(
+            "first",
+            callback=lambda **_: print("first run"),
+            params=[click.Option(["--count"], type=int, default=1)],
+        ),
+        shell=shell,
+    )
+    second = clickqt.qtgui_from_click(
+        click.Command(
+            "second",
+            callback=lambda **_: print("second run"),
+            params=[
+                click.Option(["--number"], type=int, default=2),
+                click.Option(["--secret"], hide_input=True, default="x"),
+            ],
+        ),
+        shell=shell,
+    )
+
+    assert shell.window.count() == 2 and shell.window.windowTitle() == "tools"
+    assert [shell.window.tabText(i) for i in range(2)] == ["first", "second"]
+    assert first.gui.window.window() is shell.window
+    assert shell.current_control() is first
+
+    # Every tab shows the output of its own runs
+    second.gui.run_button.click()
+    wait_process_Events(100)
+    assert "second run" in second.gui.terminal_output.toPlainText()
+    assert first.gui.terminal_output.toPlainText() == ""
+
+    # Other output goes to the selected tab
+    print("to the first tab")
+    shell.window.setCurrentIndex(1)
+    assert shell.current_control() is second
+    print("to the second tab")
+    assert "to the first tab" in first.gui.terminal_output.toPlainText()
+    assert "to the first tab" not in second.gui.terminal_output.toPlainText()
+    assert "to the second tab" in second.gui.terminal_output.toPlainText()
+
+    # The GUIs share the widget classes and the style resources
+    gui = second.gui
+    assert gui.widget_class(click.types.IntParamType) is type(
+        first.command_tree.root.widgets["count"]
+    )
+    assert gui.widget_class(type(click.Path())) is first.gui.widget_class(click.Path)
+    assert gui.widget_class(click.ParamType) is None
+    secret = second.command_tree.root.widgets["secret"]
+    assert isinstance(secret, PasswordField)
+    assert not secret.icon_text[0][0].isNull()
+
+    # The streams no longer point to the deleted tabs
+    shell.window.deleteLater()
+    QApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    assert not shell.controls
+    print("after the shell")
+
+
+def test_widget_class_cache():
+    class IntTextGUI(GUI):
+        typedict = {click.types.IntParamType: clickqt.widgets.TextField}
+
+    gui, int_text_gui = GUI(), IntTextGUI()
+    assert gui.widget_class(click.types.IntParamType) is clickqt.widgets.IntField
+    assert (
+        int_text_gui.widget_class(click.types.IntParamType) is clickqt.widgets.TextField
+    )
+    assert int_text_gui.widget_class(click.types.FloatParamType) is None
+
+    # Changes of a typedict replace the looked up classes
+    IntTextGUI.typedict[click.types.FloatParamType] = clickqt.widgets.TextField
+    assert (
+        int_text_gui.widget_class(click.types.FloatParamType)
+        is clickqt.widgets.TextField
+    )
+    del IntTextGUI.typedict[click.types.IntParamType]
+    assert int_text_gui.widget_class(click.types.IntParamType) is None
+    assert gui.widget_class(click.types.IntParamType) is clickqt.widgets.IntField
+
+    # The typedict of a single GUI
+    gui.typedict = {**GUI.typedict, click.types.IntParamType: clickqt.widgets.TextField}
+    assert gui.widget_class(click.types.IntParamType) is clickqt.widgets.TextField
+    assert GUI().widget_class(click.types.IntParamType) is clickqt.widgets.IntField
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
+import os
+import shlex
 import sys
+import threading
+import time
 import typing as t
 from os.path import realpath
 
@@ -13,11 +17,16 @@ from PySide6.QtWidgets import (
     QPushButton,
     QMessageBox,
 )
-from PySide6.QtCore import QTimer, Signal, QObject, Qt
+from PySide6.QtCore import QCoreApplication, QEvent, QTimer, Signal, QObject, Qt
 from pytestqt.qtbot import QtBot
 
-from tests.testutils import ClickAttrs
+from tests.testutils import ClickAttrs, raise_
 import clickqt.widgets
+from clickqt.core.choiceindex import choice_index
+from clickqt.core.error import ClickQtError
+from clickqt.widgets.core import QBulkPathEdit as QBulkPathEdit_module
+from clickqt.widgets.core.QBulkPathEdit import QBulkPathEdit
+from clickqt.widgets.core.QChoiceComboBox import FETCH_BATCH_SIZE
 
 
 class CustomParamType(click.ParamType):
@@ -445,3 +454,358 @@ def test_nvaluewidget_add_remove_children(
         widget.remove_button_pair(list(widget.buttondict.keys())[0])
 
     assert len(widget.children) == amount_children - remove_children
+
+
+def test_nvaluewidget_bulk_paths(tmp_path):
+    for i in range(2500):
+        (tmp_path / f"tile_{i:04d}.tif").touch()
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "tile 'x'.tif").touch()
+
+    param = click.Option(["--p"], type=click.Path(exists=True), multiple=True)
+    cli = click.Command("cli", params=[param])
+    control = clickqt.qtgui_from_click(cli)
+    widget: clickqt.widgets.NValueWidget = control.widget_registry[cli.name][param.name]
+
+    first = str(tmp_path / "tile_0000.tif")
+    widget.set_value([first])
+    widget.set_bulk_mode(True)
+    assert widget.bulkbtn.isChecked() and len(widget.children) == 0
+    bulk_edit = widget.bulk_edit
+    assert bulk_edit.values() == [first]
+
+    # Glob patterns are expanded in the background
+    bulk_edit.recursive.setChecked(True)
+    bulk_edit.pattern.setText(str(tmp_path / "**" / "*.tif"))
+    bulk_edit.add_pattern()
+    end = time.monotonic() + 10
+    while bulk_edit.is_expanding and time.monotonic() < end:
+        QApplication.processEvents()
+    assert len(bulk_edit) == 2502 and bulk_edit.count_label.text() == "2502 paths"
+
+    # Pasted lists
+    bulk_edit.add_text(f"\n{first}\n  \n")
+    paths = bulk_edit.values()
+    assert len(paths) == 2503
+
+    value, err = widget.get_value()
+    assert err.type == ClickQtError.ErrorType.NO_ERROR
+    assert list(value) == paths
+
+    # The command line is the same as with one child widget per path
+    bulk_edit.set_values(paths[:2] + [str(tmp_path / "sub" / "tile 'x'.tif")])
+    cmdline = widget.get_widget_value_cmdline()
+    widget.set_bulk_mode(False)
+    assert widget.bulk_edit is None and len(widget.children) == 3
+    assert widget.get_widget_value_cmdline() == cmdline
+    assert "'\"'\"'x'\"'\"'.tif'" in cmdline
+
+    widget.set_bulk_mode(True)
+    bulk_edit.add_text(str(tmp_path / "missing"))
+    _, err = widget.get_value()
+    assert err.type == ClickQtError.ErrorType.CONVERTING_ERROR
+
+
+def test_bulk_paths_working_directory(tmp_path):
+    (tmp_path / "a.tif").touch()
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "b.tif").touch()
+
+    param = click.Option(["--p"], type=click.Path(exists=True), multiple=True)
+    cli = click.Command("cli", params=[param])
+    control = clickqt.qtgui_from_click(
+        cli, list_editors=True, working_directory=str(tmp_path)
+    )
+    widget = control.widget_registry[cli.name][param.name]
+    bulk_edit = widget.widget
+
+    # Patterns are relative to the working directory of the GUI, not to the one of the process
+    for pattern in ("*.tif", "sub", str(tmp_path / "sub" / "*.tif")):
+        bulk_edit.pattern.setText(pattern)
+        bulk_edit.add_pattern()
+        end = time.monotonic() + 10
+        while bulk_edit.is_expanding and time.monotonic() < end:
+            QApplication.processEvents()
+    expected = ["a.tif", os.path.join("sub", "b.tif"), str(tmp_path / "sub" / "b.tif")]
+    assert bulk_edit.values() == expected
+
+    value, err = widget.get_value()
+    assert err.type == ClickQtError.ErrorType.NO_ERROR
+    assert (
+        list(value) == [str(tmp_path / "a.tif")] + [str(tmp_path / "sub" / "b.tif")] * 2
+    )
+
+
+def test_bulk_paths_expansion_errors(tmp_path, monkeypatch):
+    (tmp_path / "sub").mkdir()
+    bulk_edit = QBulkPathEdit()
+
+    # Errors of the expansion are shown in the label
+    def scandir(path):
+        raise PermissionError(13, "Permission denied", path)
+
+    monkeypatch.setattr(QBulkPathEdit_module.os, "scandir", scandir)
+    bulk_edit.pattern.setText(str(tmp_path / "sub"))
+    bulk_edit.add_pattern()
+    end = time.monotonic() + 10
+    while bulk_edit.is_expanding and time.monotonic() < end:
+        QApplication.processEvents()
+    assert (
+        bulk_edit.count_label.text()
+        == f"0 paths ({tmp_path / 'sub'}: Permission denied)"
+    )
+    bulk_edit.set_values([])
+    assert bulk_edit.count_label.text() == "0 paths"
+
+    # An expansion that finishes after the widget is deleted doesn't emit its paths
+    release = threading.Event()
+
+    def expand_pattern(pattern, recursive, root_dir=None):
+        release.wait(10)
+        yield pattern
+
+    errors = []
+    monkeypatch.setattr(QBulkPathEdit_module, "expand_pattern", expand_pattern)
+    monkeypatch.setattr(threading, "excepthook", errors.append)
+    bulk_edit.pattern.setText("path")
+    bulk_edit.add_pattern()
+    (thread,) = [
+        thread for thread in threading.enumerate() if thread.name == "clickqt-glob"
+    ]
+    bulk_edit.deleteLater()
+    QCoreApplication.sendPostedEvents(None, QEvent.Type.DeferredDelete)
+    release.set()
+    thread.join(10)
+    assert not thread.is_alive() and not errors
+
+
+def test_list_edit_widget():
+    param = click.Option(["--n"], type=int, multiple=True, default=range(10000))
+    cli = click.Command("cli", params=[param])
+    control = clickqt.qtgui_from_click(cli, list_editors=True)
+    widget = control.widget_registry[cli.name][param.name]
+    assert isinstance(widget, clickqt.widgets.ListEditWidget)
+    assert len(widget.widget) == 10000 and widget.is_enabled
+
+    value, err = widget.get_value()
+    assert err.type == ClickQtError.ErrorType.NO_ERROR
+    assert list(value) == list(range(10000))
+
+    # Invalid values are marked in the list
+    model = widget.widget.model
+    widget.widget.add_text("x\n12\ny")
+    _, err = widget.get_value()
+    assert err.type == ClickQtError.ErrorType.CONVERTING_ERROR
+    assert sorted(model.errors) == [10000, 10002]
+    assert err.message().count("is not a valid integer") == 2
+    assert model.data(model.index(10000), Qt.ItemDataRole.ForegroundRole) is not None
+
+    model.setData(model.index(10000), "11")
+    model.remove_rows([10002])
+    value, err = widget.get_value()
+    assert err.type == ClickQtError.ErrorType.NO_ERROR and value[-2:] == (11, 12)
+
+    # Same command line as a NValueWidget with these values
+    widget.widget.set_values(["1", "-2"])
+    nvalue_cli = click.Command(
+        "cli", params=[click.Option(["--n"], type=int, multiple=True)]
+    )
+    nvalue_control = clickqt.qtgui_from_click(nvalue_cli)
+    nvalue_widget = nvalue_control.widget_registry[cli.name][param.name]
+    assert isinstance(nvalue_widget, clickqt.widgets.NValueWidget)
+    nvalue_widget.set_value(["1", "-2"])
+    assert widget.get_widget_value_cmdline() == "--n 1 --n -2 "
+    assert nvalue_widget.get_widget_value_cmdline() == widget.get_widget_value_cmdline()
+
+    # Empty list -> default
+    widget.widget.set_values([])
+    value, err = widget.get_value()
+    assert err.type == ClickQtError.ErrorType.NO_ERROR and len(value) == 10000
+
+
+def test_tuple_table_widget():
+    param = click.Option(
+        ["--t"],
+        type=(str, int),
+        multiple=True,
+        default=[(f"n{i}", i) for i in range(1000)],
+    )
+    cli = click.Command("cli", params=[param])
+    control = clickqt.qtgui_from_click(cli, list_editors=True)
+    widget = control.widget_registry[cli.name][param.name]
+    assert isinstance(widget, clickqt.widgets.TupleTableWidget)
+    table = widget.widget
+    assert len(table) == 1000 and table.model.columnCount() == 2
+
+    start = time.monotonic()
+    value, err = widget.get_value()
+    assert time.monotonic() - start < 1
+    assert err.type == ClickQtError.ErrorType.NO_ERROR
+    assert list(value) == [(f"n{i}", i) for i in range(1000)]
+
+    # Pasted CSV and TSV, invalid cells are marked
+    table.set_values([])
+    table.add_text('a,1\n"b, c",x\n\n')
+    assert table.values() == [("a", "1"), ("b, c", "x")]
+    table.add_text("d\t3\te\nf\n")
+    assert table.values()[2:] == [("d", "3\te"), ("f", "")]
+    _, err = widget.get_value()
+    assert err.type == ClickQtError.ErrorType.CONVERTING_ERROR
+    assert sorted(table.model.errors) == [(1, 1), (2, 1), (3, 1)]
+
+    # Integer columns are sorted by value, converted with the parameter and a context
+    assert table.model.sort_keys[1].keywords["param"] is param
+    assert isinstance(table.model.sort_keys[1].keywords["ctx"], click.Context)
+    table.set_values([("a", "10"), ("b", "9"), ("c", "-1")])
+    table.model.sort(1)
+    assert [row[0] for row in table.values()] == ["c", "b", "a"]
+    table.model.sort(0, Qt.SortOrder.DescendingOrder)
+    assert [row[0] for row in table.values()] == ["c", "b", "a"]
+
+    # Same command line as a NValueWidget with these tuples
+    nvalue_cli = click.Command(
+        "cli", params=[click.Option(["--t"], type=(str, int), multiple=True)]
+    )
+    nvalue_control = clickqt.qtgui_from_click(nvalue_cli)
+    nvalue_widget = nvalue_control.widget_registry[cli.name][param.name]
+    assert isinstance(nvalue_widget, clickqt.widgets.NValueWidget)
+    table.set_values([("a b", "1"), ("c", "2")])
+    nvalue_widget.set_value([("a b", 1), ("c", 2)])
+    assert widget.get_widget_value_cmdline() == "--t 'a b' 1 --t c 2 "
+    assert nvalue_widget.get_widget_value_cmdline() == widget.get_widget_value_cmdline()
+
+    # Empty cells
+    param = click.Option(["--t"], type=(str, click.Path(), int), multiple=True)
+    cli = click.Command("cli", params=[param])
+    control = clickqt.qtgui_from_click(cli, list_editors=True)
+    widget = control.widget_registry[cli.name][param.name]
+    nvalue_control = clickqt.qtgui_from_click(cli)
+    nvalue_widget = nvalue_control.widget_registry[cli.name][param.name]
+    widget.widget.set_values([("", "", "1"), ("c", "p", "2")])
+    nvalue_widget.set_value([("", "", 1), ("c", "p", 2)])
+    assert shlex.split(widget.get_widget_value_cmdline()) == shlex.split(
+        nvalue_widget.get_widget_value_cmdline()
+    )
+
+    # nargs >= 2 without click.Tuple
+    param = click.Option(["--p"], type=float, nargs=2, multiple=True)
+    cli = click.Command("cli", params=[param])
+    control = clickqt.qtgui_from_click(cli, list_editors=True)
+    widget = control.widget_registry[cli.name][param.name]
+    assert isinstance(widget, clickqt.widgets.TupleTableWidget)
+    assert not widget.is_enabled
+    widget.widget.add_text("1.5\t2\n")
+    assert widget.is_enabled and widget.get_value()[0] == ((1.5, 2.0),)
+
+
+def test_checkable_combobox_large_choice():
+    choices = [f"epsg:{i}" for i in range(20000)]
+    param = click.Option(
+        ["--crs"], type=click.Choice(choices, case_sensitive=False), multiple=True
+    )
+    cli = click.Command("cli", params=[param])
+    control = clickqt.qtgui_from_click(cli)
+    widget = control.widget_registry[cli.name][param.name]
+    combobox: clickqt.widgets.core.QCheckableComboBox = widget.widget
+
+    changes = []
+    combobox.items.checkedChanged.connect(lambda: changes.append(1))
+
+    # Lower case choices are checked too, all at once
+    start = time.monotonic()
+    combobox.checkItems(choices[::2])
+    assert time.monotonic() - start < 1
+    assert len(changes) == 1
+    assert combobox.getData() == choices[::2]
+    assert combobox.lineEdit().text().startswith("epsg:0, epsg:2, ")
+
+    # Only the items that match the filter are (un)checked
+    combobox.filterEdit.setText("EPSG:1999")
+    assert combobox.proxy.rowCount() == 11
+    combobox.setShownChecked(True)
+    assert len(changes) == 2 and len(combobox.getData()) == 10006
+    combobox.setShownChecked(True)
+    assert len(changes) == 2
+    combobox.filterEdit.clear()
+    combobox.setShownChecked(False)
+    assert combobox.getData() == [] and combobox.lineEdit().text() == ""
+
+
+def test_choice_index(monkeypatch):
+    choice = click.Choice(["Alpha", "beta", "GAMMA", "alphabet"], case_sensitive=False)
+    index = choice_index(choice)
+    assert choice_index(choice) is index
+    assert index.convert("ALPHA") == "Alpha" and index.find("gamma") == 2
+    assert index.find("delta") is None
+    with pytest.raises(click.BadParameter) as exc_info:
+        index.convert("delta")
+    assert exc_info.value.message == (
+        "'delta' is not one of 'Alpha', 'beta', 'GAMMA', 'alphabet'."
+    )
+    assert index.match("al") == ["Alpha", "alphabet"]
+    assert index.match("ga") == ["GAMMA"]
+    assert index.match("bt") == ["alphabet", "beta"]  # Fuzzy, alphabetical order
+
+    # token_normalize_func of the context
+    ctx = click.Context(click.Command("cli"), token_normalize_func=str.strip)
+    assert choice_index(choice, ctx) is not index
+    assert choice_index(choice, ctx).convert(" beta ", None, ctx) == "beta"
+
+    # The widgets look up their values in the index, click.Choice.convert is neither changed nor called
+    param = click.Option(["--c"], type=choice, multiple=True)
+    cli = click.Command("cli", params=[param])
+    control = clickqt.qtgui_from_click(cli)
+    widget = control.widget_registry[cli.name][param.name]
+    widget.set_value(["alpha", "GAMMA"])
+    monkeypatch.setattr(click.Choice, "convert", lambda *args: raise_(AssertionError()))
+    value, err = widget.get_value()
+    assert err.type == ClickQtError.ErrorType.NO_ERROR and value == ("Alpha", "GAMMA")
+    assert "convert" not in vars(choice)
+
+
+def test_choice_combobox_large_choice():
+    choices = [f"EPSG:{i}" for i in range(50000)]
+    param = click.Option(
+        ["--crs"],
+        type=click.Choice(choices, case_sensitive=False),
+        default="epsg:49999",
+    )
+    start = time.monotonic()
+    cli = click.Command("cli", params=[param])
+    control = clickqt.qtgui_from_click(cli)
+    assert time.monotonic() - start < 2
+    widget = control.widget_registry[cli.name][param.name]
+    combobox: clickqt.widgets.core.QChoiceComboBox.QChoiceComboBox = widget.widget
+
+    # Only the fetched choices are in the model, the default is fetched on demand
+    assert combobox.currentText() == "EPSG:49999"
+    assert combobox.count() == FETCH_BATCH_SIZE
+    widget.set_value("epsg:4326")
+    assert combobox.currentText() == "EPSG:4326" and combobox.count() < 50000
+    value, err = widget.get_value()
+    assert value == "EPSG:4326" and err.type == ClickQtError.ErrorType.NO_ERROR
+
+    combobox.update_matches("epsg:432")
+    assert combobox.matches.stringList()[:2] == ["EPSG:432", "EPSG:4320"]
+    combobox.lineEdit().setText("epsg:3857")
+    combobox.select_text(combobox.currentText())
+    assert combobox.currentText() == "EPSG:3857"
+    combobox.select_text("epsg:12")
+    assert combobox.currentIndex() == 12 and combobox.currentText() == "EPSG:12"
+
+    combobox.lineEdit().setText("EPSG:x")
+    _, err = widget.get_value()
+    assert err.type == ClickQtError.ErrorType.CONVERTING_ERROR
+
+    # Multiple choices are validated in O(1) each
+    param = click.Option(
+        ["--crs"], type=click.Choice(choices, case_sensitive=False), multiple=True
+    )
+    cli = click.Command("cli", params=[param])
+    control = clickqt.qtgui_from_click(cli)
+    widget = control.widget_registry[cli.name][param.name]
+    start = time.monotonic()
+    widget.set_value([c.lower() for c in choices[::5]])
+    value, err = widget.get_value()
+    assert time.monotonic() - start < 2
+    assert err.type == ClickQtError.ErrorType.NO_ERROR and list(value) == choices[::5]
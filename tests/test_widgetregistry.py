@@ -54,3 +54,39 @@ def test_widget_registry_command_names(
     assert len(control.widget_registry) == len(cli_names_list)
     for i, cli_name in enumerate(control.widget_registry.keys()):
         assert cli_name == expected[i]
+
+
+def test_command_tree_colon_names():
+    param = click.Option(param_decls=["--p"], **ClickAttrs.textfield(default="x"))
+    group = click.Group(
+        "cli",
+        commands=[
+            click.Group("a", commands=[click.Command("b", params=[param])]),
+            click.Command("a:b", params=[param]),
+        ],
+    )
+
+    control = clickqt.qtgui_from_click(group)
+    control.set_ep_or_path("cli")
+    tree = control.command_tree
+
+    nested, colon = tree[("cli", "a", "b")], tree[("cli", "a:b")]
+    assert nested is not colon
+    assert nested.parent is tree[("cli", "a")] and colon.parent is tree.root
+    assert nested.lineage == (tree.root, tree[("cli", "a")], nested)
+    assert nested.widgets["p"] is not colon.widgets["p"]
+    assert nested.param_infos["p"] == (1, "StringParamType")
+
+    nested.widgets["p"].set_value("nested")
+    colon.widgets["p"].set_value("colon")
+
+    assert tree.resolve(["a", "b", "--p", "y"]) is nested
+    assert tree.resolve(["a:b", "--p", "y"]) is colon
+    assert control.command_to_cli_string(nested) == "cli a b --p nested"
+    assert control.command_to_cli_string(colon) == "cli a:b --p colon"
+
+    control.select_current_command_hierarchy(["a:b"])
+    assert control.current_node() is colon
+    control.select_current_command_hierarchy(["a", "b"])
+    assert control.current_node() is nested
+    assert control.get_hierarchy() == ["cli", "a", "b"]